@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Feed-parse micro-benchmark over the recorded fixtures in tests/fixtures/feeds.
+
+Times entry-field extraction with the current single-pass extractor against
+the previous per-field `_first_text` walk (kept below as the baseline) on the
+same pre-built entries, plus the end-to-end `parse_feed_items` time. Exits
+non-zero if the two extractors or the full parse ever disagree.
+
+Run: PYTHONPATH=src python3 scripts/bench_feed_parse.py [--repeat N] [FILE ...]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from digest.connectors import feed_parsers
+from digest.models import Item
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_FIXTURES = sorted((ROOT_DIR / "tests" / "fixtures" / "feeds").glob("*.xml"))
+
+
+def _legacy_first_text(node: ET.Element, names: list[str]) -> str | None:
+    for child in node.iter():
+        if feed_parsers._local_name(child.tag) in names and child.text:
+            value = child.text.strip()
+            if value:
+                return value
+    return None
+
+
+def _legacy_item(feed_url: str, entry: ET.Element, spec: dict[str, list[str]]) -> Item:
+    title = (_legacy_first_text(entry, spec["title"]) or "Untitled").strip()
+    if "link" in spec:
+        url = (_legacy_first_text(entry, spec["link"]) or "").strip()
+    else:
+        url = feed_parsers._atom_link(entry)
+    desc = feed_parsers._strip_html(_legacy_first_text(entry, spec["description"]) or "")
+    published_at = feed_parsers._parse_datetime(_legacy_first_text(entry, spec["published"]) or "")
+    if "author" in spec:
+        author = _legacy_first_text(entry, spec["author"]) or None
+    else:
+        author = feed_parsers._atom_author(entry)
+    return feed_parsers._to_item(feed_url, title, url, desc, published_at, author)
+
+
+_LEGACY_SPECS = {
+    "rss": {
+        "title": ["title"],
+        "link": ["link"],
+        "description": ["description"],
+        "published": ["pubDate", "date"],
+        "author": ["author", "creator"],
+    },
+    "feed": {
+        "title": ["title"],
+        "description": ["summary", "content", "description"],
+        "published": ["published", "updated", "pubDate"],
+    },
+    "RDF": {
+        "title": ["title"],
+        "link": ["link"],
+        "description": ["description"],
+        "published": ["date", "pubDate", "issued"],
+        "author": ["creator", "author"],
+    },
+}
+
+
+_CURRENT_BUILDERS = {
+    "rss": feed_parsers._rss_entry,
+    "feed": feed_parsers._atom_entry,
+    "RDF": feed_parsers._rdf_entry,
+}
+
+
+def _entries(content: bytes) -> tuple[str, list[ET.Element]]:
+    root = ET.fromstring(content)
+    kind = feed_parsers._local_name(root.tag)
+    if kind == "rss":
+        channel = root.find("channel")
+        return kind, channel.findall("item") if channel is not None else []
+    if kind == "feed":
+        return kind, [e for e in root if feed_parsers._local_name(e.tag) == "entry"]
+    if kind == "RDF":
+        return kind, [e for e in root if feed_parsers._local_name(e.tag) == "item"]
+    raise SystemExit(f"unsupported fixture root: {kind}")
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", type=Path, default=DEFAULT_FIXTURES)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+    if not args.files:
+        print("no fixtures found", file=sys.stderr)
+        return 1
+
+    print(
+        f"{'fixture':<22} {'items':>5} {'extract base ms':>16} {'extract now ms':>15} "
+        f"{'speedup':>8} {'full parse ms':>14}"
+    )
+    for path in args.files:
+        content = path.read_bytes()
+        feed_url = f"file://{path.name}"
+        kind, entries = _entries(content)
+        spec, build = _LEGACY_SPECS[kind], _CURRENT_BUILDERS[kind]
+
+        def baseline() -> list[Item]:
+            return [_legacy_item(feed_url, entry, spec) for entry in entries]
+
+        def current() -> list[Item]:
+            return [build(feed_url, entry) for entry in entries]
+
+        if current() != baseline() or feed_parsers.parse_feed_items(feed_url, content) != baseline():
+            print(f"{path.name}: output differs from the baseline extractor", file=sys.stderr)
+            return 1
+        baseline_s = _best_of(baseline, args.repeat)
+        current_s = _best_of(current, args.repeat)
+        full_s = _best_of(lambda: feed_parsers.parse_feed_items(feed_url, content), args.repeat)
+        print(
+            f"{path.name:<22} {len(entries):>5} {baseline_s * 1000:>16.2f} "
+            f"{current_s * 1000:>15.2f} {baseline_s / current_s:>7.2f}x {full_s * 1000:>14.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
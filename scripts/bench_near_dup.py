@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Near-duplicate clustering benchmark on synthetic headline batches.
+
+Builds batches of headlines in which roughly a third of the items are
+reworded copies of an earlier story. Each batch is clustered with the
+previous quadratic scan (kept below as the baseline) and with
+`cluster_near_duplicates`, which uses the MinHash/LSH index from
+NEAR_DUP_LSH_MIN_ITEMS items up. Prints best-of-N timings and microseconds
+per item so the scaling is visible, and the number of items the LSH path
+placed in a different cluster than the scan (candidate generation is
+probabilistic, so this is expected to be rare, not always zero).
+
+Run: PYTHONPATH=src python3 scripts/bench_near_dup.py [--sizes 500 1000 ...] [--repeat N]
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from datetime import datetime, timezone
+
+from digest.models import Item
+from digest.pipeline.dedupe import _tokens, cluster_near_duplicates
+
+_WORDS = [
+    "agent", "model", "release", "open", "source", "benchmark", "reasoning", "vision",
+    "training", "inference", "gpu", "cluster", "paper", "dataset", "fine", "tuning",
+    "rust", "python", "compiler", "kernel", "latency", "memory", "sparse", "attention",
+    "robot", "policy", "safety", "eval", "token", "context", "retrieval", "search",
+    "startup", "funding", "chip", "cloud", "api", "pricing", "update", "launch",
+] + [f"term{index}" for index in range(800)]
+
+
+def _legacy_cluster(items: list[Item], threshold: float = 0.7) -> list[list[Item]]:
+    clusters: list[list[Item]] = []
+    for item in items:
+        candidate = _tokens(item.title)
+        placed = False
+        for cluster in clusters:
+            centroid = _tokens(cluster[0].title)
+            if not candidate or not centroid:
+                continue
+            if len(candidate & centroid) / len(candidate | centroid) >= threshold:
+                cluster.append(item)
+                placed = True
+                break
+        if not placed:
+            clusters.append([item])
+    return clusters
+
+
+def _batch(size: int, seed: int = 7) -> list[Item]:
+    rng = random.Random(seed)
+    titles: list[str] = []
+    for index in range(size):
+        if titles and rng.random() < 0.35:
+            # Reword an earlier story: same words plus one extra.
+            words = rng.choice(titles).split()
+            words.append(rng.choice(_WORDS))
+            titles.append(" ".join(words))
+        else:
+            # A few common words plus rarer topic terms, like real headlines.
+            words = rng.sample(_WORDS[:40], 3) + rng.sample(_WORDS[40:], 4)
+            titles.append(" ".join(words) + f" story{index}")
+    now = datetime.now(timezone.utc)
+    return [
+        Item(f"item{i}", f"https://example.com/{i}", title, "example.com", None, now, "article", "")
+        for i, title in enumerate(titles)
+    ]
+
+
+def _leaders(clusters: list[list[Item]]) -> dict[str, str]:
+    return {item.id: cluster[0].id for cluster in clusters for item in cluster}
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", nargs="*", type=int, default=[250, 500, 1000, 2000, 4000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(
+        f"{'items':>6} {'clusters':>8} {'baseline ms':>12} {'lsh ms':>9} "
+        f"{'speedup':>8} {'base us/item':>13} {'lsh us/item':>12} {'differ':>7}"
+    )
+    for size in args.sizes:
+        items = _batch(size)
+        expected = _leaders(_legacy_cluster(items))
+        differ = sum(
+            1 for item_id, leader in _leaders(cluster_near_duplicates(items)).items()
+            if expected[item_id] != leader
+        )
+        baseline_s = _best_of(lambda: _legacy_cluster(items), args.repeat)
+        lsh_s = _best_of(lambda: cluster_near_duplicates(items), args.repeat)
+        print(
+            f"{size:>6} {len(set(expected.values())):>8} {baseline_s * 1000:>12.1f} {lsh_s * 1000:>9.1f} "
+            f"{baseline_s / lsh_s:>7.1f}x {baseline_s * 1e6 / size:>13.1f} "
+            f"{lsh_s * 1e6 / size:>12.1f} {differ:>7}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,6 +3,7 @@ from __future__ import annotations
 import argparse
 import json
 import time
+from dataclasses import replace
 from datetime import datetime, timezone
 import os
 from pathlib import Path
@@ -10,6 +11,7 @@ from typing import Any
 
 from digest.constants import DEFAULT_RUN_LOCK_STALE_SECONDS
 from digest.config import load_dotenv
+from digest.ops.feed_bench import bench_feed_backends, default_feed_fixtures
 from digest.ops.onboarding import OnboardingSettings, run_preflight
 from digest.ops.profile_registry import load_effective_profile
 from digest.delivery.telegram import (
@@ -21,8 +23,10 @@ from digest.delivery.telegram import (
     set_telegram_commands,
 )
 from digest.logging_utils import setup_logging
+from digest.net.http_cache import configure_http_cache
 from digest.ops.run_lock import RunLock
-from digest.ops.schedule_slots import evaluate_schedule_tick
+from digest.ops.schedule_slots import evaluate_schedule_tick, next_prefetch_shard
+from digest.ops.source_shards import plan_source_shards, shardable_sources, sources_excluding
 from digest.ops.source_registry import load_effective_sources
 from digest.ops.telegram_commands import CommandContext, handle_update
 from digest.runtime import run_digest
@@ -44,8 +48,12 @@ def _execute_run(
     use_last_completed_window: bool,
     only_new: bool,
     show_progress: bool,
+    prefetched_source_keys: set[str] | None = None,
+    include_pool: bool = False,
 ) -> int:
     sources = load_effective_sources(args.sources, args.sources_overlay)
+    if prefetched_source_keys:
+        sources = sources_excluding(sources, prefetched_source_keys)
     profile = load_effective_profile(args.profile, args.profile_overlay)
     store = SQLiteStore(args.db)
     if show_progress:
@@ -56,6 +64,7 @@ def _execute_run(
         store,
         use_last_completed_window=use_last_completed_window,
         only_new=only_new,
+        include_pool=include_pool,
         progress_cb=_print_progress if show_progress else None,
     )
     print(f"run_id={report.run_id} status={report.status}")
@@ -66,6 +75,43 @@ def _execute_run(
     return 0
 
 
+def _execute_prefetch(args: argparse.Namespace, *, shard: int) -> list[str]:
+    """Fetch one scheduler shard into the store's pool.
+
+    Returns the shard's source keys that fetched without error; failed
+    sources are left for the delivery run to fetch.
+    """
+    sources = load_effective_sources(args.sources, args.sources_overlay)
+    profile = load_effective_profile(args.profile, args.profile_overlay)
+    shards = plan_source_shards(sources, profile.fetch_shards)
+    if shard >= len(shards):
+        return []
+    shard_sources = shards[shard]
+    keys = [key for _type, _value, key in shardable_sources(shard_sources)]
+    if not keys:
+        return []
+    # The X spend cap is per run; give the shard its share of the selectors.
+    x_total = len(sources.x_authors) + len(sources.x_themes)
+    x_share = (len(shard_sources.x_authors) + len(shard_sources.x_themes)) / x_total if x_total else 0
+    profile = replace(profile, x_max_spend_per_run_usd=profile.x_max_spend_per_run_usd * x_share)
+    report = run_digest(
+        shard_sources,
+        profile,
+        SQLiteStore(args.db),
+        use_last_completed_window=True,
+        only_new=True,
+        prefetch_only=True,
+    )
+    print(
+        f"run_id={report.run_id} status={report.status} shard={shard} pooled={report.source_count}",
+        flush=True,
+    )
+    for err in report.source_errors:
+        print(f"source_error: {err}")
+    failed = set(report.context.get("fetched", {}).get("failed_source_keys") or [])
+    return [key for key in keys if key not in failed]
+
+
 SCHEDULE_STATE_PATH = ".runtime/schedule-state.json"
 SCHEDULE_TICK_SECONDS = 15
 
@@ -95,7 +141,9 @@ def _cmd_schedule(args: argparse.Namespace) -> int:
     profile.schedule (edited via the Telegram /schedule commands) is the
     single source of truth: cadence, local time, quiet hours, timezone.
     Exactly-once per slot via a persisted marker, with same-day catch-up
-    after restarts.
+    after restarts. With profile.fetch_shards > 1, source shards are fetched
+    in sub-slots ahead of each slot outside quiet hours and the delivery run
+    uses the pooled items, fetching only sources no shard covered.
     """
     last_action = ""
     while True:
@@ -121,15 +169,45 @@ def _cmd_schedule(args: argparse.Namespace) -> int:
                 },
             )
             print(f"scheduler: triggering run for slot {slot}", flush=True)
+            prefetched = state.get("prefetched") or {}
             try:
                 _execute_run(
                     args,
                     use_last_completed_window=True,
                     only_new=True,
                     show_progress=False,
+                    prefetched_source_keys=(
+                        set(prefetched.get("source_keys") or [])
+                        if prefetched.get("slot") == slot
+                        else None
+                    ),
+                    include_pool=True,
                 )
             except Exception as exc:
                 print(f"scheduler_error: {exc}", flush=True)
+        elif (due_shard := next_prefetch_shard(profile, now, state.get("prefetched") or {})):
+            shard_slot, shard = due_shard
+            prefetched = state.get("prefetched") or {}
+            if prefetched.get("slot") != shard_slot:
+                prefetched = {"slot": shard_slot, "shards": [], "source_keys": []}
+            print(f"scheduler: prefetching shard {shard} for slot {shard_slot}", flush=True)
+            try:
+                keys = _execute_prefetch(args, shard=shard)
+            except Exception as exc:
+                # The delivery run fetches whatever this shard would have.
+                keys = []
+                print(f"scheduler_error: {exc}", flush=True)
+            _write_json_state(
+                SCHEDULE_STATE_PATH,
+                {
+                    **state,
+                    "prefetched": {
+                        "slot": shard_slot,
+                        "shards": [*prefetched["shards"], shard],
+                        "source_keys": [*prefetched["source_keys"], *keys],
+                    },
+                },
+            )
         time.sleep(SCHEDULE_TICK_SECONDS)
 
 
@@ -174,6 +252,29 @@ def _cmd_doctor(args: argparse.Namespace) -> int:
     return 0 if report.get("ok", False) else 1
 
 
+def _cmd_bench_feeds(args: argparse.Namespace) -> int:
+    paths = [Path(p) for p in args.files] or default_feed_fixtures()
+    if not paths:
+        print("bench-feeds: no feed files given and no fixtures found")
+        return 1
+    try:
+        rows = bench_feed_backends(paths, repeat=args.repeat, backends=args.backend or None)
+    except (OSError, RuntimeError) as exc:
+        print(f"bench-feeds: {exc}")
+        return 1
+
+    names = list(rows[0].timings_ms) if rows else []
+    print(f"{'feed':<28} {'items':>5} " + " ".join(f"{name + ' ms':>14}" for name in names))
+    ok = True
+    for row in rows:
+        cells = " ".join(f"{row.timings_ms[name]:>14.2f}" for name in names)
+        print(f"{Path(row.path).name:<28} {row.items:>5} {cells}")
+        for name in row.mismatched:
+            ok = False
+            print(f"  mismatch: {name} items differ from stdlib")
+    return 0 if ok else 1
+
+
 def _print_progress(event: dict[str, Any]) -> None:
     elapsed = _fmt_elapsed(event.get("elapsed_s"))
     stage = str(event.get("stage", "")).strip()
@@ -448,6 +549,11 @@ def main() -> int:
     parser.add_argument("--profile", default="config/profile.yaml")
     parser.add_argument("--profile-overlay", default="data/profile.local.yaml")
     parser.add_argument("--db", default="digest.db")
+    parser.add_argument(
+        "--no-http-cache",
+        action="store_true",
+        help="Always go to the network instead of the on-disk HTTP response cache",
+    )
 
     sub = parser.add_subparsers(dest="command", required=True)
     run_p = sub.add_parser("run", help="Run digest once")
@@ -481,7 +587,21 @@ def main() -> int:
     bot_health.add_argument("--max-error-streak", type=int, default=5)
     bot_health.set_defaults(func=_cmd_bot_health_check)
 
+    bench_feeds = sub.add_parser(
+        "bench-feeds", help="Compare feed-parser backends on recorded feed files"
+    )
+    bench_feeds.add_argument("files", nargs="*", help="Feed XML files (default: test fixtures)")
+    bench_feeds.add_argument("--repeat", type=int, default=10)
+    bench_feeds.add_argument(
+        "--backend",
+        action="append",
+        choices=["stdlib", "lxml", "feedparser"],
+        help="Limit to these backends (repeatable; default: all installed)",
+    )
+    bench_feeds.set_defaults(func=_cmd_bench_feeds)
+
     args = parser.parse_args()
+    configure_http_cache(enabled=not args.no_http_cache)
     return args.func(args)
 
 
@@ -75,6 +75,15 @@ class ProfileConfig:
     github_max_items_per_org: int = 40
     github_repo_max_age_days: int = 30
     github_activity_max_age_days: int = 14
+    github_max_pages_per_selector: int = 3
+    fetch_max_workers: int = 8
+    fetch_max_per_host: int = 2
+    poll_max_staleness_hours: int = 24
+    fetch_shards: int = 1
+    fetch_shard_lead_minutes: int = 60
+    story_repeat_policy: str = "demote"
+    story_index_ttl_days: int = 7
+    seen_ttl_days: int = 0
     output: OutputSettings = field(default_factory=OutputSettings)
     llm_enabled: bool = False
     agent_scoring_enabled: bool = True
@@ -229,6 +238,9 @@ def parse_profile_dict(data: dict) -> ProfileConfig:
         raise ValueError(
             "content_depth_preference must be one of: practical, balanced, deep_technical"
         )
+    story_repeat_policy = str(data.get("story_repeat_policy", "demote")).strip().lower() or "demote"
+    if story_repeat_policy not in {"drop", "demote", "off"}:
+        raise ValueError("story_repeat_policy must be one of: drop, demote, off")
     policy_raw = data.get("run_policy", {})
     if policy_raw is None:
         policy_raw = {}
@@ -323,6 +335,17 @@ def parse_profile_dict(data: dict) -> ProfileConfig:
         github_activity_max_age_days=max(
             1, int(data.get("github_activity_max_age_days", 14) or 14)
         ),
+        github_max_pages_per_selector=max(
+            1, int(data.get("github_max_pages_per_selector", 3) or 3)
+        ),
+        fetch_max_workers=max(1, int(data.get("fetch_max_workers", 8) or 8)),
+        fetch_max_per_host=max(1, int(data.get("fetch_max_per_host", 2) or 2)),
+        poll_max_staleness_hours=max(0, int(data.get("poll_max_staleness_hours", 24) or 0)),
+        fetch_shards=max(1, int(data.get("fetch_shards", 1) or 1)),
+        fetch_shard_lead_minutes=max(1, int(data.get("fetch_shard_lead_minutes", 60) or 60)),
+        story_repeat_policy=story_repeat_policy,
+        story_index_ttl_days=max(1, int(data.get("story_index_ttl_days", 7) or 7)),
+        seen_ttl_days=max(0, int(data.get("seen_ttl_days", 0) or 0)),
         output=output,
         llm_enabled=bool(data.get("llm_enabled", False)),
         agent_scoring_enabled=bool(data.get("agent_scoring_enabled", True)),
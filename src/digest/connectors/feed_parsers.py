@@ -0,0 +1,537 @@
+"""Feed parsing backends for RSS, Atom and RDF documents.
+
+Every backend turns a feed body into the same `Item` list. `stdlib` and
+`lxml` share one incremental loop over an ElementTree-compatible pull parser;
+`feedparser` trades speed for tolerance of malformed feeds and maps its
+normalized entries back onto the same field rules.
+"""
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import io
+import os
+import re
+import threading
+import xml.etree.ElementTree as ET
+from collections.abc import Callable, Iterable, Iterator
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+from digest.models import Item
+
+TAG_RE = re.compile(r"<[^>]+>")
+MAX_CACHED_TAGS = 1024
+# Depth (number of open ancestors) at which each feed kind's entries close;
+# generic feeds accept entries at any depth.
+_ENTRY_DEPTHS = {"rss": 2, "feed": 1, "RDF": 1}
+# Consecutive past-window entries after which a date-ordered feed stops parsing.
+EARLY_STOP_STALE_ENTRIES = 3
+FEED_BACKEND_NAMES = ("stdlib", "lxml", "feedparser")
+
+
+def _strip_html(text: str) -> str:
+    return TAG_RE.sub(" ", text or "").strip()
+
+
+class FeedBackend:
+    name = ""
+
+    def parse(
+        self,
+        feed_url: str,
+        chunks: Iterable[bytes],
+        *,
+        window_start: datetime | None = None,
+        max_bytes: int | None = None,
+    ) -> list[Item]:
+        raise NotImplementedError
+
+
+class _PullParserBackend(FeedBackend):
+    """Incremental parse over an ElementTree-style `XMLPullParser`.
+
+    Each entry is turned into an `Item` as soon as its end tag arrives and is
+    then detached from the tree, so memory tracks the entries kept rather than
+    the feed size. Entries older than `window_start` are dropped; once
+    EARLY_STOP_STALE_ENTRIES of them arrive in a row while the dated entries
+    seen so far are newest-first, the rest of the body is not read at all.
+    """
+
+    def _new_parser(self) -> Any:
+        raise NotImplementedError
+
+    def parse(
+        self,
+        feed_url: str,
+        chunks: Iterable[bytes],
+        *,
+        window_start: datetime | None = None,
+        max_bytes: int | None = None,
+    ) -> list[Item]:
+        window = _WindowFilter(window_start)
+        stack: list[ET.Element] = []
+        root_kind = ""
+        channel: ET.Element | None = None
+        entry_depth: int | None = None
+        items: list[Item] = []
+
+        for events in _pull_events(self._new_parser(), chunks, max_bytes):
+            for event, elem in events:
+                if event == "start":
+                    if not stack:
+                        root_kind = _local_name(elem.tag)
+                        entry_depth = _ENTRY_DEPTHS.get(root_kind)
+                    elif len(stack) == 1 and root_kind == "rss" and elem.tag == "channel" and channel is None:
+                        channel = elem
+                    stack.append(elem)
+                    continue
+                stack.pop()
+                # Cheap depth check first: most end events are entry fields.
+                if entry_depth is not None and len(stack) != entry_depth:
+                    continue
+                build = _entry_builder(root_kind, elem, stack, channel)
+                if build is None:
+                    continue
+                item = build(feed_url, elem)
+                if stack:
+                    stack[-1].remove(elem)
+                if window.accept(item):
+                    items.append(item)
+                if window.done:
+                    return items
+        return items
+
+
+class StdlibFeedBackend(_PullParserBackend):
+    name = "stdlib"
+
+    def _new_parser(self) -> ET.XMLPullParser:
+        return ET.XMLPullParser(events=("start", "end"))
+
+
+class LxmlFeedBackend(_PullParserBackend):
+    """Same loop as `stdlib`, with lxml's C tree builder underneath."""
+
+    name = "lxml"
+
+    def __init__(self) -> None:
+        try:
+            from lxml import etree
+        except ImportError as exc:
+            raise RuntimeError("DIGEST_FEED_PARSER=lxml requires the lxml package") from exc
+        self._etree = etree
+
+    def _new_parser(self) -> Any:
+        # Comments and PIs would otherwise show up as tree nodes with
+        # non-string tags; expat (stdlib) drops them.
+        return self._etree.XMLPullParser(
+            events=("start", "end"),
+            remove_comments=True,
+            remove_pis=True,
+            no_network=True,
+        )
+
+
+class FeedparserFeedBackend(FeedBackend):
+    """Tolerant parsing via feedparser, mapped onto the stdlib field rules.
+
+    feedparser needs the whole body and cannot stop early, but it recovers
+    from malformed XML that the strict parsers reject. Where the stdlib rules
+    take the first matching element in document order (e.g. published vs
+    updated), the entry's key order is used: feedparser inserts keys as it
+    meets the elements.
+    """
+
+    name = "feedparser"
+
+    def __init__(self) -> None:
+        try:
+            import feedparser
+        except ImportError as exc:
+            raise RuntimeError(
+                "DIGEST_FEED_PARSER=feedparser requires the feedparser package"
+            ) from exc
+        self._feedparser = feedparser
+
+    def parse(
+        self,
+        feed_url: str,
+        chunks: Iterable[bytes],
+        *,
+        window_start: datetime | None = None,
+        max_bytes: int | None = None,
+    ) -> list[Item]:
+        body = bytearray()
+        for chunk in chunks:
+            body.extend(chunk)
+            if max_bytes is not None and len(body) > max_bytes:
+                raise ValueError(f"feed body exceeds {max_bytes} bytes")
+        parsed = self._feedparser.parse(
+            io.BytesIO(bytes(body)), sanitize_html=False, resolve_relative_uris=False
+        )
+        if parsed.get("bozo") and not parsed.entries:
+            raise ET.ParseError(str(parsed.get("bozo_exception") or "unparseable feed"))
+        atom = str(parsed.get("version") or "").startswith("atom")
+        window = _WindowFilter(window_start)
+        items: list[Item] = []
+        for entry in parsed.entries:
+            item = _feedparser_entry(feed_url, entry, atom=atom)
+            if window.accept(item):
+                items.append(item)
+            if window.done:
+                break
+        return items
+
+
+def _feedparser_entry(feed_url: str, entry: Any, *, atom: bool) -> Item:
+    if atom:
+        url = _atom_link_from(
+            (str(link.get("rel") or "alternate"), str(link.get("href") or ""))
+            for link in entry.get("links") or []
+        )
+    else:
+        # feedparser falls back to a permalink guid; the strict parsers do not.
+        url = "" if entry.get("guidislink") else str(entry.get("link") or "")
+    description = ""
+    for key in entry.keys():
+        if key == "summary" and str(entry.get("summary") or "").strip():
+            description = str(entry["summary"])
+            break
+        if key == "content" and atom:
+            content = (entry.get("content") or [{}])[0]
+            # Inline XHTML has no text of its own in the tree-based backends.
+            if content.get("type") != "application/xhtml+xml" and str(content.get("value") or "").strip():
+                description = str(content["value"])
+                break
+    published = next(
+        (str(entry[key]) for key in entry.keys() if key in {"published", "updated"} and entry[key]),
+        "",
+    )
+    return _to_item(
+        feed_url,
+        (str(entry.get("title") or "") or "Untitled").strip(),
+        url.strip(),
+        _strip_html(description.strip()),
+        _parse_datetime(published.strip()),
+        str(entry.get("author") or "").strip() or None,
+    )
+
+
+_BACKEND_FACTORIES: dict[str, Callable[[], FeedBackend]] = {
+    "stdlib": StdlibFeedBackend,
+    "lxml": LxmlFeedBackend,
+    "feedparser": FeedparserFeedBackend,
+}
+_BACKENDS: dict[str, FeedBackend] = {}
+_BACKENDS_LOCK = threading.Lock()
+
+
+def available_feed_backends() -> list[str]:
+    """Backends whose dependencies are importable, in preference order."""
+    return [
+        name
+        for name in FEED_BACKEND_NAMES
+        if name == "stdlib" or importlib.util.find_spec(name) is not None
+    ]
+
+
+def get_feed_backend(name: str = "") -> FeedBackend:
+    """Resolve a backend by name, falling back to DIGEST_FEED_PARSER.
+
+    `auto` (the default) is stdlib: on the recorded fixtures lxml's pull
+    parser is no faster once entries are built per element, and feedparser is
+    an order of magnitude slower. Both stay opt-in; `digest bench-feeds`
+    compares them on the host's own feeds.
+    """
+    selected = (name or os.getenv("DIGEST_FEED_PARSER", "auto")).strip().lower()
+    if selected in {"", "auto"}:
+        selected = "stdlib"
+    factory = _BACKEND_FACTORIES.get(selected)
+    if factory is None:
+        raise RuntimeError(f"Unsupported DIGEST_FEED_PARSER '{selected}'")
+    with _BACKENDS_LOCK:
+        backend = _BACKENDS.get(selected)
+        if backend is None:
+            backend = _BACKENDS[selected] = factory()
+        return backend
+
+
+def parse_feed_items(feed_url: str, content: bytes, *, backend: str = "") -> list[Item]:
+    return parse_feed_stream(feed_url, [content], backend=backend)
+
+
+def parse_feed_stream(
+    feed_url: str,
+    chunks: Iterable[bytes],
+    *,
+    window_start: datetime | None = None,
+    max_bytes: int | None = None,
+    backend: str = "",
+) -> list[Item]:
+    """Parse a feed body with the configured backend.
+
+    Entries older than `window_start` are dropped (undated ones are kept,
+    matching the runtime's window filter); bodies over `max_bytes` raise
+    `ValueError`.
+    """
+    return get_feed_backend(backend).parse(
+        feed_url, chunks, window_start=window_start, max_bytes=max_bytes
+    )
+
+
+class _WindowFilter:
+    """Window check shared by all backends.
+
+    `accept()` says whether an entry is inside the window; `done` turns true
+    once EARLY_STOP_STALE_ENTRIES consecutive stale entries arrived while the
+    dated entries so far were newest-first.
+    """
+
+    def __init__(self, window_start: datetime | None) -> None:
+        self._cutoff = _as_utc(window_start) if window_start is not None else None
+        self._newest_first = True
+        self._previous: datetime | None = None
+        self._stale_run = 0
+        self.done = False
+
+    def accept(self, item: Item) -> bool:
+        if self._cutoff is None or item.published_at is None:
+            return True
+        published = _as_utc(item.published_at)
+        if self._previous is not None and published > self._previous:
+            self._newest_first = False
+        self._previous = published
+        if published >= self._cutoff:
+            self._stale_run = 0
+            return True
+        self._stale_run += 1
+        if self._newest_first and self._stale_run >= EARLY_STOP_STALE_ENTRIES:
+            self.done = True
+        return False
+
+
+def _pull_events(
+    parser: Any, chunks: Iterable[bytes], max_bytes: int | None
+) -> Iterator[Iterator[tuple[str, ET.Element]]]:
+    """Feed `chunks` to `parser`, yielding the batch of events each one produced."""
+    received = 0
+    for chunk in chunks:
+        received += len(chunk)
+        if max_bytes is not None and received > max_bytes:
+            raise ValueError(f"feed body exceeds {max_bytes} bytes")
+        parser.feed(chunk)
+        yield parser.read_events()
+    parser.close()
+    yield parser.read_events()
+
+
+def _entry_builder(
+    root_kind: str,
+    elem: ET.Element,
+    stack: list[ET.Element],
+    channel: ET.Element | None,
+) -> Callable[[str, ET.Element], Item] | None:
+    """Return the item builder if `elem` (just closed) is an entry of this feed."""
+    depth = len(stack)
+    if root_kind == "rss":
+        if depth == 2 and elem.tag == "item" and stack[1] is channel:
+            return _rss_entry
+        return None
+    if root_kind == "feed":
+        return _atom_entry if depth == 1 and _local_name(elem.tag) == "entry" else None
+    if root_kind == "RDF":
+        return _rdf_entry if depth == 1 and _local_name(elem.tag) == "item" else None
+    return _generic_entry if _local_name(elem.tag) in {"item", "entry"} else None
+
+
+class _FieldTable:
+    """Tag -> entry-field lookup used to pull every field out of an entry in
+    one walk of its subtree.
+
+    Fields are declared as `field=(local names...)`. A field takes the text of
+    the first element, in document order, whose local name matches and whose
+    stripped text is non-empty. Full tags (namespaced or prefixed) are
+    resolved to fields once and cached, so `_local_name` is not recomputed
+    for every descendant of every entry.
+    """
+
+    def __init__(self, **fields: tuple[str, ...]) -> None:
+        self._by_local: dict[str, tuple[str, ...]] = {}
+        for field_name, names in fields.items():
+            for name in names:
+                self._by_local[name] = self._by_local.get(name, ()) + (field_name,)
+        self._by_tag: dict[str, tuple[str, ...]] = {}
+        self._field_count = len(fields)
+
+    def extract(self, entry: ET.Element) -> dict[str, str]:
+        found: dict[str, str] = {}
+        by_tag = self._by_tag
+        for node in entry.iter():
+            tag = node.tag
+            fields = by_tag.get(tag)
+            if fields is None:
+                fields = self._by_local.get(_local_name(tag), ())
+                if len(by_tag) < MAX_CACHED_TAGS:
+                    by_tag[tag] = fields
+            if not fields or not node.text:
+                continue
+            value = node.text.strip()
+            if not value:
+                continue
+            for field_name in fields:
+                if field_name not in found:
+                    found[field_name] = value
+            if len(found) == self._field_count:
+                break
+        return found
+
+
+_RSS_FIELDS = _FieldTable(
+    title=("title",),
+    link=("link",),
+    description=("description",),
+    published=("pubDate", "date"),
+    author=("author", "creator"),
+)
+_ATOM_FIELDS = _FieldTable(
+    title=("title",),
+    description=("summary", "content", "description"),
+    published=("published", "updated", "pubDate"),
+)
+_RDF_FIELDS = _FieldTable(
+    title=("title",),
+    link=("link",),
+    description=("description",),
+    published=("date", "pubDate", "issued"),
+    author=("creator", "author"),
+)
+_GENERIC_FIELDS = _FieldTable(
+    title=("title",),
+    link=("link",),
+    description=("description", "summary", "content"),
+    published=("pubDate", "published", "updated", "date"),
+    author=("author", "creator", "name"),
+)
+
+
+def _rss_entry(feed_url: str, entry: ET.Element) -> Item:
+    return _fields_to_item(feed_url, _RSS_FIELDS.extract(entry))
+
+
+def _atom_entry(feed_url: str, entry: ET.Element) -> Item:
+    fields = _ATOM_FIELDS.extract(entry)
+    fields["link"] = _atom_link(entry)
+    return _fields_to_item(feed_url, fields, author=_atom_author(entry))
+
+
+def _rdf_entry(feed_url: str, entry: ET.Element) -> Item:
+    return _fields_to_item(feed_url, _RDF_FIELDS.extract(entry))
+
+
+def _generic_entry(feed_url: str, entry: ET.Element) -> Item:
+    fields = _GENERIC_FIELDS.extract(entry)
+    if not fields.get("link"):
+        for child in entry:
+            if _local_name(child.tag) == "link":
+                href = child.attrib.get("href", "").strip()
+                if href:
+                    fields["link"] = href
+                    break
+    return _fields_to_item(feed_url, fields)
+
+
+def _fields_to_item(
+    feed_url: str, fields: dict[str, str], *, author: str | None = None
+) -> Item:
+    return _to_item(
+        feed_url,
+        (fields.get("title") or "Untitled").strip(),
+        (fields.get("link") or "").strip(),
+        _strip_html(fields.get("description") or ""),
+        _parse_datetime(fields.get("published") or ""),
+        author if author is not None else (fields.get("author") or None),
+    )
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+def _atom_link(entry: ET.Element) -> str:
+    return _atom_link_from(
+        (child.attrib.get("rel") or "alternate", child.attrib.get("href") or "")
+        for child in entry
+        if _local_name(child.tag) == "link"
+    )
+
+
+def _atom_link_from(links: Iterable[tuple[str, str]]) -> str:
+    """First rel=alternate href, else the first href at all."""
+    candidate = ""
+    for rel, href in links:
+        href = href.strip()
+        if not href:
+            continue
+        if rel.strip().lower() == "alternate":
+            return href
+        if not candidate:
+            candidate = href
+    return candidate
+
+
+def _atom_author(entry: ET.Element) -> str | None:
+    for child in entry:
+        if _local_name(child.tag) != "author":
+            continue
+        for sub in child:
+            if _local_name(sub.tag) == "name" and sub.text:
+                value = sub.text.strip()
+                if value:
+                    return value
+    return None
+
+
+def _local_name(tag: str) -> str:
+    if "}" in tag:
+        return tag.split("}", 1)[1]
+    if ":" in tag:
+        return tag.split(":", 1)[1]
+    return tag
+
+
+def _parse_datetime(raw: str | None) -> datetime | None:
+    if not raw:
+        return None
+    try:
+        return parsedate_to_datetime(raw)
+    except Exception:
+        try:
+            # Handle common Atom format like 2026-02-21T07:00:00Z
+            return datetime.fromisoformat(raw.replace("Z", "+00:00"))
+        except Exception:
+            return None
+
+
+def _to_item(
+    feed_url: str,
+    title: str,
+    url: str,
+    desc: str,
+    published_at: datetime | None,
+    author: str | None,
+) -> Item:
+    digest = hashlib.sha256((url or title).encode("utf-8")).hexdigest()
+    return Item(
+        id=digest[:16],
+        url=url,
+        title=title,
+        source=feed_url,
+        author=author,
+        published_at=published_at,
+        type="article",
+        raw_text=desc,
+        description=desc,
+        hash=digest,
+    )
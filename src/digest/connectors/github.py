@@ -1,18 +1,65 @@
 from __future__ import annotations
 
 import hashlib
-import json
-import urllib.error
 import urllib.parse
-import urllib.request
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-
-from digest.constants import GITHUB_DEFAULT_PER_PAGE
+from itertools import islice
+from typing import Callable, Generator
+
+from digest.constants import (
+    GITHUB_DEFAULT_PER_PAGE,
+    GITHUB_GRAPHQL_REPOS_PER_QUERY,
+    GITHUB_MAX_PAGES_PER_SELECTOR,
+    GITHUB_ORG_RELEASE_WORKERS,
+    GITHUB_PAGE_SIZE,
+)
+from digest.connectors.github_client import GitHubClient, GitHubRateLimited
 from digest.models import Item, ItemType
 
-API_BASE = "https://api.github.com"
 GitHubItemLink = tuple[str, str, Item]
 
+# Repo fields the org inventory keeps; enough to filter and map repo items.
+_ORG_REPO_FIELDS = (
+    "html_url",
+    "full_name",
+    "description",
+    "stargazers_count",
+    "language",
+    "updated_at",
+    "fork",
+    "archived",
+)
+
+_GRAPHQL_ISSUE_FIELDS = """
+url title body createdAt updatedAt
+comments { totalCount }
+labels(first: 20) { nodes { name } }
+author { login }
+"""
+_GRAPHQL_RELEASES_FRAGMENT = """
+fragment RepoReleases on Repository {
+  releases(first: $perPage, orderBy: {field: CREATED_AT, direction: DESC}) {
+    pageInfo { hasNextPage }
+    nodes { url name tagName description publishedAt }
+  }
+}
+"""
+# Inlined per alias: `filterBy.since` takes a per-repo variable, which a shared
+# fragment cannot. Pull requests have no `since` filter and are cut client-side.
+_GRAPHQL_ISSUES_SELECTION = f"""
+    issues(first: $perPage, states: OPEN, filterBy: {{since: $since}},
+           orderBy: {{field: UPDATED_AT, direction: DESC}}) {{
+      pageInfo {{ hasNextPage }}
+      nodes {{ {_GRAPHQL_ISSUE_FIELDS} }}
+    }}
+    pullRequests(first: $perPage, states: OPEN, orderBy: {{field: UPDATED_AT, direction: DESC}}) {{
+      pageInfo {{ hasNextPage }}
+      nodes {{ {_GRAPHQL_ISSUE_FIELDS} }}
+    }}
+"""
+
 
 def fetch_github_items(
     repos: list[str],
@@ -43,7 +90,20 @@ def fetch_github_items_linked(
     token: str = "",
     timeout: int = 20,
     org_options: dict | None = None,
+    *,
+    client: GitHubClient | None = None,
 ) -> list[GitHubItemLink]:
+    """Fetch every GitHub selector, linked to the selector it came from.
+
+    A selector whose rate limit is exhausted is deferred: its error lands in
+    `client.errors` and the remaining selectors still run.
+
+    Repo releases/issues and issue searches only ask for activity since the
+    newer of the activity window and the client's stored `since` cursor for
+    that scope, following `Link` pages up to `org_options["max_pages"]`.
+    Scopes that hit the page budget are listed in `client.truncated`.
+    """
+    client = client or GitHubClient(token)
     linked_items: list[GitHubItemLink] = []
     org_opts = org_options or {}
     min_stars = max(0, int(org_opts.get("min_stars", 0) or 0))
@@ -51,81 +111,102 @@ def fetch_github_items_linked(
     include_archived = bool(org_opts.get("include_archived", False))
     repo_max_age_days = max(1, int(org_opts.get("repo_max_age_days", 30) or 30))
     activity_max_age_days = max(1, int(org_opts.get("activity_max_age_days", 14) or 14))
+    max_pages = max(
+        1, int(org_opts.get("max_pages", GITHUB_MAX_PAGES_PER_SELECTOR) or GITHUB_MAX_PAGES_PER_SELECTOR)
+    )
 
+    # GraphQL needs a token; anonymous runs keep the per-repo REST calls.
+    activity: dict[str, tuple[list[Item], list[Item]]] = {}
+    if client.token and repos:
+        try:
+            activity = _fetch_repo_activity_graphql(
+                repos,
+                client,
+                timeout,
+                max_age_days=activity_max_age_days,
+                max_pages=max_pages,
+                include_issues=True,
+            )
+        except GitHubRateLimited as exc:
+            client.errors.extend(f"github_repo:{repo}: {exc}" for repo in repos)
+            repos = []
     for repo in repos:
-        linked_items.extend(
-            [
-                ("github_repo", repo, item)
-                for item in _fetch_repo_releases(
+        if client.token:
+            releases, issues = activity.get(repo, ([], []))
+        else:
+            try:
+                releases = _fetch_repo_releases(
                     repo,
-                    token,
+                    client,
                     timeout,
                     max_age_days=activity_max_age_days,
+                    max_pages=max_pages,
                 )
-            ]
-        )
-        linked_items.extend(
-            [
-                ("github_repo", repo, item)
-                for item in _fetch_repo_issues_and_prs(
+                issues = _fetch_repo_issues_and_prs(
                     repo,
-                    token,
+                    client,
                     timeout,
                     max_age_days=activity_max_age_days,
+                    max_pages=max_pages,
                 )
-            ]
-        )
+            except GitHubRateLimited as exc:
+                client.errors.append(f"github_repo:{repo}: {exc}")
+                continue
+        linked_items.extend([("github_repo", repo, item) for item in releases])
+        linked_items.extend([("github_repo", repo, item) for item in issues])
 
     for topic in topics:
-        linked_items.extend(
-            [
-                ("github_topic", topic, item)
-                for item in _search_repos_by_topic(
-                    topic,
-                    token,
-                    timeout,
-                    min_stars=min_stars,
-                    include_forks=include_forks,
-                    include_archived=include_archived,
-                    max_age_days=repo_max_age_days,
-                )
-            ]
-        )
+        try:
+            items = _search_repos_by_topic(
+                topic,
+                client,
+                timeout,
+                min_stars=min_stars,
+                include_forks=include_forks,
+                include_archived=include_archived,
+                max_age_days=repo_max_age_days,
+            )
+        except GitHubRateLimited as exc:
+            client.errors.append(f"github_topic:{topic}: {exc}")
+            continue
+        linked_items.extend([("github_topic", topic, item) for item in items])
 
     for query in queries:
-        linked_items.extend(
-            [
-                ("github_query", query, item)
-                for item in _search_issues_and_prs(
-                    query,
-                    token,
-                    timeout,
-                    max_age_days=activity_max_age_days,
-                )
-            ]
-        )
+        try:
+            items = _search_issues_and_prs(
+                query,
+                client,
+                timeout,
+                max_age_days=activity_max_age_days,
+                max_pages=max_pages,
+            )
+        except GitHubRateLimited as exc:
+            client.errors.append(f"github_query:{query}: {exc}")
+            continue
+        linked_items.extend([("github_query", query, item) for item in items])
 
     for org_raw in orgs or []:
         org = normalize_github_org(org_raw)
         if not org:
             continue
-        linked_items.extend(
-            [
-                ("github_org", org, item)
-                for item in _fetch_org_repo_updates_and_releases(
-                    org=org,
-                    token=token,
-                    timeout=timeout,
-                    min_stars=min_stars,
-                    include_forks=include_forks,
-                    include_archived=include_archived,
-                    max_repos=int(org_opts.get("max_repos_per_org", 20) or 20),
-                    max_items=int(org_opts.get("max_items_per_org", 40) or 40),
-                    repo_max_age_days=repo_max_age_days,
-                    activity_max_age_days=activity_max_age_days,
-                )
-            ]
-        )
+        try:
+            items = _fetch_org_repo_updates_and_releases(
+                org=org,
+                client=client,
+                timeout=timeout,
+                min_stars=min_stars,
+                include_forks=include_forks,
+                include_archived=include_archived,
+                max_repos=int(org_opts.get("max_repos_per_org", 20) or 20),
+                max_items=int(org_opts.get("max_items_per_org", 40) or 40),
+                repo_max_age_days=repo_max_age_days,
+                activity_max_age_days=activity_max_age_days,
+                max_pages=max_pages,
+            )
+        except GitHubRateLimited as exc:
+            client.errors.append(f"github_org:{org}: {exc}")
+            continue
+        linked_items.extend([("github_org", org, item) for item in items])
 
     return linked_items
 
@@ -156,10 +237,42 @@ def _is_recent(value: datetime | None, *, max_age_days: int) -> bool:
     return dt >= cutoff
 
 
+def _activity_since(client: GitHubClient, scope: str, *, max_age_days: int) -> datetime:
+    """Lower bound for a scope: its stored cursor, or else the activity window.
+
+    The window start is floored to the hour so runs within the same hour
+    send the same path; ETag revalidation ignores `since` altogether.
+    """
+    floor = datetime.now(timezone.utc) - timedelta(days=max(1, max_age_days))
+    floor = floor.replace(minute=0, second=0, microsecond=0)
+    mark = client.since(scope)
+    return max(floor, mark) if mark is not None else floor
+
+
+def _is_since(value: datetime | None, since: datetime) -> bool:
+    if value is None:
+        return False
+    dt = value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+    return dt >= since
+
+
+def _is_before(raw: object, since: datetime) -> bool:
+    value = _parse_iso(str(raw or ""))
+    return value is not None and not _is_since(value, since)
+
+
+def _since_param(since: datetime) -> str:
+    return since.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _advance(client: GitHubClient, scope: str, items: list[Item]) -> None:
+    client.advance(scope, max((i.published_at for i in items if i.published_at), default=None))
+
+
 def _fetch_org_repo_updates_and_releases(
     *,
     org: str,
-    token: str,
+    client: GitHubClient,
     timeout: int,
     min_stars: int,
     include_forks: bool,
@@ -168,8 +281,9 @@ def _fetch_org_repo_updates_and_releases(
     max_items: int,
     repo_max_age_days: int,
     activity_max_age_days: int,
+    max_pages: int = GITHUB_MAX_PAGES_PER_SELECTOR,
 ) -> list[Item]:
-    repos = _fetch_org_repos(org, token, timeout, max(1, min(100, max_repos * 2)))
+    repos = _fetch_org_repos(org, client, timeout, max(1, min(100, max_repos * 2)))
     selected = _filter_org_repos(
         repos,
         min_stars=max(0, min_stars),
@@ -177,41 +291,121 @@ def _fetch_org_repo_updates_and_releases(
         include_archived=include_archived,
         max_age_days=max(1, repo_max_age_days),
     )[: max(1, max_repos)]
+    names = [str(repo.get("full_name") or "").strip() for repo in selected]
 
-    out: list[Item] = []
-    for repo in selected:
-        full_name = str(repo.get("full_name") or "").strip()
-        if not full_name:
-            continue
-        repo_item = _map_repo_update_item(repo)
-        if repo_item is not None:
-            out.append(repo_item)
-            if len(out) >= max_items:
-                break
-        for rel in _fetch_repo_releases(
-            full_name,
-            token,
+    if client.token:
+        batched = _fetch_repo_activity_graphql(
+            names,
+            client,
             timeout,
             max_age_days=max(1, activity_max_age_days),
-        ):
-            out.append(rel)
+            max_pages=max_pages,
+            include_issues=False,
+        )
+        releases_by_repo = ((name, batched.get(name, ([], []))[0]) for name in names if name)
+    else:
+        releases_by_repo = _iter_in_order(
+            [name for name in names if name],
+            lambda name: _fetch_repo_releases(
+                name,
+                client,
+                timeout,
+                max_age_days=max(1, activity_max_age_days),
+                max_pages=max_pages,
+            ),
+            max_workers=GITHUB_ORG_RELEASE_WORKERS,
+        )
+    out: list[Item] = []
+    try:
+        for repo, full_name in zip(selected, names):
+            if not full_name:
+                continue
+            repo_item = _map_repo_update_item(repo)
+            if repo_item is not None:
+                out.append(repo_item)
+                if len(out) >= max_items:
+                    break
+            _name, releases = next(releases_by_repo)
+            for rel in releases:
+                out.append(rel)
+                if len(out) >= max_items:
+                    break
             if len(out) >= max_items:
                 break
-        if len(out) >= max_items:
-            break
+    finally:
+        releases_by_repo.close()
     return out
 
 
-def _fetch_org_repos(org: str, token: str, timeout: int, per_page: int) -> list[dict]:
-    path = f"/orgs/{org}/repos?sort=updated&direction=desc&per_page={per_page}"
+def _iter_in_order(
+    keys: list[str], fetch: Callable[[str], list[Item]], *, max_workers: int
+) -> Generator[tuple[str, list[Item]], None, None]:
+    """Yield `(key, fetch(key))` in key order with up to `max_workers` in flight.
+
+    A lookup is only submitted once the consumer has taken the result that
+    frees its slot, so closing the generator early (an org reaching
+    `max_items`) stops further requests; queued lookups are cancelled.
+    """
+    pending: deque[tuple[str, Future[list[Item]]]] = deque()
+    remaining = iter(keys)
+    with ThreadPoolExecutor(
+        max_workers=max(1, max_workers), thread_name_prefix="digest-github"
+    ) as pool:
+        try:
+            for key in islice(remaining, max(1, max_workers)):
+                pending.append((key, pool.submit(fetch, key)))
+            while pending:
+                key, future = pending.popleft()
+                result = future.result()
+                for next_key in islice(remaining, 1):
+                    pending.append((next_key, pool.submit(fetch, next_key)))
+                yield key, result
+        finally:
+            for _key, future in pending:
+                future.cancel()
+
+
+def _fetch_org_repos(org: str, client: GitHubClient, timeout: int, per_page: int) -> list[dict]:
+    """The org's repos, newest update first, via the cached inventory when possible.
+
+    A one-repo probe of the same `sort=updated` listing tells whether anything
+    changed since the stored inventory; only then is the full page re-listed.
+    """
+    query = f"?sort=updated&direction=desc&per_page={per_page}"
+    cached = client.org_inventory(org)
+    if cached is not None and int(cached["per_page"]) >= per_page:
+        listing_path = str(cached["listing_path"])
+        probe = _request_json(
+            f"{listing_path}?sort=updated&direction=desc&per_page=1", client, timeout
+        )
+        if _inventory_head(probe if isinstance(probe, list) else []) == cached["head"]:
+            return list(cached["repos"])[:per_page]
+    listing_path = f"/orgs/{org}/repos"
     try:
-        data = _request_json(path, token, timeout)
+        data = _request_json(listing_path + query, client, timeout)
     except RuntimeError as exc:
         if "HTTPError: 404" not in str(exc):
             raise
-        user_path = f"/users/{org}/repos?sort=updated&direction=desc&per_page={per_page}"
-        data = _request_json(user_path, token, timeout)
-    return data if isinstance(data, list) else []
+        listing_path = f"/users/{org}/repos"
+        data = _request_json(listing_path + query, client, timeout)
+    repos = [
+        _slim_org_repo(repo) for repo in (data if isinstance(data, list) else []) if isinstance(repo, dict)
+    ]
+    client.save_org_inventory(org, listing_path, per_page, _inventory_head(repos), repos)
+    return repos
+
+
+def _inventory_head(repos: list[dict]) -> str:
+    if not repos:
+        return ""
+    return f"{repos[0].get('full_name') or ''}@{repos[0].get('updated_at') or ''}"
+
+
+def _slim_org_repo(repo: dict) -> dict:
+    slim = {key: repo.get(key) for key in _ORG_REPO_FIELDS if key in repo}
+    if isinstance(repo.get("owner"), dict):
+        slim["owner"] = {"login": repo["owner"].get("login")}
+    return slim
 
 
 def _filter_org_repos(
@@ -269,13 +463,30 @@ def _map_repo_update_item(repo: dict) -> Item | None:
 
 def _fetch_repo_releases(
     repo: str,
-    token: str,
+    client: GitHubClient,
     timeout: int,
     *,
     max_age_days: int,
+    max_pages: int = GITHUB_MAX_PAGES_PER_SELECTOR,
 ) -> list[Item]:
-    path = f"/repos/{repo}/releases?per_page={GITHUB_DEFAULT_PER_PAGE}"
-    data = _request_json(path, token, timeout)
+    # The releases listing has no `since` filter: page until the oldest
+    # release on a page predates the cursor.
+    scope = f"releases:{repo}"
+    since = _activity_since(client, scope, max_age_days=max_age_days)
+    releases = _request_pages(
+        f"/repos/{repo}/releases?per_page={GITHUB_PAGE_SIZE}",
+        client,
+        timeout,
+        scope=scope,
+        max_pages=max_pages,
+        stop=lambda rel: _is_before(rel.get("published_at"), since),
+    )
+    items = _map_releases(repo, releases, since=since)
+    _advance(client, scope, items)
+    return items
+
+
+def _map_releases(repo: str, data: object, *, since: datetime) -> list[Item]:
     out: list[Item] = []
     for rel in data if isinstance(data, list) else []:
         url = str(rel.get("html_url", "")).strip()
@@ -284,7 +495,7 @@ def _fetch_repo_releases(
         title = str(rel.get("name") or rel.get("tag_name") or f"Release {repo}")
         raw_text = str(rel.get("body") or "")
         pub = _parse_iso(str(rel.get("published_at") or ""))
-        if not _is_recent(pub, max_age_days=max_age_days):
+        if not _is_since(pub, since):
             continue
         owner = _extract_owner(repo)
         out.append(
@@ -303,13 +514,25 @@ def _fetch_repo_releases(
 
 def _fetch_repo_issues_and_prs(
     repo: str,
-    token: str,
+    client: GitHubClient,
     timeout: int,
     *,
     max_age_days: int,
+    max_pages: int = GITHUB_MAX_PAGES_PER_SELECTOR,
 ) -> list[Item]:
-    path = f"/repos/{repo}/issues?state=open&per_page={GITHUB_DEFAULT_PER_PAGE}"
-    data = _request_json(path, token, timeout)
+    scope = f"issues:{repo}"
+    since = _activity_since(client, scope, max_age_days=max_age_days)
+    path = (
+        f"/repos/{repo}/issues?state=open&sort=updated&direction=desc"
+        f"&per_page={GITHUB_PAGE_SIZE}&since={_since_param(since)}"
+    )
+    issues = _request_pages(path, client, timeout, scope=scope, max_pages=max_pages)
+    items = _map_repo_issues(repo, issues, since=since)
+    _advance(client, scope, items)
+    return items
+
+
+def _map_repo_issues(repo: str, data: object, *, since: datetime) -> list[Item]:
     out: list[Item] = []
     for issue in data if isinstance(data, list) else []:
         url = str(issue.get("html_url", "")).strip()
@@ -320,7 +543,7 @@ def _fetch_repo_issues_and_prs(
         labels = _extract_issue_labels(issue.get("labels"))
         comments = int(issue.get("comments") or 0)
         pub = _parse_iso(str(issue.get("updated_at") or issue.get("created_at") or ""))
-        if not _is_recent(pub, max_age_days=max_age_days):
+        if not _is_since(pub, since):
             continue
         user = issue.get("user") or {}
         author = str(user.get("login") or "") or _extract_owner(repo)
@@ -341,9 +564,144 @@ def _fetch_repo_issues_and_prs(
     return out
 
 
+def _fetch_repo_activity_graphql(
+    repos: list[str],
+    client: GitHubClient,
+    timeout: int,
+    *,
+    max_age_days: int,
+    max_pages: int = GITHUB_MAX_PAGES_PER_SELECTOR,
+    include_issues: bool,
+) -> dict[str, tuple[list[Item], list[Item]]]:
+    """Releases (and optionally open issues/PRs) for many repos per request.
+
+    Repos are batched into aliased GraphQL queries of
+    GITHUB_GRAPHQL_REPOS_PER_QUERY. Nodes are reshaped into the REST payloads
+    so both paths share one mapping; open issues and PRs come from separate
+    connections and are merged by update time, matching the REST `/issues`
+    listing. A connection that still has pages past the repo's cursor falls
+    back to the paginated REST fetcher for that repo rather than truncating.
+    """
+    names = [repo for repo in dict.fromkeys(repos) if repo]
+    activity: dict[str, tuple[list[Item], list[Item]]] = {}
+    for start in range(0, len(names), GITHUB_GRAPHQL_REPOS_PER_QUERY):
+        chunk = names[start : start + GITHUB_GRAPHQL_REPOS_PER_QUERY]
+        variables: dict[str, object] = {"perPage": GITHUB_PAGE_SIZE}
+        params = ["$perPage: Int!"]
+        fields = []
+        release_since: dict[str, datetime] = {}
+        issue_since: dict[str, datetime] = {}
+        for index, repo in enumerate(chunk):
+            owner, _, name = repo.partition("/")
+            variables[f"owner{index}"] = owner
+            variables[f"name{index}"] = name
+            params.append(f"$owner{index}: String!, $name{index}: String!")
+            release_since[repo] = _activity_since(
+                client, f"releases:{repo}", max_age_days=max_age_days
+            )
+            selection = "...RepoReleases"
+            if include_issues:
+                issue_since[repo] = _activity_since(
+                    client, f"issues:{repo}", max_age_days=max_age_days
+                )
+                variables[f"since{index}"] = _since_param(issue_since[repo])
+                params.append(f"$since{index}: DateTime")
+                selection += _GRAPHQL_ISSUES_SELECTION.replace("$since", f"$since{index}")
+            fields.append(
+                f"  r{index}: repository(owner: $owner{index}, name: $name{index}) {{ {selection} }}"
+            )
+        query = (
+            "query(" + ", ".join(params) + ") {\n" + "\n".join(fields) + "\n}\n"
+            + _GRAPHQL_RELEASES_FRAGMENT
+        )
+        data = _request_graphql(query, variables, client, timeout)
+        for index, repo in enumerate(chunk):
+            node = data.get(f"r{index}")
+            if not isinstance(node, dict):
+                raise RuntimeError(f"GitHub GraphQL error: repository {repo} not found")
+            since = release_since[repo]
+            if _graphql_truncated(node.get("releases"), "publishedAt", since):
+                releases = _fetch_repo_releases(
+                    repo, client, timeout, max_age_days=max_age_days, max_pages=max_pages
+                )
+            else:
+                releases = _map_releases(
+                    repo,
+                    [
+                        {
+                            "html_url": rel.get("url"),
+                            "name": rel.get("name"),
+                            "tag_name": rel.get("tagName"),
+                            "body": rel.get("description"),
+                            "published_at": rel.get("publishedAt"),
+                        }
+                        for rel in _graphql_nodes(node.get("releases"))
+                    ],
+                    since=since,
+                )
+                _advance(client, f"releases:{repo}", releases)
+            issues: list[Item] = []
+            if include_issues:
+                since = issue_since[repo]
+                if any(
+                    _graphql_truncated(node.get(key), "updatedAt", since)
+                    for key in ("issues", "pullRequests")
+                ):
+                    issues = _fetch_repo_issues_and_prs(
+                        repo, client, timeout, max_age_days=max_age_days, max_pages=max_pages
+                    )
+                else:
+                    raw_issues = [
+                        _graphql_issue_as_rest(issue, pull_request=False)
+                        for issue in _graphql_nodes(node.get("issues"))
+                    ] + [
+                        _graphql_issue_as_rest(pr, pull_request=True)
+                        for pr in _graphql_nodes(node.get("pullRequests"))
+                    ]
+                    raw_issues.sort(
+                        key=lambda issue: str(issue.get("updated_at") or ""), reverse=True
+                    )
+                    issues = _map_repo_issues(repo, raw_issues, since=since)
+                    _advance(client, f"issues:{repo}", issues)
+            activity[repo] = (releases, issues)
+    return activity
+
+
+def _graphql_truncated(connection: object, date_key: str, since: datetime) -> bool:
+    """True when a connection has more pages and its last node is still in range."""
+    if not isinstance(connection, dict):
+        return False
+    if not (connection.get("pageInfo") or {}).get("hasNextPage"):
+        return False
+    nodes = _graphql_nodes(connection)
+    return bool(nodes) and not _is_before(nodes[-1].get(date_key), since)
+
+
+def _graphql_nodes(connection: object) -> list[dict]:
+    if not isinstance(connection, dict):
+        return []
+    return [node for node in connection.get("nodes") or [] if isinstance(node, dict)]
+
+
+def _graphql_issue_as_rest(node: dict, *, pull_request: bool) -> dict:
+    issue = {
+        "html_url": node.get("url"),
+        "title": node.get("title"),
+        "body": node.get("body"),
+        "labels": [{"name": label.get("name")} for label in _graphql_nodes(node.get("labels"))],
+        "comments": (node.get("comments") or {}).get("totalCount") or 0,
+        "created_at": node.get("createdAt"),
+        "updated_at": node.get("updatedAt"),
+        "user": {"login": (node.get("author") or {}).get("login") or ""},
+    }
+    if pull_request:
+        issue["pull_request"] = {"url": node.get("url")}
+    return issue
+
+
 def _search_repos_by_topic(
     topic: str,
-    token: str,
+    client: GitHubClient,
     timeout: int,
     *,
     min_stars: int,
@@ -353,7 +711,7 @@ def _search_repos_by_topic(
 ) -> list[Item]:
     q = urllib.parse.quote_plus(f"topic:{topic}")
     path = f"/search/repositories?q={q}&sort=updated&order=desc&per_page={GITHUB_DEFAULT_PER_PAGE}"
-    data = _request_json(path, token, timeout)
+    data = _request_json(path, client, timeout)
     out: list[Item] = []
     for repo in data.get("items", []) if isinstance(data, dict) else []:
         url = str(repo.get("html_url", "")).strip()
@@ -391,20 +749,25 @@ def _search_repos_by_topic(
 
 def _search_issues_and_prs(
     query: str,
-    token: str,
+    client: GitHubClient,
     timeout: int,
     *,
     max_age_days: int,
+    max_pages: int = GITHUB_MAX_PAGES_PER_SELECTOR,
 ) -> list[Item]:
+    scope = f"search_issues:{query}"
+    since = _activity_since(client, scope, max_age_days=max_age_days)
     # GitHub's issue search now rejects queries without a type qualifier
     # (422: "Query must include 'is:issue' or 'is:pull-request'").
     if "is:issue" not in query and "is:pull-request" not in query:
         query = f"{query} is:issue"
-    q = urllib.parse.quote_plus(query)
-    path = f"/search/issues?q={q}&sort=updated&order=desc&per_page={GITHUB_DEFAULT_PER_PAGE}"
-    data = _request_json(path, token, timeout)
+    q = urllib.parse.quote_plus(f"{query} updated:>={_since_param(since)}")
+    path = f"/search/issues?q={q}&sort=updated&order=desc&per_page={GITHUB_PAGE_SIZE}"
+    issues = _request_pages(
+        path, client, timeout, scope=scope, max_pages=max_pages, items_key="items"
+    )
     out: list[Item] = []
-    for issue in data.get("items", []) if isinstance(data, dict) else []:
+    for issue in issues:
         url = str(issue.get("html_url", "")).strip()
         if not url:
             continue
@@ -413,7 +776,7 @@ def _search_issues_and_prs(
         labels = _extract_issue_labels(issue.get("labels"))
         comments = int(issue.get("comments") or 0)
         pub = _parse_iso(str(issue.get("updated_at") or issue.get("created_at") or ""))
-        if not _is_recent(pub, max_age_days=max_age_days):
+        if not _is_since(pub, since):
             continue
         repo_url = str(issue.get("repository_url") or "")
         repo = repo_url.split("/repos/")[-1] if "/repos/" in repo_url else "search"
@@ -435,6 +798,7 @@ def _search_issues_and_prs(
                 raw_text=_compose_issue_raw_text(body, labels, comments),
             )
         )
+    _advance(client, scope, out)
     return out
 
 
@@ -460,22 +824,44 @@ def _compose_issue_raw_text(body: str, labels: list[str], comments: int) -> str:
     return " | ".join([d for d in details if d])
 
 
-def _request_json(path: str, token: str, timeout: int) -> dict | list:
-    req = urllib.request.Request(
-        API_BASE + path,
-        headers={
-            "User-Agent": "ai-digest/1.0",
-            "Accept": "application/vnd.github+json",
-            **({"Authorization": f"Bearer {token}"} if token else {}),
-        },
-    )
-    try:
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            return json.loads(resp.read().decode("utf-8"))
-    except urllib.error.HTTPError as exc:
-        raise RuntimeError(f"GitHub API HTTPError: {exc.code} ({path})") from exc
-    except urllib.error.URLError as exc:
-        raise RuntimeError(f"GitHub API connection error ({path})") from exc
+def _request_json(path: str, client: GitHubClient, timeout: int) -> dict | list:
+    return client.get_json(path, timeout)
+
+
+def _request_pages(
+    path: str,
+    client: GitHubClient,
+    timeout: int,
+    *,
+    scope: str,
+    max_pages: int,
+    items_key: str = "",
+    stop: Callable[[dict], bool] | None = None,
+) -> list[dict]:
+    """Records from `path` and its `Link: rel="next"` pages.
+
+    Stops when there is no next page, when `stop` holds for the last record
+    of a page, or after `max_pages`; a budget stop with pages left is
+    recorded in `client.truncated` instead of passing silently.
+    """
+    records: list[dict] = []
+    for _page in range(max(1, max_pages)):
+        data = _request_json(path, client, timeout)
+        page = data.get(items_key) if items_key and isinstance(data, dict) else data
+        batch = [r for r in page if isinstance(r, dict)] if isinstance(page, list) else []
+        records.extend(batch)
+        next_path = client.next_page(path)
+        if not next_path or (stop is not None and batch and stop(batch[-1])):
+            return records
+        path = next_path
+    client.truncated.append(scope)
+    return records
+
+
+def _request_graphql(
+    query: str, variables: dict[str, object], client: GitHubClient, timeout: int
+) -> dict:
+    return client.graphql(query, variables, timeout)
 
 
 def _make_item(
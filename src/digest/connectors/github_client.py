@@ -0,0 +1,344 @@
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+import urllib.error
+from dataclasses import dataclass
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from http.client import HTTPMessage
+from typing import Any, Callable
+
+from digest.constants import (
+    GITHUB_RATE_LIMIT_BURST,
+    GITHUB_RATE_LIMIT_MAX_WAIT_SECONDS,
+    GITHUB_RATE_LIMIT_RESERVE,
+)
+from digest.net.engine import HttpRequest, cached_response, send
+from digest.net.http_cache import cache_ttl
+from digest.storage.sqlite_store import SQLiteStore
+
+API_BASE = "https://api.github.com"
+_NEXT_LINK_RE = re.compile(r'<([^>]+)>\s*;\s*rel="next"')
+
+
+class GitHubRateLimited(RuntimeError):
+    """A quota is exhausted for longer than the client is willing to wait."""
+
+    def __init__(self, resource: str, reset_at: float) -> None:
+        wait_s = max(0, int(reset_at - time.time()))
+        super().__init__(f"GitHub {resource} rate limit exhausted (resets in {wait_s}s)")
+        self.resource = resource
+        self.reset_at = reset_at
+
+
+@dataclass(slots=True)
+class RateLimitState:
+    limit: int = 0
+    remaining: int | None = None
+    reset_at: float = 0.0
+    requests: int = 0
+    not_modified: int = 0
+    # Answered by the on-disk HTTP cache without a request or a quota token.
+    cached: int = 0
+    waited_s: float = 0.0
+    # Token bucket: requests may burst up to `capacity`, then refill at the
+    # rate that spreads the remaining quota over the time left until reset.
+    tokens: float = float(GITHUB_RATE_LIMIT_BURST)
+    refill_per_s: float = 0.0
+    refilled_at: float = 0.0
+
+
+class GitHubClient:
+    """GitHub REST/GraphQL access with quota tracking and ETag revalidation.
+
+    Quotas are tracked per rate-limit resource (`core`, `search`, `graphql`)
+    from the `X-RateLimit-*` headers. Once a resource's remaining quota is
+    known, requests are paced by a token bucket so a run cannot burn through
+    it; when only the reserve is left the client sleeps until the reset if
+    that is within GITHUB_RATE_LIMIT_MAX_WAIT_SECONDS and otherwise raises
+    `GitHubRateLimited`, which callers treat as a per-selector deferral.
+    403/429 responses honour `Retry-After` the same way.
+
+    With a store, REST GETs send the ETag of the last 200 for the same path
+    and a 304 (which GitHub does not count against the quota) replays the
+    stored body. ETags are keyed on the path without its `since` bound: that
+    bound moves every run, and an ETag covers only the body, so a 304 still
+    means the stored body is current. The store also holds per-scope `since` cursors: `since()`
+    reads them when the client is `incremental`, `advance()` buffers newer
+    marks and `flush_cursors()` persists them once the run has delivered. Org
+    repo listings are kept there too (`org_inventory()`).
+    Safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        token: str = "",
+        *,
+        store: SQLiteStore | None = None,
+        incremental: bool = False,
+        max_wait_seconds: float = GITHUB_RATE_LIMIT_MAX_WAIT_SECONDS,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.token = token
+        self.incremental = incremental
+        self._store = store
+        self._max_wait_seconds = max_wait_seconds
+        self._sleep = sleep
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._limits: dict[str, RateLimitState] = {}
+        self._next_paths: dict[str, str] = {}
+        self._pending_cursors: dict[str, datetime] = {}
+        self.errors: list[str] = []
+        # Scopes whose pagination stopped at the page budget with pages left.
+        self.truncated: list[str] = []
+
+    def get_json(self, path: str, timeout: int) -> dict | list:
+        resource = "search" if path.startswith("/search/") else "core"
+        etag_key = _etag_key(path)
+        cached = self._store.get_github_etag(etag_key) if self._store is not None else None
+        headers = self._headers()
+        if cached is not None:
+            headers["If-None-Match"] = str(cached["etag"])
+        request = HttpRequest(
+            url=API_BASE + path, headers=headers, timeout=timeout, cache_ttl=cache_ttl("github")
+        )
+        try:
+            response = self._send(resource, request)
+        except urllib.error.HTTPError as exc:
+            if exc.code == 304 and cached is not None:
+                with self._lock:
+                    self._state(resource).not_modified += 1
+                    if cached["next_path"]:
+                        self._next_paths[path] = _with_since(str(cached["next_path"]), path)
+                self._store.touch_github_etag(etag_key)
+                return json.loads(str(cached["body_json"]))
+            raise RuntimeError(f"GitHub API HTTPError: {exc.code} ({path})") from exc
+        except urllib.error.URLError as exc:
+            raise RuntimeError(f"GitHub API connection error ({path})") from exc
+        data = response.json()
+        next_path = _next_path(response.headers.get("Link") or "")
+        if next_path:
+            with self._lock:
+                self._next_paths[path] = next_path
+        etag = response.headers.get("ETag")
+        if etag and self._store is not None and not response.from_cache:
+            self._store.upsert_github_etag(
+                etag_key,
+                etag,
+                json.dumps(data, ensure_ascii=True),
+                next_path=_etag_key(next_path) if next_path else "",
+            )
+        return data
+
+    def next_page(self, path: str) -> str | None:
+        """`rel="next"` path from the last `get_json(path)` response, if any."""
+        with self._lock:
+            return self._next_paths.pop(path, None)
+
+    def since(self, scope: str) -> datetime | None:
+        if not self.incremental or self._store is None:
+            return None
+        return self._store.get_github_cursor(scope)
+
+    def advance(self, scope: str, value: datetime | None) -> None:
+        if value is None:
+            return
+        with self._lock:
+            current = self._pending_cursors.get(scope)
+            if current is None or value > current:
+                self._pending_cursors[scope] = value
+
+    def flush_cursors(self) -> None:
+        with self._lock:
+            rows = dict(self._pending_cursors)
+            self._pending_cursors.clear()
+        if self._store is not None:
+            self._store.upsert_github_cursors(rows)
+
+    def org_inventory(self, org: str) -> dict[str, object] | None:
+        return self._store.get_github_org_inventory(org) if self._store is not None else None
+
+    def save_org_inventory(
+        self, org: str, listing_path: str, per_page: int, head: str, repos: list[dict]
+    ) -> None:
+        if self._store is not None:
+            self._store.upsert_github_org_inventory(org, listing_path, per_page, head, repos)
+
+    def graphql(self, query: str, variables: dict[str, object], timeout: int) -> dict:
+        request = HttpRequest(
+            url=API_BASE + "/graphql",
+            method="POST",
+            headers={**self._headers(), "Content-Type": "application/json"},
+            data=json.dumps({"query": query, "variables": variables}).encode("utf-8"),
+            timeout=timeout,
+        )
+        try:
+            payload = self._send("graphql", request).json()
+        except urllib.error.HTTPError as exc:
+            raise RuntimeError(f"GitHub GraphQL HTTPError: {exc.code}") from exc
+        except urllib.error.URLError as exc:
+            raise RuntimeError("GitHub GraphQL connection error") from exc
+        data = payload.get("data") if isinstance(payload, dict) else None
+        errors = payload.get("errors") if isinstance(payload, dict) else None
+        if any(str(err.get("type") or "") == "RATE_LIMITED" for err in errors or []):
+            with self._lock:
+                reset_at = self._state("graphql").reset_at
+            raise GitHubRateLimited("graphql", reset_at)
+        if not isinstance(data, dict):
+            message = errors[0].get("message") if errors else "empty response"
+            raise RuntimeError(f"GitHub GraphQL error: {message}")
+        return data
+
+    def usage(self) -> dict[str, dict[str, Any]]:
+        """Per-resource quota snapshot for the run context."""
+        with self._lock:
+            return {
+                resource: {
+                    "requests": state.requests,
+                    "not_modified": state.not_modified,
+                    "cached": state.cached,
+                    "remaining": state.remaining,
+                    "limit": state.limit,
+                    "reset_at": int(state.reset_at) if state.reset_at else None,
+                    "waited_s": round(state.waited_s, 2),
+                }
+                for resource, state in sorted(self._limits.items())
+            }
+
+    def _headers(self) -> dict[str, str]:
+        return {
+            "User-Agent": "ai-digest/1.0",
+            "Accept": "application/vnd.github+json",
+            **({"Authorization": f"Bearer {self.token}"} if self.token else {}),
+        }
+
+    def _send(self, resource: str, request: HttpRequest):
+        cached = cached_response(request)
+        if cached is not None:
+            with self._lock:
+                self._state(resource).cached += 1
+            return cached
+        for attempt in range(2):
+            self._acquire(resource)
+            try:
+                response = send(request)
+            except urllib.error.HTTPError as exc:
+                self._observe(resource, exc.headers)
+                if exc.code not in {403, 429}:
+                    raise
+                wait = self._limited_wait(resource, exc.headers)
+                if wait is None:
+                    raise
+                if attempt or wait > self._max_wait_seconds:
+                    raise GitHubRateLimited(resource, self._clock() + wait) from exc
+                self._wait(resource, wait)
+                continue
+            self._observe(resource, response.headers)
+            return response
+        raise AssertionError("unreachable")
+
+    def _acquire(self, resource: str) -> None:
+        with self._lock:
+            state = self._state(resource)
+            now = self._clock()
+            wait = 0.0
+            reserve = GITHUB_RATE_LIMIT_RESERVE.get(resource, 0)
+            if state.remaining is not None and state.remaining <= reserve and state.reset_at > now:
+                wait = state.reset_at - now
+                if wait > self._max_wait_seconds:
+                    raise GitHubRateLimited(resource, state.reset_at)
+            elif state.refill_per_s > 0:
+                state.tokens = min(
+                    float(GITHUB_RATE_LIMIT_BURST),
+                    state.tokens + (now - state.refilled_at) * state.refill_per_s,
+                )
+                state.refilled_at = now
+                if state.tokens < 1:
+                    wait = (1 - state.tokens) / state.refill_per_s
+                state.tokens -= 1
+            state.requests += 1
+        if wait > 0:
+            self._wait(resource, wait)
+
+    def _wait(self, resource: str, seconds: float) -> None:
+        with self._lock:
+            self._state(resource).waited_s += seconds
+        self._sleep(seconds)
+
+    def _observe(self, resource: str, headers: HTTPMessage | None) -> None:
+        if headers is None:
+            return
+        remaining = _header_int(headers, "X-RateLimit-Remaining")
+        if remaining is None:
+            return
+        resource = (headers.get("X-RateLimit-Resource") or resource).strip() or resource
+        with self._lock:
+            state = self._state(resource)
+            state.remaining = remaining
+            state.limit = _header_int(headers, "X-RateLimit-Limit") or state.limit
+            state.reset_at = float(_header_int(headers, "X-RateLimit-Reset") or state.reset_at)
+            now = self._clock()
+            spendable = max(0, remaining - GITHUB_RATE_LIMIT_RESERVE.get(resource, 0))
+            state.refill_per_s = max(spendable, 1) / max(state.reset_at - now, 1.0)
+            if not state.refilled_at:
+                state.refilled_at = now
+
+    def _limited_wait(self, resource: str, headers: HTTPMessage | None) -> float | None:
+        """Seconds until a 403/429 may be retried, or None if it is not a limit."""
+        if headers is None:
+            return None
+        retry_after = (headers.get("Retry-After") or "").strip()
+        if retry_after:
+            if retry_after.isdigit():
+                return float(retry_after)
+            try:
+                return max(0.0, parsedate_to_datetime(retry_after).timestamp() - self._clock())
+            except (TypeError, ValueError):
+                return None
+        if _header_int(headers, "X-RateLimit-Remaining") == 0:
+            with self._lock:
+                reset_at = self._state(resource).reset_at
+            return max(0.0, reset_at - self._clock())
+        return None
+
+    def _state(self, resource: str) -> RateLimitState:
+        state = self._limits.get(resource)
+        if state is None:
+            state = self._limits[resource] = RateLimitState()
+        return state
+
+
+def _next_path(link_header: str) -> str:
+    match = _NEXT_LINK_RE.search(link_header)
+    if match is None or not match.group(1).startswith(API_BASE):
+        return ""
+    return match.group(1)[len(API_BASE) :]
+
+
+def _etag_key(path: str) -> str:
+    """`path` without its `since` query parameter."""
+    base, _, query = path.partition("?")
+    params = [param for param in query.split("&") if param and not param.startswith("since=")]
+    return f"{base}?{'&'.join(params)}" if params else base
+
+
+def _with_since(path: str, source: str) -> str:
+    """`path` carrying the `since` parameter of `source`, if it has one."""
+    since = next(
+        (p for p in source.partition("?")[2].split("&") if p.startswith("since=")), ""
+    )
+    if not since:
+        return path
+    return f"{path}{'&' if '?' in path else '?'}{since}"
+
+
+def _header_int(headers: HTTPMessage, name: str) -> int | None:
+    try:
+        return int(str(headers.get(name) or "").strip())
+    except ValueError:
+        return None
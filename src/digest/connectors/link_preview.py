@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from html.parser import HTMLParser
 import re
 from urllib.parse import urljoin, urlparse
-import urllib.request
+
+from digest.net.engine import HttpRequest
+from digest.net.html_head import HeadSniffer, sniff_html_head
+from digest.net.http_cache import cache_ttl
 
 
 DEFAULT_PREVIEW_TIMEOUT_SECONDS = 4
@@ -12,47 +14,6 @@ PREVIEW_USER_AGENT = "ai-digest/1.0 (+https://example.local)"
 WHITESPACE_RE = re.compile(r"\s+")
 
 
-class _PreviewParser(HTMLParser):
-    def __init__(self) -> None:
-        super().__init__()
-        self.in_title = False
-        self.title_parts: list[str] = []
-        self.meta: dict[str, str] = {}
-
-    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
-        lowered = tag.lower()
-        if lowered == "title":
-            self.in_title = True
-            return
-        if lowered != "meta":
-            return
-        attr_map = {str(key).lower(): str(value or "") for key, value in attrs}
-        key = (attr_map.get("property") or attr_map.get("name") or "").strip().lower()
-        content = (attr_map.get("content") or "").strip()
-        if key and content and key not in self.meta:
-            self.meta[key] = content
-
-    def handle_endtag(self, tag: str) -> None:
-        if tag.lower() == "title":
-            self.in_title = False
-
-    def handle_data(self, data: str) -> None:
-        if self.in_title and data:
-            self.title_parts.append(data)
-
-    def pick(self, *keys: str) -> str:
-        for key in keys:
-            value = (self.meta.get(key.lower()) or "").strip()
-            if value:
-                return value
-        return ""
-
-    @property
-    def title(self) -> str:
-        joined = " ".join(self.title_parts)
-        return WHITESPACE_RE.sub(" ", joined).strip()
-
-
 def _clean_text(value: str) -> str:
     return WHITESPACE_RE.sub(" ", (value or "").strip())
 
@@ -62,6 +23,11 @@ def _host_label(url: str) -> str:
     return parsed.netloc.lower().replace("www.", "")
 
 
+def _has_preview_fields(head: HeadSniffer) -> bool:
+    """The card is complete once the open-graph trio is known."""
+    return all(head.meta.get(key) for key in ("og:title", "og:description", "og:image"))
+
+
 def fetch_link_preview_metadata(
     url: str,
     *,
@@ -71,23 +37,22 @@ def fetch_link_preview_metadata(
     if parsed.scheme not in {"http", "https"} or not parsed.netloc:
         raise ValueError("preview URL must be a valid http/https URL")
 
-    request = urllib.request.Request(
-        url,
-        headers={
-            "User-Agent": PREVIEW_USER_AGENT,
-            "Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.8",
-        },
+    page = sniff_html_head(
+        HttpRequest(
+            url=url,
+            headers={
+                "User-Agent": PREVIEW_USER_AGENT,
+                "Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.8",
+            },
+            timeout=timeout,
+            cache_ttl=cache_ttl("link_preview"),
+        ),
+        max_bytes=MAX_PREVIEW_BYTES,
+        stop=_has_preview_fields,
+        require_html=True,
     )
-    with urllib.request.urlopen(request, timeout=timeout) as response:
-        final_url = str(response.geturl() or url)
-        content_type = str(response.headers.get("Content-Type", "") or "").lower()
-        body = response.read(MAX_PREVIEW_BYTES)
-
-    if content_type and "html" not in content_type:
-        raise RuntimeError(f"unsupported preview content type: {content_type}")
-
-    parser = _PreviewParser()
-    parser.feed(body.decode("utf-8", errors="ignore"))
+    final_url = page.url
+    parser = page.head
 
     title = _clean_text(parser.pick("og:title", "twitter:title") or parser.title)
     description = _clean_text(
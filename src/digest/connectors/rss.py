@@ -1,222 +1,215 @@
 from __future__ import annotations
 
-import hashlib
-import re
-import socket
-import time
 import urllib.error
-import urllib.request
-import xml.etree.ElementTree as ET
+from dataclasses import dataclass
 from datetime import datetime
-from email.utils import parsedate_to_datetime
+from typing import Protocol
 
+from digest.connectors.feed_parsers import parse_feed_stream
 from digest.models import Item
+from digest.net.engine import HttpRequest, RetryPolicy, open_stream, send_many
+from digest.net.http_cache import cache_ttl
 
-TAG_RE = re.compile(r"<[^>]+>")
-ATOM_NS = "{http://www.w3.org/2005/Atom}"
 DEFAULT_RSS_TIMEOUT = 20
+DEFAULT_RSS_RETRIES = 2
 DEFAULT_RSS_RETRY_BACKOFF_SECONDS = 1.0
+MAX_FEED_BYTES = 16 * 1024 * 1024
 
 
-def _strip_html(text: str) -> str:
-    return TAG_RE.sub(" ", text or "").strip()
+@dataclass(slots=True)
+class FeedResponse:
+    content: bytes
+    etag: str = ""
+    last_modified: str = ""
+    not_modified: bool = False
+    # Body bytes received; `content` stays empty when the body was streamed.
+    content_length: int = 0
 
 
-def fetch_rss_items(
-    feed_urls: list[str], timeout: int = DEFAULT_RSS_TIMEOUT, retries: int = 2
-) -> list[Item]:
-    items: list[Item] = []
-    for feed_url in feed_urls:
-        content = _fetch_with_retry(feed_url, timeout=timeout, retries=retries)
-        items.extend(parse_feed_items(feed_url, content))
-    return items
+class FeedValidators(Protocol):
+    """Conditional-GET state `fetch_rss_items` consults for each feed URL.
 
+    The runtime injects `digest.runtime_support.FeedValidatorCache`, which
+    keeps validators and replayable item ids in storage.
+    """
 
-def _fetch_with_retry(feed_url: str, timeout: int, retries: int) -> bytes:
-    last_err: Exception | None = None
-    for attempt in range(retries + 1):
-        req = urllib.request.Request(
-            feed_url,
-            headers={
-                "User-Agent": "Mozilla/5.0 (compatible; ai-digest/1.0; +https://example.local)",
-                "Accept": "application/rss+xml, application/atom+xml, application/rdf+xml, application/xml, text/xml;q=0.9, */*;q=0.8",
-            },
-        )
-        try:
-            with urllib.request.urlopen(req, timeout=timeout) as resp:
-                return resp.read()
-        except urllib.error.HTTPError as exc:
-            # Retry only for transient server-side failures.
-            if exc.code not in {429, 500, 502, 503, 504}:
-                raise
-            last_err = exc
-        except urllib.error.URLError as exc:
-            last_err = exc
-        except TimeoutError as exc:
-            last_err = exc
-        except socket.timeout as exc:
-            last_err = exc
-        if attempt < retries:
-            time.sleep(DEFAULT_RSS_RETRY_BACKOFF_SECONDS * (attempt + 1))
-    if last_err is not None:
-        raise last_err
-    raise RuntimeError(f"Failed to fetch feed: {feed_url}")
-
-
-def parse_feed_items(feed_url: str, content: bytes) -> list[Item]:
-    root = ET.fromstring(content)
-    root_name = _local_name(root.tag)
-    if root_name == "rss":
-        return _parse_rss_channel(feed_url, root)
-    if root_name == "feed":
-        return _parse_atom_feed(feed_url, root)
-    if root_name == "RDF":
-        return _parse_rdf_feed(feed_url, root)
-    return _parse_generic_feed(feed_url, root)
-
-
-def _parse_rss_channel(feed_url: str, root: ET.Element) -> list[Item]:
-    channel = root.find("channel")
-    if channel is None:
-        return []
-    items: list[Item] = []
-    for entry in channel.findall("item"):
-        title = (_first_text(entry, ["title"]) or "Untitled").strip()
-        url = (_first_text(entry, ["link"]) or "").strip()
-        desc = _strip_html(_first_text(entry, ["description"]) or "")
-        pub = _first_text(entry, ["pubDate", "date"]) or ""
-        published_at = _parse_datetime(pub)
-        author = _first_text(entry, ["author", "creator"]) or None
-        items.append(_to_item(feed_url, title, url, desc, published_at, author))
-    return items
-
+    def lookup(self, feed_url: str) -> dict[str, object] | None: ...
 
-def _parse_atom_feed(feed_url: str, root: ET.Element) -> list[Item]:
-    items: list[Item] = []
-    entries = [e for e in root if _local_name(e.tag) == "entry"]
-    for entry in entries:
-        title = (_first_text(entry, ["title"]) or "Untitled").strip()
-        url = _atom_link(entry)
-        summary = _strip_html(_first_text(entry, ["summary", "content", "description"]) or "")
-        pub = _first_text(entry, ["published", "updated", "pubDate"]) or ""
-        published_at = _parse_datetime(pub)
-        author = _atom_author(entry)
-        items.append(_to_item(feed_url, title, url, summary, published_at, author))
-    return items
+    def replay(self, feed_url: str, validator: dict[str, object]) -> list[Item] | None: ...
 
-
-def _parse_rdf_feed(feed_url: str, root: ET.Element) -> list[Item]:
-    items: list[Item] = []
-    entries = [e for e in root if _local_name(e.tag) == "item"]
-    for entry in entries:
-        title = (_first_text(entry, ["title"]) or "Untitled").strip()
-        url = (_first_text(entry, ["link"]) or "").strip()
-        desc = _strip_html(_first_text(entry, ["description"]) or "")
-        pub = _first_text(entry, ["date", "pubDate", "issued"]) or ""
-        published_at = _parse_datetime(pub)
-        author = _first_text(entry, ["creator", "author"]) or None
-        items.append(_to_item(feed_url, title, url, desc, published_at, author))
-    return items
+    def remember(self, feed_url: str, response: FeedResponse, items: list[Item]) -> None: ...
 
 
-def _parse_generic_feed(feed_url: str, root: ET.Element) -> list[Item]:
+def fetch_rss_items(
+    feed_urls: list[str],
+    timeout: int = DEFAULT_RSS_TIMEOUT,
+    retries: int = DEFAULT_RSS_RETRIES,
+    *,
+    validators: FeedValidators | None = None,
+    window_start: datetime | None = None,
+) -> list[Item]:
+    """Fetch and parse feeds, dropping entries published before `window_start`.
+
+    A single feed is streamed straight into the incremental parser; several
+    feeds fan out through one engine batch and are parsed from the buffered
+    bodies.
+    """
+    lookups = [
+        validators.lookup(feed_url) if validators is not None else None for feed_url in feed_urls
+    ]
+    targets = [
+        (
+            feed_url,
+            str(validator.get("etag") or "") if validator else "",
+            str(validator.get("last_modified") or "") if validator else "",
+        )
+        for feed_url, validator in zip(feed_urls, lookups)
+    ]
+    if len(targets) == 1:
+        try:
+            results: list[tuple[FeedResponse, list[Item]] | Exception] = [
+                _stream_feed(*targets[0], timeout=timeout, retries=retries, window_start=window_start)
+            ]
+        except Exception as exc:
+            results = [exc]
+    else:
+        results = [
+            _parse_buffered(feed_url, response, window_start)
+            for (feed_url, _, _), response in zip(
+                targets, _fetch_feeds(targets, timeout=timeout, retries=retries)
+            )
+        ]
     items: list[Item] = []
-    for entry in root.iter():
-        if _local_name(entry.tag) not in {"item", "entry"}:
-            continue
-        title = (_first_text(entry, ["title"]) or "Untitled").strip()
-        url = (_first_text(entry, ["link"]) or "").strip()
-        if not url:
-            for child in entry:
-                if _local_name(child.tag) == "link":
-                    href = child.attrib.get("href", "").strip()
-                    if href:
-                        url = href
-                        break
-        desc = _strip_html(_first_text(entry, ["description", "summary", "content"]) or "")
-        pub = _first_text(entry, ["pubDate", "published", "updated", "date"]) or ""
-        published_at = _parse_datetime(pub)
-        author = _first_text(entry, ["author", "creator", "name"]) or None
-        items.append(_to_item(feed_url, title, url, desc, published_at, author))
+    for feed_url, validator, result in zip(feed_urls, lookups, results):
+        if isinstance(result, Exception):
+            raise result
+        response, parsed = result
+        if validators is not None and validator is not None and response.not_modified:
+            replayed = validators.replay(feed_url, validator)
+            if replayed is not None:
+                items.extend(replayed)
+                continue
+            # Previous items are gone from the store; fall back to a full GET.
+            response, parsed = _stream_feed(
+                feed_url, "", "", timeout=timeout, retries=retries, window_start=window_start
+            )
+        if validators is not None:
+            validators.remember(feed_url, response, parsed)
+        items.extend(parsed)
     return items
 
 
-def _first_text(node: ET.Element, names: list[str]) -> str | None:
-    for child in node.iter():
-        if _local_name(child.tag) in names and child.text:
-            value = child.text.strip()
-            if value:
-                return value
-    return None
-
-
-def _atom_link(entry: ET.Element) -> str:
-    candidate = ""
-    for child in entry:
-        if _local_name(child.tag) != "link":
-            continue
-        href = (child.attrib.get("href") or "").strip()
-        rel = (child.attrib.get("rel") or "alternate").strip().lower()
-        if not href:
-            continue
-        if rel == "alternate":
-            return href
-        if not candidate:
-            candidate = href
-    return candidate
-
-
-def _atom_author(entry: ET.Element) -> str | None:
-    for child in entry:
-        if _local_name(child.tag) != "author":
-            continue
-        for sub in child:
-            if _local_name(sub.tag) == "name" and sub.text:
-                value = sub.text.strip()
-                if value:
-                    return value
-    return None
-
-
-def _local_name(tag: str) -> str:
-    if "}" in tag:
-        return tag.split("}", 1)[1]
-    if ":" in tag:
-        return tag.split(":", 1)[1]
-    return tag
-
-
-def _parse_datetime(raw: str | None) -> datetime | None:
-    if not raw:
-        return None
+def _stream_feed(
+    feed_url: str,
+    etag: str,
+    last_modified: str,
+    *,
+    timeout: int,
+    retries: int,
+    window_start: datetime | None,
+) -> tuple[FeedResponse, list[Item]]:
+    request = HttpRequest(
+        url=feed_url,
+        headers=_feed_headers(etag, last_modified),
+        timeout=timeout,
+        cache_ttl=cache_ttl("rss"),
+    )
     try:
-        return parsedate_to_datetime(raw)
-    except Exception:
-        try:
-            # Handle common Atom format like 2026-02-21T07:00:00Z
-            return datetime.fromisoformat(raw.replace("Z", "+00:00"))
-        except Exception:
-            return None
+        stream = open_stream(request, retry=_retry_policy(retries))
+    except urllib.error.HTTPError as exc:
+        if exc.code == 304 and (etag or last_modified):
+            not_modified = FeedResponse(
+                content=b"", etag=etag, last_modified=last_modified, not_modified=True
+            )
+            return not_modified, []
+        raise
+    with stream:
+        items = parse_feed_stream(
+            feed_url, stream.iter_chunks(), window_start=window_start, max_bytes=MAX_FEED_BYTES
+        )
+    response = FeedResponse(
+        content=b"",
+        etag=_header(stream.headers, "ETag"),
+        last_modified=_header(stream.headers, "Last-Modified"),
+        content_length=stream.bytes_read,
+    )
+    return response, items
 
 
-def _to_item(
-    feed_url: str,
-    title: str,
-    url: str,
-    desc: str,
-    published_at: datetime | None,
-    author: str | None,
-) -> Item:
-    digest = hashlib.sha256((url or title).encode("utf-8")).hexdigest()
-    return Item(
-        id=digest[:16],
-        url=url,
-        title=title,
-        source=feed_url,
-        author=author,
-        published_at=published_at,
-        type="article",
-        raw_text=desc,
-        description=desc,
-        hash=digest,
-    )
+def _parse_buffered(
+    feed_url: str, response: FeedResponse | Exception, window_start: datetime | None
+) -> tuple[FeedResponse, list[Item]] | Exception:
+    if isinstance(response, Exception):
+        return response
+    if response.not_modified:
+        return response, []
+    try:
+        items = parse_feed_stream(
+            feed_url, [response.content], window_start=window_start, max_bytes=MAX_FEED_BYTES
+        )
+    except Exception as exc:
+        return exc
+    return response, items
+
+
+def _fetch_feeds(
+    targets: list[tuple[str, str, str]],
+    *,
+    timeout: int,
+    retries: int,
+) -> list[FeedResponse | Exception]:
+    """Fetch `(url, etag, last_modified)` targets in one engine batch.
+
+    Transient failures (429/5xx, network errors, timeouts) are retried with
+    linear backoff; a 304 answer to a conditional request becomes a
+    `not_modified` response instead of an error.
+    """
+    requests = [
+        HttpRequest(
+            url=feed_url,
+            headers=_feed_headers(etag, last_modified),
+            timeout=timeout,
+            cache_ttl=cache_ttl("rss"),
+        )
+        for feed_url, etag, last_modified in targets
+    ]
+    results = send_many(requests, retry=_retry_policy(retries))
+    responses: list[FeedResponse | Exception] = []
+    for (_, etag, last_modified), result in zip(targets, results):
+        if isinstance(result, urllib.error.HTTPError) and result.code == 304 and (etag or last_modified):
+            responses.append(
+                FeedResponse(content=b"", etag=etag, last_modified=last_modified, not_modified=True)
+            )
+        elif isinstance(result, Exception):
+            responses.append(result)
+        else:
+            responses.append(
+                FeedResponse(
+                    content=result.body,
+                    etag=_header(result.headers, "ETag"),
+                    last_modified=_header(result.headers, "Last-Modified"),
+                    content_length=len(result.body),
+                )
+            )
+    return responses
+
+
+def _retry_policy(retries: int) -> RetryPolicy:
+    return RetryPolicy(retries=max(0, retries), backoff_seconds=DEFAULT_RSS_RETRY_BACKOFF_SECONDS)
+
+
+def _feed_headers(etag: str, last_modified: str) -> dict[str, str]:
+    headers = {
+        "User-Agent": "Mozilla/5.0 (compatible; ai-digest/1.0; +https://example.local)",
+        "Accept": "application/rss+xml, application/atom+xml, application/rdf+xml, application/xml, text/xml;q=0.9, */*;q=0.8",
+    }
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+def _header(headers: object, name: str) -> str:
+    value = headers.get(name) if hasattr(headers, "get") else None
+    return value.strip() if isinstance(value, str) else ""
@@ -1,30 +1,101 @@
 from __future__ import annotations
 
 import hashlib
+import os
 import re
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import BinaryIO
 import urllib.parse
 
 from digest.models import Item
+from digest.storage.sqlite_store import SQLiteStore
 
 X_URL_RE = re.compile(r"https?://(?:x\.com|twitter\.com)/[A-Za-z0-9_]{1,15}/status/\d+")
 LOW_SIGNAL_RE = re.compile(
     r"\b(giveaway|airdrop|follow\s+me|retweet|like\s+and\s+subscribe|promo\s+code|join\s+now|dm\s+me)\b",
     re.IGNORECASE,
 )
+# Prefix length hashed to notice an inbox rewritten in place at the same size or larger.
+_HEAD_HASH_BYTES = 4096
 
 
-def fetch_x_inbox_items(inbox_path: str) -> list[Item]:
+def fetch_x_inbox_items(
+    inbox_path: str,
+    *,
+    store: SQLiteStore | None = None,
+    window_start: datetime | None = None,
+) -> list[Item]:
+    """Parse the X inbox file into x_post items.
+
+    Without a store the whole file is parsed and every entry is stamped with
+    the current time. With a store the file is tailed: only complete lines
+    appended since the recorded byte offset are parsed, each URL keeps the
+    time it was first ingested as `published_at`, and the entries ingested
+    since `window_start` are returned. A replaced (device/inode), truncated
+    or rewritten (head hash) file is rescanned from the start.
+    """
     if not inbox_path:
         return []
     path = Path(inbox_path).expanduser()
     if not path.exists() or not path.is_file():
         return []
 
-    items: list[Item] = []
+    if store is None:
+        now = datetime.now(timezone.utc)
+        return [
+            _inbox_item(url, comment, now)
+            for url, comment in _parse_inbox_lines(path.read_text(encoding="utf-8"))
+        ]
+
+    key = str(path.resolve())
+    now = datetime.now(timezone.utc)
+    with path.open("rb") as handle:
+        stat = os.fstat(handle.fileno())
+        offset = _resume_offset(handle, stat, store.get_x_inbox_state(key))
+        handle.seek(offset)
+        appended = handle.read(max(0, stat.st_size - offset))
+        # A line still being written is picked up once its newline lands.
+        complete = appended[: appended.rfind(b"\n") + 1]
+        read_offset = offset + len(complete)
+        head_hash = _head_hash(handle, read_offset)
+    store.record_x_inbox_read(
+        key,
+        device=stat.st_dev,
+        inode=stat.st_ino,
+        size=stat.st_size,
+        read_offset=read_offset,
+        head_hash=head_hash,
+        entries=_parse_inbox_lines(complete.decode("utf-8", errors="replace")),
+        ingested_at=now,
+    )
+    return [
+        _inbox_item(url, comment, ingested_at)
+        for url, comment, ingested_at in store.list_x_inbox_entries(key, since=window_start)
+    ]
+
+
+def _resume_offset(handle: BinaryIO, stat: os.stat_result, state: dict[str, object] | None) -> int:
+    if state is None:
+        return 0
+    offset = int(state["read_offset"])
+    if (stat.st_dev, stat.st_ino) != (state["device"], state["inode"]) or stat.st_size < offset:
+        return 0
+    if _head_hash(handle, offset) != state["head_hash"]:
+        return 0
+    return offset
+
+
+def _head_hash(handle: BinaryIO, read_offset: int) -> str:
+    """Hash of the already-consumed prefix (capped), stable while the file only grows."""
+    handle.seek(0)
+    return hashlib.sha256(handle.read(min(read_offset, _HEAD_HASH_BYTES))).hexdigest()
+
+
+def _parse_inbox_lines(text: str) -> list[tuple[str, str]]:
+    entries: list[tuple[str, str]] = []
     seen_urls: set[str] = set()
-    for line in path.read_text(encoding="utf-8").splitlines():
+    for line in text.splitlines():
         raw = line.strip()
         if not raw or raw.startswith("#"):
             continue
@@ -39,24 +110,26 @@ def fetch_x_inbox_items(inbox_path: str) -> list[Item]:
         if comment and _is_low_signal_comment(comment):
             continue
         seen_urls.add(url)
-        handle = _extract_handle(url)
-        title = f"X post by @{handle}" if handle else "X post"
-        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
-        items.append(
-            Item(
-                id=digest[:16],
-                url=url,
-                title=title,
-                source="x.com",
-                author=handle,
-                published_at=datetime.now(timezone.utc),
-                type="x_post",
-                raw_text=comment,
-                description=comment,
-                hash=digest,
-            )
-        )
-    return items
+        entries.append((url, comment))
+    return entries
+
+
+def _inbox_item(url: str, comment: str, published_at: datetime) -> Item:
+    handle = _extract_handle(url)
+    title = f"X post by @{handle}" if handle else "X post"
+    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return Item(
+        id=digest[:16],
+        url=url,
+        title=title,
+        source="x.com",
+        author=handle,
+        published_at=published_at,
+        type="x_post",
+        raw_text=comment,
+        description=comment,
+        hash=digest,
+    )
 
 
 def _extract_handle(url: str) -> str | None:
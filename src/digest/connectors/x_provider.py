@@ -1,13 +1,18 @@
 from __future__ import annotations
 
-import json
 import os
 import urllib.parse
 import urllib.error
-import urllib.request
 from dataclasses import dataclass
 from datetime import datetime
 
+from digest.constants import X_AUTHOR_BATCH_MAX_PAGES
+from digest.net.engine import HttpRequest, send
+from digest.net.http_cache import cache_ttl
+
+_AUTHOR_QUERY_FILTERS = "-is:retweet -is:reply"
+MAX_RESULTS_PER_REQUEST = 100
+
 
 @dataclass(slots=True)
 class XPostPayload:
@@ -38,6 +43,21 @@ class XProvider:
     ) -> tuple[list[XPostPayload], str | None]:
         raise NotImplementedError
 
+    def fetch_author_batch(
+        self,
+        *,
+        authors: list[str],
+        since_id: str | None,
+        limits: dict[str, int],
+        marks: dict[str, int] | None = None,
+    ) -> dict[str, list[XPostPayload]]:
+        """Newest posts of several authors from one OR query, keyed by handle.
+
+        `limits` and `marks` are keyed like `authors`. Each author gets at
+        most its limit of posts newer than its mark (a post id).
+        """
+        raise NotImplementedError
+
 
 class InboxOnlyXProvider(XProvider):
     def _unsupported(self) -> Exception:
@@ -63,6 +83,16 @@ class InboxOnlyXProvider(XProvider):
     ) -> tuple[list[XPostPayload], str | None]:
         raise self._unsupported()
 
+    def fetch_author_batch(
+        self,
+        *,
+        authors: list[str],
+        since_id: str | None,
+        limits: dict[str, int],
+        marks: dict[str, int] | None = None,
+    ) -> dict[str, list[XPostPayload]]:
+        raise self._unsupported()
+
 
 class XApiProvider(XProvider):
     def __init__(self, *, bearer_token: str, timeout: int = 20) -> None:
@@ -78,11 +108,11 @@ class XApiProvider(XProvider):
         cursor: str | None,
         limit: int,
     ) -> tuple[list[XPostPayload], str | None]:
-        username = author.strip().lstrip("@").lower()
+        username = _handle(author)
         if not username:
             raise RuntimeError("x_author requires a non-empty handle")
         return self._search_posts(
-            query=f"from:{username} -is:retweet -is:reply",
+            query=author_batch_query([username]),
             cursor=cursor,
             limit=limit,
         )
@@ -103,12 +133,77 @@ class XApiProvider(XProvider):
             limit=limit,
         )
 
+    def fetch_author_batch(
+        self,
+        *,
+        authors: list[str],
+        since_id: str | None,
+        limits: dict[str, int],
+        marks: dict[str, int] | None = None,
+    ) -> dict[str, list[XPostPayload]]:
+        wanted: dict[str, int] = {}
+        floor: dict[str, int] = {}
+        for author in authors:
+            handle = _handle(author)
+            if handle and handle not in wanted:
+                wanted[handle] = max(0, int(limits.get(author, 0) or 0))
+                floor[handle] = int((marks or {}).get(author, 0) or 0)
+        if not wanted:
+            raise RuntimeError("x_author batch requires at least one handle")
+        by_author: dict[str, list[XPostPayload]] = {handle: [] for handle in wanted}
+        # Pages come newest-first across all authors, so one prolific author
+        # can fill a page on its own. Keep paging while some author still
+        # wants posts and the pages have not reached its mark.
+        pending = {handle for handle, count in wanted.items() if count > 0}
+        cursor: str | None = None
+        exhausted = False
+        for _ in range(X_AUTHOR_BATCH_MAX_PAGES):
+            if not pending:
+                break
+            posts, cursor = self._search_posts(
+                query=author_batch_query(list(wanted)),
+                cursor=cursor,
+                limit=sum(wanted[handle] - len(by_author[handle]) for handle in pending),
+                since_id=since_id,
+            )
+            for post in posts:
+                handle = post.author_username
+                if handle in pending and post_id_number(post.id) > floor[handle]:
+                    by_author[handle].append(post)
+                    if len(by_author[handle]) >= wanted[handle]:
+                        pending.discard(handle)
+            if posts:
+                oldest = min(post_id_number(post.id) for post in posts)
+                pending = {handle for handle in pending if oldest > floor[handle]}
+            if not cursor or not posts:
+                exhausted = True
+                break
+        if exhausted:
+            return by_author
+        # The page cap ran out first: ask for each starved author on its own.
+        for handle in [h for h in wanted if h in pending]:
+            mark = floor[handle]
+            posts, _cursor = self._search_posts(
+                query=author_batch_query([handle]),
+                cursor=None,
+                limit=wanted[handle],
+                since_id=str(mark) if mark and since_id else since_id,
+            )
+            known = {post.id for post in by_author[handle]}
+            for post in posts:
+                if len(by_author[handle]) >= wanted[handle]:
+                    break
+                if post.id not in known and post_id_number(post.id) > mark:
+                    by_author[handle].append(post)
+        return by_author
+
     def _search_posts(
         self,
         *,
         query: str,
         cursor: str | None,
         limit: int,
+        since_id: str | None = None,
     ) -> tuple[list[XPostPayload], str | None]:
         params: dict[str, str] = {
             "query": query,
@@ -120,6 +215,8 @@ class XApiProvider(XProvider):
         }
         if cursor:
             params["next_token"] = cursor
+        if since_id:
+            params["since_id"] = since_id
         payload = self._request_json("/2/tweets/search/recent", params)
         includes = payload.get("includes", {}) if isinstance(payload, dict) else {}
         users = includes.get("users", []) if isinstance(includes, dict) else []
@@ -146,17 +243,18 @@ class XApiProvider(XProvider):
         url = f"https://api.x.com{path}"
         if query:
             url = f"{url}?{query}"
-        req = urllib.request.Request(
-            url,
+        req = HttpRequest(
+            url=url,
             headers={
                 "Authorization": f"Bearer {self._bearer_token}",
                 "Accept": "application/json",
                 "User-Agent": "ai-digest/1.0",
             },
+            timeout=self._timeout,
+            cache_ttl=cache_ttl("x"),
         )
         try:
-            with urllib.request.urlopen(req, timeout=self._timeout) as resp:
-                data = json.loads(resp.read().decode("utf-8"))
+            data = send(req).json()
         except urllib.error.HTTPError as exc:
             raise RuntimeError(f"X search HTTP Error {exc.code}") from exc
         if not isinstance(data, dict):
@@ -176,6 +274,57 @@ def get_x_provider(mode: str = "") -> XProvider:
     raise RuntimeError(f"Unsupported DIGEST_X_PROVIDER '{selected}'")
 
 
+def author_batch_query(handles: list[str]) -> str:
+    clauses = [f"from:{handle}" for handle in handles]
+    joined = clauses[0] if len(clauses) == 1 else "(" + " OR ".join(clauses) + ")"
+    return f"{joined} {_AUTHOR_QUERY_FILTERS}"
+
+
+def pack_author_batches(
+    authors: list[str],
+    *,
+    max_chars: int,
+    limits: dict[str, int] | None = None,
+) -> list[list[str]]:
+    """Group authors, in order, into OR queries no longer than `max_chars`.
+
+    With `limits`, a group also stops growing once its summed per-author
+    limits would exceed one request's `max_results`, so a batch never needs
+    more posts than a single page can return.
+    """
+    batches: list[list[str]] = []
+    current: list[str] = []
+    current_posts = 0
+    for author in authors:
+        handle = _handle(author)
+        if not handle:
+            continue
+        posts = int((limits or {}).get(author, 0) or 0)
+        candidate = [*current, author]
+        fits = len(author_batch_query([_handle(a) for a in candidate])) <= max_chars
+        if current and (not fits or current_posts + posts > MAX_RESULTS_PER_REQUEST):
+            batches.append(current)
+            candidate = [author]
+            current_posts = 0
+        current = candidate
+        current_posts += posts
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _handle(author: str) -> str:
+    return author.strip().lstrip("@").lower()
+
+
+def post_id_number(value: str | None) -> int:
+    """Post ids are snowflakes, so numeric order is posting order."""
+    try:
+        return int(str(value or "").strip())
+    except ValueError:
+        return 0
+
+
 def _bound_limit(value: int) -> int:
     if value <= 0:
         return 10
@@ -2,16 +2,29 @@ from __future__ import annotations
 
 import hashlib
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from urllib.parse import urlparse
 
 from digest.config import SourceConfig
-from digest.connectors.x_provider import XPostPayload, get_x_provider
+from digest.constants import (
+    X_LINK_PREVIEW_FAILURE_MAX_AGE_HOURS,
+    X_LINK_PREVIEW_MAX_AGE_HOURS,
+    X_LINK_PREVIEW_WORKERS,
+    X_SEARCH_QUERY_MAX_CHARS,
+)
+from digest.connectors.x_provider import (
+    XPostPayload,
+    XProvider,
+    get_x_provider,
+    post_id_number,
+)
 from digest.models import Item
 from digest.storage.sqlite_store import SQLiteStore
 from digest.connectors.link_preview import fetch_link_preview_metadata
 
 SelectorItemLink = tuple[str, str, Item]
+_SNOWFLAKE_EPOCH_MS = 1288834974657
 
 
 def fetch_x_selector_items_linked(
@@ -22,7 +35,15 @@ def fetch_x_selector_items_linked(
     default_limit: int = 25,
     author_limits: dict[str, int] | None = None,
     theme_limits: dict[str, int] | None = None,
+    author_batches: list[list[str]] | None = None,
 ) -> tuple[list[SelectorItemLink], list[str]]:
+    """Fetch x_author/x_theme selectors through the configured provider.
+
+    With `author_batches` (see `_plan_x_selector_limits`), each group of
+    authors is fetched with one OR query instead of one request per author;
+    the posts are split back by author and each author's `last_item_id` in
+    x_selector_cursors moves to the newest post it received.
+    """
     linked_items: list[SelectorItemLink] = []
     errors: list[str] = []
     limit = _resolve_limit(default_limit)
@@ -33,7 +54,23 @@ def fetch_x_selector_items_linked(
 
     provider = get_x_provider(provider_mode)
 
-    for author in sources.x_authors:
+    if author_batches is not None:
+        for batch in author_batches:
+            _fetch_author_batch(
+                provider,
+                store,
+                batch,
+                limits={
+                    author: _selector_limit_for(author, limits=author_limits, fallback=limit)
+                    for author in batch
+                },
+                linked_items=linked_items,
+                errors=errors,
+                preview_cache=preview_cache,
+            )
+
+    unbatched_authors = sources.x_authors if author_batches is None else []
+    for author in unbatched_authors:
         limit_for_author = _selector_limit_for(
             author,
             limits=author_limits,
@@ -59,6 +96,7 @@ def fetch_x_selector_items_linked(
                     posts,
                     author=author,
                     preview_cache=preview_cache,
+                    store=store,
                 )
             )
             last_item_id = posts[-1].id if posts else None
@@ -107,6 +145,64 @@ def fetch_x_selector_items_linked(
     return linked_items, errors
 
 
+def _fetch_author_batch(
+    provider: XProvider,
+    store: SQLiteStore,
+    batch: list[str],
+    *,
+    limits: dict[str, int],
+    linked_items: list[SelectorItemLink],
+    errors: list[str],
+    preview_cache: dict[str, dict[str, str]],
+) -> None:
+    authors = [author for author in batch if limits.get(author, 0) > 0]
+    if not authors:
+        return
+    last_ids = store.get_x_last_item_ids("x_author", authors)
+    # One since_id serves the whole query, so it can only be as new as the
+    # stalest author's mark; newer authors are trimmed per author below.
+    # Recent search rejects a since_id outside its 7-day window.
+    marks = {author: post_id_number(last_ids.get(author)) for author in authors}
+    oldest_mark = min(marks.values())
+    since_id = str(oldest_mark) if oldest_mark and _post_age_days(oldest_mark) < 6.5 else None
+    try:
+        posts_by_handle = provider.fetch_author_batch(
+            authors=authors,
+            since_id=since_id,
+            limits={author: limits[author] for author in authors},
+            marks=marks,
+        )
+    except Exception as exc:
+        errors.extend(f"x_author:{author}: {exc}" for author in authors)
+        return
+    for author in authors:
+        mark = marks[author]
+        posts = [
+            post
+            for post in posts_by_handle.get(author.strip().lstrip("@").lower(), [])
+            if post_id_number(post.id) > mark
+        ][: limits[author]]
+        linked_items.extend(
+            ("x_author", author, _to_item(post, selector_type="x_author", selector_value=author))
+            for post in posts
+        )
+        linked_items.extend(
+            _promote_author_links(posts, author=author, preview_cache=preview_cache, store=store)
+        )
+        if posts:
+            store.set_x_cursor(
+                selector_type="x_author",
+                selector_value=author,
+                cursor=None,
+                last_item_id=str(max(post_id_number(post.id) for post in posts)),
+            )
+
+
+def _post_age_days(post_id: int) -> float:
+    posted_ms = (post_id >> 22) + _SNOWFLAKE_EPOCH_MS
+    return (datetime.now(timezone.utc).timestamp() * 1000 - posted_ms) / 86_400_000
+
+
 def fetch_x_selector_items(
     sources: SourceConfig,
     store: SQLiteStore,
@@ -115,6 +211,7 @@ def fetch_x_selector_items(
     default_limit: int = 25,
     author_limits: dict[str, int] | None = None,
     theme_limits: dict[str, int] | None = None,
+    author_batches: list[list[str]] | None = None,
 ) -> tuple[list[Item], list[str]]:
     linked_items, errors = fetch_x_selector_items_linked(
         sources,
@@ -123,6 +220,7 @@ def fetch_x_selector_items(
         default_limit=default_limit,
         author_limits=author_limits,
         theme_limits=theme_limits,
+        author_batches=author_batches,
     )
     return [item for _selector_type, _selector_value, item in linked_items], errors
 
@@ -139,6 +237,16 @@ def _resolve_limit(default_value: int) -> int:
     return max(5, min(100, int(parsed)))
 
 
+def resolve_author_batch_chars() -> int:
+    """Query-length budget for batched x_author search (0 = one request per author)."""
+    raw = str(os.getenv("DIGEST_X_BATCH_QUERY_CHARS", "") or "").strip()
+    try:
+        parsed = int(raw) if raw else X_SEARCH_QUERY_MAX_CHARS
+    except ValueError:
+        parsed = X_SEARCH_QUERY_MAX_CHARS
+    return max(0, parsed)
+
+
 def _selector_limit_for(
     selector: str,
     *,
@@ -198,29 +306,84 @@ def _promote_author_links(
     *,
     author: str,
     preview_cache: dict[str, dict[str, str]],
+    store: SQLiteStore | None = None,
 ) -> list[SelectorItemLink]:
     linked: list[SelectorItemLink] = []
     per_post_limit = _resolve_promoted_link_limit()
     if per_post_limit <= 0:
         return linked
 
+    promoted: list[tuple[XPostPayload, str]] = []
     for post in posts:
         promoted_count = 0
         for outbound in post.outbound_urls:
             candidate = _normalize_outbound_url(outbound)
             if not candidate or not _is_promotable_url(candidate):
                 continue
-            if candidate not in preview_cache:
-                preview_cache[candidate] = _safe_preview(candidate)
-            linked.append(
-                ("x_author", author, _promoted_link_item(post, author=author, preview=preview_cache[candidate]))
-            )
+            promoted.append((post, candidate))
             promoted_count += 1
             if promoted_count >= per_post_limit:
                 break
+    _load_previews([url for _post, url in promoted], preview_cache=preview_cache, store=store)
+    for post, candidate in promoted:
+        linked.append(
+            ("x_author", author, _promoted_link_item(post, author=author, preview=preview_cache[candidate]))
+        )
     return linked
 
 
+def _load_previews(
+    urls: list[str],
+    *,
+    preview_cache: dict[str, dict[str, str]],
+    store: SQLiteStore | None,
+) -> None:
+    """Fill `preview_cache` for `urls` from the store, fetching the rest concurrently.
+
+    Fetched previews, including failures, are written back to the store so
+    later runs reuse them; failures expire after
+    X_LINK_PREVIEW_FAILURE_MAX_AGE_HOURS instead of the full max age.
+    """
+    missing: list[str] = []
+    for url in dict.fromkeys(urls):
+        if url in preview_cache:
+            continue
+        cached = (
+            store.get_cached_link_preview(
+                url,
+                max_age_hours=X_LINK_PREVIEW_MAX_AGE_HOURS,
+                failure_max_age_hours=X_LINK_PREVIEW_FAILURE_MAX_AGE_HOURS,
+            )
+            if store is not None
+            else None
+        )
+        if cached is not None:
+            preview_cache[url] = cached
+        else:
+            missing.append(url)
+    if not missing:
+        return
+    if len(missing) == 1:
+        fetched = [_safe_preview(missing[0])]
+    else:
+        workers = min(X_LINK_PREVIEW_WORKERS, len(missing))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="digest-preview") as pool:
+            fetched = list(pool.map(_safe_preview, missing))
+    for url, preview in zip(missing, fetched):
+        preview_cache[url] = preview
+        if store is not None:
+            store.upsert_link_preview(
+                url=url,
+                resolved_url=str(preview.get("resolved_url") or url),
+                host=str(preview.get("host") or ""),
+                title=str(preview.get("title") or ""),
+                description=str(preview.get("description") or ""),
+                image_url=str(preview.get("image_url") or ""),
+                status=str(preview.get("status") or ""),
+                error=str(preview.get("error") or ""),
+            )
+
+
 def _normalize_outbound_url(url: str) -> str:
     value = str(url or "").strip()
     if not value:
@@ -239,7 +402,7 @@ def _is_promotable_url(url: str) -> bool:
 def _safe_preview(url: str) -> dict[str, str]:
     try:
         return fetch_link_preview_metadata(url)
-    except Exception:
+    except Exception as exc:
         return {
             "url": url,
             "resolved_url": url,
@@ -248,7 +411,7 @@ def _safe_preview(url: str) -> dict[str, str]:
             "description": "",
             "image_url": "",
             "status": "preview_unavailable",
-            "error": "",
+            "error": str(exc)[:200],
         }
 
 
@@ -1,15 +1,32 @@
 from __future__ import annotations
 
-from digest.connectors.rss import fetch_rss_items
+from datetime import datetime
+
+from digest.connectors.rss import DEFAULT_RSS_RETRIES, FeedValidators, fetch_rss_items
 from digest.models import Item
 
+DEFAULT_YOUTUBE_TIMEOUT = 15
+
 
 def _channel_feed(channel_id: str) -> str:
     return f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
 
 
-def fetch_youtube_items(channels: list[str], timeout: int = 15) -> list[Item]:
-    items = fetch_rss_items([_channel_feed(ch) for ch in channels], timeout=timeout)
+def fetch_youtube_items(
+    channels: list[str],
+    timeout: int = DEFAULT_YOUTUBE_TIMEOUT,
+    retries: int = DEFAULT_RSS_RETRIES,
+    *,
+    validators: FeedValidators | None = None,
+    window_start: datetime | None = None,
+) -> list[Item]:
+    items = fetch_rss_items(
+        [_channel_feed(ch) for ch in channels],
+        timeout=timeout,
+        retries=retries,
+        validators=validators,
+        window_start=window_start,
+    )
     for item in items:
         item.type = "video"
     return items
@@ -13,5 +13,87 @@ DIGEST_SKIM_LIMIT = 10
 DIGEST_VIDEO_LIMIT = 5
 DIGEST_TOTAL_LIMIT = 20
 
+# Promoted X links: how long a fetched preview (or a failed fetch) is reused
+# from the link_previews table, and how many uncached previews load at once.
+X_LINK_PREVIEW_MAX_AGE_HOURS = 24
+X_LINK_PREVIEW_FAILURE_MAX_AGE_HOURS = 6
+X_LINK_PREVIEW_WORKERS = 4
+# Batched x_author search: longest recent-search query (the basic-tier limit)
+# that packs several `from:` clauses, and pages followed per batch per run.
+X_SEARCH_QUERY_MAX_CHARS = 512
+X_AUTHOR_BATCH_MAX_PAGES = 3
+
 GITHUB_DEFAULT_PER_PAGE = 5
+# Page size for listings followed through `Link` headers up to the cursor, and
+# the default number of such pages per selector before it reports truncation.
+GITHUB_PAGE_SIZE = 30
+GITHUB_MAX_PAGES_PER_SELECTOR = 3
+# Repositories per aliased GraphQL query; keeps each query's node count (and
+# rate-limit cost) small while still collapsing dozens of REST calls into one.
+GITHUB_GRAPHQL_REPOS_PER_QUERY = 20
+# Concurrent per-repo release lookups when scanning an org over REST.
+GITHUB_ORG_RELEASE_WORKERS = 4
+# Requests the GitHub client may send back-to-back before quota pacing kicks in.
+GITHUB_RATE_LIMIT_BURST = 10
+# Quota left untouched per rate-limit resource (for other tools sharing the token).
+GITHUB_RATE_LIMIT_RESERVE = {"core": 50, "search": 1, "graphql": 50}
+# Longest the client sleeps for a quota reset before deferring the selector.
+GITHUB_RATE_LIMIT_MAX_WAIT_SECONDS = 60
+
+# Source health: successful fetch latencies kept per source and the samples
+# needed before a source's timeout follows its own p95 (times the multiplier,
+# clamped between the floor and the connector default).
+SOURCE_HEALTH_LATENCY_SAMPLES = 20
+SOURCE_HEALTH_MIN_SAMPLES = 5
+SOURCE_TIMEOUT_P95_MULTIPLIER = 4.0
+SOURCE_TIMEOUT_MIN_SECONDS = 3
+# Consecutive failures before a source is quarantined; the re-probe interval
+# doubles from the base with every failed probe, up to the max.
+SOURCE_QUARANTINE_AFTER_FAILURES = 3
+SOURCE_QUARANTINE_BASE_HOURS = 1
+SOURCE_QUARANTINE_MAX_HOURS = 168
+
+# Adaptive polling: publish times read per source, gaps needed before its
+# interval is trusted, and the fraction of that interval to wait between polls
+# (bounded by the profile's poll_max_staleness_hours).
+POLL_HISTORY_ITEMS = 20
+POLL_MIN_GAPS = 2
+POLL_INTERVAL_FRACTION = 0.25
+# Longest catch-up window for a source returning after skipped polls.
+POLL_CATCHUP_MAX_HOURS = 7 * 24
+
+# Relative fetch cost per source type when balancing scheduler fetch shards.
+SOURCE_SHARD_WEIGHTS = {
+    "rss": 1,
+    "youtube_channel": 1,
+    "x_author": 1,
+    "x_theme": 2,
+    "github_repo": 2,
+    "github_topic": 2,
+    "github_query": 2,
+    "github_org": 5,
+}
+
+# Near-duplicate clustering: MinHash permutations per signature, and the batch
+# size from which the LSH index replaces the direct cluster scan.
+NEAR_DUP_NUM_PERM = 64
+NEAR_DUP_LSH_MIN_ITEMS = 200
+
+# Cross-run story index: title Jaccard at which a new item counts as a story
+# already scored or delivered, and the rank penalty under the demote policy.
+STORY_INDEX_THRESHOLD = 0.6
+STORY_REPEAT_PENALTY = 10
+# Story index keys: titles with fewer tokens than this say too little to
+# identify a story, items with fewer shingles than this are never indexed or
+# matched, and at most this many body tokens are taken from the description
+# (or text) of an item whose title is skipped.
+STORY_MIN_TITLE_TOKENS = 3
+STORY_MIN_SHINGLES = 6
+STORY_BODY_TOKENS = 40
 
+# Seen-set Bloom filter: target false-positive rate, the smallest capacity
+# (keys) a filter file is sized for, and the share of seen rows a TTL expiry
+# must remove before the filter is rebuilt without them.
+SEEN_BLOOM_FALSE_POSITIVE_RATE = 0.01
+SEEN_BLOOM_MIN_CAPACITY = 10_000
+SEEN_BLOOM_REBUILD_FRACTION = 0.5
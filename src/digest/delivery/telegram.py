@@ -5,9 +5,9 @@ import json
 import re
 from typing import Any
 import urllib.parse
-import urllib.request
 
 from digest.models import DigestSections
+from digest.net.engine import HttpRequest, send
 
 TELEGRAM_PRIMARY_MIN_ITEMS = 10
 TELEGRAM_PRIMARY_MIN_SOURCES = 5
@@ -410,14 +410,14 @@ def clear_telegram_menu_button(bot_token: str) -> None:
 def _tg_post(bot_token: str, method: str, payload: dict[str, Any]) -> dict:
     """Low-level POST to Telegram Bot API."""
     body = urllib.parse.urlencode(payload).encode("utf-8")
-    req = urllib.request.Request(
-        f"https://api.telegram.org/bot{bot_token}/{method}",
+    req = HttpRequest(
+        url=f"https://api.telegram.org/bot{bot_token}/{method}",
         data=body,
         method="POST",
         headers={"Content-Type": "application/x-www-form-urlencoded"},
+        timeout=20,
     )
-    with urllib.request.urlopen(req, timeout=20) as resp:
-        result = json.loads(resp.read().decode("utf-8"))
+    result = send(req).json()
     if not result.get("ok"):
         raise RuntimeError(f"Telegram {method} failed")
     return result
@@ -432,9 +432,7 @@ def get_telegram_updates(
     if offset is not None:
         query["offset"] = str(offset)
     url = f"https://api.telegram.org/bot{bot_token}/getUpdates?{urllib.parse.urlencode(query)}"
-    req = urllib.request.Request(url, method="GET")
-    with urllib.request.urlopen(req, timeout=timeout + 10) as resp:
-        result = json.loads(resp.read().decode("utf-8"))
+    result = send(HttpRequest(url=url, timeout=timeout + 10)).json()
     if not result.get("ok"):
         raise RuntimeError("Telegram getUpdates failed")
     rows = result.get("result", [])
@@ -0,0 +1 @@
+"""Shared HTTP transport for connectors and delivery."""
@@ -0,0 +1,756 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+import os
+import ssl
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+import zlib
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from email.parser import BytesParser
+from http.client import HTTPMessage
+from typing import Any, Callable
+
+from digest.net.http_cache import CachedEntry, get_http_cache
+from digest.net.pool import (
+    DEFAULT_IDLE_TIMEOUT_SECONDS,
+    ConnectionPool,
+    PooledConnection,
+    proxy_authorization,
+)
+
+DEFAULT_MAX_CONCURRENCY = 64
+DEFAULT_MAX_PER_HOST = 6
+DEFAULT_TIMEOUT_SECONDS = 20
+DEFAULT_USER_AGENT = "ai-digest/1.0"
+DEFAULT_ACCEPT_ENCODING = "gzip, deflate"
+# Request headers that are not resent when a redirect leaves the origin.
+CROSS_ORIGIN_STRIPPED_HEADERS = frozenset({"authorization", "cookie"})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+MAX_ERROR_BODY_BYTES = 64 * 1024
+MAX_REDIRECTS = 5
+READ_CHUNK_BYTES = 64 * 1024
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+
+
+@dataclass(slots=True)
+class HttpRequest:
+    url: str
+    method: str = "GET"
+    headers: dict[str, str] = field(default_factory=dict)
+    data: bytes | None = None
+    timeout: float = DEFAULT_TIMEOUT_SECONDS
+    # Stop reading the body after this many bytes (like `resp.read(n)`).
+    max_bytes: int | None = None
+    # Seconds a cached 200 answers this request; 0 bypasses the HTTP cache.
+    cache_ttl: float = 0.0
+
+
+@dataclass(slots=True)
+class HttpResponse:
+    url: str
+    status: int
+    headers: HTTPMessage
+    body: bytes
+    from_cache: bool = False
+
+    def json(self) -> Any:
+        return json.loads(self.body.decode("utf-8"))
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """How many times a request is re-sent after a transient failure.
+
+    Only statuses in `retry_statuses` and network errors/timeouts are retried;
+    every other HTTP error is raised on the first attempt. The delay grows
+    linearly: `backoff_seconds * (attempt + 1)`.
+    """
+
+    retries: int = 0
+    backoff_seconds: float = 1.0
+    retry_statuses: frozenset[int] = RETRYABLE_STATUSES
+
+    def delay(self, attempt: int) -> float:
+        return self.backoff_seconds * (attempt + 1)
+
+
+NO_RETRY = RetryPolicy()
+
+
+class FetchEngine:
+    """Asyncio HTTP/1.1 client running on one background event-loop thread.
+
+    Every request made through the engine shares a global concurrency gate and
+    a per-host gate, so hundreds of feed/API waits overlap on a single thread
+    without hammering any one host. Connections are kept alive and pooled per
+    (scheme, host, port), so repeated calls to GitHub or Telegram pay the
+    TCP/TLS handshake once; gzip/deflate bodies are decoded transparently.
+    Proxies come from the same `*_proxy` / `no_proxy` settings urllib reads.
+    Failures surface as the same exceptions `urllib.request.urlopen` raises
+    (`HTTPError`, `URLError`, `TimeoutError`), which keeps the connectors'
+    existing error handling valid.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_per_host: int = DEFAULT_MAX_PER_HOST,
+        max_idle_total: int = DEFAULT_MAX_CONCURRENCY,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT_SECONDS,
+    ) -> None:
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_per_host = max(1, max_per_host)
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._global_gate: asyncio.Semaphore | None = None
+        self._host_gates: dict[str, asyncio.Semaphore] = {}
+        self.pool = ConnectionPool(
+            ssl_context=ssl.create_default_context(),
+            max_idle_per_host=self.max_per_host,
+            max_idle_total=max_idle_total,
+            idle_timeout=idle_timeout,
+        )
+
+    # -- synchronous facade -------------------------------------------------
+
+    def request(self, request: HttpRequest, *, retry: RetryPolicy | None = None) -> HttpResponse:
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(self.fetch(request, retry=retry), loop)
+        return future.result()
+
+    def request_many(
+        self,
+        requests: Sequence[HttpRequest],
+        *,
+        retry: RetryPolicy | None = None,
+    ) -> list[HttpResponse | Exception]:
+        """Run all requests concurrently; failures are returned in place, not raised."""
+        if not requests:
+            return []
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(self.fetch_all(requests, retry=retry), loop)
+        return future.result()
+
+    def stream(
+        self, request: HttpRequest, *, retry: RetryPolicy | None = None
+    ) -> StreamingResponse:
+        """Send `request` and return once the status line and headers arrived.
+
+        The body is pulled chunk by chunk from the calling thread; the
+        connection and host gate stay held until the stream is closed.
+        """
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(self.open_stream(request, retry=retry), loop)
+        return StreamingResponse(future.result(), loop, timeout=request.timeout)
+
+    def close(self) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self.pool.aclose(), loop).result(timeout=5)
+        except Exception:
+            pass
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+        loop.close()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._thread is None or not self._thread.is_alive():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="digest-net", daemon=True)
+                thread.start()
+                self._loop, self._thread = loop, thread
+                self._global_gate = None
+                self._host_gates = {}
+            if threading.current_thread() is self._thread:
+                raise RuntimeError("blocking request issued from the engine loop; await fetch() instead")
+            return self._loop
+
+    # -- async API ----------------------------------------------------------
+
+    async def fetch_all(
+        self,
+        requests: Sequence[HttpRequest],
+        *,
+        retry: RetryPolicy | None = None,
+    ) -> list[HttpResponse | Exception]:
+        results = await asyncio.gather(
+            *(self.fetch(request, retry=retry) for request in requests),
+            return_exceptions=True,
+        )
+        return [r if isinstance(r, (HttpResponse, Exception)) else RuntimeError(str(r)) for r in results]
+
+    async def fetch(self, request: HttpRequest, *, retry: RetryPolicy | None = None) -> HttpResponse:
+        exchange = await self._open_with_retry(request, retry or NO_RETRY)
+        async with exchange:
+            body = await exchange.read_all(request.max_bytes)
+        return HttpResponse(
+            url=exchange.url, status=exchange.status, headers=exchange.headers, body=body
+        )
+
+    async def open_stream(
+        self, request: HttpRequest, *, retry: RetryPolicy | None = None
+    ) -> Exchange:
+        return await self._open_with_retry(request, retry or NO_RETRY)
+
+    async def _open_with_retry(self, request: HttpRequest, policy: RetryPolicy) -> Exchange:
+        """Open a 2xx exchange, following redirects and retrying transient failures.
+
+        Non-2xx answers are drained (up to MAX_ERROR_BODY_BYTES) and raised as
+        `HTTPError`, so both buffered and streamed callers see the same errors.
+        """
+        last_err: Exception | None = None
+        for attempt in range(policy.retries + 1):
+            try:
+                exchange = await self._follow_redirects(request)
+                if 200 <= exchange.status < 300:
+                    return exchange
+                async with exchange:
+                    body = await exchange.read_all(MAX_ERROR_BODY_BYTES)
+                error = _http_error(exchange.url, exchange.status, exchange.headers, body)
+            except (TimeoutError, urllib.error.URLError) as exc:
+                last_err = exc
+            else:
+                if exchange.status not in policy.retry_statuses:
+                    raise error
+                last_err = error
+            if attempt < policy.retries:
+                await asyncio.sleep(policy.delay(attempt))
+        assert last_err is not None
+        raise last_err
+
+    async def _follow_redirects(self, request: HttpRequest) -> Exchange:
+        url, method, data = request.url, request.method.upper(), request.data
+        headers = request.headers
+        for _ in range(MAX_REDIRECTS + 1):
+            exchange = await self._start(request, url, method, data, headers)
+            location = exchange.headers.get("Location")
+            if exchange.status not in REDIRECT_STATUSES or not location:
+                return exchange
+            async with exchange:
+                await exchange.read_all(MAX_ERROR_BODY_BYTES)
+            target = urllib.parse.urljoin(url, location.strip())
+            if _origin(target) != _origin(url):
+                headers = {
+                    name: value
+                    for name, value in headers.items()
+                    if name.lower() not in CROSS_ORIGIN_STRIPPED_HEADERS
+                }
+            url = target
+            if exchange.status == 303 or (exchange.status in {301, 302} and method == "POST"):
+                method, data = "GET", None
+        raise urllib.error.URLError(f"too many redirects: {request.url}")
+
+    async def _start(
+        self,
+        request: HttpRequest,
+        url: str,
+        method: str,
+        data: bytes | None,
+        headers: dict[str, str],
+    ) -> Exchange:
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in {"http", "https"} or not parts.hostname:
+            raise urllib.error.URLError(f"unsupported URL: {url}")
+        gates = (self._gate_for(""), self._gate_for(parts.hostname.lower()))
+        for gate in gates:
+            await gate.acquire()
+        try:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + request.timeout
+            with _url_errors():
+                conn, version, status, headers = await asyncio.wait_for(
+                    self._send_head(parts, method, data, headers), timeout=request.timeout
+                )
+        except BaseException:
+            for gate in gates:
+                gate.release()
+            raise
+        empty = method == "HEAD" or status in {204, 304} or 100 <= status < 200
+        return Exchange(
+            pool=self.pool,
+            conn=conn,
+            gates=gates,
+            url=urllib.parse.urlunsplit(parts),
+            version=version,
+            status=status,
+            headers=headers,
+            body=_BodyReader(conn.reader, headers, empty=empty),
+            deadline=deadline,
+        )
+
+    def _gate_for(self, host: str) -> asyncio.Semaphore:
+        # Only touched from the loop thread, so no lock is needed.
+        if not host:
+            if self._global_gate is None:
+                self._global_gate = asyncio.Semaphore(self.max_concurrency)
+            return self._global_gate
+        gate = self._host_gates.get(host)
+        if gate is None:
+            gate = self._host_gates[host] = asyncio.Semaphore(self.max_per_host)
+        return gate
+
+    async def _send_head(
+        self,
+        parts: urllib.parse.SplitResult,
+        method: str,
+        data: bytes | None,
+        headers: dict[str, str],
+    ) -> tuple[PooledConnection, str, int, HTTPMessage]:
+        scheme, host, port = _origin(parts)
+        proxy = _proxy_for(parts)
+        head = _request_head(headers, parts, method, data, proxy=proxy)
+        key = (scheme, host, port, proxy)
+        while True:
+            conn, reused = await self.pool.acquire(key)
+            try:
+                conn.writer.write(head)
+                if data:
+                    conn.writer.write(data)
+                await conn.writer.drain()
+                version, status, headers = await _read_head(conn.reader)
+                return conn, version, status, headers
+            except (OSError, asyncio.IncompleteReadError) as exc:
+                conn.close()
+                # A pooled socket the server already closed fails before any
+                # response bytes arrive; resend idempotent requests once on a
+                # fresh connection instead of surfacing the stale socket.
+                stale = isinstance(exc, ConnectionError) or (
+                    isinstance(exc, asyncio.IncompleteReadError) and not exc.partial
+                )
+                if reused and stale and method in IDEMPOTENT_METHODS:
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+
+
+class Exchange:
+    """One response being read off a pooled connection (loop thread only).
+
+    Holds the connection and the concurrency gates until `aclose()`; the
+    connection goes back to the pool only if the body was read to the end.
+    """
+
+    def __init__(
+        self,
+        *,
+        pool: ConnectionPool,
+        conn: PooledConnection,
+        gates: tuple[asyncio.Semaphore, ...],
+        url: str,
+        version: str,
+        status: int,
+        headers: HTTPMessage,
+        body: _BodyReader,
+        deadline: float,
+    ) -> None:
+        self._pool = pool
+        self._conn = conn
+        self._gates = gates
+        self._body = body
+        self._decoder = _Decoder(headers.get("Content-Encoding"))
+        self._deadline = deadline
+        self._closed = False
+        self.url = url
+        self.version = version
+        self.status = status
+        self.headers = headers
+
+    @property
+    def bytes_read(self) -> int:
+        return self._body.bytes_read
+
+    async def read_chunk(self, timeout: float | None = None) -> bytes:
+        """Next decoded chunk, or b"" at the end of the body."""
+        with _url_errors():
+            while True:
+                raw = await asyncio.wait_for(self._body.read(), timeout=timeout)
+                if not raw:
+                    return self._decoder.flush()
+                decoded = self._decoder.feed(raw)
+                if decoded:
+                    return decoded
+
+    async def read_all(self, max_bytes: int | None = None) -> bytes:
+        remaining = asyncio.get_running_loop().time()
+        timeout = max(0.0, self._deadline - remaining)
+        return await asyncio.wait_for(self._read_all(max_bytes), timeout=timeout)
+
+    async def _read_all(self, max_bytes: int | None) -> bytes:
+        buf = bytearray()
+        while max_bytes is None or len(buf) < max_bytes:
+            chunk = await self.read_chunk()
+            if not chunk:
+                break
+            buf.extend(chunk)
+        return bytes(buf if max_bytes is None else buf[:max_bytes])
+
+    async def aclose(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        connection = (self.headers.get("Connection") or "").lower()
+        reusable = (
+            self._body.complete
+            and self._body.framed
+            and self.version == "HTTP/1.1"
+            and "close" not in connection
+        )
+        self._pool.release(self._conn, reusable=reusable)
+        for gate in self._gates:
+            gate.release()
+
+    async def __aenter__(self) -> Exchange:
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        await self.aclose()
+
+
+class StreamingResponse:
+    """Synchronous view of an open `Exchange` for parsers that consume
+    the body incrementally. Close it (or use it as a context manager) as
+    soon as the caller is done; unread bodies are dropped, not pooled."""
+
+    def __init__(
+        self, exchange: Exchange, loop: asyncio.AbstractEventLoop, *, timeout: float
+    ) -> None:
+        self._exchange = exchange
+        self._loop = loop
+        self._timeout = timeout
+        self.url = exchange.url
+        self.status = exchange.status
+        self.headers = exchange.headers
+        # Called with the whole decoded body once it has been read to the end.
+        self.on_complete: Callable[[bytes], None] | None = None
+
+    @property
+    def bytes_read(self) -> int:
+        """Raw (possibly compressed) body bytes received so far."""
+        return self._exchange.bytes_read
+
+    def iter_chunks(self) -> Iterator[bytes]:
+        parts: list[bytes] | None = [] if self.on_complete is not None else None
+        while True:
+            chunk = self._call(self._exchange.read_chunk(self._timeout))
+            if not chunk:
+                if parts is not None and self.on_complete is not None:
+                    self.on_complete(b"".join(parts))
+                return
+            if parts is not None:
+                parts.append(chunk)
+            yield chunk
+
+    def close(self) -> None:
+        self._call(self._exchange.aclose())
+
+    def _call(self, coro: Any) -> Any:
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def __enter__(self) -> StreamingResponse:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+
+class CachedStream:
+    """`StreamingResponse` stand-in that replays a cached body."""
+
+    def __init__(self, entry: CachedEntry) -> None:
+        self.url = entry.url
+        self.status = entry.status
+        self.headers = entry.headers
+        self._body = entry.body
+        self._offset = 0
+        self.from_cache = True
+
+    @property
+    def bytes_read(self) -> int:
+        return self._offset
+
+    def iter_chunks(self) -> Iterator[bytes]:
+        while self._offset < len(self._body):
+            chunk = self._body[self._offset : self._offset + READ_CHUNK_BYTES]
+            self._offset += len(chunk)
+            yield chunk
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> CachedStream:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+
+class _BodyReader:
+    """Incremental HTTP/1.1 body reader for Content-Length, chunked and
+    read-to-EOF framing."""
+
+    def __init__(self, reader: asyncio.StreamReader, headers: HTTPMessage, *, empty: bool) -> None:
+        self._reader = reader
+        self._chunked = "chunked" in (headers.get("Transfer-Encoding") or "").lower()
+        length = (headers.get("Content-Length") or "").strip()
+        self._remaining: int | None = int(length) if length.isdigit() else None
+        self._chunk_left = 0
+        self.framed = empty or self._chunked or self._remaining is not None
+        self.complete = empty or self._remaining == 0
+        self.bytes_read = 0
+
+    async def read(self, size: int = READ_CHUNK_BYTES) -> bytes:
+        if self.complete:
+            return b""
+        if self._chunked:
+            data = await self._read_chunked(size)
+        elif self._remaining is not None:
+            data = await self._reader.read(min(size, self._remaining))
+            if not data:
+                raise asyncio.IncompleteReadError(b"", self._remaining)
+            self._remaining -= len(data)
+            self.complete = self._remaining == 0
+        else:
+            data = await self._reader.read(size)
+            self.complete = not data
+        self.bytes_read += len(data)
+        return data
+
+    async def _read_chunked(self, size: int) -> bytes:
+        if self._chunk_left == 0:
+            size_line = await self._reader.readuntil(b"\r\n")
+            self._chunk_left = int(size_line.split(b";", 1)[0].strip() or b"0", 16)
+            if self._chunk_left == 0:
+                # Skip optional trailers up to the terminating blank line.
+                while (await self._reader.readuntil(b"\r\n")) != b"\r\n":
+                    pass
+                self.complete = True
+                return b""
+        data = await self._reader.readexactly(min(size, self._chunk_left))
+        self._chunk_left -= len(data)
+        if self._chunk_left == 0:
+            await self._reader.readexactly(2)
+        return data
+
+
+class _Decoder:
+    """Incremental Content-Encoding decoder (identity, gzip, deflate)."""
+
+    def __init__(self, encoding: str | None) -> None:
+        self._coding = (encoding or "").strip().lower()
+        if self._coding not in {"", "identity", "gzip", "x-gzip", "deflate"}:
+            raise urllib.error.URLError(f"unsupported Content-Encoding: {self._coding}")
+        # wbits=MAX_WBITS|32 auto-detects gzip and zlib headers.
+        self._obj = None if self._coding in {"", "identity"} else zlib.decompressobj(zlib.MAX_WBITS | 32)
+        self._started = False
+
+    def feed(self, data: bytes) -> bytes:
+        if self._obj is None:
+            return data
+        try:
+            out = self._obj.decompress(data)
+        except zlib.error:
+            # Some servers send raw deflate for "deflate", which needs negative wbits.
+            if self._started or self._coding != "deflate":
+                raise ValueError(f"could not decode {self._coding} response body")
+            self._obj = zlib.decompressobj(-zlib.MAX_WBITS)
+            out = self._obj.decompress(data)
+        self._started = True
+        return out
+
+    def flush(self) -> bytes:
+        return self._obj.flush() if self._obj is not None else b""
+
+
+class _url_errors:
+    """Translate transport failures into `URLError`, as urllib would."""
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc: BaseException | None, _tb: object) -> None:
+        if exc is None or isinstance(exc, (TimeoutError, urllib.error.URLError)):
+            return
+        if isinstance(exc, (OSError, asyncio.IncompleteReadError, ValueError, zlib.error)):
+            raise urllib.error.URLError(exc) from exc
+
+
+def _request_head(
+    request_headers: dict[str, str],
+    parts: urllib.parse.SplitResult,
+    method: str,
+    data: bytes | None,
+    *,
+    proxy: str = "",
+) -> bytes:
+    target = parts.path or "/"
+    if parts.query:
+        target += "?" + parts.query
+    host = parts.hostname or ""
+    if ":" in host:
+        host = f"[{host}]"
+    if parts.port:
+        host += f":{parts.port}"
+    defaults = {
+        "Host": host,
+        "User-Agent": DEFAULT_USER_AGENT,
+        "Accept-Encoding": DEFAULT_ACCEPT_ENCODING,
+        "Connection": "keep-alive",
+    }
+    if proxy and parts.scheme == "http":
+        # Plain-http requests go to the proxy itself, in absolute form.
+        target = f"http://{host}{target}"
+        auth = proxy_authorization(proxy)
+        if auth:
+            defaults["Proxy-Authorization"] = auth
+    headers: dict[str, tuple[str, str]] = {}
+    for name, value in [*defaults.items(), *request_headers.items()]:
+        headers[name.lower()] = (name, str(value))
+    if data is not None:
+        headers["content-length"] = ("Content-Length", str(len(data)))
+    lines = [f"{method} {target} HTTP/1.1"]
+    lines.extend(f"{name}: {value}" for name, value in headers.values())
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+def _origin(url: str | urllib.parse.SplitResult) -> tuple[str, str, int]:
+    parts = urllib.parse.urlsplit(url) if isinstance(url, str) else url
+    scheme = parts.scheme.lower()
+    return scheme, (parts.hostname or "").lower(), parts.port or (443 if scheme == "https" else 80)
+
+
+def _proxy_for(parts: urllib.parse.SplitResult) -> str:
+    """Proxy URL for `parts` from the environment (as urllib resolves it), or ""."""
+    proxy = urllib.request.getproxies().get(parts.scheme, "")
+    if not proxy:
+        return ""
+    host = parts.hostname or ""
+    if urllib.request.proxy_bypass(f"{host}:{parts.port}" if parts.port else host):
+        return ""
+    if "://" not in proxy:
+        proxy = f"http://{proxy}"
+    if urllib.parse.urlsplit(proxy).scheme not in {"http", "https"}:
+        raise urllib.error.URLError(f"unsupported proxy: {proxy}")
+    return proxy
+
+
+async def _read_head(reader: asyncio.StreamReader) -> tuple[str, int, HTTPMessage]:
+    raw = await reader.readuntil(b"\r\n\r\n")
+    status_line, _, header_blob = raw.partition(b"\r\n")
+    parts = status_line.decode("latin-1").split(" ", 2)
+    if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+        raise urllib.error.URLError(f"malformed status line: {status_line[:80]!r}")
+    headers = BytesParser(_class=HTTPMessage).parsebytes(header_blob)
+    return parts[0], int(parts[1]), headers
+
+
+def _http_error(url: str, status: int, headers: HTTPMessage, body: bytes) -> urllib.error.HTTPError:
+    return urllib.error.HTTPError(url, status, f"HTTP Error {status}", headers, io.BytesIO(body))
+
+
+_ENGINE: FetchEngine | None = None
+_ENGINE_LOCK = threading.Lock()
+
+
+def get_engine() -> FetchEngine:
+    global _ENGINE
+    with _ENGINE_LOCK:
+        if _ENGINE is None:
+            _ENGINE = FetchEngine(
+                max_concurrency=_env_int("DIGEST_HTTP_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY),
+                max_per_host=_env_int("DIGEST_HTTP_MAX_PER_HOST", DEFAULT_MAX_PER_HOST),
+                idle_timeout=float(
+                    _env_int("DIGEST_HTTP_IDLE_TIMEOUT", int(DEFAULT_IDLE_TIMEOUT_SECONDS))
+                ),
+            )
+        return _ENGINE
+
+
+def send(request: HttpRequest, *, retry: RetryPolicy | None = None) -> HttpResponse:
+    """Blocking request through the shared engine (and HTTP cache, if installed)."""
+    cached = cached_response(request)
+    if cached is not None:
+        return cached
+    response = get_engine().request(request, retry=retry)
+    _cache_store(request, response)
+    return response
+
+
+def send_many(
+    requests: Sequence[HttpRequest], *, retry: RetryPolicy | None = None
+) -> list[HttpResponse | Exception]:
+    """Blocking fan-out through the shared engine; results keep request order."""
+    results: list[HttpResponse | Exception | None] = [cached_response(r) for r in requests]
+    misses = [index for index, result in enumerate(results) if result is None]
+    fetched = get_engine().request_many([requests[i] for i in misses], retry=retry)
+    for index, result in zip(misses, fetched):
+        results[index] = result
+        if isinstance(result, HttpResponse):
+            _cache_store(requests[index], result)
+    return [result for result in results if result is not None]
+
+
+def open_stream(
+    request: HttpRequest, *, retry: RetryPolicy | None = None
+) -> StreamingResponse | CachedStream:
+    """Streaming request through the shared engine; see `FetchEngine.stream`.
+
+    A cache hit replays the stored body. On a miss the body is cached only if
+    the caller reads it to the end; streams closed early are not stored.
+    """
+    cache = get_http_cache()
+    entry = cache.get(request) if cache is not None else None
+    if entry is not None:
+        return CachedStream(entry)
+    stream = get_engine().stream(request, retry=retry)
+    if cache is not None and request.cache_ttl > 0:
+        stream.on_complete = lambda body: cache.put(
+            request, url=stream.url, status=stream.status, headers=stream.headers, body=body
+        )
+    return stream
+
+
+def cached_response(request: HttpRequest) -> HttpResponse | None:
+    """Fresh cached answer for `request`, or None (no cache, no TTL, stale, absent)."""
+    cache = get_http_cache()
+    entry = cache.get(request) if cache is not None else None
+    if entry is None:
+        return None
+    return HttpResponse(
+        url=entry.url, status=entry.status, headers=entry.headers, body=entry.body, from_cache=True
+    )
+
+
+def _cache_store(request: HttpRequest, response: HttpResponse) -> None:
+    cache = get_http_cache()
+    if cache is not None and not response.from_cache:
+        cache.put(
+            request,
+            url=response.url,
+            status=response.status,
+            headers=response.headers,
+            body=response.body,
+        )
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name, "").strip()
+    try:
+        return max(1, int(raw)) if raw else default
+    except ValueError:
+        return default
@@ -0,0 +1,176 @@
+"""Streaming `<head>` sniffer shared by link previews and `/source add` detection.
+
+Both callers only need what an HTML page declares up front (title, meta
+tags, `<link>` elements), so the body is read chunk by chunk into an
+incremental parser and the connection is closed as soon as `</head>` (or
+`<body>`) is seen, a caller-supplied predicate is satisfied, or `max_bytes`
+is reached. Unread bodies are dropped by the engine rather than pooled.
+
+Because the stream is closed early, the engine never caches these bodies.
+Requests with a `cache_ttl` store the prefix that was read as a head-only
+cache entry instead, and replay it while it is fresh.
+"""
+
+from __future__ import annotations
+
+import codecs
+import re
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from typing import Callable
+
+from digest.net.engine import CachedStream, HttpRequest, open_stream
+from digest.net.http_cache import get_http_cache
+
+DEFAULT_SNIFF_MAX_BYTES = 256 * 1024
+_WHITESPACE_RE = re.compile(r"\s+")
+_CHARSET_RE = re.compile(r"charset=([\w-]+)", re.IGNORECASE)
+# HTTP cache variant for the body prefix a sniff read.
+HEAD_CACHE_VARIANT = "head"
+
+
+class HeadSniffer(HTMLParser):
+    """Incremental parser collecting the page title, meta tags and links.
+
+    Meta keys come from `itemprop`, `property` or `name` (lowercased, first
+    occurrence wins); `links` keeps every `<link>` as a lowercased-key
+    attribute map in document order. `head_done` flips at `</head>` or at the
+    first `<body>`.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.meta: dict[str, str] = {}
+        self.links: list[dict[str, str]] = []
+        self.head_done = False
+        self.text = ""
+        self._in_title = False
+        self._title_parts: list[str] = []
+
+    def feed(self, data: str) -> None:
+        self.text += data
+        super().feed(data)
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        lowered = tag.lower()
+        if lowered == "body":
+            self.head_done = True
+            return
+        if lowered == "title":
+            self._in_title = True
+            return
+        if lowered not in {"link", "meta"}:
+            return
+        attr_map = {str(key).lower(): str(value or "") for key, value in attrs}
+        if lowered == "link":
+            self.links.append(attr_map)
+            return
+        key = (
+            attr_map.get("itemprop")
+            or attr_map.get("property")
+            or attr_map.get("name")
+            or ""
+        ).strip().lower()
+        content = (attr_map.get("content") or "").strip()
+        if key and content and key not in self.meta:
+            self.meta[key] = content
+
+    def handle_endtag(self, tag: str) -> None:
+        lowered = tag.lower()
+        if lowered == "title":
+            self._in_title = False
+        elif lowered == "head":
+            self.head_done = True
+
+    def handle_data(self, data: str) -> None:
+        if self._in_title and data:
+            self._title_parts.append(data)
+
+    def pick(self, *keys: str) -> str:
+        for key in keys:
+            value = (self.meta.get(key.lower()) or "").strip()
+            if value:
+                return value
+        return ""
+
+    @property
+    def title(self) -> str:
+        return _WHITESPACE_RE.sub(" ", " ".join(self._title_parts)).strip()
+
+
+@dataclass(slots=True)
+class SniffedPage:
+    url: str
+    content_type: str
+    head: HeadSniffer
+    bytes_read: int
+
+
+def parse_head(text: str) -> HeadSniffer:
+    sniffer = HeadSniffer()
+    sniffer.feed(text)
+    sniffer.close()
+    return sniffer
+
+
+def sniff_html_head(
+    request: HttpRequest,
+    *,
+    max_bytes: int = DEFAULT_SNIFF_MAX_BYTES,
+    stop: Callable[[HeadSniffer], bool] | None = None,
+    until_head_end: bool = True,
+    require_html: bool = False,
+) -> SniffedPage:
+    """Stream `request` into a `HeadSniffer`, stopping as early as possible.
+
+    With `require_html`, a declared non-HTML Content-Type raises before any
+    body byte is read. `until_head_end=False` keeps reading past `</head>`
+    (up to `max_bytes`) until `stop` holds, for markers that may sit in the
+    body.
+    """
+    cache = get_http_cache()
+    cached = cache.get(request, variant=HEAD_CACHE_VARIANT) if cache is not None else None
+    with CachedStream(cached) if cached is not None else open_stream(request) as stream:
+        content_type = str(stream.headers.get("Content-Type", "") or "").lower()
+        if require_html and content_type and "html" not in content_type:
+            raise RuntimeError(f"unsupported content type: {content_type}")
+        decoder = codecs.getincrementaldecoder(_charset(content_type))(errors="replace")
+        sniffer = HeadSniffer()
+        consumed: list[bytes] = []
+        received = 0
+        for chunk in stream.iter_chunks():
+            chunk = chunk[: max_bytes - received]
+            received += len(chunk)
+            consumed.append(chunk)
+            sniffer.feed(decoder.decode(chunk))
+            if until_head_end and sniffer.head_done:
+                break
+            if stop is not None and stop(sniffer):
+                break
+            if received >= max_bytes:
+                break
+        if cache is not None and not getattr(stream, "from_cache", False):
+            cache.put(
+                request,
+                url=str(stream.url or request.url),
+                status=stream.status,
+                headers=stream.headers,
+                body=b"".join(consumed),
+                variant=HEAD_CACHE_VARIANT,
+            )
+        return SniffedPage(
+            url=str(stream.url or request.url),
+            content_type=content_type,
+            head=sniffer,
+            bytes_read=stream.bytes_read,
+        )
+
+
+def _charset(content_type: str) -> str:
+    match = _CHARSET_RE.search(content_type)
+    if match:
+        try:
+            return codecs.lookup(match.group(1)).name
+        except LookupError:
+            pass
+    return "utf-8"
@@ -0,0 +1,234 @@
+"""On-disk response cache shared by every connector that goes through the engine.
+
+Entries are content-addressed: the file name is the SHA-256 of the method,
+URL, body cap and the request headers that change the answer (`Accept`,
+`Accept-Language`, `Authorization`). Conditional headers are left out of the
+key, so a fresh entry answers a revalidation without touching the network.
+Each entry is one file: a JSON metadata line followed by the decoded body.
+A `variant` keeps partial bodies apart from full ones: the `<head>` sniffer
+stores the prefix it read under the "head" variant, which plain `get()`
+calls never see.
+
+Freshness is decided per request (`HttpRequest.cache_ttl`), so each connector
+picks its own TTL; `cache_ttl()` reads the defaults below, overridable with
+`DIGEST_HTTP_CACHE_TTL_<CONNECTOR>` (seconds, 0 disables that connector).
+The directory is bounded by `max_bytes`: hits refresh an entry's mtime and
+writes that push the total over the limit evict least-recently-used files.
+
+The library default is no cache; the CLI turns it on under `.runtime/` unless
+`--no-http-cache` is given or DIGEST_HTTP_CACHE=0.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from http.client import HTTPMessage
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from digest.net.engine import HttpRequest
+
+DEFAULT_HTTP_CACHE_DIR = ".runtime/http_cache"
+DEFAULT_HTTP_CACHE_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_CACHE_TTLS = {
+    "rss": 600,
+    "github": 300,
+    "x": 120,
+    "link_preview": 24 * 3600,
+}
+CACHEABLE_METHODS = frozenset({"GET"})
+_KEY_HEADERS = ("accept", "accept-language", "authorization")
+# Describe the wire body, not the decoded bytes the cache stores.
+_DROPPED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding", "connection"})
+# Evict down to this fraction of the limit so a full cache does not rescan on every write.
+_EVICT_TARGET = 0.9
+
+
+@dataclass(slots=True)
+class CachedEntry:
+    url: str
+    status: int
+    headers: HTTPMessage
+    body: bytes
+
+
+class HttpCache:
+    def __init__(self, root: str | Path, *, max_bytes: int = DEFAULT_HTTP_CACHE_MAX_BYTES) -> None:
+        self.root = Path(root)
+        self.max_bytes = max(1, int(max_bytes))
+        self._lock = threading.Lock()
+        self._total_bytes: int | None = None
+        self.hits = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def get(self, request: HttpRequest, *, variant: str = "") -> CachedEntry | None:
+        if not _cacheable(request):
+            return None
+        path = self._path(request, variant)
+        try:
+            with path.open("rb") as handle:
+                meta = json.loads(handle.readline().decode("utf-8"))
+                body = handle.read()
+        except (OSError, ValueError):
+            return None
+        if time.time() - float(meta.get("stored_at") or 0) > request.cache_ttl:
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        headers = HTTPMessage()
+        for name, value in meta.get("headers") or []:
+            headers[str(name)] = str(value)
+        with self._lock:
+            self.hits += 1
+        return CachedEntry(
+            url=str(meta.get("url") or request.url),
+            status=int(meta.get("status") or 200),
+            headers=headers,
+            body=body,
+        )
+
+    def put(
+        self,
+        request: HttpRequest,
+        *,
+        url: str,
+        status: int,
+        headers: HTTPMessage,
+        body: bytes,
+        variant: str = "",
+    ) -> None:
+        if not _cacheable(request) or status != 200:
+            return
+        meta = {
+            "url": url,
+            "status": status,
+            "stored_at": time.time(),
+            "headers": [
+                [name, value]
+                for name, value in headers.items()
+                if name.lower() not in _DROPPED_HEADERS
+            ],
+        }
+        payload = json.dumps(meta, ensure_ascii=True).encode("utf-8") + b"\n" + body
+        path = self._path(request, variant)
+        tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            previous = path.stat().st_size if path.exists() else 0
+            tmp.write_bytes(payload)
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+            return
+        with self._lock:
+            self.stores += 1
+            total = self._current_total() + len(payload) - previous
+            self._total_bytes = total
+            if total > self.max_bytes:
+                self._evict()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "stores": self.stores,
+                "evictions": self.evictions,
+            }
+
+    def _path(self, request: HttpRequest, variant: str = "") -> Path:
+        key = _cache_key(request, variant)
+        return self.root / key[:2] / key
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries: list[tuple[float, int, Path]] = []
+        for path in self.root.glob("??/*"):
+            if path.suffix == ".tmp":
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _current_total(self) -> int:
+        if self._total_bytes is None:
+            self._total_bytes = sum(size for _mtime, size, _path in self._entries())
+        return self._total_bytes
+
+    def _evict(self) -> None:
+        entries = sorted(self._entries())
+        total = sum(size for _mtime, size, _path in entries)
+        target = int(self.max_bytes * _EVICT_TARGET)
+        for _mtime, size, path in entries:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            self.evictions += 1
+        self._total_bytes = total
+
+
+def cache_ttl(connector: str) -> float:
+    """TTL in seconds for a connector's requests (0 means never cached)."""
+    raw = os.getenv(f"DIGEST_HTTP_CACHE_TTL_{connector.upper()}", "").strip()
+    try:
+        return max(0.0, float(raw)) if raw else float(DEFAULT_CACHE_TTLS.get(connector, 0))
+    except ValueError:
+        return float(DEFAULT_CACHE_TTLS.get(connector, 0))
+
+
+_CACHE: HttpCache | None = None
+_CACHE_LOCK = threading.Lock()
+
+
+def configure_http_cache(
+    *,
+    enabled: bool = True,
+    root: str | Path = DEFAULT_HTTP_CACHE_DIR,
+    max_bytes: int | None = None,
+) -> HttpCache | None:
+    """Install (or with `enabled=False` remove) the process-wide cache."""
+    global _CACHE
+    if enabled and os.getenv("DIGEST_HTTP_CACHE", "1").strip().lower() in {"0", "false", "off", "no"}:
+        enabled = False
+    if max_bytes is None:
+        raw = os.getenv("DIGEST_HTTP_CACHE_MAX_MB", "").strip()
+        max_bytes = int(raw) * 1024 * 1024 if raw.isdigit() else DEFAULT_HTTP_CACHE_MAX_BYTES
+    with _CACHE_LOCK:
+        _CACHE = HttpCache(root, max_bytes=max_bytes) if enabled else None
+        return _CACHE
+
+
+def get_http_cache() -> HttpCache | None:
+    with _CACHE_LOCK:
+        return _CACHE
+
+
+def _cacheable(request: HttpRequest) -> bool:
+    return request.cache_ttl > 0 and request.method.upper() in CACHEABLE_METHODS
+
+
+def _cache_key(request: HttpRequest, variant: str = "") -> str:
+    headers = {name.lower(): value for name, value in request.headers.items()}
+    parts = [
+        request.method.upper(),
+        request.url,
+        str(request.max_bytes or ""),
+        *(f"{name}:{headers.get(name, '')}" for name in _KEY_HEADERS),
+    ]
+    if variant:
+        parts.append(f"variant:{variant}")
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
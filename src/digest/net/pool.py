@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import ssl
+import time
+import urllib.parse
+from collections import deque
+from dataclasses import dataclass
+
+DEFAULT_MAX_IDLE_PER_HOST = 6
+DEFAULT_MAX_IDLE_TOTAL = 64
+DEFAULT_IDLE_TIMEOUT_SECONDS = 30.0
+
+# (scheme, host, port, proxy URL or "" for a direct connection)
+PoolKey = tuple[str, str, int, str]
+
+
+@dataclass(slots=True)
+class PooledConnection:
+    key: PoolKey
+    reader: asyncio.StreamReader
+    writer: asyncio.StreamWriter
+    idle_since: float = 0.0
+    requests: int = 0
+
+    def close(self) -> None:
+        try:
+            self.writer.close()
+        except Exception:
+            pass
+
+    def is_usable(self) -> bool:
+        # A server that dropped an idle keep-alive socket shows up as EOF.
+        return not self.reader.at_eof() and not self.writer.is_closing()
+
+
+class ConnectionPool:
+    """Idle keep-alive connections keyed by (scheme, host, port, proxy).
+
+    Lives on the engine's event loop and is only touched from that thread.
+    Active connections are bounded by the engine's host gates; this class
+    bounds what is kept *idle* (per host and overall) and closes sockets that
+    sat unused for longer than `idle_timeout`. Proxied http connections go to
+    the proxy itself; proxied https connections are CONNECT tunnels with TLS
+    to the origin on top.
+    """
+
+    def __init__(
+        self,
+        *,
+        ssl_context: ssl.SSLContext,
+        max_idle_per_host: int = DEFAULT_MAX_IDLE_PER_HOST,
+        max_idle_total: int = DEFAULT_MAX_IDLE_TOTAL,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT_SECONDS,
+    ) -> None:
+        self._ssl_context = ssl_context
+        self.max_idle_per_host = max(0, max_idle_per_host)
+        self.max_idle_total = max(0, max_idle_total)
+        self.idle_timeout = max(0.0, idle_timeout)
+        self._idle: dict[PoolKey, deque[PooledConnection]] = {}
+        self._idle_count = 0
+        self._sweep_handle: asyncio.TimerHandle | None = None
+        self.opened = 0
+        self.reused = 0
+
+    async def acquire(self, key: PoolKey) -> tuple[PooledConnection, bool]:
+        """Return `(connection, reused)`; reuses the most recently idled socket."""
+        self._evict_expired(time.monotonic())
+        idle = self._idle.get(key)
+        while idle:
+            conn = idle.pop()
+            self._idle_count -= 1
+            if conn.is_usable():
+                conn.requests += 1
+                self.reused += 1
+                return conn, True
+            conn.close()
+        scheme, host, port, proxy = key
+        secure = scheme == "https"
+        if proxy:
+            reader, writer = await self._open_via_proxy(proxy, host, port, secure=secure)
+        else:
+            reader, writer = await asyncio.open_connection(
+                host,
+                port,
+                ssl=self._ssl_context if secure else None,
+                server_hostname=host if secure else None,
+            )
+        self.opened += 1
+        return PooledConnection(key=key, reader=reader, writer=writer, requests=1), False
+
+    async def _open_via_proxy(
+        self, proxy: str, host: str, port: int, *, secure: bool
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        parts = urllib.parse.urlsplit(proxy)
+        proxy_secure = parts.scheme == "https"
+        reader, writer = await asyncio.open_connection(
+            parts.hostname,
+            parts.port or (443 if proxy_secure else 80),
+            ssl=self._ssl_context if proxy_secure else None,
+            server_hostname=parts.hostname if proxy_secure else None,
+        )
+        if not secure:
+            return reader, writer
+        try:
+            authority = f"[{host}]:{port}" if ":" in host else f"{host}:{port}"
+            lines = [f"CONNECT {authority} HTTP/1.1", f"Host: {authority}"]
+            auth = proxy_authorization(proxy)
+            if auth:
+                lines.append(f"Proxy-Authorization: {auth}")
+            writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+            await writer.drain()
+            head = await reader.readuntil(b"\r\n\r\n")
+            status_line = head.partition(b"\r\n")[0].decode("latin-1")
+            status = status_line.split(" ", 2)
+            if len(status) < 2 or status[1] != "200":
+                raise ConnectionRefusedError(f"proxy refused CONNECT {authority}: {status_line}")
+            await writer.start_tls(self._ssl_context, server_hostname=host)
+        except BaseException:
+            writer.close()
+            raise
+        return reader, writer
+
+    def release(self, conn: PooledConnection, *, reusable: bool) -> None:
+        if not reusable or self.max_idle_per_host == 0 or not conn.is_usable():
+            conn.close()
+            return
+        idle = self._idle.setdefault(conn.key, deque())
+        if len(idle) >= self.max_idle_per_host:
+            idle.popleft().close()
+            self._idle_count -= 1
+        conn.idle_since = time.monotonic()
+        idle.append(conn)
+        self._idle_count += 1
+        while self._idle_count > self.max_idle_total:
+            self._drop_oldest()
+        self._schedule_sweep()
+
+    def idle_count(self, key: PoolKey | None = None) -> int:
+        if key is None:
+            return self._idle_count
+        return len(self._idle.get(key) or ())
+
+    async def aclose(self) -> None:
+        if self._sweep_handle is not None:
+            self._sweep_handle.cancel()
+            self._sweep_handle = None
+        conns = [conn for idle in self._idle.values() for conn in idle]
+        self._idle.clear()
+        self._idle_count = 0
+        for conn in conns:
+            conn.close()
+        for conn in conns:
+            try:
+                await asyncio.wait_for(conn.writer.wait_closed(), timeout=1)
+            except Exception:
+                pass
+
+    def _evict_expired(self, now: float) -> None:
+        for key in list(self._idle):
+            idle = self._idle[key]
+            while idle and now - idle[0].idle_since >= self.idle_timeout:
+                idle.popleft().close()
+                self._idle_count -= 1
+            if not idle:
+                del self._idle[key]
+
+    def _drop_oldest(self) -> None:
+        oldest_key = min(
+            (key for key, idle in self._idle.items() if idle),
+            key=lambda key: self._idle[key][0].idle_since,
+        )
+        self._idle[oldest_key].popleft().close()
+        self._idle_count -= 1
+
+    def _schedule_sweep(self) -> None:
+        if self._sweep_handle is not None or not self._idle_count:
+            return
+        loop = asyncio.get_running_loop()
+        self._sweep_handle = loop.call_later(self.idle_timeout, self._sweep)
+
+    def _sweep(self) -> None:
+        self._sweep_handle = None
+        self._evict_expired(time.monotonic())
+        self._schedule_sweep()
+
+
+def proxy_authorization(proxy: str) -> str:
+    """Basic `Proxy-Authorization` value for credentials in a proxy URL, or ""."""
+    parts = urllib.parse.urlsplit(proxy)
+    if parts.username is None:
+        return ""
+    user = urllib.parse.unquote(parts.username)
+    password = urllib.parse.unquote(parts.password or "")
+    token = base64.b64encode(f"{user}:{password}".encode("utf-8")).decode("ascii")
+    return f"Basic {token}"
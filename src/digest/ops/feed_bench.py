@@ -0,0 +1,56 @@
+"""Feed-parser backend comparison for `digest bench-feeds`.
+
+Parses recorded feed files with every installed backend, checks that each one
+returns exactly the stdlib items, and reports best-of-N timings so operators
+can decide whether DIGEST_FEED_PARSER is worth changing on their hardware.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from digest.connectors.feed_parsers import available_feed_backends, parse_feed_items
+
+DEFAULT_FEED_FIXTURES_DIR = Path("tests/fixtures/feeds")
+
+
+@dataclass(slots=True)
+class FeedBenchRow:
+    path: str
+    items: int
+    # backend name -> best wall time in milliseconds
+    timings_ms: dict[str, float] = field(default_factory=dict)
+    # backends whose items differ from the stdlib parse
+    mismatched: list[str] = field(default_factory=list)
+
+
+def bench_feed_backends(
+    paths: list[Path],
+    *,
+    repeat: int = 10,
+    backends: list[str] | None = None,
+) -> list[FeedBenchRow]:
+    names = backends or available_feed_backends()
+    rows: list[FeedBenchRow] = []
+    for path in paths:
+        content = path.read_bytes()
+        feed_url = f"file://{path.name}"
+        reference = parse_feed_items(feed_url, content, backend="stdlib")
+        row = FeedBenchRow(path=str(path), items=len(reference))
+        for name in names:
+            if parse_feed_items(feed_url, content, backend=name) != reference:
+                row.mismatched.append(name)
+            best = float("inf")
+            for _ in range(max(1, repeat)):
+                started = time.perf_counter()
+                parse_feed_items(feed_url, content, backend=name)
+                best = min(best, time.perf_counter() - started)
+            row.timings_ms[name] = best * 1000
+        rows.append(row)
+    return rows
+
+
+def default_feed_fixtures() -> list[Path]:
+    return sorted(DEFAULT_FEED_FIXTURES_DIR.glob("*.xml"))
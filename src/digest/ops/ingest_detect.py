@@ -8,13 +8,13 @@ ingest suggestion instead of dead-ending.
 
 from __future__ import annotations
 
-from html.parser import HTMLParser
 import re
 import urllib.parse
-import urllib.request
 from dataclasses import dataclass
 from typing import Callable
 
+from digest.net.engine import HttpRequest
+from digest.net.html_head import HeadSniffer, parse_head, sniff_html_head
 from digest.ops.source_registry import canonicalize_source_value
 
 FETCH_TIMEOUT_SECONDS = 4
@@ -27,6 +27,7 @@ _YT_PAGE_CHANNEL_ID_RE = re.compile(r'"channelId"\s*:\s*"(UC[0-9A-Za-z_-]{22})"'
 _YT_CHANNEL_PATH_RE = re.compile(r"/channel/(UC[0-9A-Za-z_-]{22})")
 
 _FEED_TYPES = {"application/rss+xml", "application/atom+xml"}
+_YOUTUBE_HOSTS = {"youtube.com", "m.youtube.com", "youtu.be"}
 
 # github.com paths that are product routes, not owners/repos.
 _GITHUB_RESERVED_PATHS = {
@@ -60,49 +61,41 @@ class IngestDetection:
     invalid: bool = False  # value failed validation - do not log as a suggestion
 
 
-class _PageParser(HTMLParser):
-    """Attribute-order-independent scan for feed <link>s and <meta> values."""
-
-    def __init__(self) -> None:
-        super().__init__()
-        self.feed_href = ""
-        self.meta: dict[str, str] = {}
-
-    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
-        lowered = tag.lower()
-        if lowered not in {"link", "meta"}:
-            return
-        attr_map = {str(key).lower(): str(value or "") for key, value in attrs}
-        if lowered == "link":
-            if self.feed_href:
-                return
-            rel = attr_map.get("rel", "").lower().split()
-            content_type = attr_map.get("type", "").strip().lower()
-            if "alternate" in rel and content_type in _FEED_TYPES:
-                self.feed_href = attr_map.get("href", "").strip()
-            return
-        key = (
-            attr_map.get("itemprop")
-            or attr_map.get("property")
-            or attr_map.get("name")
-            or ""
-        ).strip().lower()
-        content = (attr_map.get("content") or "").strip()
-        if key and content and key not in self.meta:
-            self.meta[key] = content
-
-
-def _parse_page(body: str) -> _PageParser:
-    parser = _PageParser()
-    parser.feed(body)
-    return parser
+def _feed_href(head: HeadSniffer) -> str:
+    """First `<link rel="alternate">` advertising an RSS/Atom feed."""
+    for attrs in head.links:
+        rel = attrs.get("rel", "").lower().split()
+        if "alternate" in rel and attrs.get("type", "").strip().lower() in _FEED_TYPES:
+            href = attrs.get("href", "").strip()
+            if href:
+                return href
+    return ""
+
+
+def _looks_like_feed(body: str) -> bool:
+    head = body.lstrip()[:200].lower()
+    return head.startswith("<?xml") or "<rss" in head or "<feed" in head
+
+
+def _enough_to_detect(head: HeadSniffer) -> bool:
+    return bool(_feed_href(head) or _looks_like_feed(head.text) or _channel_id_from_head(head))
 
 
 def _default_fetch(url: str) -> tuple[str, str]:
-    req = urllib.request.Request(url, headers={"User-Agent": _USER_AGENT})
-    with urllib.request.urlopen(req, timeout=FETCH_TIMEOUT_SECONDS) as resp:
-        final_url = str(resp.geturl() or url)
-        return final_url, resp.read(MAX_FETCH_BYTES).decode("utf-8", errors="replace")
+    """Stream just enough of the page to detect it.
+
+    Feed autodiscovery only needs `<head>`; YouTube's channel id markers can
+    sit in the body, so those pages are read until one shows up (bounded by
+    MAX_FETCH_BYTES).
+    """
+    host = urllib.parse.urlparse(url).netloc.lower().removeprefix("www.")
+    page = sniff_html_head(
+        HttpRequest(url=url, headers={"User-Agent": _USER_AGENT}, timeout=FETCH_TIMEOUT_SECONDS),
+        max_bytes=MAX_FETCH_BYTES,
+        stop=_enough_to_detect,
+        until_head_end=host not in _YOUTUBE_HOSTS,
+    )
+    return page.url, page.head.text
 
 
 def detect_ingest(raw: str, fetch: Fetcher | None = None) -> IngestDetection | None:
@@ -138,7 +131,7 @@ def detect_ingest(raw: str, fetch: Fetcher | None = None) -> IngestDetection | N
     if host in {"x.com", "twitter.com"}:
         return _try("x_author", value)
 
-    if host in {"youtube.com", "m.youtube.com", "youtu.be"}:
+    if host in _YOUTUBE_HOSTS:
         if len(path_parts) >= 2 and path_parts[0] == "channel":
             match = _YT_CHANNEL_ID_RE.fullmatch(path_parts[1])
             if match:
@@ -157,10 +150,9 @@ def detect_ingest(raw: str, fetch: Fetcher | None = None) -> IngestDetection | N
         final_url, body = fetch(value)
     except Exception:
         return IngestDetection("", value, note="unreachable")
-    head = body.lstrip()[:200].lower()
-    if head.startswith("<?xml") or "<rss" in head or "<feed" in head:
+    if _looks_like_feed(body):
         return IngestDetection("rss", value)
-    href = _parse_page(body).feed_href
+    href = _feed_href(parse_head(body))
     if href:
         feed_url = urllib.parse.urljoin(final_url or value, href)
         return IngestDetection("rss", feed_url, note="feed discovered on page")
@@ -168,12 +160,16 @@ def detect_ingest(raw: str, fetch: Fetcher | None = None) -> IngestDetection | N
 
 
 def _channel_id_from_page(page: str) -> str:
+    return _channel_id_from_head(parse_head(page))
+
+
+def _channel_id_from_head(head: HeadSniffer) -> str:
     """Pull the channel id from anchored markers only - a bare UC... match can
     hit a related channel or any 24-char substring."""
-    match = _YT_PAGE_CHANNEL_ID_RE.search(page)
+    match = _YT_PAGE_CHANNEL_ID_RE.search(head.text)
     if match:
         return match.group(1)
-    meta = _parse_page(page).meta
+    meta = head.meta
     identifier = meta.get("identifier", "")
     if _YT_CHANNEL_ID_RE.fullmatch(identifier):
         return identifier
@@ -0,0 +1,117 @@
+"""Adaptive polling: skip sources that are not expected to have new content.
+
+A source's update interval is the median gap between the publish times of
+the items it has linked (`source_item_links`). A source is due again once a
+fraction of that interval has passed since it was last polled successfully,
+and never later than `max_staleness`. Sources without enough history, or
+that update faster than the run cadence, are polled every run.
+
+Last-poll times are kept whenever the planner tracks a run, even with
+skipping turned off. The runtime only flushes them once the run's items were
+delivered or pooled, so an accumulated run does not count as a poll.
+`window_start()` uses them to read a source back to its
+last successful poll, so a source that was skipped (by this planner or by
+quarantine) still yields what it published in the meantime.
+"""
+
+from __future__ import annotations
+
+import statistics
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from digest.constants import (
+    POLL_CATCHUP_MAX_HOURS,
+    POLL_HISTORY_ITEMS,
+    POLL_INTERVAL_FRACTION,
+    POLL_MIN_GAPS,
+)
+from digest.storage.sqlite_store import SQLiteStore
+
+
+@dataclass(slots=True)
+class PollDecision:
+    source_key: str
+    due: bool
+    next_due_at: datetime | None
+    interval_hours: float | None
+
+
+class SourcePollPlanner:
+    """Run-scoped poll decisions; `mark_polled()` buffers, `flush()` persists."""
+
+    def __init__(
+        self,
+        store: SQLiteStore,
+        source_keys: list[str],
+        *,
+        max_staleness_hours: float,
+        enabled: bool = True,
+        now: datetime | None = None,
+    ) -> None:
+        self._store = store
+        self._now = now or datetime.now(timezone.utc)
+        self._max_staleness = timedelta(hours=max(0.0, float(max_staleness_hours)))
+        self.tracking = enabled and bool(source_keys)
+        self.enabled = self.tracking and self._max_staleness > timedelta(0)
+        self._history = (
+            store.source_publish_history(source_keys, per_source=POLL_HISTORY_ITEMS)
+            if self.enabled
+            else {}
+        )
+        self._polled = store.get_source_poll_times(source_keys) if self.tracking else {}
+        self._pending: dict[str, datetime] = {}
+        self.skipped: dict[str, str] = {}
+        self.next_due: dict[str, str] = {}
+
+    def interval(self, source_key: str) -> timedelta | None:
+        published = self._history.get(source_key) or []
+        gaps = [
+            (newer - older).total_seconds()
+            for newer, older in zip(published, published[1:])
+            if newer > older
+        ]
+        if len(gaps) < POLL_MIN_GAPS:
+            return None
+        return timedelta(seconds=statistics.median(gaps))
+
+    def decide(self, source_key: str) -> PollDecision:
+        interval = self.interval(source_key)
+        last_polled = self._polled.get(source_key)
+        if not self.enabled or interval is None or last_polled is None:
+            return PollDecision(source_key, True, None, _hours(interval))
+        wait = min(interval * POLL_INTERVAL_FRACTION, self._max_staleness)
+        next_due_at = last_polled + wait
+        return PollDecision(source_key, next_due_at <= self._now, next_due_at, _hours(interval))
+
+    def is_due(self, source_key: str) -> bool:
+        """Decide for one source, noting skips and next-due times for the run context."""
+        decision = self.decide(source_key)
+        if not decision.due and decision.next_due_at is not None:
+            self.skipped[source_key] = decision.next_due_at.isoformat()
+        return decision.due
+
+    def window_start(self, source_key: str, default: datetime) -> datetime:
+        """Where this source's fetch window starts: its last successful poll if older than `default`."""
+        last_polled = self._polled.get(source_key)
+        if last_polled is None or last_polled >= default:
+            return default
+        return max(last_polled, self._now - timedelta(hours=POLL_CATCHUP_MAX_HOURS))
+
+    def mark_polled(self, source_key: str) -> None:
+        if not self.tracking:
+            return
+        self._pending[source_key] = self._now
+        interval = self.interval(source_key)
+        if interval is not None:
+            wait = min(interval * POLL_INTERVAL_FRACTION, self._max_staleness)
+            self.next_due[source_key] = (self._now + wait).isoformat()
+
+    def flush(self) -> None:
+        rows = dict(self._pending)
+        self._pending.clear()
+        self._store.upsert_source_poll_times(rows)
+
+
+def _hours(interval: timedelta | None) -> float | None:
+    return round(interval.total_seconds() / 3600, 2) if interval is not None else None
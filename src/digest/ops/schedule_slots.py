@@ -75,6 +75,12 @@ def is_quiet_hours_active(schedule: dict[str, Any], *, local_dt: datetime) -> bo
     return current_minutes >= start_minutes or current_minutes < end_minutes
 
 
+def _quiet_at(schedule: dict[str, Any], when_utc: datetime) -> bool:
+    return is_quiet_hours_active(
+        schedule, local_dt=when_utc.astimezone(ZoneInfo(schedule["timezone"]))
+    )
+
+
 def evaluate_schedule_tick(
     profile_cfg: Any, now_utc: datetime, last_triggered_slot: str
 ) -> tuple[str, str]:
@@ -87,8 +93,7 @@ def evaluate_schedule_tick(
     schedule = schedule_config_from_profile(profile_cfg)
     if not schedule["enabled"]:
         return "disabled", ""
-    local_now = now_utc.astimezone(ZoneInfo(schedule["timezone"]))
-    if is_quiet_hours_active(schedule, local_dt=local_now):
+    if _quiet_at(schedule, now_utc):
         return "quiet", ""
     due_slot, _next_slot = due_slot_utc(
         cadence=schedule["cadence"],
@@ -101,3 +106,38 @@ def evaluate_schedule_tick(
     if now_utc >= due_slot and last_triggered_slot != due_iso:
         return "run", due_iso
     return "wait", due_iso
+
+
+def next_prefetch_shard(
+    profile_cfg: Any, now_utc: datetime, prefetched: dict[str, Any]
+) -> tuple[str, int] | None:
+    """Shard whose background sub-slot has come up before the next delivery slot.
+
+    With ``profile.fetch_shards`` > 1 the ``fetch_shard_lead_minutes`` before
+    each slot are split into one sub-slot per shard. ``prefetched`` is the
+    persisted ``{"slot": ..., "shards": [...]}`` marker; returns
+    (slot_iso, shard) for the first due shard not yet fetched for that slot.
+    Nothing is prefetched for a slot that falls in quiet hours.
+    """
+    shard_count = int(getattr(profile_cfg, "fetch_shards", 1) or 1)
+    schedule = schedule_config_from_profile(profile_cfg)
+    if not schedule["enabled"] or shard_count <= 1:
+        return None
+    due_slot, next_slot = due_slot_utc(
+        cadence=schedule["cadence"],
+        time_local=schedule["time_local"],
+        hourly_minute=schedule["hourly_minute"],
+        timezone_name=schedule["timezone"],
+        now_utc=now_utc,
+    )
+    if _quiet_at(schedule, next_slot):
+        return None
+    lead_minutes = int(getattr(profile_cfg, "fetch_shard_lead_minutes", 60) or 60)
+    lead = min(timedelta(minutes=lead_minutes), next_slot - due_slot)
+    step = lead / shard_count
+    slot_iso = next_slot.isoformat()
+    done = set(prefetched.get("shards") or []) if prefetched.get("slot") == slot_iso else set()
+    for shard in range(shard_count):
+        if shard not in done and now_utc >= next_slot - lead + step * shard:
+            return slot_iso, shard
+    return None
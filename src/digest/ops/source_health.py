@@ -0,0 +1,147 @@
+"""Per-source fetch health: latency history, failure streaks and quarantine.
+
+Each feed-backed source (RSS, YouTube channel) keeps its last successful
+fetch latencies, its consecutive failure count and its last success/error in
+the `source_health` table. The runtime uses that history to give a source a
+timeout derived from its own p95 instead of the connector default, to stop
+retrying a source that is already failing, and to skip quarantined sources
+entirely until their re-probe time. Every failed probe doubles the re-probe
+interval; one success clears the quarantine.
+
+Only feeds are covered. GitHub and X selectors are fetched together as one
+task each, with the connector's fixed timeout and retries. Their
+per-selector errors are rate-limit deferrals or provider-wide failures, not
+signs that one source is unhealthy, so they are never quarantined and do
+not appear in `/source health`.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+from digest.constants import (
+    SOURCE_HEALTH_LATENCY_SAMPLES,
+    SOURCE_HEALTH_MIN_SAMPLES,
+    SOURCE_QUARANTINE_AFTER_FAILURES,
+    SOURCE_QUARANTINE_BASE_HOURS,
+    SOURCE_QUARANTINE_MAX_HOURS,
+    SOURCE_TIMEOUT_MIN_SECONDS,
+    SOURCE_TIMEOUT_P95_MULTIPLIER,
+)
+from digest.storage.sqlite_store import SQLiteStore
+
+
+@dataclass(slots=True)
+class SourceHealth:
+    source_key: str
+    latencies: list[float] = field(default_factory=list)
+    consecutive_failures: int = 0
+    quarantine_count: int = 0
+    quarantined_until: datetime | None = None
+    last_success_at: datetime | None = None
+    last_failure_at: datetime | None = None
+    last_error: str = ""
+
+    def percentile(self, q: float) -> float | None:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))
+        return ordered[index]
+
+    def quarantined_at(self, now: datetime) -> bool:
+        return self.quarantined_until is not None and self.quarantined_until > now
+
+    def as_row(self) -> dict[str, object]:
+        return {
+            "source_key": self.source_key,
+            "latencies": list(self.latencies),
+            "consecutive_failures": self.consecutive_failures,
+            "quarantine_count": self.quarantine_count,
+            "quarantined_until": self.quarantined_until,
+            "last_success_at": self.last_success_at,
+            "last_failure_at": self.last_failure_at,
+            "last_error": self.last_error,
+        }
+
+
+def load_source_health(store: SQLiteStore, source_keys: list[str] | None = None) -> list[SourceHealth]:
+    return [
+        SourceHealth(source_key=key, **row)  # type: ignore[arg-type]
+        for key, row in sorted(store.get_source_health(source_keys).items())
+    ]
+
+
+class SourceHealthTracker:
+    """Run-scoped view of source health; `record()` buffers, `flush()` persists."""
+
+    def __init__(
+        self,
+        store: SQLiteStore,
+        source_keys: list[str],
+        *,
+        now: datetime | None = None,
+    ) -> None:
+        self._store = store
+        self._now = now or datetime.now(timezone.utc)
+        self._health = {
+            health.source_key: health
+            for health in (load_source_health(store, source_keys) if source_keys else [])
+        }
+        self._dirty: set[str] = set()
+        self.skipped: list[str] = []
+        self.newly_quarantined: list[str] = []
+
+    def get(self, source_key: str) -> SourceHealth:
+        health = self._health.get(source_key)
+        if health is None:
+            health = self._health[source_key] = SourceHealth(source_key=source_key)
+        return health
+
+    def should_skip(self, source_key: str) -> bool:
+        """True (and noted in `skipped`) while the source is quarantined."""
+        if self.get(source_key).quarantined_at(self._now):
+            self.skipped.append(source_key)
+            return True
+        return False
+
+    def timeout_for(self, source_key: str, default: float) -> int:
+        health = self.get(source_key)
+        p95 = health.percentile(0.95)
+        if p95 is None or len(health.latencies) < SOURCE_HEALTH_MIN_SAMPLES:
+            return int(default)
+        adaptive = math.ceil(p95 * SOURCE_TIMEOUT_P95_MULTIPLIER)
+        return int(min(default, max(SOURCE_TIMEOUT_MIN_SECONDS, adaptive)))
+
+    def retries_for(self, source_key: str, default: int) -> int:
+        # A source that failed last time gets a single attempt (a probe).
+        return 0 if self.get(source_key).consecutive_failures else default
+
+    def record(self, source_key: str, *, elapsed_s: float, error: Exception | None) -> None:
+        health = self.get(source_key)
+        if error is None:
+            health.latencies = [*health.latencies, float(elapsed_s)][-SOURCE_HEALTH_LATENCY_SAMPLES:]
+            health.consecutive_failures = 0
+            health.quarantine_count = 0
+            health.quarantined_until = None
+            health.last_success_at = self._now
+        else:
+            health.consecutive_failures += 1
+            health.last_failure_at = self._now
+            health.last_error = str(error)
+            if health.consecutive_failures >= SOURCE_QUARANTINE_AFTER_FAILURES:
+                hours = min(
+                    SOURCE_QUARANTINE_MAX_HOURS,
+                    SOURCE_QUARANTINE_BASE_HOURS * 2**health.quarantine_count,
+                )
+                health.quarantined_until = self._now + timedelta(hours=hours)
+                health.quarantine_count += 1
+                self.newly_quarantined.append(source_key)
+        self._dirty.add(source_key)
+
+    def flush(self) -> None:
+        rows = [self._health[key].as_row() for key in sorted(self._dirty)]
+        self._dirty.clear()
+        self._store.upsert_source_health(rows)
@@ -0,0 +1,87 @@
+"""Split configured sources into fetch shards for the scheduler.
+
+With `fetch_shards > 1` the scheduler fetches each shard in its own
+background sub-slot ahead of a delivery slot. Fetched items are pooled in
+the store, and the delivery run scores and renders the pool instead of
+hitting every source at once. Shards are balanced by a per-type cost
+weight (a GitHub org fans out into many API calls, a feed is one request).
+Ties are broken by a stable hash of the source key, so a given source list
+always splits the same way.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import replace
+
+from digest.config import SourceConfig
+from digest.constants import SOURCE_SHARD_WEIGHTS
+from digest.ops.source_registry import source_key_for
+
+# SourceConfig list field for each shardable source type. The X inbox is a
+# local file and always stays with the delivery run.
+_SHARDABLE_FIELDS = {
+    "rss": "rss_feeds",
+    "youtube_channel": "youtube_channels",
+    "x_author": "x_authors",
+    "x_theme": "x_themes",
+    "github_repo": "github_repos",
+    "github_topic": "github_topics",
+    "github_query": "github_search_queries",
+    "github_org": "github_orgs",
+}
+
+
+def shardable_sources(sources: SourceConfig) -> list[tuple[str, str, str]]:
+    """(source_type, value, source_key) for every source that can be sharded."""
+    return [
+        (source_type, value, source_key_for(source_type, value))
+        for source_type, attr in _SHARDABLE_FIELDS.items()
+        for value in getattr(sources, attr)
+    ]
+
+
+def _stable_hash(source_key: str) -> int:
+    return int.from_bytes(hashlib.sha1(source_key.encode("utf-8")).digest()[:8], "big")
+
+
+def plan_source_shards(sources: SourceConfig, shard_count: int) -> list[SourceConfig]:
+    """Greedy cost-weighted split into `shard_count` source configs (inbox excluded)."""
+    shard_count = max(1, int(shard_count))
+    entries = sorted(
+        shardable_sources(sources),
+        key=lambda entry: (-SOURCE_SHARD_WEIGHTS.get(entry[0], 1), _stable_hash(entry[2])),
+    )
+    loads = [0] * shard_count
+    members: list[dict[str, list[str]]] = [{} for _ in range(shard_count)]
+    for source_type, value, _key in entries:
+        shard = min(range(shard_count), key=lambda index: (loads[index], index))
+        loads[shard] += SOURCE_SHARD_WEIGHTS.get(source_type, 1)
+        members[shard].setdefault(source_type, []).append(value)
+    return [
+        _with_values(sources, shard_members, keep_inbox=False) for shard_members in members
+    ]
+
+
+def sources_excluding(sources: SourceConfig, source_keys: set[str]) -> SourceConfig:
+    """The sources (inbox included) whose keys are not in `source_keys`."""
+    remaining: dict[str, list[str]] = {}
+    for source_type, value, key in shardable_sources(sources):
+        if key not in source_keys:
+            remaining.setdefault(source_type, []).append(value)
+    return _with_values(sources, remaining, keep_inbox=True)
+
+
+def _with_values(
+    sources: SourceConfig, values: dict[str, list[str]], *, keep_inbox: bool
+) -> SourceConfig:
+    # Keep the configured order inside each list so fetch results stay stable.
+    chosen = {source_type: set(items) for source_type, items in values.items()}
+    return replace(
+        sources,
+        x_inbox_path=sources.x_inbox_path if keep_inbox else "",
+        **{
+            attr: [v for v in getattr(sources, attr) if v in chosen.get(source_type, set())]
+            for source_type, attr in _SHARDABLE_FIELDS.items()
+        },
+    )
@@ -0,0 +1,144 @@
+"""Cross-run story index: recognise a story that was already scored or sent.
+
+Dedupe only sees one run's items, so the same story from another outlet on
+the next day arrives as a new URL. Every scored item is indexed with its
+shingles and MinHash/LSH bucket keys (`story_index`/`story_buckets`).
+A later run looks its candidates up by bucket: one query per 500 keys. It
+then checks the exact Jaccard similarity against the stored shingles.
+Entries expire after the profile's `story_index_ttl_days`.
+
+Shingles come from the title, except for templated titles ("X post by
+@handle", bare release tags) and titles too short to tell stories apart.
+Those items are keyed on their description, or the start of their text,
+instead. Items that still have fewer than `STORY_MIN_SHINGLES` shingles are
+neither indexed nor matched.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from digest.constants import (
+    STORY_BODY_TOKENS,
+    STORY_INDEX_THRESHOLD,
+    STORY_MIN_SHINGLES,
+    STORY_MIN_TITLE_TOKENS,
+)
+from digest.models import Item
+from digest.pipeline.dedupe import TOKEN_RE
+from digest.pipeline.near_dup import MinHasher, jaccard
+from digest.storage.sqlite_store import SQLiteStore
+from digest.urls import canonical_url
+
+
+# Titles generated by connectors rather than written by the author.
+_TEMPLATED_TITLE_RE = re.compile(
+    r"^(?:x post(?: by @\w*)?|release [\w./-]+|(?:release )?v?\d+(?:[.\-_+][0-9a-z]+)*)$",
+    re.IGNORECASE,
+)
+
+
+def story_shingles(item: Item) -> frozenset[str]:
+    """Shingles that identify the story behind `item` (empty when too few)."""
+    title = " ".join(item.title.split())
+    tokens = TOKEN_RE.findall(title.lower())
+    if _TEMPLATED_TITLE_RE.match(title) or len(set(tokens)) < STORY_MIN_TITLE_TOKENS:
+        body = item.description.strip() or item.raw_text
+        body_tokens = list(dict.fromkeys(TOKEN_RE.findall(body.lower())))[:STORY_BODY_TOKENS]
+        shingles = frozenset(f"d:{token}" for token in body_tokens)
+    else:
+        shingles = frozenset(tokens)
+    return shingles if len(shingles) >= STORY_MIN_SHINGLES else frozenset()
+
+
+@dataclass(slots=True)
+class StoryMatch:
+    item_id: str
+    story_id: str
+    matched_item_id: str
+    similarity: float
+    delivered: bool
+
+
+class StoryIndex:
+    """Run-scoped access to the persisted story index."""
+
+    def __init__(
+        self,
+        store: SQLiteStore,
+        *,
+        ttl_days: int,
+        threshold: float = STORY_INDEX_THRESHOLD,
+        now: datetime | None = None,
+    ) -> None:
+        self._store = store
+        self._hasher = MinHasher(threshold)
+        self.threshold = threshold
+        now = now or datetime.now(timezone.utc)
+        self.pruned = store.prune_story_index(before=(now - timedelta(days=max(1, ttl_days))).isoformat())
+        self._keys: dict[str, tuple[frozenset[str], list[int]]] = {}
+        self.matches: dict[str, StoryMatch] = {}
+
+    def _shingles_and_buckets(self, item: Item) -> tuple[frozenset[str], list[int]]:
+        cached = self._keys.get(item.id)
+        if cached is None:
+            shingles = story_shingles(item)
+            cached = self._keys[item.id] = (shingles, self._hasher.bucket_keys(shingles))
+        return cached
+
+    def match(self, items: list[Item]) -> dict[str, StoryMatch]:
+        """Items (by id) that repeat an indexed story from an earlier run."""
+        keyed = [(item, *self._shingles_and_buckets(item)) for item in items]
+        by_bucket = self._store.story_bucket_matches(
+            [bucket for _item, _shingles, buckets in keyed for bucket in buckets]
+        )
+        entries = self._store.get_story_entries(
+            [item_id for ids in by_bucket.values() for item_id in ids]
+        )
+        found: dict[str, StoryMatch] = {}
+        for item, shingles, buckets in keyed:
+            best: StoryMatch | None = None
+            candidates = {item_id for bucket in buckets for item_id in by_bucket.get(bucket, ())}
+            for candidate_id in sorted(candidates):
+                entry = entries.get(candidate_id)
+                if entry is None or candidate_id == item.id:
+                    continue
+                if canonical_url(str(entry["url"])) == canonical_url(item.url):
+                    continue
+                similarity = jaccard(shingles, entry["shingles"])  # type: ignore[arg-type]
+                if similarity < self.threshold or (best and similarity <= best.similarity):
+                    continue
+                best = StoryMatch(
+                    item_id=item.id,
+                    story_id=str(entry["story_id"]),
+                    matched_item_id=candidate_id,
+                    similarity=round(similarity, 3),
+                    delivered=bool(entry["delivered"]),
+                )
+            if best is not None:
+                found[item.id] = best
+        self.matches.update(found)
+        return found
+
+    def remember(self, items: list[Item], *, delivered_ids: set[str]) -> None:
+        """Index scored items; repeats join the story they matched."""
+        rows: list[dict[str, object]] = []
+        for item in items:
+            shingles, buckets = self._shingles_and_buckets(item)
+            if not buckets:
+                continue
+            match = self.matches.get(item.id)
+            rows.append(
+                {
+                    "item_id": item.id,
+                    "story_id": match.story_id if match else item.id,
+                    "url": item.url,
+                    "title": item.title,
+                    "shingles": shingles,
+                    "buckets": buckets,
+                    "delivered": item.id in delivered_ids,
+                }
+            )
+        self._store.index_stories(rows)
@@ -18,6 +18,7 @@ from digest.ops.profile_registry import (
 )
 from digest.ops.run_lock import RunLock
 from digest.ops.ingest_detect import detect_ingest
+from digest.ops.source_health import SourceHealth, load_source_health
 from digest.ops.source_registry import (
     add_source,
     canonicalize_source_value,
@@ -134,7 +135,7 @@ def handle_update(update: dict, ctx: CommandContext) -> BotResponse | None:
             chat_id=chat_id,
             text="Usage: /digest run [mode]\nModes: fresh_only, balanced, replay_recent, backfill",
         )
-    if cmd == "/source":
+    if cmd in {"/source", "/sources"}:
         result = _handle_source(args, ctx, chat_id, user_id)
         if isinstance(result, BotResponse):
             return result
@@ -1444,9 +1445,16 @@ def _handle_source(
     args: list[str], ctx: CommandContext, chat_id: str, user_id: str
 ) -> str | BotResponse:
     if not args:
-        return "Usage: /source &lt;add|remove|list|wizard&gt; ..."
+        return "Usage: /source &lt;add|remove|list|health|wizard&gt; ..."
 
     action = args[0]
+    if action == "health":
+        try:
+            rows = load_source_health(SQLiteStore(ctx.db_path))
+        except Exception as exc:
+            return f"Source command failed: {_esc(exc)}"
+        return _render_source_health(rows)
+
     if action == "wizard":
         _clear_state(ctx, chat_id, user_id)
         return "Source wizard started. Choose an action:"
@@ -1487,7 +1495,7 @@ def _handle_source(
         except Exception as exc:
             return f"Source command failed: {_esc(exc)}"
 
-    return "Usage: /source &lt;add|remove|list|wizard&gt; ..."
+    return "Usage: /source &lt;add|remove|list|health|wizard&gt; ..."
 
 
 def _handle_paste_add(
@@ -1555,6 +1563,44 @@ def _render_source_list(rows: dict[str, list[str]]) -> str:
     return "\n".join(lines)
 
 
+def _render_source_health(rows: list[SourceHealth], *, limit: int = 10) -> str:
+    if not rows:
+        return "No source health recorded yet - it fills in after the next run."
+    now = datetime.now(timezone.utc)
+    quarantined = [h for h in rows if h.quarantined_at(now)]
+    failing = [h for h in rows if h.consecutive_failures and not h.quarantined_at(now)]
+    slowest = sorted(
+        (h for h in rows if h.latencies), key=lambda h: h.percentile(0.95) or 0.0, reverse=True
+    )
+    lines = [
+        f"<b>Source health</b>: {len(rows)} tracked, "
+        f"{len(quarantined)} quarantined, {len(failing)} failing"
+    ]
+    if quarantined:
+        lines.append("<b>Quarantined</b>:")
+        for h in quarantined[:limit]:
+            until = h.quarantined_until.strftime("%Y-%m-%d %H:%M UTC") if h.quarantined_until else ""
+            lines.append(
+                f"  - {_esc(h.source_key)}: {h.consecutive_failures} failures, "
+                f"re-probe {until} ({_esc(h.last_error[:80])})"
+            )
+    if failing:
+        lines.append("<b>Failing</b>:")
+        for h in failing[:limit]:
+            lines.append(
+                f"  - {_esc(h.source_key)}: {h.consecutive_failures} in a row "
+                f"({_esc(h.last_error[:80])})"
+            )
+    if slowest:
+        lines.append("<b>Slowest (p50 / p95)</b>:")
+        for h in slowest[:limit]:
+            lines.append(
+                f"  - {_esc(h.source_key)}: "
+                f"{h.percentile(0.5) or 0.0:.1f}s / {h.percentile(0.95) or 0.0:.1f}s"
+            )
+    return "\n".join(lines)
+
+
 def _trigger_run(ctx: CommandContext, chat_id: str, *, mode: str | None = None) -> str:
     run_id = uuid.uuid4().hex[:DEFAULT_RUN_ID_LENGTH]
     acquired, current = ctx.lock.acquire(run_id)
@@ -1615,6 +1661,7 @@ def _help_text() -> str:
         "/settings — content depth, run mode, LLM, exclusions\n"
         "/source wizard — manage sources\n"
         "/source list [type] — list sources\n"
+        "/source health — slow, failing and quarantined sources\n"
         "/source add|remove &lt;type&gt; &lt;value&gt;\n"
         "/feedback mute|trust &lt;type&gt; &lt;value&gt;\n"
         "/feedback summary\n\n"
@@ -2,7 +2,10 @@ from __future__ import annotations
 
 import re
 
+from digest.constants import NEAR_DUP_LSH_MIN_ITEMS
 from digest.models import Item
+from digest.pipeline.near_dup import NearDuplicateIndex, jaccard
+from digest.urls import item_key
 
 TOKEN_RE = re.compile(r"[a-z0-9]+")
 
@@ -15,7 +18,7 @@ def dedupe_exact(items: list[Item]) -> list[Item]:
     merged: dict[str, Item] = {}
     order: list[str] = []
     for item in items:
-        key = item.url or item.hash
+        key = item_key(item)
         if key in merged:
             merged[key] = _merge_duplicate_item(merged[key], item)
             continue
@@ -106,22 +109,52 @@ def _choose_description(primary: str, secondary: str) -> str:
     return one if len(one) >= len(two) else two
 
 
-def cluster_near_duplicates(items: list[Item], threshold: float = 0.7) -> list[list[Item]]:
+def item_shingles(item: Item, *, include_description: bool = False) -> frozenset[str]:
+    shingles = _tokens(item.title)
+    if include_description:
+        shingles |= {f"d:{token}" for token in _tokens(item.description)}
+    return frozenset(shingles)
+
+
+def cluster_near_duplicates(
+    items: list[Item],
+    threshold: float = 0.7,
+    *,
+    include_description: bool = False,
+) -> list[list[Item]]:
+    """Group items whose shingles reach `threshold` Jaccard with a cluster's first item.
+
+    Each item joins the earliest such cluster. Small batches use a direct
+    scan; larger ones go through the MinHash/LSH index, which applies the
+    same rule to its bucket candidates only. Candidate generation is
+    probabilistic: a pair near the threshold is found with probability
+    >= `near_dup.LSH_TARGET_RECALL`, so a large batch can occasionally keep apart two
+    items the direct scan would merge.
+
+    Shingles are title tokens. `include_description` adds description tokens;
+    `dedupe_and_cluster` leaves it off because descriptions differ between
+    outlets and would split clusters that the title alone merges today.
+    """
+    shingles = [item_shingles(item, include_description=include_description) for item in items]
     clusters: list[list[Item]] = []
-    for item in items:
-        candidate = _tokens(item.title)
-        placed = False
-        for cluster in clusters:
-            centroid = _tokens(cluster[0].title)
-            if not candidate or not centroid:
-                continue
-            jaccard = len(candidate & centroid) / len(candidate | centroid)
-            if jaccard >= threshold:
-                cluster.append(item)
-                placed = True
-                break
-        if not placed:
+    if len(items) < NEAR_DUP_LSH_MIN_ITEMS:
+        centroids: list[frozenset[str]] = []
+        for item, candidate in zip(items, shingles):
+            for index, centroid in enumerate(centroids):
+                if candidate and centroid and jaccard(candidate, centroid) >= threshold:
+                    clusters[index].append(item)
+                    break
+            else:
+                centroids.append(candidate)
+                clusters.append([item])
+        return clusters
+    index = NearDuplicateIndex(threshold)
+    for item, candidate in zip(items, shingles):
+        cluster = index.add(candidate)
+        if cluster == len(clusters):
             clusters.append([item])
+        else:
+            clusters[cluster].append(item)
     return clusters
 
 
@@ -0,0 +1,119 @@
+"""MinHash/LSH index for near-duplicate clustering.
+
+Each cluster is represented by the shingles of its first item. A new item's
+MinHash signature is cut into bands. Clusters that share at least one band
+bucket become candidates, and the item joins the earliest candidate whose
+exact Jaccard similarity reaches the threshold. This is the same rule the
+linear scan applies, but only to bucket candidates. Band width is chosen so
+that a pair at the threshold lands in a shared bucket with probability
+>= `LSH_TARGET_RECALL`; the rare pair that shares no bucket is missed, so
+results can differ from the linear scan.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import zlib
+
+from digest.constants import NEAR_DUP_NUM_PERM
+
+# Mersenne prime for the universal hash family (a * x + b) mod p.
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+LSH_TARGET_RECALL = 0.999
+
+
+def lsh_bands(threshold: float, num_perm: int) -> tuple[int, int]:
+    """(bands, rows) with the widest rows that still meet the recall target."""
+    threshold = min(max(threshold, 0.01), 1.0)
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        if bands < 1:
+            break
+        recall = 1 - (1 - threshold**rows) ** bands
+        if recall < LSH_TARGET_RECALL:
+            break
+        best = (bands, rows)
+    return best
+
+
+def jaccard(left: frozenset[str], right: frozenset[str]) -> float:
+    if not left or not right:
+        return 0.0
+    return len(left & right) / len(left | right)
+
+
+class MinHasher:
+    """Deterministic MinHash signatures and LSH band keys for a threshold.
+
+    Token hashes and permutations are seeded, so signatures (and the
+    `bucket_keys` derived from them) are stable across processes and can be
+    persisted.
+    """
+
+    def __init__(self, threshold: float = 0.7, *, num_perm: int = NEAR_DUP_NUM_PERM, seed: int = 1) -> None:
+        self.threshold = threshold
+        self.bands, self.rows = lsh_bands(threshold, num_perm)
+        rng = random.Random(seed)
+        self._perms = [
+            (rng.randrange(1, _PRIME), rng.randrange(0, _PRIME))
+            for _ in range(self.bands * self.rows)
+        ]
+        self._token_rows: dict[str, list[int]] = {}
+
+    def _permuted(self, token: str) -> list[int]:
+        row = self._token_rows.get(token)
+        if row is None:
+            value = zlib.crc32(token.encode("utf-8"))
+            row = [((a * value + b) % _PRIME) & _MAX_HASH for a, b in self._perms]
+            self._token_rows[token] = row
+        return row
+
+    def signature(self, shingles: frozenset[str]) -> list[int]:
+        return list(map(min, zip(*(self._permuted(token) for token in shingles))))
+
+    def band_keys(self, signature: list[int]) -> list[tuple[int, ...]]:
+        rows = self.rows
+        return [tuple(signature[band * rows : (band + 1) * rows]) for band in range(self.bands)]
+
+    def bucket_keys(self, shingles: frozenset[str]) -> list[int]:
+        """One signed 64-bit key per band, suitable for an indexed SQLite column."""
+        if not shingles:
+            return []
+        return [
+            int.from_bytes(
+                hashlib.blake2b(repr((band, key)).encode("ascii"), digest_size=8).digest(),
+                "big",
+                signed=True,
+            )
+            for band, key in enumerate(self.band_keys(self.signature(shingles)))
+        ]
+
+
+class NearDuplicateIndex(MinHasher):
+    """Assigns shingle sets to clusters in insertion order (first match wins)."""
+
+    def __init__(self, threshold: float = 0.7, *, num_perm: int = NEAR_DUP_NUM_PERM, seed: int = 1) -> None:
+        super().__init__(threshold, num_perm=num_perm, seed=seed)
+        self._buckets: list[dict[tuple[int, ...], list[int]]] = [{} for _ in range(self.bands)]
+        self._centroids: list[frozenset[str]] = []
+
+    def add(self, shingles: frozenset[str]) -> int:
+        """Cluster index for `shingles`, opening a new cluster when nothing matches."""
+        if not shingles:
+            self._centroids.append(shingles)
+            return len(self._centroids) - 1
+        keys = self.band_keys(self.signature(shingles))
+        candidates: set[int] = set()
+        for band, key in enumerate(keys):
+            candidates.update(self._buckets[band].get(key, ()))
+        for cluster in sorted(candidates):
+            if jaccard(shingles, self._centroids[cluster]) >= self.threshold:
+                return cluster
+        cluster = len(self._centroids)
+        self._centroids.append(shingles)
+        for band, key in enumerate(keys):
+            self._buckets[band].setdefault(key, []).append(cluster)
+        return cluster
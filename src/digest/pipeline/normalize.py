@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import hashlib
+
 from digest.models import Item
 from digest.pipeline.clean_text import clean_youtube_text
+from digest.urls import canonical_url
 
 
 def normalize_items(items: list[Item]) -> list[Item]:
@@ -14,5 +17,11 @@ def normalize_items(items: list[Item]) -> list[Item]:
             item.description = " ".join(clean_youtube_text(item.description).split())
         else:
             item.raw_text = " ".join(item.raw_text.split())
+        # The score cache keys on the hash, so derive it from the canonical
+        # URL; the URL itself stays as the source gave it, for display.
+        if item.url:
+            canonical = canonical_url(item.url)
+            if canonical != item.url:
+                item.hash = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
         normalized.append(item)
     return normalized
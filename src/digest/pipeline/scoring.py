@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from dataclasses import dataclass
 
 from digest.config import ProfileConfig
 from digest.models import Item, Score, ScoredItem
@@ -38,41 +39,132 @@ TECHNICAL_KEYWORDS = {
     "gradient",
     "retrieval benchmark",
 }
+TOPIC_KEYWORDS = {
+    "llm": ("llm", "model", "gpt", "claude"),
+    "agents": ("agent", "agents", "tool use"),
+    "rag": ("rag", "retrieval"),
+    "evals": ("eval", "benchmark"),
+    "safety": ("safety", "alignment"),
+    "research": ("paper", "arxiv", "research"),
+    "infra": ("inference", "gpu", "cuda", "latency"),
+    "product": ("release", "launch", "feature"),
+    "policy": ("policy", "regulation", "government"),
+    "open-source": ("open source", "github", "oss"),
+}
+FORMAT_KEYWORDS = {
+    "tutorial": ("tutorial", "how to", "guide"),
+    "benchmark": ("benchmark", "eval"),
+    "paper": ("paper", "arxiv"),
+    "release-note": ("release", "launch", "announced"),
+    "opinion": ("opinion", "thoughts"),
+}
+PAPER_KEYWORDS = ("paper", "ablation", "sota", "state of the art")
+ROUNDUP_KEYWORDS = ("recap", "roundup")
+X_ENDORSEMENT_MARKER = "x_endorsed_by:"
 X_ENDORSEMENT_RE = re.compile(r"x_endorsed_by:([a-z0-9_]+)")
 SOURCE_PREFERENCE_MAX_BONUS = 2.0
 
 
-def _contains_any(text: str, words: list[str] | set[str]) -> int:
-    t = text.lower()
-    return sum(1 for w in words if w.lower() in t)
-
-
-def _count_x_endorsements(text: str) -> int:
-    return len({match.group(1) for match in X_ENDORSEMENT_RE.finditer(text.lower())})
-
-
-def score_item(item: Item, profile: ProfileConfig) -> Score:
-    text = f"{item.title} {item.description} {item.raw_text}".lower()
-
-    relevance = min(60, _contains_any(text, AI_KEYWORDS) * 6)
-    relevance += min(15, _contains_any(text, profile.topics + profile.entities) * 5)
-    relevance = max(0, min(60, relevance - _contains_any(text, profile.exclusions) * 10))
+@dataclass(slots=True)
+class ItemFeatures:
+    hits: frozenset[str]
+    x_endorsements: int
+    technicality: str
+
+
+class ProfileMatcher:
+    """Keyword features for items, compiled once per run from a profile.
+
+    The scoring vocabularies and the profile's keyword lists are folded into
+    one deduplicated, lowercased vocabulary. Each item's text is built and
+    swept against it once, and the resulting `ItemFeatures` are cached by item
+    id, so scoring, tagging and the rank adjustments share a single pass.
+    Matching keeps the substring semantics of the rules scorer ("model" hits
+    "models"). The cache assumes item text does not change after the first
+    lookup, which holds once items are normalized.
+    """
+
+    def __init__(self, profile: ProfileConfig) -> None:
+        self.profile = profile
+        self.topic_words = [w.lower() for w in profile.topics + profile.entities]
+        self.exclusion_words = [w.lower() for w in profile.exclusions]
+        self.blocked_sources = [s.lower() for s in profile.blocked_sources]
+        self.blocked_authors_x = {a.lower() for a in profile.blocked_authors_x}
+        self.blocked_orgs_github = {o.lower() for o in profile.blocked_orgs_github}
+        self.trusted_sources = [s.lower() for s in profile.trusted_sources]
+        self.trusted_authors_x = {a.lower() for a in profile.trusted_authors_x}
+        self.trusted_orgs_github = {o.lower() for o in profile.trusted_orgs_github}
+        vocabulary: list[str] = [
+            *AI_KEYWORDS,
+            *CLICKBAIT,
+            *TECHNICAL_KEYWORDS,
+            *PAPER_KEYWORDS,
+            *ROUNDUP_KEYWORDS,
+            X_ENDORSEMENT_MARKER,
+            *self.topic_words,
+            *self.exclusion_words,
+        ]
+        for words in (*TOPIC_KEYWORDS.values(), *FORMAT_KEYWORDS.values()):
+            vocabulary.extend(words)
+        self.vocabulary = tuple(dict.fromkeys(vocabulary))
+        self._features: dict[str, ItemFeatures] = {}
+
+    def features(self, item: Item) -> ItemFeatures:
+        cached = self._features.get(item.id)
+        if cached is not None:
+            return cached
+        text = f"{item.title} {item.description} {item.raw_text}".lower()
+        hits = frozenset(word for word in self.vocabulary if word in text)
+        endorsements = 0
+        if X_ENDORSEMENT_MARKER in hits:
+            endorsements = len({match.group(1) for match in X_ENDORSEMENT_RE.finditer(text)})
+        features = ItemFeatures(
+            hits=hits,
+            x_endorsements=endorsements,
+            technicality=_technicality_from_hits(item, hits),
+        )
+        self._features[item.id] = features
+        return features
+
+    @staticmethod
+    def count(features: ItemFeatures, words) -> int:
+        """Number of `words` (lowercase, duplicates counted) present in the item."""
+        return sum(1 for word in words if word in features.hits)
+
+    @staticmethod
+    def any_hit(features: ItemFeatures, words) -> bool:
+        return any(word in features.hits for word in words)
+
+
+def _matcher_for(profile: ProfileConfig | None, matcher: ProfileMatcher | None) -> ProfileMatcher:
+    if matcher is not None:
+        return matcher
+    return ProfileMatcher(profile if profile is not None else ProfileConfig())
+
+
+def score_item(item: Item, profile: ProfileConfig, matcher: ProfileMatcher | None = None) -> Score:
+    matcher = _matcher_for(profile, matcher)
+    features = matcher.features(item)
+
+    relevance = min(60, matcher.count(features, AI_KEYWORDS) * 6)
+    relevance += min(15, matcher.count(features, matcher.topic_words) * 5)
+    relevance = max(0, min(60, relevance - matcher.count(features, matcher.exclusion_words) * 10))
 
     quality = 10
-    quality += min(12, _count_x_endorsements(text) * 4)
+    quality += min(12, features.x_endorsements * 4)
     if len(item.raw_text) > 500:
         quality += 8
-    quality -= _contains_any(text, CLICKBAIT) * 5
+    quality -= matcher.count(features, CLICKBAIT) * 5
     quality = max(0, min(30, quality))
 
     novelty = 10
-    if "recap" in text or "roundup" in text:
+    if matcher.any_hit(features, ROUNDUP_KEYWORDS):
         novelty -= 4
     novelty = max(0, min(10, novelty))
 
     total = relevance + quality + novelty
     reason = f"rel={relevance};qual={quality};nov={novelty}"
-    tags, topic_tags, format_tags = _rule_tags(item)
+    tags, topic_tags, format_tags = _rule_tags(item, matcher)
     return Score(
         item_id=item.id,
         relevance=relevance,
@@ -87,40 +179,60 @@ def score_item(item: Item, profile: ProfileConfig) -> Score:
     )
 
 
-def is_blocked(item: Item, profile: ProfileConfig) -> bool:
-    if any(src.lower() in item.source.lower() for src in profile.blocked_sources):
-        return True
-    if item.source == "x.com" and item.author and item.author.lower() in {a.lower() for a in profile.blocked_authors_x}:
-        return True
-    github_owner = _github_owner(item.source)
-    if github_owner and github_owner.lower() in {o.lower() for o in profile.blocked_orgs_github}:
-        return True
-    return False
+def is_blocked(item: Item, profile: ProfileConfig, matcher: ProfileMatcher | None = None) -> bool:
+    matcher = _matcher_for(profile, matcher)
+    return _source_listed(
+        item,
+        matcher.blocked_sources,
+        matcher.blocked_authors_x,
+        matcher.blocked_orgs_github,
+    )
 
 
-def source_preference_adjustment(item: Item, score: Score, profile: ProfileConfig) -> float:
+def source_preference_adjustment(
+    item: Item,
+    score: Score,
+    profile: ProfileConfig,
+    matcher: ProfileMatcher | None = None,
+) -> float:
     if score.quality < _source_preference_quality_floor(score):
         return 0.0
-    preferred = False
-    if any(src.lower() in item.source.lower() for src in profile.trusted_sources):
-        preferred = True
-    if (
-        item.source == "x.com"
-        and item.author
-        and item.author.lower() in {a.lower() for a in profile.trusted_authors_x}
-    ):
-        preferred = True
-    github_owner = _github_owner(item.source)
-    if github_owner and github_owner.lower() in {o.lower() for o in profile.trusted_orgs_github}:
-        preferred = True
+    matcher = _matcher_for(profile, matcher)
+    preferred = _source_listed(
+        item,
+        matcher.trusted_sources,
+        matcher.trusted_authors_x,
+        matcher.trusted_orgs_github,
+    )
     return SOURCE_PREFERENCE_MAX_BONUS if preferred else 0.0
 
 
-def content_depth_adjustment(item: Item, profile: ProfileConfig) -> int:
+def _source_listed(
+    item: Item,
+    sources: list[str],
+    authors_x: set[str],
+    orgs_github: set[str],
+) -> bool:
+    source = item.source.lower()
+    if any(src in source for src in sources):
+        return True
+    if item.source == "x.com" and item.author and item.author.lower() in authors_x:
+        return True
+    github_owner = _github_owner(item.source)
+    if github_owner and github_owner.lower() in orgs_github:
+        return True
+    return False
+
+
+def content_depth_adjustment(
+    item: Item,
+    profile: ProfileConfig,
+    matcher: ProfileMatcher | None = None,
+) -> int:
     preference = str(getattr(profile, "content_depth_preference", "balanced") or "").strip().lower()
     if preference not in {"practical", "balanced", "deep_technical"}:
         preference = "balanced"
-    technicality = technicality_level(item)
+    technicality = technicality_level(item, _matcher_for(profile, matcher))
     if technicality == "high":
         if preference == "practical":
             return -8
@@ -140,6 +252,7 @@ def research_concentration_adjustments(
     *,
     rank_overrides: dict[str, float] | None = None,
     pool_size: int = 15,
+    matcher: ProfileMatcher | None = None,
 ) -> dict[str, float]:
     if pool_size <= 0:
         return {}
@@ -154,7 +267,7 @@ def research_concentration_adjustments(
 
     family_rows: dict[str, list] = {}
     for scored in ranked_non_videos:
-        if not _is_research_heavy(scored):
+        if not _is_research_heavy(scored, matcher):
             continue
         bucket = source_bucket(scored.item.source)
         family_rows.setdefault(bucket, []).append(scored)
@@ -172,15 +285,18 @@ def research_concentration_adjustments(
     return adjustments
 
 
-def technicality_level(item: Item) -> str:
-    text = f"{item.title} {item.description} {item.raw_text}".lower()
+def technicality_level(item: Item, matcher: ProfileMatcher | None = None) -> str:
+    return _matcher_for(None, matcher).features(item).technicality
+
+
+def _technicality_from_hits(item: Item, hits: frozenset[str]) -> str:
     signals = 0
     if item.source.startswith("https://arxiv.org") or item.source.startswith("http://arxiv.org"):
         signals += 3
     if item.type in {"github_issue", "github_pr", "github_repo"}:
         signals += 1
-    signals += _contains_any(text, TECHNICAL_KEYWORDS)
-    if any(token in text for token in {"paper", "ablation", "sota", "state of the art"}):
+    signals += sum(1 for word in TECHNICAL_KEYWORDS if word in hits)
+    if any(word in hits for word in PAPER_KEYWORDS):
         signals += 1
     if signals >= 4:
         return "high"
@@ -189,11 +305,11 @@ def technicality_level(item: Item) -> str:
     return "low"
 
 
-def _is_research_heavy(scored: ScoredItem) -> bool:
+def _is_research_heavy(scored: ScoredItem, matcher: ProfileMatcher | None = None) -> bool:
     if source_bucket(scored.item.source) == "arxiv.org":
         return True
     format_tags = {tag.strip().lower() for tag in scored.score.format_tags}
-    if "paper" in format_tags and technicality_level(scored.item) != "low":
+    if "paper" in format_tags and technicality_level(scored.item, matcher) != "low":
         return True
     return False
 
@@ -214,43 +330,28 @@ def _source_preference_quality_floor(score: Score) -> int:
     return 14
 
 
-def _rule_tags(item: Item) -> tuple[list[str], list[str], list[str]]:
-    text = f"{item.title} {item.description} {item.raw_text}".lower()
-    topic_tags: list[str] = []
-    format_tags: list[str] = []
-
-    topic_map = {
-        "llm": ["llm", "model", "gpt", "claude"],
-        "agents": ["agent", "agents", "tool use"],
-        "rag": ["rag", "retrieval"],
-        "evals": ["eval", "benchmark"],
-        "safety": ["safety", "alignment"],
-        "research": ["paper", "arxiv", "research"],
-        "infra": ["inference", "gpu", "cuda", "latency"],
-        "product": ["release", "launch", "feature"],
-        "policy": ["policy", "regulation", "government"],
-        "open-source": ["open source", "github", "oss"],
-    }
-    for tag, kws in topic_map.items():
-        if any(k in text for k in kws):
-            topic_tags.append(tag)
+def _rule_tags(
+    item: Item, matcher: ProfileMatcher | None = None
+) -> tuple[list[str], list[str], list[str]]:
+    matcher = _matcher_for(None, matcher)
+    features = matcher.features(item)
+    topic_tags = [
+        tag for tag, words in TOPIC_KEYWORDS.items() if matcher.any_hit(features, words)
+    ]
 
+    format_tags: list[str] = []
     if item.type == "video":
         format_tags.append("video")
-    if any(k in text for k in ["tutorial", "how to", "guide"]):
-        format_tags.append("tutorial")
-    if any(k in text for k in ["benchmark", "eval"]):
-        format_tags.append("benchmark")
-    if any(k in text for k in ["paper", "arxiv"]):
-        format_tags.append("paper")
-    if technicality_level(item) != "low":
+    for tag in ("tutorial", "benchmark", "paper"):
+        if matcher.any_hit(features, FORMAT_KEYWORDS[tag]):
+            format_tags.append(tag)
+    if features.technicality != "low":
         format_tags.append("technical")
-    if "x_endorsed_by:" in text:
+    if X_ENDORSEMENT_MARKER in features.hits:
         format_tags.append("x-discovered")
-    if any(k in text for k in ["release", "launch", "announced"]):
-        format_tags.append("release-note")
-    if any(k in text for k in ["opinion", "thoughts"]):
-        format_tags.append("opinion")
+    for tag in ("release-note", "opinion"):
+        if matcher.any_hit(features, FORMAT_KEYWORDS[tag]):
+            format_tags.append(tag)
     if not format_tags:
         format_tags.append("news")
 
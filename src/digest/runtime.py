@@ -7,6 +7,7 @@ from datetime import datetime, timedelta, timezone
 import logging
 import os
 import urllib.error
+import urllib.parse
 from pathlib import Path
 from typing import Any, Callable
 
@@ -15,13 +16,20 @@ from digest.constants import (
     DEFAULT_SCORE_CACHE_MAX_AGE_HOURS,
     DEFAULT_WINDOW_HOURS,
     DIGEST_MUST_READ_LIMIT,
+    STORY_REPEAT_PENALTY,
 )
 from digest.config import ProfileConfig, SourceConfig
 from digest.connectors.github import fetch_github_items_linked, normalize_github_org
-from digest.connectors.rss import fetch_rss_items
+from digest.connectors.github_client import GitHubClient
+from digest.connectors.rss import (
+    DEFAULT_RSS_RETRIES,
+    DEFAULT_RSS_TIMEOUT,
+    fetch_rss_items,
+)
 from digest.connectors.x_inbox import fetch_x_inbox_items
-from digest.connectors.x_selectors import fetch_x_selector_items_linked
-from digest.connectors.youtube import fetch_youtube_items
+from digest.connectors.x_provider import pack_author_batches
+from digest.connectors.x_selectors import fetch_x_selector_items_linked, resolve_author_batch_chars
+from digest.connectors.youtube import DEFAULT_YOUTUBE_TIMEOUT, fetch_youtube_items
 from digest.delivery.obsidian import render_obsidian_note, write_obsidian_note
 from digest.delivery.telegram import (
     build_feedback_keyboard,
@@ -33,6 +41,7 @@ from digest.pipeline.dedupe import dedupe_and_cluster
 from digest.pipeline.github_issue_impact import evaluate_github_issue_impact
 from digest.pipeline.normalize import normalize_items
 from digest.pipeline.scoring import (
+    ProfileMatcher,
     content_depth_adjustment,
     is_blocked,
     research_concentration_adjustments,
@@ -54,17 +63,31 @@ from digest.quality.online_repair import (
     source_family,
     validate_repaired_must_read,
 )
+from digest.ops.poll_planner import SourcePollPlanner
+from digest.ops.source_health import SourceHealthTracker
+from digest.ops.story_index import StoryIndex
 from digest.ops.source_registry import source_key_for
-from digest.runtime_support import RunProgressEmitter, SourceLinkRecorder
+from digest.runtime_support import (
+    FeedValidatorCache,
+    FetchOutcome,
+    FetchTask,
+    RunProgressEmitter,
+    SourceCursorCache,
+    SourceLinkRecorder,
+    run_fetch_tasks,
+)
 from digest.storage.sqlite_store import SQLiteStore
 from digest.logging_utils import get_run_logger, log_event
 from digest.summarizers.extractive import ExtractiveSummarizer
 from digest.summarizers.responses_api import ResponsesAPISummarizer
 from digest.scorers.agent import ResponsesAPIScorerTagger
+from digest.urls import item_key
 
 
 ProgressCallback = Callable[[dict[str, Any]], None]
 
+YOUTUBE_FETCH_HOST = "www.youtube.com"
+
 
 def run_digest(
     sources: SourceConfig,
@@ -76,9 +99,17 @@ def run_digest(
     allow_seen_fallback: bool = True,
     preview_mode: bool = False,
     min_items_for_delivery: int = 0,
+    prefetch_only: bool = False,
+    include_pool: bool = False,
     logger: logging.Logger | logging.LoggerAdapter | None = None,
     progress_cb: ProgressCallback | None = None,
 ) -> RunReport:
+    """Fetch, score and deliver one digest.
+
+    `prefetch_only` runs just the fetch stage and pools the fetched items in
+    the store (a scheduler shard); `include_pool` adds pooled items to this
+    run's raw items and, once the digest is delivered, clears the pool.
+    """
     run_id = uuid.uuid4().hex[:DEFAULT_RUN_ID_LENGTH]
     run_logger = logger or get_run_logger(run_id)
     now = datetime.now(tz=timezone.utc)
@@ -130,250 +161,507 @@ def run_digest(
     source_links = source_link_recorder.links
     record_source_links = source_link_recorder.record
 
+    x_budget_plan = _plan_x_selector_limits(
+        authors=sources.x_authors,
+        themes=sources.x_themes,
+        max_spend_usd=profile.x_max_spend_per_run_usd,
+        cost_per_post_usd=profile.x_cost_per_post_usd,
+        batch_query_chars=resolve_author_batch_chars(),
+    )
+    github_orgs = [normalize_github_org(v) for v in sources.github_orgs]
+    github_orgs = [v for v in github_orgs if v]
+
+    feed_validators = FeedValidatorCache(store)
+    # Feeds drop entries older than the window while parsing; _filter_window
+    # below still applies to every source.
+    feed_window_start = datetime.fromisoformat(window_start)
+    # Per-source high-water marks: in only_new runs, entries a source already
+    # delivered skip normalize/dedupe and are held back for the seen
+    # fallbacks. Only fresh-only runs (whose fallback tops up with videos
+    # alone) can let RSS parsing stop at the mark itself.
+    source_cursors = SourceCursorCache(
+        store,
+        [source_key_for("rss", v) for v in sources.rss_feeds]
+        + [source_key_for("youtube_channel", v) for v in sources.youtube_channels]
+        + [source_key_for("github_repo", v) for v in sources.github_repos]
+        + [source_key_for("github_topic", v) for v in sources.github_topics]
+        + [source_key_for("github_query", v) for v in sources.github_search_queries]
+        + [source_key_for("github_org", v) for v in github_orgs],
+    )
+    cursor_held_items: list[Item] = []
+    github_client = GitHubClient(
+        os.getenv("GITHUB_TOKEN", "").strip(), store=store, incremental=only_new
+    )
+    # ETags not revalidated within the activity window are for paths no
+    # longer requested.
+    store.prune_github_etags(
+        before=(now - timedelta(days=profile.github_activity_max_age_days)).isoformat()
+    )
+    # Feed-backed sources get timeouts from their own latency history and are
+    # skipped while quarantined for repeated failures. GitHub and X selectors
+    # are not tracked (see digest.ops.source_health).
+    source_health = SourceHealthTracker(
+        store,
+        [source_key_for("rss", v) for v in sources.rss_feeds]
+        + [source_key_for("youtube_channel", v) for v in sources.youtube_channels],
+    )
+    # In only_new runs, sources that publish rarely are polled on their own
+    # observed cadence rather than every run.
+    poll_planner = SourcePollPlanner(
+        store,
+        [source_key_for("rss", v) for v in sources.rss_feeds]
+        + [source_key_for("youtube_channel", v) for v in sources.youtube_channels]
+        + [source_key_for("github_repo", v) for v in sources.github_repos],
+        max_staleness_hours=profile.poll_max_staleness_hours,
+        enabled=only_new,
+        now=now,
+    )
+    # A source polled again after skipped runs reads back to its last
+    # successful poll; its items are held to that start, not the run window.
+    source_window_starts: dict[str, datetime] = {}
+    item_window_starts: dict[str, datetime] = {}
+
+    def source_window(source_key: str) -> datetime:
+        start = poll_planner.window_start(source_key, feed_window_start)
+        if start < feed_window_start:
+            source_window_starts[source_key] = start
+        return start
+
+    github_repos = [
+        repo for repo in sources.github_repos if poll_planner.is_due(source_key_for("github_repo", repo))
+    ]
+    for repo in github_repos:
+        source_window(source_key_for("github_repo", repo))
+    fetch_tasks: list[FetchTask] = []
     for feed_url in sources.rss_feeds:
-        try:
-            fetched = fetch_rss_items([feed_url])
-            raw_items.extend(fetched)
-            record_source_links("rss", feed_url, fetched)
-            rss_fetched_items += len(fetched)
-            log_event(
-                run_logger,
-                "info",
-                "fetch_rss",
-                "Fetched RSS source",
-                source=feed_url,
-                item_count=len(fetched),
-            )
-            emit_progress(
-                "fetch_rss",
-                "Fetched RSS source",
-                source=feed_url,
-                item_count=len(fetched),
+        health_key = source_key_for("rss", feed_url)
+        if source_health.should_skip(health_key) or not poll_planner.is_due(health_key):
+            continue
+        feed_cutoff = source_window(health_key)
+        if only_new and not allow_seen_fallback:
+            feed_cutoff = source_cursors.cutoff(health_key, feed_cutoff)
+        fetch_tasks.append(
+            FetchTask(
+                kind="rss",
+                value=feed_url,
+                host=_fetch_host(feed_url),
+                run=lambda feed_url=feed_url, feed_cutoff=feed_cutoff, key=health_key: fetch_rss_items(
+                    [feed_url],
+                    timeout=source_health.timeout_for(key, DEFAULT_RSS_TIMEOUT),
+                    retries=source_health.retries_for(key, DEFAULT_RSS_RETRIES),
+                    validators=feed_validators,
+                    window_start=feed_cutoff,
+                ),
             )
-        except Exception as exc:
-            source_errors.append(f"rss:{feed_url}: {exc}")
-            log_event(
-                run_logger,
-                "error",
-                "fetch_rss",
-                "RSS source fetch failed",
-                source=feed_url,
-                error=str(exc),
+        )
+    for channel_id in sources.youtube_channels:
+        health_key = source_key_for("youtube_channel", channel_id)
+        if source_health.should_skip(health_key) or not poll_planner.is_due(health_key):
+            continue
+        channel_start = source_window(health_key)
+        fetch_tasks.append(
+            FetchTask(
+                kind="youtube_channel",
+                value=channel_id,
+                host=YOUTUBE_FETCH_HOST,
+                run=lambda channel_id=channel_id, key=health_key, start=channel_start: fetch_youtube_items(
+                    [channel_id],
+                    timeout=source_health.timeout_for(key, DEFAULT_YOUTUBE_TIMEOUT),
+                    retries=source_health.retries_for(key, DEFAULT_RSS_RETRIES),
+                    validators=feed_validators,
+                    window_start=start,
+                ),
             )
-            emit_progress(
-                "fetch_rss",
-                "RSS source fetch failed",
-                source=feed_url,
-                error=str(exc),
+        )
+    if sources.x_inbox_path:
+        fetch_tasks.append(
+            FetchTask(
+                kind="x_inbox",
+                value=sources.x_inbox_path,
+                host="",
+                run=lambda: fetch_x_inbox_items(
+                    sources.x_inbox_path, store=store, window_start=feed_window_start
+                ),
             )
-
-    for channel_id in sources.youtube_channels:
-        try:
-            fetched = fetch_youtube_items([channel_id])
-            raw_items.extend(fetched)
-            record_source_links("youtube_channel", channel_id, fetched)
-            youtube_fetched_items += len(fetched)
-            log_event(
-                run_logger,
-                "info",
-                "fetch_youtube_channel",
-                "Fetched YouTube channel source",
-                channel_id=channel_id,
-                item_count=len(fetched),
+        )
+    if sources.x_authors or sources.x_themes:
+        fetch_tasks.append(
+            FetchTask(
+                kind="x_selectors",
+                value="",
+                host="",
+                run=lambda: fetch_x_selector_items_linked(
+                    sources,
+                    store,
+                    author_limits=x_budget_plan["author_limits"],
+                    theme_limits=x_budget_plan["theme_limits"],
+                    author_batches=x_budget_plan["author_batches"],
+                ),
             )
-            emit_progress(
-                "fetch_youtube_channel",
-                "Fetched YouTube channel source",
-                channel_id=channel_id,
-                item_count=len(fetched),
+        )
+    if (
+        github_repos
+        or sources.github_topics
+        or sources.github_search_queries
+        or sources.github_orgs
+    ):
+        fetch_tasks.append(
+            FetchTask(
+                kind="github",
+                value="",
+                host="",
+                run=lambda: fetch_github_items_linked(
+                    github_repos,
+                    sources.github_topics,
+                    sources.github_search_queries,
+                    orgs=github_orgs,
+                    token=github_client.token,
+                    org_options={
+                        "min_stars": profile.github_min_stars,
+                        "include_forks": profile.github_include_forks,
+                        "include_archived": profile.github_include_archived,
+                        "max_repos_per_org": profile.github_max_repos_per_org,
+                        "max_items_per_org": profile.github_max_items_per_org,
+                        "repo_max_age_days": profile.github_repo_max_age_days,
+                        "activity_max_age_days": profile.github_activity_max_age_days,
+                        "max_pages": profile.github_max_pages_per_selector,
+                    },
+                    client=github_client,
+                ),
             )
-        except Exception as exc:
-            source_errors.append(f"youtube:channel:{channel_id}: {exc}")
+        )
+
+    def report_fetch(outcome: FetchOutcome) -> None:
+        task = outcome.task
+        exc = outcome.error
+        if task.kind == "rss":
+            if exc is None:
+                fields = dict(source=task.value, item_count=len(outcome.result))
+                log_event(run_logger, "info", "fetch_rss", "Fetched RSS source", **fields)
+                emit_progress("fetch_rss", "Fetched RSS source", **fields)
+                return
+            fields = dict(source=task.value, error=str(exc))
+            log_event(run_logger, "error", "fetch_rss", "RSS source fetch failed", **fields)
+            emit_progress("fetch_rss", "RSS source fetch failed", **fields)
+            return
+        if task.kind == "youtube_channel":
+            if exc is None:
+                fields = dict(channel_id=task.value, item_count=len(outcome.result))
+                log_event(
+                    run_logger,
+                    "info",
+                    "fetch_youtube_channel",
+                    "Fetched YouTube channel source",
+                    **fields,
+                )
+                emit_progress(
+                    "fetch_youtube_channel", "Fetched YouTube channel source", **fields
+                )
+                return
+            fields = dict(channel_id=task.value, error=str(exc))
             log_event(
                 run_logger,
                 "error",
                 "fetch_youtube_channel",
                 "YouTube channel fetch failed",
-                channel_id=channel_id,
-                error=str(exc),
+                **fields,
             )
-            emit_progress(
-                "fetch_youtube_channel",
-                "YouTube channel fetch failed",
-                channel_id=channel_id,
-                error=str(exc),
+            emit_progress("fetch_youtube_channel", "YouTube channel fetch failed", **fields)
+            return
+        if task.kind == "x_inbox":
+            if exc is None:
+                fields = dict(inbox_path=task.value, item_count=len(outcome.result))
+                log_event(
+                    run_logger, "info", "fetch_x_inbox", "Fetched X inbox items", **fields
+                )
+                emit_progress("fetch_x_inbox", "Fetched X inbox items", **fields)
+                return
+            fields = dict(inbox_path=task.value, error=str(exc))
+            log_event(run_logger, "error", "fetch_x_inbox", "X inbox fetch failed", **fields)
+            emit_progress("fetch_x_inbox", "X inbox fetch failed", **fields)
+            return
+        if task.kind == "x_selectors":
+            selector_errors = [f"x_selector: {exc}"] if exc is not None else outcome.result[1]
+            fields = dict(
+                author_selector_count=len(sources.x_authors),
+                theme_selector_count=len(sources.x_themes),
+                x_posts_budget_per_run=x_budget_plan["post_budget"],
+                x_max_spend_per_run_usd=profile.x_max_spend_per_run_usd,
+                x_cost_per_post_usd=profile.x_cost_per_post_usd,
+                author_selector_budget=x_budget_plan["author_budget"],
+                theme_selector_budget=x_budget_plan["theme_budget"],
+                author_selector_skips=x_budget_plan["author_skipped"],
+                author_selector_requests=x_budget_plan["author_requests"],
+                theme_selector_skips=x_budget_plan["theme_skipped"],
+                item_count=len(outcome.result[0]) if exc is None else 0,
+                error_count=len(selector_errors),
             )
-
-    if sources.x_inbox_path:
-        try:
-            fetched = fetch_x_inbox_items(sources.x_inbox_path)
-            raw_items.extend(fetched)
-            record_source_links("x_inbox", sources.x_inbox_path, fetched)
-            x_fetched_items += len(fetched)
             log_event(
                 run_logger,
-                "info",
-                "fetch_x_inbox",
-                "Fetched X inbox items",
-                inbox_path=sources.x_inbox_path,
-                item_count=len(fetched),
-            )
-            emit_progress(
-                "fetch_x_inbox",
-                "Fetched X inbox items",
-                inbox_path=sources.x_inbox_path,
-                item_count=len(fetched),
+                "info" if not selector_errors else "warn",
+                "fetch_x_selectors",
+                "Fetched X selector items",
+                **fields,
             )
-        except Exception as exc:
-            source_errors.append(f"x_inbox:{sources.x_inbox_path}: {exc}")
+            emit_progress("fetch_x_selectors", "Fetched X selector items", **fields)
+            return
+        if task.kind == "github":
+            if exc is None:
+                fields = dict(
+                    repo_count=len(github_repos),
+                    topic_count=len(sources.github_topics),
+                    query_count=len(sources.github_search_queries),
+                    org_count=len(github_orgs),
+                    item_count=len(outcome.result),
+                )
+                log_event(run_logger, "info", "fetch_github", "Fetched GitHub items", **fields)
+                emit_progress("fetch_github", "Fetched GitHub items", **fields)
+                return
             log_event(
                 run_logger,
                 "error",
-                "fetch_x_inbox",
-                "X inbox fetch failed",
-                inbox_path=sources.x_inbox_path,
-                error=str(exc),
-            )
-            emit_progress(
-                "fetch_x_inbox",
-                "X inbox fetch failed",
-                inbox_path=sources.x_inbox_path,
+                "fetch_github",
+                "GitHub fetch failed",
                 error=str(exc),
             )
+            emit_progress("fetch_github", "GitHub fetch failed", error=str(exc))
 
-    if sources.x_authors or sources.x_themes:
-        selector_fetched = 0
-        selector_errors: list[str] = []
-        x_budget_plan = _plan_x_selector_limits(
-            authors=sources.x_authors,
-            themes=sources.x_themes,
-            max_spend_usd=profile.x_max_spend_per_run_usd,
-            cost_per_post_usd=profile.x_cost_per_post_usd,
-        )
-        try:
-            linked_selector_items, selector_errors = fetch_x_selector_items_linked(
-                sources,
-                store,
-                author_limits=x_budget_plan["author_limits"],
-                theme_limits=x_budget_plan["theme_limits"],
+    fetch_outcomes = run_fetch_tasks(
+        fetch_tasks,
+        max_workers=profile.fetch_max_workers,
+        max_per_host=profile.fetch_max_per_host,
+        on_done=report_fetch,
+    )
+
+    def admit(source_type: str, source_value: str, items: list[Item]) -> list[Item]:
+        source_key = source_key_for(source_type, source_value)
+        source_cursors.observe(source_key, items)
+        fresh, known = source_cursors.split(source_key, items)
+        start = source_window_starts.get(source_key)
+        if start is not None:
+            for item in fresh:
+                item_window_starts[item.id] = min(start, item_window_starts.get(item.id, start))
+        if not only_new:
+            return items
+        cursor_held_items.extend(known)
+        return fresh
+
+    # Sources whose fetch failed; a prefetch shard reports them so the
+    # delivery run fetches them itself.
+    failed_source_keys: set[str] = set()
+
+    # Merge in configuration order (not completion order) so raw_items, and
+    # therefore dedupe/cluster results, match the sequential fetch exactly.
+    for outcome in fetch_outcomes:
+        task = outcome.task
+        exc = outcome.error
+        if task.kind in {"rss", "youtube_channel"}:
+            source_health.record(
+                source_key_for(task.kind, task.value), elapsed_s=outcome.elapsed_s, error=exc
+            )
+            if exc is None:
+                poll_planner.mark_polled(source_key_for(task.kind, task.value))
+            else:
+                failed_source_keys.add(source_key_for(task.kind, task.value))
+        if task.kind == "rss":
+            if exc is not None:
+                source_errors.append(f"rss:{task.value}: {exc}")
+                continue
+            fresh = admit("rss", task.value, outcome.result)
+            raw_items.extend(fresh)
+            record_source_links("rss", task.value, fresh)
+            rss_fetched_items += len(outcome.result)
+        elif task.kind == "youtube_channel":
+            if exc is not None:
+                source_errors.append(f"youtube:channel:{task.value}: {exc}")
+                continue
+            fresh = admit("youtube_channel", task.value, outcome.result)
+            raw_items.extend(fresh)
+            record_source_links("youtube_channel", task.value, fresh)
+            youtube_fetched_items += len(outcome.result)
+        elif task.kind == "x_inbox":
+            if exc is not None:
+                source_errors.append(f"x_inbox:{task.value}: {exc}")
+                continue
+            raw_items.extend(outcome.result)
+            record_source_links("x_inbox", task.value, outcome.result)
+            x_fetched_items += len(outcome.result)
+        elif task.kind in {"x_selectors", "github"}:
+            selectors = _linked_selectors(task.kind, sources, github_repos)
+            if exc is not None:
+                label = "x_selector" if task.kind == "x_selectors" else "github"
+                source_errors.append(f"{label}: {exc}")
+                failed_source_keys.update(key for _prefix, key in selectors)
+                continue
+            if task.kind == "x_selectors":
+                linked_items, linked_errors = outcome.result
+            else:
+                linked_items, linked_errors = outcome.result, list(github_client.errors)
+            failed_source_keys.update(
+                key
+                for prefix, key in selectors
+                if any(error.startswith(prefix) for error in linked_errors)
             )
-            fetched = [item for _selector_type, _selector_value, item in linked_selector_items]
-            raw_items.extend(fetched)
-            for selector_type, selector_value, item in linked_selector_items:
+            fetched = [item for _source_type, _source_value, item in linked_items]
+            if task.kind == "github":
+                for repo in github_repos:
+                    if not any(error.startswith(f"github_repo:{repo}:") for error in linked_errors):
+                        poll_planner.mark_polled(source_key_for("github_repo", repo))
+                by_source: dict[tuple[str, str], list[Item]] = {}
+                for source_type, source_value, item in linked_items:
+                    by_source.setdefault((source_type, source_value), []).append(item)
+                admitted = {
+                    id(item)
+                    for (source_type, source_value), items in by_source.items()
+                    for item in admit(source_type, source_value, items)
+                }
+                linked_items = [link for link in linked_items if id(link[2]) in admitted]
+            raw_items.extend(item for _source_type, _source_value, item in linked_items)
+            for source_type, source_value, item in linked_items:
                 source_links.append(
                     {
-                        "source_key": source_key_for(selector_type, selector_value),
-                        "source_type": selector_type,
-                        "source_value": selector_value,
+                        "source_key": source_key_for(source_type, source_value),
+                        "source_type": source_type,
+                        "source_value": source_value,
                         "item_id": item.id,
                     }
                 )
-            selector_fetched = len(fetched)
-            x_fetched_items += selector_fetched
-        except Exception as exc:
-            selector_errors.append(f"x_selector: {exc}")
-        source_errors.extend(selector_errors)
+            if task.kind == "x_selectors":
+                x_fetched_items += len(fetched)
+            else:
+                github_fetched_items += len(fetched)
+            source_errors.extend(linked_errors)
+
+    source_health.flush()
+    if poll_planner.skipped:
+        fields = dict(skipped=len(poll_planner.skipped), next_due=dict(poll_planner.skipped))
+        log_event(run_logger, "info", "fetch_poll_skip", "Sources not yet due were skipped", **fields)
+        emit_progress("fetch_poll_skip", "Sources not yet due were skipped", **fields)
+    if source_health.skipped or source_health.newly_quarantined:
+        fields = dict(
+            skipped=list(source_health.skipped),
+            newly_quarantined=list(source_health.newly_quarantined),
+        )
+        log_event(
+            run_logger, "warn", "fetch_quarantine", "Quarantined sources skipped or added", **fields
+        )
+        emit_progress("fetch_quarantine", "Quarantined sources skipped or added", **fields)
+
+    if sources.rss_feeds or sources.youtube_channels:
         log_event(
             run_logger,
-            "info" if not selector_errors else "warn",
-            "fetch_x_selectors",
-            "Fetched X selector items",
-            author_selector_count=len(sources.x_authors),
-            theme_selector_count=len(sources.x_themes),
-            x_posts_budget_per_run=x_budget_plan["post_budget"],
-            x_max_spend_per_run_usd=profile.x_max_spend_per_run_usd,
-            x_cost_per_post_usd=profile.x_cost_per_post_usd,
-            author_selector_budget=x_budget_plan["author_budget"],
-            theme_selector_budget=x_budget_plan["theme_budget"],
-            author_selector_skips=x_budget_plan["author_skipped"],
-            theme_selector_skips=x_budget_plan["theme_skipped"],
-            item_count=selector_fetched,
-            error_count=len(selector_errors),
+            "info",
+            "fetch_conditional",
+            "Conditional feed fetch summary",
+            feed_count=len(sources.rss_feeds) + len(sources.youtube_channels),
+            not_modified_count=feed_validators.not_modified_count,
+            bytes_saved=feed_validators.bytes_saved,
         )
         emit_progress(
-            "fetch_x_selectors",
-            "Fetched X selector items",
-            author_selector_count=len(sources.x_authors),
-            theme_selector_count=len(sources.x_themes),
-            x_posts_budget_per_run=x_budget_plan["post_budget"],
-            x_max_spend_per_run_usd=profile.x_max_spend_per_run_usd,
-            x_cost_per_post_usd=profile.x_cost_per_post_usd,
-            author_selector_budget=x_budget_plan["author_budget"],
-            theme_selector_budget=x_budget_plan["theme_budget"],
-            author_selector_skips=x_budget_plan["author_skipped"],
-            theme_selector_skips=x_budget_plan["theme_skipped"],
-            item_count=selector_fetched,
-            error_count=len(selector_errors),
+            "fetch_conditional",
+            "Conditional feed fetch summary",
+            feed_count=len(sources.rss_feeds) + len(sources.youtube_channels),
+            not_modified_count=feed_validators.not_modified_count,
+            bytes_saved=feed_validators.bytes_saved,
         )
 
-    if (
-        sources.github_repos
-        or sources.github_topics
-        or sources.github_search_queries
-        or sources.github_orgs
-    ):
-        try:
-            gh_token = os.getenv("GITHUB_TOKEN", "").strip()
-            github_orgs = [normalize_github_org(v) for v in sources.github_orgs]
-            github_orgs = [v for v in github_orgs if v]
-            linked_github_items = fetch_github_items_linked(
-                sources.github_repos,
-                sources.github_topics,
-                sources.github_search_queries,
-                orgs=github_orgs,
-                token=gh_token,
-                org_options={
-                    "min_stars": profile.github_min_stars,
-                    "include_forks": profile.github_include_forks,
-                    "include_archived": profile.github_include_archived,
-                    "max_repos_per_org": profile.github_max_repos_per_org,
-                    "max_items_per_org": profile.github_max_items_per_org,
-                    "repo_max_age_days": profile.github_repo_max_age_days,
-                    "activity_max_age_days": profile.github_activity_max_age_days,
-                },
-            )
-            fetched = [item for _source_type, _source_value, item in linked_github_items]
-            raw_items.extend(fetched)
-            for source_type, source_value, item in linked_github_items:
-                source_links.append(
-                    {
-                        "source_key": source_key_for(source_type, source_value),
-                        "source_type": source_type,
-                        "source_value": source_value,
-                        "item_id": item.id,
-                    }
-                )
-            github_fetched_items += len(fetched)
-            log_event(
-                run_logger,
-                "info",
-                "fetch_github",
-                "Fetched GitHub items",
-                repo_count=len(sources.github_repos),
-                topic_count=len(sources.github_topics),
-                query_count=len(sources.github_search_queries),
-                org_count=len(github_orgs),
-                item_count=len(fetched),
-            )
-            emit_progress(
-                "fetch_github",
-                "Fetched GitHub items",
-                repo_count=len(sources.github_repos),
-                topic_count=len(sources.github_topics),
-                query_count=len(sources.github_search_queries),
-                org_count=len(github_orgs),
-                item_count=len(fetched),
-            )
-        except Exception as exc:
-            source_errors.append(f"github: {exc}")
-            log_event(
-                run_logger,
-                "error",
-                "fetch_github",
-                "GitHub fetch failed",
-                error=str(exc),
-            )
-            emit_progress("fetch_github", "GitHub fetch failed", error=str(exc))
+    if source_cursors.new_counts:
+        fields = dict(
+            source_count=len(source_cursors.new_counts),
+            new_count=sum(source_cursors.new_counts.values()),
+            skipped_count=source_cursors.skipped_count,
+            held_for_fallback_count=len(cursor_held_items),
+        )
+        log_event(
+            run_logger,
+            "info",
+            "fetch_cursors",
+            "Source high-water mark summary",
+            new_counts=source_cursors.new_counts,
+            **fields,
+        )
+        emit_progress("fetch_cursors", "Source high-water mark summary", **fields)
+
+    if github_client.truncated:
+        fields = dict(
+            scopes=list(github_client.truncated),
+            max_pages=profile.github_max_pages_per_selector,
+        )
+        log_event(
+            run_logger,
+            "warn",
+            "fetch_github_truncated",
+            "GitHub pagination stopped at the page budget",
+            **fields,
+        )
+        emit_progress("fetch_github_truncated", "GitHub pagination stopped at the page budget", **fields)
+
+    if prefetch_only:
+        pooled_items = normalize_items(raw_items)
+        store.upsert_items(pooled_items)
+        feed_validators.flush()
+        store.link_source_items(run_id=run_id, links=source_links)
+        store.pool_source_items(
+            run_id=run_id,
+            links=[
+                {**link, "window_start": item_window_starts[link["item_id"]].isoformat()}
+                if link["item_id"] in item_window_starts
+                else link
+                for link in source_links
+            ],
+        )
+        # Pooled items are durable until a delivery run consumes them, so the
+        # marks and poll times can advance now.
+        source_cursors.flush()
+        poll_planner.flush()
+        github_client.flush_cursors()
+        store.finish_run(run_id, "prefetched", source_errors, summary_errors)
+        fields = dict(
+            status="prefetched",
+            pooled_item_count=len(pooled_items),
+            source_error_count=len(source_errors),
+        )
+        log_event(run_logger, "info", "run_finish", "Prefetch run finished", **fields)
+        emit_progress("run_finish", "Prefetch run finished", **fields)
+        return RunReport(
+            run_id=run_id,
+            status="prefetched",
+            source_errors=source_errors,
+            summary_errors=summary_errors,
+            source_count=len(pooled_items),
+            context={
+                "fetched": {
+                    "pooled_items": len(pooled_items),
+                    "failed_source_keys": sorted(failed_source_keys),
+                }
+            },
+        )
+
+    pooled_item_count = 0
+    if include_pool:
+        pool_links = store.list_source_pool()
+        pooled_by_id = {
+            item.id: item
+            for item in store.get_items(list(dict.fromkeys(link["item_id"] for link in pool_links)))
+        }
+        fetched_ids = {item.id for item in raw_items}
+        for link in pool_links:
+            item = pooled_by_id.get(link["item_id"])
+            if item is None:
+                continue
+            pooled_start = link.pop("window_start", "")
+            if pooled_start:
+                start = datetime.fromisoformat(pooled_start)
+                item_window_starts[item.id] = min(start, item_window_starts.get(item.id, start))
+            source_links.append(dict(link))
+            if item.id not in fetched_ids:
+                fetched_ids.add(item.id)
+                raw_items.append(item)
+                pooled_item_count += 1
+        if pooled_item_count:
+            fields = dict(pooled_item_count=pooled_item_count, link_count=len(pool_links))
+            log_event(run_logger, "info", "fetch_pool", "Added prefetched items from the pool", **fields)
+            emit_progress("fetch_pool", "Added prefetched items from the pool", **fields)
 
     raw_video_count = _count_item_type(raw_items, "video")
 
@@ -382,7 +670,7 @@ def run_digest(
     deduped_video_count = _count_item_type(deduped_items, "video")
     dedupe_dropped_count = max(0, len(normalized) - len(deduped_items))
     dedupe_dropped_video_count = max(0, raw_video_count - deduped_video_count)
-    unique_items = _filter_window(deduped_items, window_start)
+    unique_items = _filter_window(deduped_items, window_start, item_window_starts)
     window_video_count = _count_item_type(unique_items, "video")
     window_dropped_count = max(0, len(deduped_items) - len(unique_items))
     window_dropped_video_count = max(0, deduped_video_count - window_video_count)
@@ -401,7 +689,10 @@ def run_digest(
         unique_count=len(unique_items),
     )
 
-    seen = store.seen_keys()
+    if profile.seen_ttl_days:
+        store.reset_seen(older_than_days=profile.seen_ttl_days)
+    seen = store.seen_matches([item_key(i) for i in unique_items]) if only_new else set()
+    seen_total = store.seen_count()
     candidate_items = unique_items
     supplemental_seen_videos = 0
     seen_filtered_count = 0
@@ -410,30 +701,65 @@ def run_digest(
     seen_readded_video_count = 0
     github_issue_kept_high_impact = 0
     github_issue_dropped_low_impact = 0
+    # Stories already scored in earlier runs (by title similarity, any URL).
+    story_index = (
+        StoryIndex(store, ttl_days=profile.story_index_ttl_days, now=now)
+        if only_new and profile.story_repeat_policy != "off"
+        else None
+    )
+    story_repeat_dropped = 0
+    story_repeat_demoted = 0
     if only_new:
-        new_items = [i for i in unique_items if (i.url or i.hash) not in seen]
+        new_items = [i for i in unique_items if item_key(i) not in seen]
         seen_filtered_count = max(0, len(unique_items) - len(new_items))
         seen_filtered_video_count = max(
             0,
             _count_item_type(unique_items, "video")
             - _count_item_type(new_items, "video"),
         )
+        story_matches = story_index.match(new_items) if story_index is not None else {}
+        if story_matches and profile.story_repeat_policy == "drop":
+            new_items = [i for i in new_items if i.id not in story_matches]
+            story_repeat_dropped = len(story_matches)
+        if story_matches:
+            fields = dict(
+                policy=profile.story_repeat_policy,
+                repeat_count=len(story_matches),
+                delivered_repeat_count=sum(1 for m in story_matches.values() if m.delivered),
+            )
+            log_event(run_logger, "info", "story_repeats", "Matched stories from earlier runs", **fields)
+            emit_progress("story_repeats", "Matched stories from earlier runs", **fields)
         candidate_items = new_items
+        # Entries held back by source high-water marks were delivered before,
+        # so they only matter to the seen fallbacks below.
+        needs_seen_pool = (allow_seen_fallback and not candidate_items) or (
+            not allow_seen_fallback
+            and candidate_items
+            and not any(i.type == "video" for i in candidate_items)
+        )
+        seen_pool = unique_items
+        if needs_seen_pool and cursor_held_items:
+            unique_ids = {i.id for i in unique_items}
+            held_unique = _filter_window(
+                dedupe_and_cluster(normalize_items(cursor_held_items)), window_start
+            )
+            seen |= store.seen_matches([item_key(i) for i in held_unique])
+            seen_pool = unique_items + [i for i in held_unique if i.id not in unique_ids]
         # Keep delivery non-empty for manual/interactive usage when window has content
         # but all items were already seen in previous runs.
-        if allow_seen_fallback and not candidate_items and unique_items:
-            candidate_items = unique_items
-            seen_readded_count = len(unique_items)
-            seen_readded_video_count = _count_item_type(unique_items, "video")
+        if allow_seen_fallback and not candidate_items and seen_pool:
+            candidate_items = seen_pool
+            seen_readded_count = len(seen_pool)
+            seen_readded_video_count = _count_item_type(seen_pool, "video")
         elif not allow_seen_fallback and candidate_items:
             has_video = any(i.type == "video" for i in candidate_items)
             if not has_video:
                 existing_ids = {i.id for i in candidate_items}
                 seen_videos = [
                     i
-                    for i in unique_items
+                    for i in seen_pool
                     if i.type == "video"
-                    and (i.url or i.hash) in seen
+                    and item_key(i) in seen
                     and i.id not in existing_ids
                 ]
                 seen_videos.sort(
@@ -469,7 +795,7 @@ def run_digest(
         "info",
         "candidate_select",
         "Selected candidate items",
-        seen_count=len(seen),
+        seen_count=seen_total,
         candidate_pre_issue_filter_count=candidate_pre_issue_filter_count,
         candidate_count=len(candidate_items),
         supplemental_seen_videos=supplemental_seen_videos,
@@ -481,7 +807,7 @@ def run_digest(
         "Selected candidate items",
         candidate_pre_issue_filter_count=candidate_pre_issue_filter_count,
         candidate_count=len(candidate_items),
-        seen_count=len(seen),
+        seen_count=seen_total,
         supplemental_seen_videos=supplemental_seen_videos,
         github_issue_kept_high_impact=github_issue_kept_high_impact,
         github_issue_dropped_low_impact=github_issue_dropped_low_impact,
@@ -524,16 +850,19 @@ def run_digest(
             )
         return False
 
+    # Keyword features are computed once per item and shared by blocking,
+    # rules scoring, tagging and the rank adjustments below.
+    matcher = ProfileMatcher(profile)
     blocked_items: list[Item] = []
     eligible_items: list[Item] = []
     for item in candidate_items:
-        if is_blocked(item, profile):
+        if is_blocked(item, profile, matcher):
             blocked_items.append(item)
             continue
         eligible_items.append(item)
     blocked_count = len(blocked_items)
     blocked_video_count = _count_item_type(blocked_items, "video")
-    rules_scores = {item.id: score_item(item, profile) for item in eligible_items}
+    rules_scores = {item.id: score_item(item, profile, matcher) for item in eligible_items}
     eligible_count = len(eligible_items)
     eligible_video_count = _count_item_type(eligible_items, "video")
 
@@ -761,7 +1090,7 @@ def run_digest(
         source_preference_adjustments: dict[str, float] = {}
         for scored in scored_items:
             adjustment = float(
-                source_preference_adjustment(scored.item, scored.score, profile)
+                source_preference_adjustment(scored.item, scored.score, profile, matcher)
             )
             if adjustment == 0.0:
                 continue
@@ -793,7 +1122,7 @@ def run_digest(
     if scored_items:
         depth_adjustments: dict[str, float] = {}
         for scored in scored_items:
-            adjustment = float(content_depth_adjustment(scored.item, profile))
+            adjustment = float(content_depth_adjustment(scored.item, profile, matcher))
             if adjustment == 0:
                 continue
             depth_adjustments[scored.item.id] = adjustment
@@ -823,11 +1152,27 @@ def run_digest(
                 adjusted_item_count=depth_adjustment_count,
             )
 
+    if story_index is not None and profile.story_repeat_policy == "demote" and scored_items:
+        repeat_adjustments = {
+            scored.item.id: -float(STORY_REPEAT_PENALTY)
+            for scored in scored_items
+            if scored.item.id in story_index.matches
+        }
+        story_repeat_demoted = len(repeat_adjustments)
+        rank_overrides = _apply_rank_adjustments(
+            scored_items,
+            rank_overrides=rank_overrides,
+            adjustment_breakdowns=adjustment_breakdowns,
+            label="story_repeat",
+            adjustments=repeat_adjustments,
+        )
+
     research_adjustment_count = 0
     research_adjustment_total = 0.0
     research_adjustments = research_concentration_adjustments(
         scored_items,
         rank_overrides=rank_overrides,
+        matcher=matcher,
     )
     if research_adjustments:
         for item_id, adjustment in research_adjustments.items():
@@ -1211,10 +1556,21 @@ def run_digest(
             "x_items": x_fetched_items,
             "github_items": github_fetched_items,
             "raw_total": len(raw_items),
+            "not_modified_feeds": feed_validators.not_modified_count,
+            "not_modified_bytes_saved": feed_validators.bytes_saved,
+            "cursor_new_items": sum(source_cursors.new_counts.values()),
+            "cursor_skipped_items": source_cursors.skipped_count,
+            "github_quota": github_client.usage(),
+            "github_truncated": list(github_client.truncated),
+            "quarantined_sources": list(source_health.skipped),
+            "newly_quarantined_sources": list(source_health.newly_quarantined),
+            "poll_skipped_sources": dict(poll_planner.skipped),
+            "poll_next_due": dict(poll_planner.next_due),
+            "pooled_items": pooled_item_count,
         },
         "pipeline": {
             "unique_count": len(unique_items),
-            "seen_count": len(seen),
+            "seen_count": seen_total,
             "candidate_pre_issue_filter_count": candidate_pre_issue_filter_count,
             "candidate_count": len(candidate_items),
             "supplemental_seen_videos": supplemental_seen_videos,
@@ -1233,6 +1589,8 @@ def run_digest(
             "blocked_dropped": blocked_count,
             "blocked_dropped_videos": blocked_video_count,
             "github_low_impact_dropped": github_issue_dropped_low_impact,
+            "story_repeat_dropped": story_repeat_dropped,
+            "story_repeat_demoted": story_repeat_demoted,
             "ranking_dropped": ranking_dropped_count,
             "ranking_dropped_videos": ranking_dropped_video_count,
         },
@@ -1451,6 +1809,7 @@ def run_digest(
             )
 
     store.upsert_items(normalized)
+    feed_validators.flush()
     store.link_source_items(run_id=run_id, links=source_links)
     store.insert_scores(run_id, scores)
     store.replace_run_selected_items(
@@ -1481,7 +1840,17 @@ def run_digest(
         store.finish_run(run_id, final_status, source_errors, summary_errors)
     else:
         final_status = status
-        store.mark_seen([i.url or i.hash for i in candidate_items])
+        store.mark_seen([item_key(i) for i in candidate_items])
+        if story_index is not None:
+            story_index.remember(
+                [scored.item for scored in scored_items],
+                delivered_ids={scored.item.id for scored in selected_items},
+            )
+        source_cursors.flush()
+        poll_planner.flush()
+        github_client.flush_cursors()
+        if include_pool:
+            store.clear_source_pool(through=run_started_at.isoformat())
         store.finish_run(run_id, final_status, source_errors, summary_errors)
     log_event(
         run_logger,
@@ -1576,6 +1945,10 @@ def _build_sparse_context_note(
     return " ".join(parts)
 
 
+def _fetch_host(url: str) -> str:
+    return (urllib.parse.urlparse(url).netloc or "").strip().lower()
+
+
 def _count_item_type(items: list[Item], item_type: str) -> int:
     return sum(1 for item in items if item.type == item_type)
 
@@ -1606,7 +1979,15 @@ def _plan_x_selector_limits(
     themes: list[str],
     max_spend_usd: float,
     cost_per_post_usd: float,
+    batch_query_chars: int = 0,
 ) -> dict[str, object]:
+    """Split the run's X post budget across selectors (authors first).
+
+    With `batch_query_chars`, funded authors are also packed into batched OR
+    queries: each batch is one request whose max_results is the sum of its
+    authors' limits, capped at one page, so `author_requests` drops from one
+    per author to one per batch.
+    """
     post_budget = _x_posts_budget_per_run(
         max_spend_usd=max_spend_usd,
         cost_per_post_usd=cost_per_post_usd,
@@ -1621,6 +2002,13 @@ def _plan_x_selector_limits(
         author_limits = {}
         theme_limits = _split_evenly(clean_themes, post_budget)
 
+    funded_authors = [author for author in clean_authors if author_limits.get(author, 0) > 0]
+    author_batches = (
+        pack_author_batches(funded_authors, max_chars=batch_query_chars, limits=author_limits)
+        if batch_query_chars > 0
+        else None
+    )
+
     return {
         "post_budget": post_budget,
         "author_budget": sum(author_limits.values()),
@@ -1629,10 +2017,37 @@ def _plan_x_selector_limits(
         "theme_limits": theme_limits,
         "author_skipped": sum(1 for value in author_limits.values() if value <= 0),
         "theme_skipped": sum(1 for value in theme_limits.values() if value <= 0),
+        "author_batches": author_batches,
+        "author_requests": len(author_batches) if author_batches is not None else len(funded_authors),
     }
 
 
-def _filter_window(items: list[Item], window_start_iso: str) -> list[Item]:
+def _linked_selectors(
+    kind: str, sources: SourceConfig, github_repos: list[str]
+) -> list[tuple[str, str]]:
+    """(error prefix, source key) for each selector an X or GitHub task fetched."""
+    if kind == "x_selectors":
+        selectors = [("x_author", v, v) for v in sources.x_authors] + [
+            ("x_theme", v, v) for v in sources.x_themes
+        ]
+    else:
+        selectors = (
+            [("github_repo", v, v) for v in github_repos]
+            + [("github_topic", v, v) for v in sources.github_topics]
+            + [("github_query", v, v) for v in sources.github_search_queries]
+            + [("github_org", normalize_github_org(v), v) for v in sources.github_orgs]
+        )
+    return [
+        (f"{source_type}:{label}: ", source_key_for(source_type, value))
+        for source_type, label, value in selectors
+    ]
+
+
+def _filter_window(
+    items: list[Item],
+    window_start_iso: str,
+    item_starts: dict[str, datetime] | None = None,
+) -> list[Item]:
     start = datetime.fromisoformat(window_start_iso)
     if start.tzinfo is None:
         start = start.replace(tzinfo=timezone.utc)
@@ -1641,7 +2056,8 @@ def _filter_window(items: list[Item], window_start_iso: str) -> list[Item]:
         published = item.published_at
         if published is not None and published.tzinfo is None:
             published = published.replace(tzinfo=timezone.utc)
-        if published is None or published >= start:
+        item_start = (item_starts or {}).get(item.id, start)
+        if published is None or published >= item_start:
             filtered.append(item)
     return filtered
 
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Callable
 
+from digest.connectors.rss import FeedResponse
 from digest.models import Item
 from digest.ops.source_registry import source_key_for
+from digest.storage.sqlite_store import SQLiteStore
 
 ProgressCallback = Callable[[dict[str, Any]], None]
 
@@ -57,3 +64,235 @@ class SourceLinkRecorder:
                     "item_id": item.id,
                 }
             )
+
+
+class SourceCursorCache:
+    """Per-source high-water marks: the newest dated entry each source returned.
+
+    Marks are loaded once per run. `split()` separates entries a source
+    already delivered (published before the mark, or the mark entry itself)
+    from new ones; undated entries always count as new. `observe()` buffers
+    advanced marks and `flush()` persists them, which the runtime only does
+    after the run's items are marked seen, so an accumulated or failed run
+    never hides entries it did not deliver.
+    """
+
+    def __init__(self, store: SQLiteStore, source_keys: list[str]) -> None:
+        self._store = store
+        self._marks = store.get_source_cursors(source_keys) if source_keys else {}
+        self._pending: dict[str, dict[str, object]] = {}
+        self.new_counts: dict[str, int] = {}
+        self.skipped_count = 0
+
+    def cutoff(self, source_key: str, window_start: datetime) -> datetime:
+        mark = self._marks.get(source_key)
+        if mark is None:
+            return window_start
+        return max(window_start, mark["newest_published_at"])
+
+    def split(self, source_key: str, items: list[Item]) -> tuple[list[Item], list[Item]]:
+        mark = self._marks.get(source_key)
+        if mark is None:
+            fresh, known = list(items), []
+        else:
+            mark_url = str(mark["newest_url"] or "")
+            mark_at = mark["newest_published_at"]
+            fresh, known = [], []
+            for item in items:
+                published = _as_utc(item.published_at)
+                if (mark_url and item.url == mark_url) or (
+                    published is not None and published < mark_at
+                ):
+                    known.append(item)
+                else:
+                    fresh.append(item)
+        self.new_counts[source_key] = self.new_counts.get(source_key, 0) + len(fresh)
+        self.skipped_count += len(known)
+        return fresh, known
+
+    def observe(self, source_key: str, items: list[Item]) -> None:
+        newest = max(
+            (item for item in items if item.published_at is not None),
+            key=lambda item: _as_utc(item.published_at),
+            default=None,
+        )
+        if newest is None:
+            return
+        newest_at = _as_utc(newest.published_at)
+        current = self._pending.get(source_key) or self._marks.get(source_key)
+        if current is not None and current["newest_published_at"] >= newest_at:
+            return
+        self._pending[source_key] = {
+            "source_key": source_key,
+            "newest_url": newest.url,
+            "newest_published_at": newest_at,
+        }
+
+    def flush(self) -> None:
+        rows = list(self._pending.values())
+        self._pending.clear()
+        self._store.upsert_source_cursors(rows)
+
+
+class FeedValidatorCache:
+    """Per-run conditional-GET state for feed URLs.
+
+    Validators (ETag / Last-Modified) and the item ids of the last full fetch
+    are read from SQLite. On a 304 the feed's previous items are replayed from
+    the `items` table instead of being downloaded and parsed again. New
+    validators are buffered and only persisted by `flush()`, which the runtime
+    calls after the run's items are stored, so a replay never points at items
+    that were never written.
+    """
+
+    def __init__(self, store: SQLiteStore) -> None:
+        self._store = store
+        self._lock = threading.Lock()
+        self._pending: dict[str, dict[str, object]] = {}
+        self.not_modified_count = 0
+        self.bytes_saved = 0
+
+    def lookup(self, feed_url: str) -> dict[str, object] | None:
+        validator = self._store.get_feed_validator(feed_url)
+        if validator is None:
+            return None
+        if not validator.get("etag") and not validator.get("last_modified"):
+            return None
+        return validator
+
+    def replay(self, feed_url: str, validator: dict[str, object]) -> list[Item] | None:
+        item_ids = [str(v) for v in validator.get("item_ids") or []]
+        items = self._store.get_items(item_ids)
+        if len(items) != len(item_ids):
+            return None
+        with self._lock:
+            self.not_modified_count += 1
+            self.bytes_saved += int(validator.get("content_length") or 0)
+            self._pending[feed_url] = {**validator, "url": feed_url}
+        return items
+
+    def remember(self, feed_url: str, response: FeedResponse, items: list[Item]) -> None:
+        if not response.etag and not response.last_modified:
+            return
+        with self._lock:
+            self._pending[feed_url] = {
+                "url": feed_url,
+                "etag": response.etag,
+                "last_modified": response.last_modified,
+                "content_length": response.content_length,
+                "item_ids": [item.id for item in items],
+            }
+
+    def flush(self) -> None:
+        with self._lock:
+            rows = list(self._pending.values())
+            self._pending.clear()
+        self._store.upsert_feed_validators(rows)
+
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=timezone.utc)
+
+
+@dataclass(slots=True)
+class FetchTask:
+    kind: str
+    value: str
+    host: str
+    run: Callable[[], Any]
+
+
+@dataclass(slots=True)
+class FetchOutcome:
+    task: FetchTask
+    result: Any = None
+    error: Exception | None = None
+    elapsed_s: float = 0.0
+
+
+def run_fetch_tasks(
+    tasks: list[FetchTask],
+    *,
+    max_workers: int,
+    max_per_host: int,
+    on_done: Callable[[FetchOutcome], None] | None = None,
+) -> list[FetchOutcome]:
+    """Run source fetches concurrently; outcomes come back in task order.
+
+    `on_done` fires on the calling thread as each fetch completes so progress
+    reporting stays single-threaded. Tasks with an empty host skip the
+    per-host gate (local files, single-call connectors).
+    """
+    if not tasks:
+        return []
+    host_gates = {
+        task.host: threading.BoundedSemaphore(max(1, max_per_host))
+        for task in tasks
+        if task.host
+    }
+
+    def execute(task: FetchTask) -> FetchOutcome:
+        gate = host_gates.get(task.host)
+        started = time.monotonic()
+        try:
+            if gate is None:
+                result = task.run()
+            else:
+                with gate:
+                    # Latency samples drive adaptive timeouts: time the fetch
+                    # itself, not the wait for a host slot.
+                    started = time.monotonic()
+                    result = task.run()
+        except Exception as exc:
+            return FetchOutcome(
+                task=task,
+                error=exc,
+                elapsed_s=round(time.monotonic() - started, 3),
+            )
+        return FetchOutcome(
+            task=task,
+            result=result,
+            elapsed_s=round(time.monotonic() - started, 3),
+        )
+
+    outcomes: list[FetchOutcome | None] = [None] * len(tasks)
+    workers = max(1, min(int(max_workers), len(tasks)))
+    if workers == 1:
+        for index, task in enumerate(tasks):
+            outcome = execute(task)
+            outcomes[index] = outcome
+            if on_done is not None:
+                on_done(outcome)
+        return [outcome for outcome in outcomes if outcome is not None]
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="digest-fetch") as pool:
+        futures = {
+            pool.submit(execute, tasks[index]): index
+            for index in _interleave_by_host(tasks)
+        }
+        for future in as_completed(futures):
+            outcome = future.result()
+            outcomes[futures[future]] = outcome
+            if on_done is not None:
+                on_done(outcome)
+    return [outcome for outcome in outcomes if outcome is not None]
+
+
+def _interleave_by_host(tasks: list[FetchTask]) -> list[int]:
+    # Round-robin submission across hosts so workers rarely sit blocked on a
+    # busy host gate while other hosts still have queued work.
+    by_host: OrderedDict[str, list[int]] = OrderedDict()
+    for index, task in enumerate(tasks):
+        by_host.setdefault(task.host or f"__task_{index}", []).append(index)
+    order: list[int] = []
+    queues = list(by_host.values())
+    while queues:
+        next_round: list[list[int]] = []
+        for queue in queues:
+            order.append(queue.pop(0))
+            if queue:
+                next_round.append(queue)
+        queues = next_round
+    return order
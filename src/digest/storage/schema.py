@@ -53,6 +53,113 @@ SCHEMA_SQL = """
                     PRIMARY KEY (selector_type, selector_value)
                 );
 
+                CREATE TABLE IF NOT EXISTS source_cursors (
+                    source_key TEXT PRIMARY KEY,
+                    newest_url TEXT,
+                    newest_published_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                );
+
+                CREATE TABLE IF NOT EXISTS schema_migrations (
+                    name TEXT PRIMARY KEY,
+                    applied_at TEXT NOT NULL
+                );
+
+                CREATE TABLE IF NOT EXISTS story_index (
+                    item_id TEXT PRIMARY KEY,
+                    story_id TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    shingles TEXT NOT NULL,
+                    delivered INTEGER NOT NULL DEFAULT 0,
+                    indexed_at TEXT NOT NULL
+                );
+
+                CREATE TABLE IF NOT EXISTS story_buckets (
+                    bucket INTEGER NOT NULL,
+                    item_id TEXT NOT NULL,
+                    PRIMARY KEY (bucket, item_id)
+                );
+
+                CREATE TABLE IF NOT EXISTS source_pool (
+                    source_key TEXT NOT NULL,
+                    item_id TEXT NOT NULL,
+                    source_type TEXT NOT NULL,
+                    source_value TEXT NOT NULL,
+                    run_id TEXT NOT NULL,
+                    pooled_at TEXT NOT NULL,
+                    window_start TEXT,
+                    PRIMARY KEY (source_key, item_id)
+                );
+
+                CREATE TABLE IF NOT EXISTS source_poll_state (
+                    source_key TEXT PRIMARY KEY,
+                    last_polled_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                );
+
+                CREATE TABLE IF NOT EXISTS source_health (
+                    source_key TEXT PRIMARY KEY,
+                    latencies_json TEXT NOT NULL,
+                    consecutive_failures INTEGER NOT NULL,
+                    quarantine_count INTEGER NOT NULL,
+                    quarantined_until TEXT,
+                    last_success_at TEXT,
+                    last_failure_at TEXT,
+                    last_error TEXT,
+                    updated_at TEXT NOT NULL
+                );
+
+                CREATE TABLE IF NOT EXISTS github_etags (
+                    path TEXT PRIMARY KEY,
+                    etag TEXT NOT NULL,
+                    body_json TEXT NOT NULL,
+                    next_path TEXT,
+                    updated_at TEXT NOT NULL
+                );
+
+                CREATE TABLE IF NOT EXISTS github_cursors (
+                    scope TEXT PRIMARY KEY,
+                    since TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                );
+
+                CREATE TABLE IF NOT EXISTS github_org_repos (
+                    org TEXT PRIMARY KEY,
+                    listing_path TEXT NOT NULL,
+                    per_page INTEGER NOT NULL,
+                    head TEXT NOT NULL,
+                    repos_json TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                );
+
+                CREATE TABLE IF NOT EXISTS x_inbox_state (
+                    path TEXT PRIMARY KEY,
+                    device INTEGER NOT NULL,
+                    inode INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    read_offset INTEGER NOT NULL,
+                    head_hash TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                );
+
+                CREATE TABLE IF NOT EXISTS x_inbox_entries (
+                    path TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    comment TEXT NOT NULL,
+                    first_ingested_at TEXT NOT NULL,
+                    PRIMARY KEY (path, url)
+                );
+
+                CREATE TABLE IF NOT EXISTS feed_validators (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    content_length INTEGER NOT NULL,
+                    item_ids_json TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                );
+
                 CREATE TABLE IF NOT EXISTS source_item_links (
                     source_key TEXT NOT NULL,
                     source_type TEXT NOT NULL,
@@ -193,8 +300,14 @@ SCHEMA_SQL = """
                     ON run_timeline_notes(run_id, created_at_utc DESC);
                 CREATE INDEX IF NOT EXISTS idx_x_selector_cursors_updated_at
                     ON x_selector_cursors(updated_at DESC);
+                CREATE INDEX IF NOT EXISTS idx_x_inbox_entries_ingested
+                    ON x_inbox_entries(path, first_ingested_at);
                 CREATE INDEX IF NOT EXISTS idx_source_item_links_source_key
                     ON source_item_links(source_key, linked_at DESC);
                 CREATE INDEX IF NOT EXISTS idx_source_item_links_item_id
                     ON source_item_links(item_id);
+                CREATE INDEX IF NOT EXISTS idx_story_index_indexed_at
+                    ON story_index(indexed_at);
+                CREATE INDEX IF NOT EXISTS idx_story_buckets_item_id
+                    ON story_buckets(item_id);
                 """
@@ -0,0 +1,106 @@
+"""On-disk Bloom filter in front of the `seen` table.
+
+A miss in the filter means the key was definitely never marked seen, so
+`SQLiteStore.seen_matches()` only queries the table for possible hits. The
+file records the highest `seen` rowid it covers, and each load adds just the
+rows inserted since then. Deleting seen rows (reset or TTL expiry) removes
+the file, and it is rebuilt from the table on the next lookup. It is also
+rebuilt with a larger size once it holds more keys than it was sized for.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import sqlite3
+import struct
+from pathlib import Path
+
+from digest.constants import SEEN_BLOOM_FALSE_POSITIVE_RATE, SEEN_BLOOM_MIN_CAPACITY
+
+_MAGIC = b"DSBF1"
+# bit count, hash count, capacity, key count, covered rowid
+_HEADER = struct.Struct(">QIQQQ")
+
+
+class SeenBloomFilter:
+    def __init__(self, capacity: int, *, false_positive_rate: float = SEEN_BLOOM_FALSE_POSITIVE_RATE) -> None:
+        self.capacity = max(SEEN_BLOOM_MIN_CAPACITY, int(capacity))
+        bits = math.ceil(-self.capacity * math.log(false_positive_rate) / (math.log(2) ** 2))
+        self.bit_count = max(8, bits)
+        self.hash_count = max(1, round(self.bit_count / self.capacity * math.log(2)))
+        self.bits = bytearray((self.bit_count + 7) // 8)
+        self.key_count = 0
+        self.rowid = 0
+
+    def _positions(self, key: str) -> list[int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "big")
+        second = int.from_bytes(digest[8:], "big") | 1
+        return [(first + i * second) % self.bit_count for i in range(self.hash_count)]
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.key_count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def save(self, path: Path) -> None:
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp, "wb") as fh:
+            fh.write(_MAGIC)
+            fh.write(
+                _HEADER.pack(self.bit_count, self.hash_count, self.capacity, self.key_count, self.rowid)
+            )
+            fh.write(self.bits)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> SeenBloomFilter | None:
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        if not data.startswith(_MAGIC) or len(data) < len(_MAGIC) + _HEADER.size:
+            return None
+        bit_count, hash_count, capacity, key_count, rowid = _HEADER.unpack_from(data, len(_MAGIC))
+        body = data[len(_MAGIC) + _HEADER.size :]
+        if len(body) != (bit_count + 7) // 8:
+            return None
+        bloom = cls.__new__(cls)
+        bloom.capacity, bloom.bit_count, bloom.hash_count = capacity, bit_count, hash_count
+        bloom.bits = bytearray(body)
+        bloom.key_count, bloom.rowid = key_count, rowid
+        return bloom
+
+
+def refresh_seen_bloom(conn: sqlite3.Connection, path: Path) -> SeenBloomFilter:
+    """Load the filter at `path`, add seen rows newer than it covers, and save it."""
+    bloom = SeenBloomFilter.load(path)
+    if bloom is not None:
+        max_rowid = int(conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM seen").fetchone()[0])
+        if max_rowid < bloom.rowid:
+            bloom = None  # the table shrank behind the filter's back
+    added = 0
+    if bloom is not None:
+        for rowid, key in conn.execute(
+            "SELECT rowid, key FROM seen WHERE rowid > ? ORDER BY rowid", (bloom.rowid,)
+        ):
+            bloom.add(str(key))
+            bloom.rowid = int(rowid)
+            added += 1
+        if bloom.key_count > bloom.capacity:
+            bloom = None
+    if bloom is None:
+        total = int(conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0])
+        bloom = SeenBloomFilter(total * 2)
+        for rowid, key in conn.execute("SELECT rowid, key FROM seen ORDER BY rowid"):
+            bloom.add(str(key))
+            bloom.rowid = int(rowid)
+        added = -1
+    if added:
+        bloom.save(path)
+    return bloom
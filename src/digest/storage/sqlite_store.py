@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 import sqlite3
 from contextlib import contextmanager
 from dataclasses import dataclass
@@ -8,9 +9,12 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from collections import Counter
 
+from digest.constants import SEEN_BLOOM_REBUILD_FRACTION
 from digest.models import Item, Score
 from digest.quality.online_repair import decayed_weight, source_family
 from digest.storage.schema import SCHEMA_SQL
+from digest.storage.seen_bloom import refresh_seen_bloom
+from digest.urls import canonical_url
 
 
 @dataclass(slots=True)
@@ -23,8 +27,18 @@ class RunRecord:
 
 
 class SQLiteStore:
-    def __init__(self, db_path: str = "digest.db") -> None:
+    def __init__(self, db_path: str = "digest.db", *, seen_bloom: bool | None = None) -> None:
         self.db_path = Path(db_path)
+        if seen_bloom is None:
+            seen_bloom = os.getenv("DIGEST_SEEN_BLOOM", "1").strip().lower() not in {
+                "0",
+                "false",
+                "off",
+                "no",
+            }
+        self.seen_bloom_path = (
+            self.db_path.with_name(self.db_path.name + ".seen-bloom") if seen_bloom else None
+        )
         self._init_db()
 
     @contextmanager
@@ -53,6 +67,40 @@ class SQLiteStore:
             self._ensure_column(
                 conn, "run_selected_items", "adjustment_breakdown_json", "TEXT"
             )
+            self._ensure_column(conn, "github_etags", "next_path", "TEXT")
+            self._ensure_column(conn, "source_pool", "window_start", "TEXT")
+            self._run_migration(conn, "canonical_seen_keys", self._canonicalize_seen_keys)
+
+    def _run_migration(self, conn: sqlite3.Connection, name: str, migrate) -> None:
+        """Apply a one-time data migration, recorded in schema_migrations."""
+        if conn.execute("SELECT 1 FROM schema_migrations WHERE name = ?", (name,)).fetchone():
+            return
+        migrate(conn)
+        conn.execute(
+            "INSERT INTO schema_migrations (name, applied_at) VALUES (?, ?)",
+            (name, datetime.now(tz=timezone.utc).isoformat()),
+        )
+
+    def _canonicalize_seen_keys(self, conn: sqlite3.Connection) -> None:
+        # Seen keys written before URL canonicalization keep their earliest
+        # first_seen_at under the canonical key.
+        rows = conn.execute(
+            "SELECT key, first_seen_at FROM seen WHERE key LIKE 'http%'"
+        ).fetchall()
+        changed = [(key, canonical_url(key), first_seen_at) for key, first_seen_at in rows]
+        changed = [row for row in changed if row[1] != row[0]]
+        if not changed:
+            return
+        conn.executemany(
+            "INSERT OR IGNORE INTO seen (key, first_seen_at) VALUES (?, ?)",
+            [(canonical, first_seen_at) for _key, canonical, first_seen_at in changed],
+        )
+        conn.executemany(
+            "UPDATE seen SET first_seen_at = MIN(first_seen_at, ?) WHERE key = ?",
+            [(first_seen_at, canonical) for _key, canonical, first_seen_at in changed],
+        )
+        conn.executemany("DELETE FROM seen WHERE key = ?", [(key,) for key, _c, _f in changed])
+        self._invalidate_seen_bloom()
 
     def _ensure_column(
         self, conn: sqlite3.Connection, table: str, column: str, col_type: str
@@ -107,6 +155,37 @@ class SQLiteStore:
                 ],
             )
 
+    def get_items(self, item_ids: list[str]) -> list[Item]:
+        clean_ids = [str(v or "").strip() for v in item_ids if str(v or "").strip()]
+        if not clean_ids:
+            return []
+        placeholders = ",".join(["?"] * len(clean_ids))
+        with self._conn() as conn:
+            rows = conn.execute(
+                (
+                    "SELECT id, url, title, source, author, published_at, type, "
+                    "raw_text, description, hash "
+                    f"FROM items WHERE id IN ({placeholders})"
+                ),
+                clean_ids,
+            ).fetchall()
+        by_id = {
+            str(row[0]): Item(
+                id=str(row[0]),
+                url=str(row[1] or ""),
+                title=str(row[2] or ""),
+                source=str(row[3] or ""),
+                author=(str(row[4]) if row[4] else None),
+                published_at=_parse_dt(str(row[5] or "")),
+                type=str(row[6] or "article"),
+                raw_text=str(row[7] or ""),
+                description=str(row[8] or ""),
+                hash=str(row[9] or ""),
+            )
+            for row in rows
+        }
+        return [by_id[item_id] for item_id in clean_ids if item_id in by_id]
+
     def link_source_items(
         self,
         *,
@@ -138,6 +217,208 @@ class SQLiteStore:
                 ],
             )
 
+    def story_bucket_matches(self, buckets: list[int]) -> dict[int, list[str]]:
+        """Item ids of indexed stories per LSH bucket (only buckets with entries)."""
+        keys = sorted(set(buckets))
+        matches: dict[int, list[str]] = {}
+        with self._conn() as conn:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                rows = conn.execute(
+                    (
+                        "SELECT bucket, item_id FROM story_buckets "
+                        f"WHERE bucket IN ({','.join('?' * len(chunk))})"
+                    ),
+                    chunk,
+                ).fetchall()
+                for row in rows:
+                    matches.setdefault(int(row[0]), []).append(str(row[1]))
+        return matches
+
+    def get_story_entries(self, item_ids: list[str]) -> dict[str, dict[str, object]]:
+        ids = sorted(set(item_ids))
+        entries: dict[str, dict[str, object]] = {}
+        with self._conn() as conn:
+            for start in range(0, len(ids), 500):
+                chunk = ids[start : start + 500]
+                rows = conn.execute(
+                    (
+                        "SELECT item_id, story_id, url, title, shingles, delivered, indexed_at "
+                        f"FROM story_index WHERE item_id IN ({','.join('?' * len(chunk))})"
+                    ),
+                    chunk,
+                ).fetchall()
+                for row in rows:
+                    entries[str(row[0])] = {
+                        "story_id": str(row[1]),
+                        "url": str(row[2] or ""),
+                        "title": str(row[3] or ""),
+                        "shingles": frozenset(str(row[4] or "").split()),
+                        "delivered": bool(row[5]),
+                        "indexed_at": _parse_dt(str(row[6] or "")),
+                    }
+        return entries
+
+    def index_stories(self, rows: list[dict[str, object]]) -> None:
+        if not rows:
+            return
+        now = datetime.now(tz=timezone.utc).isoformat()
+        with self._conn() as conn:
+            conn.executemany(
+                """
+                INSERT INTO story_index (
+                    item_id, story_id, url, title, shingles, delivered, indexed_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(item_id) DO UPDATE SET
+                    delivered = MAX(story_index.delivered, excluded.delivered)
+                """,
+                [
+                    (
+                        str(row["item_id"]),
+                        str(row["story_id"]),
+                        str(row.get("url") or ""),
+                        str(row.get("title") or ""),
+                        " ".join(sorted(row.get("shingles") or ())),  # type: ignore[arg-type]
+                        1 if row.get("delivered") else 0,
+                        now,
+                    )
+                    for row in rows
+                ],
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO story_buckets (bucket, item_id) VALUES (?, ?)",
+                [
+                    (int(bucket), str(row["item_id"]))
+                    for row in rows
+                    for bucket in row.get("buckets") or ()  # type: ignore[union-attr]
+                ],
+            )
+
+    def prune_story_index(self, *, before: str) -> int:
+        with self._conn() as conn:
+            conn.execute(
+                "DELETE FROM story_buckets WHERE item_id IN "
+                "(SELECT item_id FROM story_index WHERE indexed_at < ?)",
+                (before,),
+            )
+            cur = conn.execute("DELETE FROM story_index WHERE indexed_at < ?", (before,))
+        return int(cur.rowcount or 0)
+
+    def pool_source_items(self, *, run_id: str, links: list[dict[str, str]]) -> None:
+        """Hold prefetched items (already upserted) for the next delivery run.
+
+        A link's optional `window_start` is the catch-up start its source was
+        read back to, so the delivery run keeps the item even when it predates
+        that run's window.
+        """
+        if not links:
+            return
+        now = datetime.now(tz=timezone.utc).isoformat()
+        with self._conn() as conn:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO source_pool (
+                    source_key, item_id, source_type, source_value, run_id, pooled_at,
+                    window_start
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        str(link.get("source_key") or "").strip(),
+                        str(link.get("item_id") or "").strip(),
+                        str(link.get("source_type") or "").strip(),
+                        str(link.get("source_value") or "").strip(),
+                        run_id,
+                        now,
+                        str(link.get("window_start") or "").strip() or None,
+                    )
+                    for link in links
+                    if str(link.get("source_key") or "").strip()
+                    and str(link.get("item_id") or "").strip()
+                ],
+            )
+
+    def list_source_pool(self) -> list[dict[str, str]]:
+        with self._conn() as conn:
+            rows = conn.execute(
+                "SELECT source_key, source_type, source_value, item_id, window_start "
+                "FROM source_pool ORDER BY pooled_at, rowid"
+            ).fetchall()
+        return [
+            {
+                "source_key": str(row[0]),
+                "source_type": str(row[1]),
+                "source_value": str(row[2]),
+                "item_id": str(row[3]),
+                "window_start": str(row[4] or ""),
+            }
+            for row in rows
+        ]
+
+    def clear_source_pool(self, *, through: str) -> int:
+        with self._conn() as conn:
+            cur = conn.execute("DELETE FROM source_pool WHERE pooled_at <= ?", (through,))
+        return int(cur.rowcount or 0)
+
+    def source_publish_history(
+        self, source_keys: list[str], *, per_source: int = 20
+    ) -> dict[str, list[datetime]]:
+        """Newest-first publish times of the items each source has linked."""
+        keys = sorted({str(k or "").strip() for k in source_keys} - {""})
+        history: dict[str, list[datetime]] = {}
+        with self._conn() as conn:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                rows = conn.execute(
+                    (
+                        "SELECT source_key, published_at FROM ("
+                        " SELECT l.source_key, i.published_at, ROW_NUMBER() OVER ("
+                        "  PARTITION BY l.source_key ORDER BY i.published_at DESC) AS rank"
+                        " FROM source_item_links l JOIN items i ON i.id = l.item_id"
+                        f" WHERE l.source_key IN ({','.join('?' * len(chunk))})"
+                        " AND i.published_at IS NOT NULL AND i.published_at != ''"
+                        ") WHERE rank <= ? ORDER BY source_key, published_at DESC"
+                    ),
+                    (*chunk, per_source),
+                ).fetchall()
+                for row in rows:
+                    published_at = _parse_dt(str(row[1] or ""))
+                    if published_at is not None:
+                        history.setdefault(str(row[0]), []).append(published_at)
+        return history
+
+    def get_source_poll_times(self, source_keys: list[str]) -> dict[str, datetime]:
+        keys = sorted({str(k or "").strip() for k in source_keys} - {""})
+        polled: dict[str, datetime] = {}
+        with self._conn() as conn:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                rows = conn.execute(
+                    (
+                        "SELECT source_key, last_polled_at FROM source_poll_state "
+                        f"WHERE source_key IN ({','.join('?' * len(chunk))})"
+                    ),
+                    chunk,
+                ).fetchall()
+                for row in rows:
+                    polled_at = _parse_dt(str(row[1] or ""))
+                    if polled_at is not None:
+                        polled[str(row[0])] = polled_at
+        return polled
+
+    def upsert_source_poll_times(self, polled: dict[str, datetime]) -> None:
+        if not polled:
+            return
+        now = datetime.now(tz=timezone.utc).isoformat()
+        with self._conn() as conn:
+            conn.executemany(
+                (
+                    "INSERT OR REPLACE INTO source_poll_state "
+                    "(source_key, last_polled_at, updated_at) VALUES (?, ?, ?)"
+                ),
+                [(key, value.isoformat(), now) for key, value in sorted(polled.items())],
+            )
+
     def latest_items_for_sources(self, source_keys: list[str]) -> dict[str, dict[str, str]]:
         clean_keys = [str(key or "").strip() for key in source_keys if str(key or "").strip()]
         if not clean_keys:
@@ -198,7 +479,13 @@ class SQLiteStore:
         url: str,
         *,
         max_age_hours: int = 24,
+        failure_max_age_hours: int | None = None,
     ) -> dict[str, str] | None:
+        """Cached preview for `url`, or None when missing or older than allowed.
+
+        Rows whose status is not "ready" (failed fetches) expire after
+        `failure_max_age_hours` when given, so failures are retried sooner.
+        """
         key = str(url or "").strip()
         if not key:
             return None
@@ -217,6 +504,8 @@ class SQLiteStore:
         if fetched_at is None:
             return None
         age_seconds = (datetime.now(tz=timezone.utc) - fetched_at).total_seconds()
+        if failure_max_age_hours is not None and str(row[6] or "") != "ready":
+            max_age_hours = failure_max_age_hours
         if age_seconds > max(1, max_age_hours) * 3600:
             return None
         return {
@@ -509,6 +798,358 @@ class SQLiteStore:
             rows = conn.execute("SELECT key FROM seen").fetchall()
         return {r[0] for r in rows}
 
+    def seen_matches(self, keys: list[str]) -> set[str]:
+        """The subset of `keys` already marked seen (primary-key lookups)."""
+        wanted = sorted({str(k) for k in keys if k})
+        found: set[str] = set()
+        with self._conn() as conn:
+            if self.seen_bloom_path is not None and wanted:
+                bloom = refresh_seen_bloom(conn, self.seen_bloom_path)
+                wanted = [key for key in wanted if key in bloom]
+            for start in range(0, len(wanted), 500):
+                chunk = wanted[start : start + 500]
+                rows = conn.execute(
+                    f"SELECT key FROM seen WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                found.update(str(row[0]) for row in rows)
+        return found
+
+    def seen_count(self) -> int:
+        with self._conn() as conn:
+            row = conn.execute("SELECT COUNT(*) FROM seen").fetchone()
+        return int(row[0] or 0) if row else 0
+
+    def _invalidate_seen_bloom(self) -> None:
+        # Bloom filters cannot forget keys; rebuild after deletions.
+        if self.seen_bloom_path is not None:
+            self.seen_bloom_path.unlink(missing_ok=True)
+
+    def get_feed_validator(self, url: str) -> dict[str, object] | None:
+        key = str(url or "").strip()
+        if not key:
+            return None
+        with self._conn() as conn:
+            row = conn.execute(
+                (
+                    "SELECT etag, last_modified, content_length, item_ids_json, updated_at "
+                    "FROM feed_validators WHERE url = ?"
+                ),
+                (key,),
+            ).fetchone()
+        if not row:
+            return None
+        return {
+            "url": key,
+            "etag": str(row[0] or ""),
+            "last_modified": str(row[1] or ""),
+            "content_length": int(row[2] or 0),
+            "item_ids": _json_list(row[3]),
+            "updated_at": str(row[4] or ""),
+        }
+
+    def upsert_feed_validators(self, rows: list[dict[str, object]]) -> None:
+        if not rows:
+            return
+        now = datetime.now(tz=timezone.utc).isoformat()
+        with self._conn() as conn:
+            conn.executemany(
+                (
+                    "INSERT OR REPLACE INTO feed_validators "
+                    "(url, etag, last_modified, content_length, item_ids_json, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)"
+                ),
+                [
+                    (
+                        str(row.get("url") or "").strip(),
+                        str(row.get("etag") or "").strip() or None,
+                        str(row.get("last_modified") or "").strip() or None,
+                        int(row.get("content_length") or 0),
+                        json.dumps(list(row.get("item_ids") or []), ensure_ascii=True),
+                        now,
+                    )
+                    for row in rows
+                    if str(row.get("url") or "").strip()
+                ],
+            )
+
+    def get_source_cursors(self, source_keys: list[str]) -> dict[str, dict[str, object]]:
+        keys = sorted({str(k or "").strip() for k in source_keys} - {""})
+        cursors: dict[str, dict[str, object]] = {}
+        with self._conn() as conn:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                rows = conn.execute(
+                    (
+                        "SELECT source_key, newest_url, newest_published_at FROM source_cursors "
+                        f"WHERE source_key IN ({','.join('?' * len(chunk))})"
+                    ),
+                    chunk,
+                ).fetchall()
+                for row in rows:
+                    published_at = _parse_dt(str(row[2] or ""))
+                    if published_at is None:
+                        continue
+                    cursors[str(row[0])] = {
+                        "newest_url": str(row[1] or ""),
+                        "newest_published_at": published_at,
+                    }
+        return cursors
+
+    def get_source_health(self, source_keys: list[str] | None = None) -> dict[str, dict[str, object]]:
+        """Health rows by source key; all rows when `source_keys` is None."""
+        query = (
+            "SELECT source_key, latencies_json, consecutive_failures, quarantine_count, "
+            "quarantined_until, last_success_at, last_failure_at, last_error FROM source_health"
+        )
+        with self._conn() as conn:
+            if source_keys is None:
+                rows = conn.execute(query).fetchall()
+            else:
+                keys = sorted({str(k or "").strip() for k in source_keys} - {""})
+                rows = []
+                for start in range(0, len(keys), 500):
+                    chunk = keys[start : start + 500]
+                    rows.extend(
+                        conn.execute(
+                            f"{query} WHERE source_key IN ({','.join('?' * len(chunk))})",
+                            chunk,
+                        ).fetchall()
+                    )
+        health: dict[str, dict[str, object]] = {}
+        for row in rows:
+            try:
+                latencies = [float(v) for v in json.loads(str(row[1] or "[]"))]
+            except (TypeError, ValueError):
+                latencies = []
+            health[str(row[0])] = {
+                "latencies": latencies,
+                "consecutive_failures": int(row[2] or 0),
+                "quarantine_count": int(row[3] or 0),
+                "quarantined_until": _parse_dt(str(row[4] or "")),
+                "last_success_at": _parse_dt(str(row[5] or "")),
+                "last_failure_at": _parse_dt(str(row[6] or "")),
+                "last_error": str(row[7] or ""),
+            }
+        return health
+
+    def upsert_source_health(self, rows: list[dict[str, object]]) -> None:
+        if not rows:
+            return
+        now = datetime.now(tz=timezone.utc).isoformat()
+
+        def iso(value: object) -> str | None:
+            return value.isoformat() if isinstance(value, datetime) else None
+
+        with self._conn() as conn:
+            conn.executemany(
+                (
+                    "INSERT OR REPLACE INTO source_health "
+                    "(source_key, latencies_json, consecutive_failures, quarantine_count, "
+                    "quarantined_until, last_success_at, last_failure_at, last_error, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                ),
+                [
+                    (
+                        str(row["source_key"]),
+                        json.dumps([round(float(v), 3) for v in row.get("latencies") or []]),
+                        int(row.get("consecutive_failures") or 0),
+                        int(row.get("quarantine_count") or 0),
+                        iso(row.get("quarantined_until")),
+                        iso(row.get("last_success_at")),
+                        iso(row.get("last_failure_at")),
+                        str(row.get("last_error") or "")[:500],
+                        now,
+                    )
+                    for row in rows
+                ],
+            )
+
+    def upsert_source_cursors(self, rows: list[dict[str, object]]) -> None:
+        if not rows:
+            return
+        now = datetime.now(tz=timezone.utc).isoformat()
+        with self._conn() as conn:
+            conn.executemany(
+                (
+                    "INSERT OR REPLACE INTO source_cursors "
+                    "(source_key, newest_url, newest_published_at, updated_at) "
+                    "VALUES (?, ?, ?, ?)"
+                ),
+                [
+                    (
+                        str(row["source_key"]),
+                        str(row.get("newest_url") or "").strip() or None,
+                        row["newest_published_at"].isoformat(),
+                        now,
+                    )
+                    for row in rows
+                    if isinstance(row.get("newest_published_at"), datetime)
+                ],
+            )
+
+    def get_github_etag(self, path: str) -> dict[str, object] | None:
+        with self._conn() as conn:
+            row = conn.execute(
+                "SELECT etag, body_json, next_path FROM github_etags WHERE path = ?",
+                (path,),
+            ).fetchone()
+        if not row:
+            return None
+        return {
+            "path": path,
+            "etag": str(row[0]),
+            "body_json": str(row[1]),
+            "next_path": str(row[2] or ""),
+        }
+
+    def upsert_github_etag(
+        self, path: str, etag: str, body_json: str, *, next_path: str = ""
+    ) -> None:
+        now = datetime.now(tz=timezone.utc).isoformat()
+        with self._conn() as conn:
+            conn.execute(
+                (
+                    "INSERT OR REPLACE INTO github_etags "
+                    "(path, etag, body_json, next_path, updated_at) VALUES (?, ?, ?, ?, ?)"
+                ),
+                (path, etag, body_json, next_path or None, now),
+            )
+
+    def touch_github_etag(self, path: str) -> None:
+        """Mark a stored ETag as revalidated now, so pruning keeps it."""
+        now = datetime.now(tz=timezone.utc).isoformat()
+        with self._conn() as conn:
+            conn.execute("UPDATE github_etags SET updated_at = ? WHERE path = ?", (now, path))
+
+    def prune_github_etags(self, *, before: str) -> int:
+        with self._conn() as conn:
+            cur = conn.execute("DELETE FROM github_etags WHERE updated_at < ?", (before,))
+        return int(cur.rowcount or 0)
+
+    def get_github_cursor(self, scope: str) -> datetime | None:
+        with self._conn() as conn:
+            row = conn.execute(
+                "SELECT since FROM github_cursors WHERE scope = ?", (scope,)
+            ).fetchone()
+        return _parse_dt(str(row[0] or "")) if row else None
+
+    def upsert_github_cursors(self, rows: dict[str, datetime]) -> None:
+        if not rows:
+            return
+        now = datetime.now(tz=timezone.utc).isoformat()
+        with self._conn() as conn:
+            conn.executemany(
+                (
+                    "INSERT INTO github_cursors (scope, since, updated_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT(scope) DO UPDATE SET "
+                    "since = MAX(github_cursors.since, excluded.since), "
+                    "updated_at = excluded.updated_at"
+                ),
+                [(scope, since.isoformat(), now) for scope, since in rows.items()],
+            )
+
+    def get_github_org_inventory(self, org: str) -> dict[str, object] | None:
+        with self._conn() as conn:
+            row = conn.execute(
+                "SELECT listing_path, per_page, head, repos_json FROM github_org_repos WHERE org = ?",
+                (org,),
+            ).fetchone()
+        if not row:
+            return None
+        try:
+            repos = json.loads(str(row[3] or "[]"))
+        except json.JSONDecodeError:
+            return None
+        return {
+            "org": org,
+            "listing_path": str(row[0]),
+            "per_page": int(row[1] or 0),
+            "head": str(row[2] or ""),
+            "repos": repos if isinstance(repos, list) else [],
+        }
+
+    def upsert_github_org_inventory(
+        self, org: str, listing_path: str, per_page: int, head: str, repos: list[dict]
+    ) -> None:
+        now = datetime.now(tz=timezone.utc).isoformat()
+        with self._conn() as conn:
+            conn.execute(
+                (
+                    "INSERT OR REPLACE INTO github_org_repos "
+                    "(org, listing_path, per_page, head, repos_json, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)"
+                ),
+                (org, listing_path, per_page, head, json.dumps(repos, ensure_ascii=True), now),
+            )
+
+    def get_x_inbox_state(self, path: str) -> dict[str, object] | None:
+        with self._conn() as conn:
+            row = conn.execute(
+                (
+                    "SELECT device, inode, size, read_offset, head_hash "
+                    "FROM x_inbox_state WHERE path = ?"
+                ),
+                (path,),
+            ).fetchone()
+        if not row:
+            return None
+        return {
+            "device": int(row[0]),
+            "inode": int(row[1]),
+            "size": int(row[2]),
+            "read_offset": int(row[3]),
+            "head_hash": str(row[4] or ""),
+        }
+
+    def record_x_inbox_read(
+        self,
+        path: str,
+        *,
+        device: int,
+        inode: int,
+        size: int,
+        read_offset: int,
+        head_hash: str,
+        entries: list[tuple[str, str]],
+        ingested_at: datetime,
+    ) -> None:
+        """Advance the inbox read position and add newly seen (url, comment) lines.
+
+        Both happen in one transaction; URLs already recorded for `path` keep
+        their original first_ingested_at, so a full rescan does not refresh them.
+        """
+        now = datetime.now(tz=timezone.utc).isoformat()
+        with self._conn() as conn:
+            conn.executemany(
+                (
+                    "INSERT OR IGNORE INTO x_inbox_entries "
+                    "(path, url, comment, first_ingested_at) VALUES (?, ?, ?, ?)"
+                ),
+                [(path, url, comment, ingested_at.isoformat()) for url, comment in entries],
+            )
+            conn.execute(
+                (
+                    "INSERT OR REPLACE INTO x_inbox_state "
+                    "(path, device, inode, size, read_offset, head_hash, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+                ),
+                (path, device, inode, size, read_offset, head_hash, now),
+            )
+
+    def list_x_inbox_entries(
+        self, path: str, *, since: datetime | None = None
+    ) -> list[tuple[str, str, datetime]]:
+        """(url, comment, first_ingested_at) in ingestion order, optionally windowed."""
+        query = "SELECT url, comment, first_ingested_at FROM x_inbox_entries WHERE path = ?"
+        params: list[object] = [path]
+        if since is not None:
+            query += " AND first_ingested_at >= ?"
+            params.append(since.astimezone(timezone.utc).isoformat())
+        with self._conn() as conn:
+            rows = conn.execute(query + " ORDER BY rowid", params).fetchall()
+        return [(str(row[0]), str(row[1]), datetime.fromisoformat(str(row[2]))) for row in rows]
+
     def get_x_cursor(self, selector_type: str, selector_value: str) -> str | None:
         with self._conn() as conn:
             row = conn.execute(
@@ -523,6 +1164,20 @@ class SQLiteStore:
         value = str(row[0] or "").strip()
         return value or None
 
+    def get_x_last_item_ids(self, selector_type: str, selector_values: list[str]) -> dict[str, str]:
+        if not selector_values:
+            return {}
+        placeholders = ",".join(["?"] * len(selector_values))
+        with self._conn() as conn:
+            rows = conn.execute(
+                (
+                    "SELECT selector_value, last_item_id FROM x_selector_cursors "
+                    f"WHERE selector_type = ? AND selector_value IN ({placeholders})"
+                ),
+                (selector_type, *selector_values),
+            ).fetchall()
+        return {str(row[0]): str(row[1]) for row in rows if str(row[1] or "").strip()}
+
     def set_x_cursor(
         self,
         *,
@@ -567,25 +1222,39 @@ class SQLiteStore:
             return int(row[0] or 0) if row else 0
 
     def reset_seen(self, *, older_than_days: int | None = None) -> int:
+        count, rebuild = self._delete_seen(older_than_days=older_than_days)
+        if rebuild:
+            self._invalidate_seen_bloom()
+        return count
+
+    def _delete_seen(self, *, older_than_days: int | None) -> tuple[int, bool]:
+        """Rows deleted, and whether the Bloom filter has to be rebuilt.
+
+        Expired keys left in the filter only cost a confirming lookup. The
+        filter is rebuilt when most rows went, or when the highest rowid went:
+        new rows could then reuse rowids the filter claims to cover.
+        """
         with self._conn() as conn:
             if older_than_days is None:
                 row = conn.execute("SELECT COUNT(*) FROM seen").fetchone()
                 count = int(row[0] or 0) if row else 0
                 conn.execute("DELETE FROM seen")
-                return count
+                return count, count > 0
             cutoff = datetime.now(tz=timezone.utc) - timedelta(
                 days=max(1, int(older_than_days))
             )
-            row = conn.execute(
-                "SELECT COUNT(*) FROM seen WHERE first_seen_at <= ?",
-                (cutoff.isoformat(),),
+            total, max_rowid = conn.execute(
+                "SELECT COUNT(*), COALESCE(MAX(rowid), 0) FROM seen"
             ).fetchone()
-            count = int(row[0] or 0) if row else 0
-            conn.execute(
+            count = conn.execute(
                 "DELETE FROM seen WHERE first_seen_at <= ?",
                 (cutoff.isoformat(),),
-            )
-            return count
+            ).rowcount
+            if count <= 0:
+                return 0, False
+            (remaining_max,) = conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM seen").fetchone()
+            rebuild = remaining_max < max_rowid or count >= total * SEEN_BLOOM_REBUILD_FRACTION
+            return count, rebuild
 
     def last_completed_window_end(self) -> str | None:
         with self._conn() as conn:
@@ -0,0 +1,144 @@
+"""URL canonicalization shared by the pipeline and the store.
+
+`canonical_url()` maps the variants of one article URL (tracking
+parameters, AMP and mobile hosts, http/https, trailing slashes) to a single
+key. Items keep the URL their source gave them for display. Exact dedupe
+and the seen table key on `item_key()`; the score cache keys on the item
+hash, which normalization derives from the canonical URL.
+"""
+
+from __future__ import annotations
+
+import re
+import urllib.parse
+from functools import lru_cache
+
+from digest.models import Item
+
+# Query parameters that only track the click, on any host.
+TRACKING_PARAMS = {
+    "fbclid",
+    "gclid",
+    "dclid",
+    "msclkid",
+    "yclid",
+    "igshid",
+    "mc_cid",
+    "mc_eid",
+    "mkt_tok",
+    "_hsenc",
+    "_hsmi",
+    "ref_src",
+    "ref_url",
+    "cmpid",
+    "spm",
+    "outputtype",
+}
+TRACKING_PREFIXES = ("utm_",)
+
+# Host aliases that serve the same pages as the canonical host.
+HOST_ALIASES = {
+    "twitter.com": "x.com",
+    "www.twitter.com": "x.com",
+    "mobile.twitter.com": "x.com",
+    "www.x.com": "x.com",
+    "mobile.x.com": "x.com",
+    "youtube.com": "www.youtube.com",
+    "m.youtube.com": "www.youtube.com",
+    "music.youtube.com": "www.youtube.com",
+    "reddit.com": "www.reddit.com",
+    "old.reddit.com": "www.reddit.com",
+    "m.reddit.com": "www.reddit.com",
+    "np.reddit.com": "www.reddit.com",
+    "export.arxiv.org": "arxiv.org",
+    "www.arxiv.org": "arxiv.org",
+    "m.facebook.com": "www.facebook.com",
+    "mobile.facebook.com": "www.facebook.com",
+    "m.imdb.com": "www.imdb.com",
+}
+
+# Hosts whose pages are identified by these query parameters alone (an empty
+# set drops the whole query string).
+HOST_QUERY_KEYS = {
+    "x.com": set(),
+    "www.youtube.com": {"v", "list"},
+    "news.ycombinator.com": {"id"},
+    "arxiv.org": set(),
+    "github.com": set(),
+    "medium.com": set(),
+}
+
+_AMP_CACHE_SUFFIX = ".cdn.ampproject.org"
+_ARXIV_PDF_RE = re.compile(r"^/pdf/(.+?)(?:\.pdf)?$")
+
+
+@lru_cache(maxsize=8192)
+def canonical_url(url: str) -> str:
+    """One URL per article: https, no tracking params, AMP and mobile hosts folded.
+
+    This is a key, not a link to show: the scheme is only upgraded on default
+    ports, and query parameters are only dropped when they are known to track
+    or the host's rule says the page does not need them. Non-http(s) values
+    (and anything that does not parse) are returned as-is.
+    """
+    raw = (url or "").strip()
+    parsed = urllib.parse.urlsplit(raw)
+    if parsed.scheme.lower() not in {"http", "https"} or not parsed.hostname:
+        return raw
+    host = parsed.hostname.lower()
+    path = parsed.path or "/"
+
+    # Google AMP cache: https://<x>.cdn.ampproject.org/c/s/<host>/<path>
+    if host.endswith(_AMP_CACHE_SUFFIX):
+        parts = path.split("/", 4)
+        if len(parts) >= 4 and parts[1] == "c":
+            rest = "/".join(parts[3:]) if parts[2] == "s" else "/".join(parts[2:])
+            inner_host, _, inner_path = rest.partition("/")
+            host, path = inner_host.lower(), "/" + inner_path
+    if host.startswith("amp."):
+        host = host[4:]
+    if host.endswith(".m.wikipedia.org"):
+        host = host[: -len(".m.wikipedia.org")] + ".wikipedia.org"
+    host = HOST_ALIASES.get(host, host)
+
+    if host == "youtu.be":
+        video_id = path.strip("/")
+        host, path = "www.youtube.com", "/watch"
+        query = [("v", video_id)] if video_id else []
+    else:
+        query = urllib.parse.parse_qsl(parsed.query, keep_blank_values=True)
+    if host == "www.youtube.com" and path.startswith("/shorts/"):
+        query = [("v", path.split("/")[2])]
+        path = "/watch"
+    if host == "arxiv.org":
+        pdf = _ARXIV_PDF_RE.match(path)
+        if pdf:
+            path = f"/abs/{pdf.group(1)}"
+
+    if path.endswith("/amp") or path.endswith(".amp"):
+        path = path[:-4] or "/"
+    if len(path) > 1:
+        path = path.rstrip("/") or "/"
+
+    keep = HOST_QUERY_KEYS.get(host)
+    query = [
+        (key, value)
+        for key, value in query
+        if (key in keep if keep is not None else not _is_tracking_param(key))
+    ]
+    port = parsed.port
+    if port in {None, 80, 443}:
+        scheme, netloc = "https", host
+    else:
+        scheme, netloc = parsed.scheme.lower(), f"{host}:{port}"
+    return urllib.parse.urlunsplit((scheme, netloc, path, urllib.parse.urlencode(query), ""))
+
+
+def _is_tracking_param(key: str) -> bool:
+    lowered = key.lower()
+    return lowered in TRACKING_PARAMS or lowered.startswith(TRACKING_PREFIXES)
+
+
+def item_key(item: Item) -> str:
+    """Dedupe and seen key: the canonical URL, or the hash for URL-less items."""
+    return canonical_url(item.url) if item.url else item.hash
@@ -129,6 +129,8 @@ class TestConfig(unittest.TestCase):
                     "github_max_items_per_org: 11\n"
                     "github_repo_max_age_days: 21\n"
                     "github_activity_max_age_days: 5\n"
+                    "fetch_max_workers: 4\n"
+                    "fetch_max_per_host: 3\n"
                     "max_agent_items_per_run: 12\n"
                     "max_llm_summaries_per_run: 9\n"
                     "max_llm_requests_per_run: 30\n"
@@ -152,6 +154,8 @@ class TestConfig(unittest.TestCase):
             self.assertEqual(profile.github_max_items_per_org, 11)
             self.assertEqual(profile.github_repo_max_age_days, 21)
             self.assertEqual(profile.github_activity_max_age_days, 5)
+            self.assertEqual(profile.fetch_max_workers, 4)
+            self.assertEqual(profile.fetch_max_per_host, 3)
             self.assertEqual(profile.max_agent_items_per_run, 12)
             self.assertEqual(profile.max_llm_summaries_per_run, 9)
             self.assertEqual(profile.max_llm_requests_per_run, 30)
@@ -1,8 +1,17 @@
 import unittest
 from datetime import datetime
+from unittest.mock import patch
 
+from digest.constants import NEAR_DUP_LSH_MIN_ITEMS
 from digest.models import Item
-from digest.pipeline.dedupe import dedupe_exact
+from digest.pipeline.dedupe import cluster_near_duplicates, dedupe_exact
+from digest.pipeline.near_dup import NearDuplicateIndex, lsh_bands
+
+
+def _titled(idx: int, title: str, description: str = "") -> Item:
+    return Item(
+        str(idx), f"https://e/{idx}", title, "s", None, datetime.now(), "article", "", description
+    )
 
 
 class TestDedupe(unittest.TestCase):
@@ -42,5 +51,52 @@ class TestDedupe(unittest.TestCase):
         self.assertEqual(out[0].title, "Article title")
 
 
+class TestNearDuplicateClustering(unittest.TestCase):
+    def test_lsh_index_matches_direct_scan_on_large_batches(self):
+        titles = []
+        for idx in range(NEAR_DUP_LSH_MIN_ITEMS * 2):
+            if idx % 3 == 2:
+                titles.append(titles[idx - 2] + " update")
+            else:
+                titles.append(f"story {idx} about topic{idx % 17} and model{idx % 29} release")
+        items = [_titled(idx, title) for idx, title in enumerate(titles)]
+
+        clusters = cluster_near_duplicates(items)
+        with patch("digest.pipeline.dedupe.NEAR_DUP_LSH_MIN_ITEMS", len(items) + 1):
+            scanned = cluster_near_duplicates(items)
+        self.assertEqual([[i.id for i in c] for c in clusters], [[i.id for i in c] for c in scanned])
+        self.assertEqual(len(clusters), sum(1 for idx in range(len(items)) if idx % 3 != 2))
+        self.assertEqual([i.id for i in clusters[0]], ["0", "2"])
+
+    def test_index_joins_earliest_matching_cluster(self):
+        index = NearDuplicateIndex(0.5)
+        self.assertEqual(index.add(frozenset({"a", "b", "c"})), 0)
+        self.assertEqual(index.add(frozenset({"x", "y", "z"})), 1)
+        self.assertEqual(index.add(frozenset()), 2)
+        self.assertEqual(index.add(frozenset({"a", "b", "c", "x"})), 0)
+        self.assertEqual(lsh_bands(0.7, 64), (21, 3))
+
+    def test_lsh_path_can_miss_a_pair_at_the_threshold(self):
+        # Accepted divergence: at exactly Jaccard 0.7 this pair shares no
+        # band bucket (the index targets 99.9% recall at the threshold), so
+        # the LSH path keeps it apart while the direct scan merges it.
+        common = " ".join(f"t1447c{i}" for i in range(14))
+        items = [
+            _titled(1, common + " t1447a0 t1447a1 t1447a2"),
+            _titled(2, common + " t1447b0 t1447b1 t1447b2"),
+        ]
+        self.assertEqual(len(cluster_near_duplicates(items)), 1)
+        with patch("digest.pipeline.dedupe.NEAR_DUP_LSH_MIN_ITEMS", 0):
+            self.assertEqual(len(cluster_near_duplicates(items)), 2)
+
+    def test_description_shingles_are_opt_in(self):
+        items = [
+            _titled(1, "Launch day", "new open weights model for agents"),
+            _titled(2, "Launch day", "quarterly earnings call transcript"),
+        ]
+        self.assertEqual(len(cluster_near_duplicates(items)), 1)
+        self.assertEqual(len(cluster_near_duplicates(items, include_description=True)), 2)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,26 +1,95 @@
+import importlib.util
+import os
+import tempfile
 import unittest
-from unittest.mock import MagicMock, patch
+import urllib.error
+from http.client import HTTPMessage
+from pathlib import Path
+from unittest.mock import patch
 
-from digest.connectors.rss import _fetch_with_retry, parse_feed_items
+from datetime import datetime, timezone
+
+from digest.connectors.feed_parsers import get_feed_backend, parse_feed_items, parse_feed_stream
+from digest.connectors.rss import fetch_rss_items
+from digest.net.engine import HttpResponse, RetryPolicy
+from digest.runtime_support import FeedValidatorCache
+from digest.storage.sqlite_store import SQLiteStore
+
+FIXTURES = Path(__file__).parent / "fixtures" / "feeds"
+
+RSS_BODY = b"""<rss><channel>
+  <item>
+    <title>Cached Post</title>
+    <link>https://example.com/cached</link>
+    <description>Body</description>
+  </item>
+</channel></rss>"""
+
+
+def _message(headers: dict[str, str]) -> HTTPMessage:
+    message = HTTPMessage()
+    for name, value in headers.items():
+        message[name] = value
+    return message
+
+
+def _response(body: bytes, headers: dict[str, str]) -> HttpResponse:
+    return HttpResponse(
+        url="https://example.com/feed.xml", status=200, headers=_message(headers), body=body
+    )
+
+
+class _Stream:
+    def __init__(self, body: bytes, headers: dict[str, str]) -> None:
+        self.body = body
+        self.headers = _message(headers)
+        self.bytes_read = len(body)
+        self.closed = False
+
+    def iter_chunks(self):
+        for start in range(0, len(self.body), 7):
+            yield self.body[start : start + 7]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        self.closed = True
+
+
+def _dated_rss(*days: int) -> bytes:
+    entries = "".join(
+        f"<item><title>Day {day}</title><link>https://example.com/{day}</link>"
+        f"<pubDate>{day:02d} Mar 2026 10:00:00 +0000</pubDate></item>"
+        for day in days
+    )
+    return f"<rss><channel>{entries}</channel></rss>".encode("utf-8")
 
 
 class TestFeedParsing(unittest.TestCase):
-    def test_fetch_retries_timeout_then_succeeds(self):
-        response = MagicMock()
-        response.read.return_value = b"<rss><channel></channel></rss>"
-        context = MagicMock()
-        context.__enter__.return_value = response
-        context.__exit__.return_value = False
+    def test_fetch_uses_engine_retry_policy(self):
+        with patch(
+            "digest.connectors.rss.open_stream",
+            return_value=_Stream(RSS_BODY, {}),
+        ) as open_stream:
+            items = fetch_rss_items(["https://example.com/feed.xml"], timeout=5, retries=2)
+
+        self.assertEqual([i.url for i in items], ["https://example.com/cached"])
+        request = open_stream.call_args.args[0]
+        self.assertEqual(request.url, "https://example.com/feed.xml")
+        self.assertEqual(request.timeout, 5)
+        self.assertEqual(open_stream.call_args.kwargs["retry"], RetryPolicy(retries=2, backoff_seconds=1.0))
 
+    def test_multiple_feeds_fan_out_in_one_batch(self):
+        feeds = ["https://a.example/feed.xml", "https://b.example/feed.xml"]
         with patch(
-            "digest.connectors.rss.urllib.request.urlopen",
-            side_effect=[TimeoutError("timed out"), context],
-        ) as urlopen, patch("digest.connectors.rss.time.sleep") as sleep:
-            content = _fetch_with_retry("https://example.com/feed.xml", timeout=5, retries=2)
+            "digest.connectors.rss.send_many",
+            return_value=[_response(RSS_BODY, {}), TimeoutError("timed out")],
+        ) as send_many:
+            with self.assertRaises(TimeoutError):
+                fetch_rss_items(feeds)
 
-        self.assertEqual(content, b"<rss><channel></channel></rss>")
-        self.assertEqual(urlopen.call_count, 2)
-        sleep.assert_called_once_with(1.0)
+        self.assertEqual([r.url for r in send_many.call_args.args[0]], feeds)
 
     def test_atom_feed_parses_entries(self):
         xml = b"""<?xml version='1.0' encoding='UTF-8'?>
@@ -73,5 +142,168 @@ class TestFeedParsing(unittest.TestCase):
         self.assertEqual(items[0].url, "https://example.com/generic")
 
 
+class TestRecordedFeedFixtures(unittest.TestCase):
+    def _parse(self, name: str):
+        return parse_feed_items(f"https://example.com/{name}", (FIXTURES / name).read_bytes())
+
+    def test_arxiv_rss_fields(self):
+        items = self._parse("arxiv_cs_lg.xml")
+        self.assertEqual(len(items), 80)
+        first = items[0]
+        self.assertEqual(first.url, "https://arxiv.org/abs/2603.10000")
+        self.assertTrue(first.description.startswith("arXiv:2603.10000v1 Announce Type: new"))
+        self.assertEqual(first.author, "D. Tanaka, B. Novak, K. Kim, H. Singh, N. Tanaka, C. Kim")
+        self.assertEqual(first.published_at.isoformat(), "2026-03-02T00:00:00-05:00")
+
+    def test_atom_fields_follow_document_order(self):
+        items = self._parse("blog_atom.xml")
+        self.assertEqual(len(items), 25)
+        first = items[0]
+        self.assertEqual(first.url, "https://blog.example.org/posts/0")
+        self.assertEqual(first.author, "A. Weber")
+        # <updated> precedes <published> in the entry, so it wins.
+        self.assertEqual(first.published_at.isoformat(), "2026-02-28T12:00:00+00:00")
+        self.assertNotIn("<p>", first.description)
+
+    def test_rdf_fields(self):
+        items = self._parse("news_rdf.xml")
+        self.assertEqual(len(items), 40)
+        first = items[0]
+        self.assertEqual(first.url, "https://news.example.net/story/2026000")
+        self.assertEqual(first.author, "J. Zhou")
+        self.assertEqual(first.published_at.isoformat(), "2026-03-01T23:15:00+00:00")
+
+
+class TestWindowedFeedParsing(unittest.TestCase):
+    WINDOW = datetime(2026, 3, 5, tzinfo=timezone.utc)
+
+    def test_ordered_feed_stops_after_stale_run(self):
+        chunks_read = []
+
+        def chunks():
+            body = _dated_rss(9, 8, 6, 4, 3, 2, 1)
+            for start in range(0, len(body), 40):
+                chunks_read.append(start)
+                yield body[start : start + 40]
+
+        items = parse_feed_stream("https://example.com/feed", chunks(), window_start=self.WINDOW)
+
+        self.assertEqual([i.title for i in items], ["Day 9", "Day 8", "Day 6"])
+        total_chunks = -(-len(_dated_rss(9, 8, 6, 4, 3, 2, 1)) // 40)
+        self.assertLess(len(chunks_read), total_chunks)
+
+    def test_unordered_feed_keeps_every_in_window_entry(self):
+        body = _dated_rss(6, 1, 2, 3, 9)
+        items = parse_feed_stream("https://example.com/feed", [body], window_start=self.WINDOW)
+        self.assertEqual([i.title for i in items], ["Day 6", "Day 9"])
+
+    def test_matches_full_parse_without_window(self):
+        body = _dated_rss(9, 8, 1)
+        streamed = parse_feed_stream("https://example.com/feed", [body[:10], body[10:]])
+        self.assertEqual(streamed, parse_feed_items("https://example.com/feed", body))
+
+    def test_oversized_body_is_rejected(self):
+        with self.assertRaises(ValueError):
+            parse_feed_stream("https://example.com/feed", [RSS_BODY], max_bytes=10)
+
+    def test_fetch_streams_single_feed_with_window(self):
+        stream = _Stream(_dated_rss(9, 4, 3, 2), {})
+        with patch("digest.connectors.rss.open_stream", return_value=stream):
+            items = fetch_rss_items(["https://example.com/feed"], window_start=self.WINDOW)
+
+        self.assertEqual([i.title for i in items], ["Day 9"])
+        self.assertTrue(stream.closed)
+
+
+class TestFeedBackends(unittest.TestCase):
+    def _assert_backend_matches_stdlib(self, backend: str) -> None:
+        for path in sorted(FIXTURES.glob("*.xml")):
+            with self.subTest(fixture=path.name):
+                content = path.read_bytes()
+                expected = parse_feed_items(path.name, content, backend="stdlib")
+                self.assertEqual(parse_feed_items(path.name, content, backend=backend), expected)
+
+    @unittest.skipUnless(importlib.util.find_spec("lxml"), "lxml not installed")
+    def test_lxml_backend_matches_stdlib(self):
+        self._assert_backend_matches_stdlib("lxml")
+
+    @unittest.skipUnless(importlib.util.find_spec("feedparser"), "feedparser not installed")
+    def test_feedparser_backend_matches_stdlib(self):
+        self._assert_backend_matches_stdlib("feedparser")
+
+    @unittest.skipUnless(importlib.util.find_spec("feedparser"), "feedparser not installed")
+    def test_feedparser_backend_applies_window(self):
+        body = _dated_rss(9, 8, 6, 4, 3, 2, 1)
+        items = parse_feed_stream(
+            "https://example.com/feed",
+            [body],
+            window_start=TestWindowedFeedParsing.WINDOW,
+            backend="feedparser",
+        )
+        self.assertEqual([i.title for i in items], ["Day 9", "Day 8", "Day 6"])
+
+    def test_backend_selected_from_env(self):
+        with patch.dict(os.environ, {"DIGEST_FEED_PARSER": "stdlib"}):
+            self.assertEqual(get_feed_backend().name, "stdlib")
+        with patch.dict(os.environ, {"DIGEST_FEED_PARSER": "auto"}):
+            self.assertEqual(get_feed_backend().name, "stdlib")
+        with patch.dict(os.environ, {"DIGEST_FEED_PARSER": "sax"}):
+            with self.assertRaises(RuntimeError):
+                get_feed_backend()
+
+
+class TestConditionalFeedFetch(unittest.TestCase):
+    def test_not_modified_replays_stored_items_without_parsing(self):
+        feed = "https://example.com/feed.xml"
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SQLiteStore(str(Path(tmp) / "digest.db"))
+            first = FeedValidatorCache(store)
+            with patch(
+                "digest.connectors.rss.open_stream",
+                return_value=_Stream(RSS_BODY, {"ETag": '"v1"', "Last-Modified": "Mon"}),
+            ):
+                items = fetch_rss_items([feed], validators=first)
+            store.upsert_items(items)
+            first.flush()
+
+            second = FeedValidatorCache(store)
+            not_modified = urllib.error.HTTPError(feed, 304, "Not Modified", {}, None)
+            with (
+                patch("digest.connectors.rss.open_stream", side_effect=not_modified) as send,
+                patch("digest.connectors.rss.parse_feed_stream") as parse,
+            ):
+                replayed = fetch_rss_items([feed], validators=second)
+
+            request = send.call_args.args[0]
+            self.assertEqual(request.headers["If-None-Match"], '"v1"')
+            self.assertEqual(request.headers["If-Modified-Since"], "Mon")
+            parse.assert_not_called()
+            self.assertEqual([i.url for i in replayed], ["https://example.com/cached"])
+            self.assertEqual(second.not_modified_count, 1)
+            self.assertEqual(second.bytes_saved, len(RSS_BODY))
+
+    def test_missing_replay_items_fall_back_to_full_fetch(self):
+        feed = "https://example.com/feed.xml"
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SQLiteStore(str(Path(tmp) / "digest.db"))
+            store.upsert_feed_validators(
+                [{"url": feed, "etag": '"v1"', "content_length": 10, "item_ids": ["gone"]}]
+            )
+            cache = FeedValidatorCache(store)
+            not_modified = urllib.error.HTTPError(feed, 304, "Not Modified", {}, None)
+            with patch(
+                "digest.connectors.rss.open_stream",
+                side_effect=[not_modified, _Stream(RSS_BODY, {"ETag": '"v2"'})],
+            ) as send:
+                items = fetch_rss_items([feed], validators=cache)
+
+            self.assertEqual(send.call_count, 2)
+            self.assertNotIn("If-None-Match", send.call_args.args[0].headers)
+            self.assertEqual(len(items), 1)
+            self.assertEqual(cache.not_modified_count, 0)
+            cache.flush()
+            self.assertEqual(store.get_feed_validator(feed)["etag"], '"v2"')
+
+
 if __name__ == "__main__":
     unittest.main()
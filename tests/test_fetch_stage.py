@@ -0,0 +1,466 @@
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+from digest.config import OutputSettings, ProfileConfig, SourceConfig
+from digest.constants import SOURCE_QUARANTINE_AFTER_FAILURES
+from digest.models import Item
+from digest.ops.source_health import SourceHealthTracker
+from digest.ops.source_registry import source_key_for
+from digest.runtime import run_digest
+from digest.runtime_support import FetchTask, SourceCursorCache, run_fetch_tasks
+from digest.storage.sqlite_store import SQLiteStore
+
+
+def _item(idx: int, source: str) -> Item:
+    return Item(
+        id=f"item{idx}",
+        url=f"https://{source}/post-{idx}",
+        title=f"Distinct headline number {idx} about topic {idx * 7}",
+        source=source,
+        author=None,
+        published_at=datetime.now(),
+        type="article",
+        raw_text="",
+        hash=f"hash{idx}",
+    )
+
+
+class TestRunFetchTasks(unittest.TestCase):
+    def test_outcomes_keep_task_order_regardless_of_completion(self):
+        delays = [0.05, 0.0, 0.02]
+        tasks = [
+            FetchTask(
+                kind="rss",
+                value=str(idx),
+                host=f"host{idx}",
+                run=lambda idx=idx: (time.sleep(delays[idx]), idx)[1],
+            )
+            for idx in range(3)
+        ]
+        done_order: list[str] = []
+
+        outcomes = run_fetch_tasks(
+            tasks,
+            max_workers=3,
+            max_per_host=1,
+            on_done=lambda outcome: done_order.append(outcome.task.value),
+        )
+
+        self.assertEqual([o.result for o in outcomes], [0, 1, 2])
+        self.assertEqual(sorted(done_order), ["0", "1", "2"])
+
+    def test_errors_are_isolated_per_task(self):
+        def boom():
+            raise RuntimeError("feed down")
+
+        tasks = [
+            FetchTask(kind="rss", value="a", host="a.example", run=lambda: ["ok"]),
+            FetchTask(kind="rss", value="b", host="b.example", run=boom),
+        ]
+
+        outcomes = run_fetch_tasks(tasks, max_workers=2, max_per_host=1)
+
+        self.assertEqual(outcomes[0].result, ["ok"])
+        self.assertIsNone(outcomes[0].error)
+        self.assertIsInstance(outcomes[1].error, RuntimeError)
+
+    def test_per_host_limit_caps_concurrency(self):
+        lock = threading.Lock()
+        active = {"now": 0, "peak": 0}
+
+        def work():
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(0.02)
+            with lock:
+                active["now"] -= 1
+            return []
+
+        tasks = [
+            FetchTask(kind="rss", value=str(i), host="same.example", run=work)
+            for i in range(6)
+        ]
+
+        run_fetch_tasks(tasks, max_workers=6, max_per_host=2)
+
+        self.assertLessEqual(active["peak"], 2)
+
+    def test_elapsed_excludes_wait_for_host_slot(self):
+        tasks = [
+            FetchTask(kind="rss", value=str(i), host="same.example", run=lambda: time.sleep(0.1))
+            for i in range(3)
+        ]
+
+        outcomes = run_fetch_tasks(tasks, max_workers=3, max_per_host=1)
+
+        self.assertTrue(all(outcome.elapsed_s < 0.18 for outcome in outcomes))
+
+
+class TestRuntimeFetchStage(unittest.TestCase):
+    def test_concurrent_fetch_matches_sequential_ordering(self):
+        feeds = [f"https://feed{i}.example/rss" for i in range(5)]
+        delays = {feed: 0.03 * (5 - i) for i, feed in enumerate(feeds)}
+
+        def fake_fetch(urls, **_kwargs):
+            feed = urls[0]
+            time.sleep(delays[feed])
+            if feed.startswith("https://feed2."):
+                raise RuntimeError("timed out")
+            idx = feeds.index(feed)
+            return [_item(idx * 10 + n, f"feed{idx}.example") for n in range(2)]
+
+        def run(workers: int):
+            with tempfile.TemporaryDirectory() as tmp:
+                store = SQLiteStore(str(Path(tmp) / "digest.db"))
+                profile = ProfileConfig(
+                    output=OutputSettings(obsidian_vault_path=""),
+                    agent_scoring_enabled=False,
+                    fetch_max_workers=workers,
+                )
+                events: list[dict] = []
+                with (
+                    patch("digest.runtime.fetch_rss_items", side_effect=fake_fetch),
+                    patch("digest.runtime._write_latest_telegram_artifact"),
+                    patch("digest.runtime._archive_root", return_value=Path(tmp)),
+                ):
+                    report = run_digest(
+                        SourceConfig(rss_feeds=feeds),
+                        profile,
+                        store,
+                        use_last_completed_window=False,
+                        only_new=False,
+                        progress_cb=events.append,
+                    )
+                with store._conn() as conn:
+                    linked = [
+                        row[0]
+                        for row in conn.execute(
+                            "SELECT source_value FROM source_item_links ORDER BY item_id"
+                        ).fetchall()
+                    ]
+                fetch_events = [e for e in events if e.get("stage") == "fetch_rss"]
+                return report, linked, fetch_events
+
+        sequential, seq_links, seq_events = run(1)
+        concurrent, con_links, con_events = run(5)
+
+        self.assertEqual(concurrent.source_errors, sequential.source_errors)
+        self.assertEqual(concurrent.source_errors, [f"rss:{feeds[2]}: timed out"])
+        self.assertEqual(concurrent.context["fetched"], sequential.context["fetched"])
+        self.assertEqual(con_links, seq_links)
+        self.assertEqual(len(con_events), len(feeds))
+        self.assertEqual(
+            sorted(e["source"] for e in con_events),
+            sorted(e["source"] for e in seq_events),
+        )
+
+
+class TestSourceCursors(unittest.TestCase):
+    def _dated(self, idx: int, published_at: datetime | None) -> Item:
+        item = _item(idx, "feed.example")
+        item.published_at = published_at
+        return item
+
+    def test_split_keeps_new_undated_and_tied_entries(self):
+        now = datetime(2026, 3, 10, tzinfo=timezone.utc)
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SQLiteStore(str(Path(tmp) / "digest.db"))
+            first = SourceCursorCache(store, ["rss:feed"])
+            first.observe("rss:feed", [self._dated(1, now), self._dated(2, now - timedelta(hours=5))])
+            first.flush()
+
+            cursors = SourceCursorCache(store, ["rss:feed", "rss:other"])
+            items = [
+                self._dated(3, now + timedelta(hours=1)),
+                self._dated(4, now),
+                self._dated(1, now),
+                self._dated(5, None),
+                self._dated(2, now - timedelta(hours=5)),
+            ]
+            fresh, known = cursors.split("rss:feed", items)
+
+            self.assertEqual([i.id for i in fresh], ["item3", "item4", "item5"])
+            self.assertEqual([i.id for i in known], ["item1", "item2"])
+            self.assertEqual(cursors.new_counts, {"rss:feed": 3})
+            self.assertEqual(cursors.cutoff("rss:feed", now - timedelta(days=1)), now)
+            self.assertEqual(cursors.cutoff("rss:other", now - timedelta(days=1)), now - timedelta(days=1))
+
+    def test_fresh_only_run_skips_entries_below_the_mark(self):
+        now = datetime.now(timezone.utc)
+        old = self._dated(1, now - timedelta(hours=3))
+        new = self._dated(2, now - timedelta(minutes=5))
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SQLiteStore(str(Path(tmp) / "digest.db"))
+            profile = ProfileConfig(
+                output=OutputSettings(obsidian_vault_path=""), agent_scoring_enabled=False
+            )
+            sources = SourceConfig(rss_feeds=["https://feed.example/rss"])
+            calls: list[datetime] = []
+
+            def fake_fetch(_urls, *, window_start, **_kwargs):
+                calls.append(window_start)
+                return [item for item in (new, old) if item.published_at >= window_start]
+
+            with (
+                patch("digest.runtime.fetch_rss_items", side_effect=lambda *a, **k: [old]),
+                patch("digest.runtime._write_latest_telegram_artifact"),
+                patch("digest.runtime._archive_root", return_value=Path(tmp)),
+            ):
+                run_digest(sources, profile, store, use_last_completed_window=False, only_new=False)
+            with (
+                patch("digest.runtime.fetch_rss_items", side_effect=fake_fetch),
+                patch("digest.runtime._write_latest_telegram_artifact"),
+                patch("digest.runtime._archive_root", return_value=Path(tmp)),
+            ):
+                report = run_digest(
+                    sources,
+                    profile,
+                    store,
+                    use_last_completed_window=False,
+                    only_new=True,
+                    allow_seen_fallback=False,
+                )
+
+        self.assertEqual(calls, [old.published_at])
+        self.assertEqual(report.context["fetched"]["raw_total"], 1)
+        self.assertEqual(report.context["fetched"]["cursor_new_items"], 1)
+        self.assertEqual(report.context["fetched"]["cursor_skipped_items"], 1)
+
+    def test_source_skipped_by_poll_planner_keeps_items_from_skipped_runs(self):
+        now = datetime.now(timezone.utc)
+        feed = "https://feed.example/rss"
+        key = source_key_for("rss", feed)
+        missed = self._dated(99, now - timedelta(hours=5))
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SQLiteStore(str(Path(tmp) / "digest.db"))
+            # A feed that publishes every two days, last polled ten hours ago:
+            # it is not due again for another two hours.
+            history = [self._dated(day, now - timedelta(days=2 * day)) for day in range(1, 5)]
+            store.upsert_items(history)
+            store.link_source_items(
+                run_id="seed",
+                links=[
+                    {"source_key": key, "source_type": "rss", "source_value": feed, "item_id": item.id}
+                    for item in history
+                ],
+            )
+            store.upsert_source_poll_times({key: now - timedelta(hours=10)})
+            store.start_run("seed", (now - timedelta(hours=11)).isoformat(), (now - timedelta(hours=10)).isoformat())
+            store.finish_run("seed", "success", [], [])
+            sources = SourceConfig(rss_feeds=[feed])
+            windows: list[datetime] = []
+
+            def fake_fetch(_urls, *, window_start, **_kwargs):
+                windows.append(window_start)
+                return [missed] if missed.published_at >= window_start else []
+
+            def run(staleness_hours: int):
+                profile = ProfileConfig(
+                    output=OutputSettings(obsidian_vault_path=""),
+                    agent_scoring_enabled=False,
+                    poll_max_staleness_hours=staleness_hours,
+                )
+                with (
+                    patch("digest.runtime.fetch_rss_items", side_effect=fake_fetch),
+                    patch("digest.runtime._write_latest_telegram_artifact"),
+                    patch("digest.runtime._archive_root", return_value=Path(tmp)),
+                ):
+                    return run_digest(sources, profile, store, only_new=True)
+
+            skipped = [run(24), run(24)]
+            self.assertEqual(windows, [])
+            self.assertTrue(all(key in r.context["fetched"]["poll_skipped_sources"] for r in skipped))
+            self.assertGreater(store.last_completed_window_end(), missed.published_at.isoformat())
+
+            # A short staleness cap makes the feed due; it reads back to its last poll.
+            report = run(1)
+        self.assertEqual(len(windows), 1)
+        self.assertLess(windows[0], missed.published_at)
+        self.assertEqual(report.context["pipeline"]["unique_count"], 1)
+
+    def test_accumulated_run_does_not_record_a_poll(self):
+        feed = "https://feed.example/rss"
+        key = source_key_for("rss", feed)
+        item = self._dated(97, datetime.now(timezone.utc) - timedelta(minutes=5))
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SQLiteStore(str(Path(tmp) / "digest.db"))
+            profile = ProfileConfig(
+                output=OutputSettings(obsidian_vault_path=""), agent_scoring_enabled=False
+            )
+
+            def run(min_items: int):
+                with (
+                    patch("digest.runtime.fetch_rss_items", return_value=[item]),
+                    patch("digest.runtime._write_latest_telegram_artifact"),
+                    patch("digest.runtime._archive_root", return_value=Path(tmp)),
+                ):
+                    return run_digest(
+                        SourceConfig(rss_feeds=[feed]),
+                        profile,
+                        store,
+                        only_new=True,
+                        min_items_for_delivery=min_items,
+                    )
+
+            self.assertEqual(run(5).status, "accumulated")
+            self.assertEqual(store.get_source_poll_times([key]), {})
+            self.assertNotEqual(run(0).status, "accumulated")
+            self.assertIn(key, store.get_source_poll_times([key]))
+
+    def test_source_leaving_quarantine_keeps_items_from_quarantined_runs(self):
+        now = datetime.now(timezone.utc)
+        feed = "https://feed.example/rss"
+        key = source_key_for("rss", feed)
+        missed = self._dated(98, now - timedelta(hours=5))
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SQLiteStore(str(Path(tmp) / "digest.db"))
+            store.upsert_source_poll_times({key: now - timedelta(hours=10)})
+            store.start_run("seed", (now - timedelta(hours=11)).isoformat(), (now - timedelta(hours=10)).isoformat())
+            store.finish_run("seed", "success", [], [])
+            health = SourceHealthTracker(store, [key], now=now - timedelta(minutes=30))
+            for _ in range(SOURCE_QUARANTINE_AFTER_FAILURES):
+                health.record(key, elapsed_s=20, error=RuntimeError("timed out"))
+            health.flush()
+            profile = ProfileConfig(
+                output=OutputSettings(obsidian_vault_path=""), agent_scoring_enabled=False
+            )
+            windows: list[datetime] = []
+
+            def fake_fetch(_urls, *, window_start, **_kwargs):
+                windows.append(window_start)
+                return [missed] if missed.published_at >= window_start else []
+
+            def run():
+                with (
+                    patch("digest.runtime.fetch_rss_items", side_effect=fake_fetch),
+                    patch("digest.runtime._write_latest_telegram_artifact"),
+                    patch("digest.runtime._archive_root", return_value=Path(tmp)),
+                ):
+                    return run_digest(SourceConfig(rss_feeds=[feed]), profile, store, only_new=True)
+
+            run()
+            self.assertEqual(windows, [])
+            # The quarantine lapses; the re-probe reads back to the last good poll.
+            with store._conn() as conn:
+                conn.execute(
+                    "UPDATE source_health SET quarantined_until = ?",
+                    ((now - timedelta(minutes=1)).isoformat(),),
+                )
+            report = run()
+        self.assertEqual(len(windows), 1)
+        self.assertLess(windows[0], missed.published_at)
+        self.assertEqual(report.context["pipeline"]["unique_count"], 1)
+
+
+class TestPrefetchPool(unittest.TestCase):
+    def test_delivery_run_scores_items_pooled_by_prefetch_shards(self):
+        pooled = _item(1, "feed.example")
+        pooled.published_at = datetime.now(timezone.utc) - timedelta(minutes=5)
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SQLiteStore(str(Path(tmp) / "digest.db"))
+            profile = ProfileConfig(
+                output=OutputSettings(obsidian_vault_path=""), agent_scoring_enabled=False
+            )
+            with patch("digest.runtime.fetch_rss_items", return_value=[pooled]) as fetch:
+                prefetch = run_digest(
+                    SourceConfig(rss_feeds=["https://feed.example/rss"]),
+                    profile,
+                    store,
+                    use_last_completed_window=False,
+                    prefetch_only=True,
+                )
+            self.assertEqual(fetch.call_count, 1)
+            self.assertEqual(prefetch.status, "prefetched")
+            self.assertIsNone(store.last_completed_window_end())
+            self.assertEqual(len(store.list_source_pool()), 1)
+
+            with (
+                patch("digest.runtime.fetch_rss_items") as fetch,
+                patch("digest.runtime._write_latest_telegram_artifact"),
+                patch("digest.runtime._archive_root", return_value=Path(tmp)),
+            ):
+                report = run_digest(
+                    SourceConfig(),
+                    profile,
+                    store,
+                    use_last_completed_window=False,
+                    include_pool=True,
+                )
+            fetch.assert_not_called()
+            self.assertEqual(report.context["fetched"]["pooled_items"], 1)
+            self.assertEqual(report.context["pipeline"]["unique_count"], 1)
+            self.assertEqual(store.list_source_pool(), [])
+
+    def test_prefetch_reports_sources_that_failed(self):
+        ok_feed, bad_feed = "https://feed.example/rss", "https://down.example/rss"
+
+        def fake_fetch(urls, **_kwargs):
+            if urls == [bad_feed]:
+                raise TimeoutError("timed out")
+            return [_item(3, "feed.example")]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SQLiteStore(str(Path(tmp) / "digest.db"))
+            profile = ProfileConfig(
+                output=OutputSettings(obsidian_vault_path=""), agent_scoring_enabled=False
+            )
+            with (
+                patch("digest.runtime.fetch_rss_items", side_effect=fake_fetch),
+                patch(
+                    "digest.runtime.fetch_x_selector_items_linked",
+                    return_value=([], ["x_author:alice: 503 Service Unavailable"]),
+                ),
+            ):
+                report = run_digest(
+                    SourceConfig(rss_feeds=[ok_feed, bad_feed], x_authors=["alice", "bob"]),
+                    profile,
+                    store,
+                    use_last_completed_window=False,
+                    prefetch_only=True,
+                )
+        self.assertEqual(
+            report.context["fetched"]["failed_source_keys"],
+            sorted([source_key_for("rss", bad_feed), source_key_for("x_author", "alice")]),
+        )
+
+    def test_pooled_catch_up_items_keep_their_source_window(self):
+        now = datetime.now(timezone.utc)
+        feed = "https://feed.example/rss"
+        key = source_key_for("rss", feed)
+        missed = _item(2, "feed.example")
+        missed.published_at = now - timedelta(hours=5)
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SQLiteStore(str(Path(tmp) / "digest.db"))
+            # The feed was last polled ten hours ago; a run has completed since.
+            store.upsert_source_poll_times({key: now - timedelta(hours=10)})
+            store.start_run("seed", (now - timedelta(hours=2)).isoformat(), (now - timedelta(hours=1)).isoformat())
+            store.finish_run("seed", "success", [], [])
+            profile = ProfileConfig(
+                output=OutputSettings(obsidian_vault_path=""),
+                agent_scoring_enabled=False,
+                poll_max_staleness_hours=1,
+            )
+            with patch("digest.runtime.fetch_rss_items", return_value=[missed]):
+                run_digest(SourceConfig(rss_feeds=[feed]), profile, store, only_new=True, prefetch_only=True)
+            self.assertEqual(
+                [link["window_start"] for link in store.list_source_pool()],
+                [(now - timedelta(hours=10)).isoformat()],
+            )
+
+            with (
+                patch("digest.runtime._write_latest_telegram_artifact"),
+                patch("digest.runtime._archive_root", return_value=Path(tmp)),
+            ):
+                report = run_digest(SourceConfig(), profile, store, only_new=True, include_pool=True)
+        self.assertEqual(report.context["fetched"]["pooled_items"], 1)
+        self.assertEqual(report.context["pipeline"]["unique_count"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,209 @@
+import io
+import json
+import tempfile
+import time
+import unittest
+import urllib.error
+from datetime import datetime, timedelta, timezone
+from http.client import HTTPMessage
+from pathlib import Path
+from unittest.mock import patch
+
+from digest.connectors.github import fetch_github_items_linked
+from digest.connectors.github_client import GitHubClient, GitHubRateLimited
+from digest.net.engine import HttpResponse
+from digest.storage.sqlite_store import SQLiteStore
+
+
+def _headers(**values: str) -> HTTPMessage:
+    message = HTTPMessage()
+    for name, value in values.items():
+        message[name.replace("_", "-")] = value
+    return message
+
+
+def _ok(body: bytes, **headers: str) -> HttpResponse:
+    return HttpResponse(url="https://api.github.com/x", status=200, headers=_headers(**headers), body=body)
+
+
+def _error(code: int, **headers: str) -> urllib.error.HTTPError:
+    return urllib.error.HTTPError(
+        "https://api.github.com/x", code, "error", _headers(**headers), io.BytesIO(b"")
+    )
+
+
+class TestGitHubClient(unittest.TestCase):
+    def setUp(self):
+        self.slept: list[float] = []
+        self.now = time.time()
+
+    def _client(self, **kwargs) -> GitHubClient:
+        return GitHubClient("token", sleep=self.slept.append, clock=lambda: self.now, **kwargs)
+
+    def test_etag_revalidation_replays_stored_body(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SQLiteStore(str(Path(tmp) / "digest.db"))
+            client = self._client(store=store)
+            sent = []
+
+            def fake_send(request, **_kwargs):
+                sent.append(request.headers.get("If-None-Match"))
+                if len(sent) == 1:
+                    return _ok(b'[{"id": 1}]', ETag='"v1"')
+                raise _error(304, X_RateLimit_Remaining="4999")
+
+            with patch("digest.connectors.github_client.send", side_effect=fake_send):
+                first = client.get_json("/repos/a/b/releases", 5)
+                second = client.get_json("/repos/a/b/releases", 5)
+
+        self.assertEqual(first, second)
+        self.assertEqual(sent, [None, '"v1"'])
+        self.assertEqual(client.usage()["core"]["not_modified"], 1)
+        self.assertEqual(client.usage()["core"]["remaining"], 4999)
+
+    def test_exhausted_quota_waits_for_a_near_reset_and_defers_a_far_one(self):
+        client = self._client()
+        near = _ok(b"{}", X_RateLimit_Remaining="1", X_RateLimit_Reset=str(int(self.now + 20)))
+        with patch("digest.connectors.github_client.send", return_value=near):
+            client.get_json("/repos/a/b", 5)
+            client.get_json("/repos/a/b", 5)
+        self.assertEqual(len(self.slept), 1)
+        self.assertAlmostEqual(self.slept[0], 20, delta=1)
+
+        far = _ok(b"{}", X_RateLimit_Remaining="0", X_RateLimit_Reset=str(int(self.now + 3600)))
+        with patch("digest.connectors.github_client.send", return_value=far) as send_mock:
+            client.get_json("/search/issues?q=x", 5)
+            with self.assertRaises(GitHubRateLimited):
+                client.get_json("/search/issues?q=y", 5)
+        self.assertEqual(send_mock.call_count, 1)
+
+    def test_secondary_limit_honours_retry_after(self):
+        client = self._client()
+        responses = [_error(429, Retry_After="3"), _ok(b'{"ok": true}')]
+
+        def fake_send(_request, **_kwargs):
+            result = responses.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        with patch("digest.connectors.github_client.send", side_effect=fake_send):
+            self.assertEqual(client.get_json("/repos/a/b", 5), {"ok": True})
+        self.assertEqual(self.slept, [3.0])
+
+        with patch("digest.connectors.github_client.send", side_effect=_error(403, Retry_After="600")):
+            with self.assertRaises(GitHubRateLimited):
+                client.get_json("/repos/a/b", 5)
+
+    def test_remaining_quota_paces_requests(self):
+        client = self._client()
+        # 60 requests left for the next hour: after the burst, ~1 per minute.
+        paced = _ok(b"{}", X_RateLimit_Remaining="110", X_RateLimit_Reset=str(int(self.now + 3600)))
+        with patch("digest.connectors.github_client.send", return_value=paced):
+            for _ in range(12):
+                client.get_json("/repos/a/b", 5)
+        self.assertTrue(self.slept)
+        self.assertAlmostEqual(max(self.slept), 60, delta=1)
+
+    def test_rate_limited_selector_is_deferred_not_fatal(self):
+        fresh = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+        def fake_request(path, _client, _timeout):
+            if path.startswith("/search/"):
+                raise GitHubRateLimited("search", time.time() + 600)
+            return [{"html_url": "https://github.com/a/b/releases/v1", "name": "v1", "published_at": fresh}]
+
+        client = GitHubClient("")
+        with patch("digest.connectors.github._request_json", side_effect=fake_request):
+            links = fetch_github_items_linked(["a/b"], ["llm"], [], client=client)
+
+        self.assertEqual({source_type for source_type, _value, _item in links}, {"github_repo"})
+        self.assertEqual(len(client.errors), 1)
+        self.assertTrue(client.errors[0].startswith("github_topic:llm: GitHub search rate limit"))
+
+
+class TestGitHubIncrementalFetch(unittest.TestCase):
+    def setUp(self):
+        now = datetime.now(timezone.utc).replace(microsecond=0)
+        self.mark = now - timedelta(hours=2)
+        self.stamps = [(now - timedelta(minutes=m)).isoformat().replace("+00:00", "Z") for m in (1, 30)]
+        self.paths: list[str] = []
+        self.endless = False
+
+    def _fake_send(self, request, **_kwargs):
+        path = request.url.removeprefix("https://api.github.com")
+        self.paths.append(path)
+        if "/releases" in path:
+            return _ok(b"[]")
+        page = 2 if "page=2" in path else 1
+        issue = {
+            "html_url": f"https://github.com/a/b/issues/{page}",
+            "title": f"Issue {page}",
+            "updated_at": self.stamps[page - 1],
+        }
+        body = json.dumps([issue]).encode()
+        link = f'<https://api.github.com/repositories/1/issues?page={page + 1}>; rel="next"'
+        return _ok(body, Link=link) if page == 1 or self.endless else _ok(body)
+
+    def _fetch(self, client, **options):
+        with patch("digest.connectors.github_client.send", side_effect=self._fake_send):
+            return fetch_github_items_linked(["a/b"], [], [], client=client, org_options=options)
+
+    def test_issues_resume_from_cursor_and_follow_link_pages(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SQLiteStore(str(Path(tmp) / "digest.db"))
+            store.upsert_github_cursors({"issues:a/b": self.mark})
+            client = GitHubClient("", store=store, incremental=True)
+            links = self._fetch(client)
+            client.flush_cursors()
+            cursor = store.get_github_cursor("issues:a/b")
+
+        issue_paths = [p for p in self.paths if "issues" in p]
+        self.assertIn("since=" + self.mark.strftime("%Y-%m-%dT%H:%M:%SZ"), issue_paths[0])
+        self.assertEqual(len(issue_paths), 2)
+        self.assertEqual([item.title for _t, _v, item in links], ["Issue 1", "Issue 2"])
+        self.assertEqual(cursor, datetime.fromisoformat(self.stamps[0].replace("Z", "+00:00")))
+        self.assertEqual(client.truncated, [])
+
+    def test_consecutive_runs_revalidate_the_same_etag_row(self):
+        revalidated: list[str | None] = []
+
+        def fake_send(request, **_kwargs):
+            path = request.url.removeprefix("https://api.github.com")
+            if "/releases" in path:
+                return _ok(b"[]")
+            revalidated.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"issues-v1"':
+                raise _error(304)
+            issue = {"html_url": "https://github.com/a/b/issues/1", "title": "Issue", "updated_at": self.stamps[0]}
+            return _ok(json.dumps([issue]).encode(), ETag='"issues-v1"')
+
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SQLiteStore(str(Path(tmp) / "digest.db"))
+            store.upsert_github_cursors({"issues:a/b": self.mark})
+            for _run in range(2):
+                client = GitHubClient("", store=store, incremental=True)
+                with patch("digest.connectors.github_client.send", side_effect=fake_send):
+                    fetch_github_items_linked(["a/b"], [], [], client=client, org_options={})
+                client.flush_cursors()
+            with store._conn() as conn:
+                paths = [row[0] for row in conn.execute("SELECT path FROM github_etags WHERE path LIKE '%issues%'")]
+            pruned = store.prune_github_etags(before=(datetime.now(timezone.utc) - timedelta(days=1)).isoformat())
+
+        self.assertEqual(revalidated, [None, '"issues-v1"'])
+        self.assertEqual(len(paths), 1)
+        self.assertNotIn("since=", paths[0])
+        self.assertEqual(pruned, 0)
+
+    def test_page_budget_is_reported_as_truncation(self):
+        self.endless = True
+        client = GitHubClient("")
+        links = self._fetch(client, max_pages=2)
+
+        self.assertEqual(len([p for p in self.paths if "issues" in p]), 2)
+        self.assertEqual(len(links), 2)
+        self.assertEqual(client.truncated, ["issues:a/b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,18 @@
+import tempfile
+import threading
 import unittest
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from unittest.mock import patch
 
-from digest.connectors.github import fetch_github_items, normalize_github_org
+from digest.connectors.github import (
+    fetch_github_items,
+    fetch_github_items_linked,
+    normalize_github_org,
+)
+from digest.connectors.github_client import GitHubClient
+from digest.constants import GITHUB_ORG_RELEASE_WORKERS
+from digest.storage.sqlite_store import SQLiteStore
 
 
 class TestGitHubConnector(unittest.TestCase):
@@ -296,3 +306,224 @@ class TestGitHubSearchQueryQualifier(unittest.TestCase):
         self.assertEqual(len(search_paths), 1)
         self.assertIn("is%3Apull-request", search_paths[0])
         self.assertNotIn("is%3Aissue&", search_paths[0])
+
+
+class TestGitHubOrgScanning(unittest.TestCase):
+    def setUp(self):
+        self.fresh = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        self.head_updated = self.fresh
+        self.paths: list[str] = []
+        self.lock = threading.Lock()
+
+    def _fake_request(self, path, _client, _timeout):
+        with self.lock:
+            self.paths.append(path)
+        if path.startswith("/orgs/acme/repos"):
+            repos = [
+                {
+                    "html_url": f"https://github.com/acme/r{n}",
+                    "full_name": f"acme/r{n}",
+                    "updated_at": self.head_updated if n == 0 else self.fresh,
+                    "stargazers_count": 10,
+                    "owner": {"login": "acme"},
+                }
+                for n in range(10)
+            ]
+            return repos[:1] if path.endswith("per_page=1") else repos
+        repo = "/".join(path.split("/")[2:4])
+        return [
+            {
+                "html_url": f"https://github.com/{repo}/releases/tag/v{n}",
+                "name": f"v{n}",
+                "published_at": self.fresh,
+            }
+            for n in range(3)
+        ]
+
+    def _fetch(self, client, max_items=40):
+        with patch("digest.connectors.github._request_json", side_effect=self._fake_request):
+            return fetch_github_items_linked(
+                [],
+                [],
+                [],
+                orgs=["acme"],
+                client=client,
+                org_options={"max_repos_per_org": 10, "max_items_per_org": max_items},
+            )
+
+    def test_inventory_is_reused_until_the_update_ordering_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            client = GitHubClient("", store=SQLiteStore(str(Path(tmp) / "digest.db")))
+            first = self._fetch(client)
+            self.paths.clear()
+            second = self._fetch(client)
+            reused_listing = [p for p in self.paths if p.startswith("/orgs/")]
+
+            self.head_updated = (datetime.now(timezone.utc) + timedelta(seconds=5)).isoformat()
+            self.paths.clear()
+            self._fetch(client)
+            changed_listing = [p for p in self.paths if p.startswith("/orgs/")]
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(first), 10 * 4)
+        self.assertEqual(reused_listing, ["/orgs/acme/repos?sort=updated&direction=desc&per_page=1"])
+        self.assertEqual(len(changed_listing), 2)
+        self.assertTrue(changed_listing[1].endswith("per_page=20"))
+
+    def test_release_lookups_stop_once_max_items_is_reached(self):
+        links = self._fetch(GitHubClient(""), max_items=6)
+
+        release_paths = [p for p in self.paths if "/releases" in p]
+        self.assertEqual(len(links), 6)
+        self.assertEqual(
+            [item.url for _t, _v, item in links[:5]],
+            [
+                "https://github.com/acme/r0",
+                "https://github.com/acme/r0/releases/tag/v0",
+                "https://github.com/acme/r0/releases/tag/v1",
+                "https://github.com/acme/r0/releases/tag/v2",
+                "https://github.com/acme/r1",
+            ],
+        )
+        # Two repos consumed, plus at most one window of lookups in flight.
+        self.assertLessEqual(len(release_paths), 2 + GITHUB_ORG_RELEASE_WORKERS)
+        self.assertLess(len(release_paths), 10)
+
+
+class TestGitHubGraphQLBatching(unittest.TestCase):
+    def setUp(self):
+        now = datetime.now(timezone.utc)
+        self.stamps = [
+            (now - timedelta(hours=h)).isoformat().replace("+00:00", "Z") for h in range(8)
+        ]
+
+    def _releases(self, repo):
+        return [
+            {
+                "html_url": f"https://github.com/{repo}/releases/tag/v{n}",
+                "name": f"v{n}",
+                "tag_name": f"v{n}",
+                "body": "notes",
+                "published_at": self.stamps[n],
+            }
+            for n in range(2)
+        ]
+
+    def _issues(self, repo):
+        # REST lists issues and PRs together, most recently updated first.
+        issues = []
+        for n in range(7):
+            issue = {
+                "html_url": f"https://github.com/{repo}/issues/{n}",
+                "title": f"Issue {n}",
+                "body": "body",
+                "labels": [{"name": "bug"}],
+                "comments": n,
+                "created_at": self.stamps[n],
+                "updated_at": self.stamps[n],
+                "user": {"login": "alice"},
+            }
+            if n % 2:
+                issue["pull_request"] = {"url": issue["html_url"]}
+            issues.append(issue)
+        return issues
+
+    def _org_repo(self, name):
+        return {
+            "html_url": f"https://github.com/acme/{name}",
+            "full_name": f"acme/{name}",
+            "description": name,
+            "updated_at": self.stamps[0],
+            "stargazers_count": 50,
+            "owner": {"login": "acme"},
+        }
+
+    def _fake_rest(self, path, token, timeout):
+        if path.startswith("/orgs/acme/repos"):
+            return [self._org_repo("one"), self._org_repo("two")]
+        repo = "/".join(path.split("/")[2:4])
+        if "/releases" in path:
+            return self._releases(repo)
+        if "/issues" in path:
+            return self._issues(repo)
+        return {}
+
+    def _fake_graphql(self, query, variables, token, timeout):
+        self.graphql_calls += 1
+        data = {}
+        index = 0
+        while f"owner{index}" in variables:
+            repo = f"{variables[f'owner{index}']}/{variables[f'name{index}']}"
+            node = {
+                "releases": {
+                    "nodes": [
+                        {
+                            "url": rel["html_url"],
+                            "name": rel["name"],
+                            "tagName": rel["tag_name"],
+                            "description": rel["body"],
+                            "publishedAt": rel["published_at"],
+                        }
+                        for rel in self._releases(repo)
+                    ]
+                }
+            }
+            if "pullRequests" in query:
+                for key, is_pr in (("issues", False), ("pullRequests", True)):
+                    node[key] = {
+                        "nodes": [
+                            {
+                                "url": issue["html_url"],
+                                "title": issue["title"],
+                                "body": issue["body"],
+                                "createdAt": issue["created_at"],
+                                "updatedAt": issue["updated_at"],
+                                "comments": {"totalCount": issue["comments"]},
+                                "labels": {"nodes": issue["labels"]},
+                                "author": {"login": issue["user"]["login"]},
+                            }
+                            for issue in self._issues(repo)
+                            if bool(issue.get("pull_request")) == is_pr
+                        ][: variables["perPage"]]
+                    }
+            data[f"r{index}"] = node
+            index += 1
+        return data
+
+    def _fetch(self, token):
+        return fetch_github_items_linked(
+            ["openai/cookbook", "acme/tools"],
+            [],
+            [],
+            orgs=["acme"],
+            token=token,
+            org_options={"max_repos_per_org": 5, "max_items_per_org": 5},
+        )
+
+    def test_graphql_batches_match_rest_links(self):
+        self.graphql_calls = 0
+        with patch("digest.connectors.github._request_json", side_effect=self._fake_rest):
+            rest = self._fetch("")
+
+        rest_paths: list[str] = []
+
+        def org_listing_only(path, token, timeout):
+            rest_paths.append(path)
+            return self._fake_rest(path, token, timeout)
+
+        with (
+            patch("digest.connectors.github._request_json", side_effect=org_listing_only),
+            patch("digest.connectors.github._request_graphql", side_effect=self._fake_graphql),
+        ):
+            batched = self._fetch("token")
+
+        self.assertEqual(batched, rest)
+        self.assertEqual(len(batched), 2 * (2 + 7) + 5)
+        self.assertEqual(self.graphql_calls, 2)
+        self.assertEqual(len(rest_paths), 1)
+        self.assertTrue(rest_paths[0].startswith("/orgs/acme/repos"))
+
+    def test_missing_repository_raises(self):
+        with patch("digest.connectors.github._request_graphql", return_value={"r0": None}):
+            with self.assertRaises(RuntimeError):
+                fetch_github_items_linked(["ghost/repo"], [], [], token="token")
@@ -0,0 +1,463 @@
+import gzip
+import os
+import tempfile
+import threading
+import time
+import unittest
+import urllib.error
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import patch
+
+from digest.net.engine import (
+    CachedStream,
+    FetchEngine,
+    HttpRequest,
+    RetryPolicy,
+    open_stream,
+    send,
+    send_many,
+)
+from digest.connectors.link_preview import fetch_link_preview_metadata
+from digest.net.html_head import sniff_html_head
+from digest.ops.ingest_detect import detect_ingest
+from digest.net.http_cache import HttpCache, configure_http_cache
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    hits: dict[str, int] = {}
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def log_message(self, *_args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        with self.lock:
+            self.hits[self.path] = self.hits.get(self.path, 0) + 1
+            hits = self.hits[self.path]
+        if self.path == "/flaky" and hits == 1:
+            self._reply(503, b"busy")
+        elif self.path == "/gzip":
+            encoded = "gzip" in (self.headers.get("Accept-Encoding") or "")
+            body = b"compressed " * 100
+            headers = {"Content-Encoding": "gzip"} if encoded else {}
+            self._reply(200, gzip.compress(body) if encoded else body, headers)
+        elif self.path == "/close":
+            self._reply(200, b"bye", {"Connection": "close"})
+            self.close_connection = True
+        elif self.path == "/big":
+            self._reply(200, b"x" * 200_000)
+        elif self.path == "/drop":
+            # Keep-alive response, but the server hangs up right after it.
+            self._reply(200, b"dropped")
+            self.close_connection = True
+        elif self.path == "/missing":
+            self._reply(404, b"nope")
+        elif self.path == "/redirect":
+            self.send_response(302)
+            self.send_header("Location", "/plain")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        elif self.path in {"/redirect-away", "/redirect-home"}:
+            host = "localhost" if self.path == "/redirect-away" else "127.0.0.1"
+            self.send_response(302)
+            self.send_header("Location", f"http://{host}:{self.server.server_address[1]}/echo-headers")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        elif self.path == "/echo-headers":
+            names = ("Authorization", "Cookie", "X-Client")
+            self._reply(200, "|".join(self.headers.get(n) or "-" for n in names).encode())
+        elif self.path == "/chunked":
+            self.send_response(200)
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for part in (b"hello ", b"world"):
+                self.wfile.write(f"{len(part):x}\r\n".encode() + part + b"\r\n")
+            self.wfile.write(b"0\r\n\r\n")
+        elif self.path == "/page":
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            head = (
+                b"<html><head><title> Page\n Title </title>"
+                b'<meta property="og:description" content="About it">'
+                b'<link href="/feed.xml" type="application/rss+xml" rel="alternate">'
+                b"</head>"
+            )
+            try:
+                for part in (head, *[b"<p>" + b"x" * 8000 + b"</p>"] * 40):
+                    self.wfile.write(f"{len(part):x}\r\n".encode() + part + b"\r\n")
+                    self.wfile.flush()
+                self.wfile.write(b"0\r\n\r\n")
+            except OSError:
+                self.close_connection = True
+        elif self.path == "/image":
+            self._reply(200, b"\x89PNG" + b"\x00" * 5000, {"Content-Type": "image/png"})
+        elif self.path.startswith("/slow"):
+            with self.lock:
+                type(self).active += 1
+                type(self).peak = max(type(self).peak, type(self).active)
+            time.sleep(0.2)
+            with self.lock:
+                type(self).active -= 1
+            self._reply(200, b"slow")
+        else:
+            self._reply(200, b"plain body", {"ETag": '"abc"'})
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self._reply(200, b"echo:" + body)
+
+    def _reply(self, status: int, body: bytes, headers: dict[str, str] | None = None) -> None:
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class _ProxyHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    seen: list[tuple[str, str, str]] = []
+
+    def log_message(self, *_args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        self.seen.append(("GET", self.path, self.headers.get("Proxy-Authorization") or ""))
+        body = b"via proxy"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_CONNECT(self) -> None:
+        self.seen.append(("CONNECT", self.path, self.headers.get("Proxy-Authorization") or ""))
+        self.send_response(403)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+        self.close_connection = True
+
+
+class TestFetchEngine(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        _Handler.hits = {}
+        _Handler.peak = 0
+        self.engine = FetchEngine(max_concurrency=8, max_per_host=2)
+
+    def tearDown(self):
+        self.engine.close()
+
+    def test_get_returns_body_headers_and_final_url(self):
+        response = self.engine.request(HttpRequest(url=f"{self.base}/redirect", timeout=5))
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.body, b"plain body")
+        self.assertEqual(response.headers.get("ETag"), '"abc"')
+        self.assertTrue(response.url.endswith("/plain"))
+
+    def test_cross_origin_redirect_drops_credentials(self):
+        headers = {"Authorization": "token secret", "Cookie": "sid=1", "X-Client": "digest"}
+        same = self.engine.request(
+            HttpRequest(url=f"{self.base}/redirect-home", headers=headers, timeout=5)
+        )
+        away = self.engine.request(
+            HttpRequest(url=f"{self.base}/redirect-away", headers=headers, timeout=5)
+        )
+
+        self.assertEqual(same.body, b"token secret|sid=1|digest")
+        self.assertEqual(away.body, b"-|-|digest")
+
+    def test_chunked_body_and_max_bytes(self):
+        full = self.engine.request(HttpRequest(url=f"{self.base}/chunked", timeout=5))
+        capped = self.engine.request(HttpRequest(url=f"{self.base}/plain", timeout=5, max_bytes=5))
+        self.assertEqual(full.body, b"hello world")
+        self.assertEqual(capped.body, b"plain")
+
+    def test_post_sends_body(self):
+        response = self.engine.request(
+            HttpRequest(url=f"{self.base}/echo", method="POST", data=b"a=1", timeout=5)
+        )
+        self.assertEqual(response.body, b"echo:a=1")
+
+    def test_transient_status_is_retried(self):
+        response = self.engine.request(
+            HttpRequest(url=f"{self.base}/flaky", timeout=5),
+            retry=RetryPolicy(retries=1, backoff_seconds=0),
+        )
+        self.assertEqual(response.body, b"plain body")
+        self.assertEqual(_Handler.hits["/flaky"], 2)
+
+    def test_client_errors_raise_http_error_without_retry(self):
+        with self.assertRaises(urllib.error.HTTPError) as ctx:
+            self.engine.request(
+                HttpRequest(url=f"{self.base}/missing", timeout=5),
+                retry=RetryPolicy(retries=3, backoff_seconds=0),
+            )
+        self.assertEqual(ctx.exception.code, 404)
+        self.assertEqual(ctx.exception.read(), b"nope")
+        self.assertEqual(_Handler.hits["/missing"], 1)
+
+    def test_request_many_keeps_order_and_caps_per_host(self):
+        urls = [f"{self.base}/slow/{i}" for i in range(6)] + [f"{self.base}/missing"]
+        results = self.engine.request_many([HttpRequest(url=u, timeout=5) for u in urls])
+
+        self.assertEqual([r.body for r in results[:6]], [b"slow"] * 6)
+        self.assertIsInstance(results[6], urllib.error.HTTPError)
+        self.assertLessEqual(_Handler.peak, 2)
+        self.assertGreaterEqual(_Handler.peak, 2)
+
+    def test_keep_alive_reuses_one_connection_per_host(self):
+        for _ in range(5):
+            self.engine.request(HttpRequest(url=f"{self.base}/plain", timeout=5))
+        self.engine.request(
+            HttpRequest(url=f"{self.base}/echo", method="POST", data=b"x", timeout=5)
+        )
+
+        self.assertEqual(self.engine.pool.opened, 1)
+        self.assertEqual(self.engine.pool.reused, 5)
+
+    def test_connection_close_and_truncated_bodies_are_not_pooled(self):
+        self.engine.request(HttpRequest(url=f"{self.base}/close", timeout=5))
+        self.engine.request(HttpRequest(url=f"{self.base}/big", timeout=5, max_bytes=3))
+        self.engine.request(HttpRequest(url=f"{self.base}/plain", timeout=5))
+
+        self.assertEqual(self.engine.pool.opened, 3)
+        self.assertEqual(self.engine.pool.idle_count(), 1)
+
+    def test_stale_pooled_connection_is_replaced(self):
+        self.engine.request(HttpRequest(url=f"{self.base}/drop", timeout=5))
+        response = self.engine.request(HttpRequest(url=f"{self.base}/plain", timeout=5))
+
+        self.assertEqual(response.body, b"plain body")
+        self.assertEqual(self.engine.pool.opened, 2)
+
+    def test_idle_connections_are_evicted(self):
+        engine = FetchEngine(idle_timeout=0)
+        try:
+            engine.request(HttpRequest(url=f"{self.base}/plain", timeout=5))
+            engine.request(HttpRequest(url=f"{self.base}/plain", timeout=5))
+            self.assertEqual(engine.pool.opened, 2)
+            self.assertEqual(engine.pool.reused, 0)
+        finally:
+            engine.close()
+
+    def test_gzip_body_is_decoded(self):
+        response = self.engine.request(HttpRequest(url=f"{self.base}/gzip", timeout=5))
+        self.assertEqual(response.body, b"compressed " * 100)
+
+    def test_stream_yields_chunks_and_early_close_drops_connection(self):
+        with self.engine.stream(HttpRequest(url=f"{self.base}/big", timeout=5)) as stream:
+            first = next(stream.iter_chunks())
+        self.assertEqual(stream.status, 200)
+        self.assertTrue(first and set(first) == {ord("x")})
+        self.assertLess(stream.bytes_read, 200_000)
+        self.assertEqual(self.engine.pool.idle_count(), 0)
+
+        with self.engine.stream(HttpRequest(url=f"{self.base}/chunked", timeout=5)) as stream:
+            body = b"".join(stream.iter_chunks())
+        self.assertEqual(body, b"hello world")
+        self.assertEqual(self.engine.pool.idle_count(), 1)
+
+    def test_stream_raises_http_error_before_body(self):
+        with self.assertRaises(urllib.error.HTTPError) as ctx:
+            self.engine.stream(HttpRequest(url=f"{self.base}/missing", timeout=5))
+        self.assertEqual(ctx.exception.code, 404)
+
+    def test_timeout_raises_timeout_error(self):
+        with self.assertRaises(TimeoutError):
+            self.engine.request(HttpRequest(url=f"{self.base}/slow/t", timeout=0.05))
+
+    def test_unreachable_host_raises_url_error(self):
+        with self.assertRaises(urllib.error.URLError):
+            self.engine.request(HttpRequest(url="http://127.0.0.1:1/", timeout=2))
+
+
+class TestProxySupport(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _ProxyHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.proxy = f"127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        _ProxyHandler.seen = []
+        self.engine = FetchEngine()
+
+    def tearDown(self):
+        self.engine.close()
+
+    def test_http_requests_go_through_the_configured_proxy(self):
+        env = {"http_proxy": f"http://user:p%40ss@{self.proxy}", "no_proxy": ""}
+        with patch.dict(os.environ, env):
+            response = self.engine.request(HttpRequest(url="http://feeds.example/rss?x=1", timeout=5))
+
+        self.assertEqual(response.body, b"via proxy")
+        self.assertEqual(
+            _ProxyHandler.seen, [("GET", "http://feeds.example/rss?x=1", "Basic dXNlcjpwQHNz")]
+        )
+
+    def test_https_requests_open_a_connect_tunnel(self):
+        with patch.dict(os.environ, {"https_proxy": self.proxy, "no_proxy": ""}):
+            with self.assertRaises(urllib.error.URLError):
+                self.engine.request(HttpRequest(url="https://api.example/v1", timeout=5))
+
+        self.assertEqual(_ProxyHandler.seen, [("CONNECT", "api.example:443", "")])
+
+    def test_no_proxy_hosts_are_fetched_directly(self):
+        with patch.dict(os.environ, {"http_proxy": self.proxy, "no_proxy": "feeds.example"}):
+            with self.assertRaises(urllib.error.URLError):
+                self.engine.request(HttpRequest(url="http://feeds.example:1/rss", timeout=2))
+
+        self.assertEqual(_ProxyHandler.seen, [])
+
+
+class TestHttpCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        _Handler.hits = {}
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = configure_http_cache(root=self.tmp.name)
+
+    def tearDown(self):
+        configure_http_cache(enabled=False)
+        self.tmp.cleanup()
+
+    def test_fresh_entries_answer_without_network(self):
+        cached = HttpRequest(url=f"{self.base}/plain", timeout=5, cache_ttl=60)
+        first = send(cached)
+        second = send(HttpRequest(url=cached.url, timeout=5, cache_ttl=60, headers={"If-None-Match": "x"}))
+        batch = send_many([cached, HttpRequest(url=f"{self.base}/gzip", timeout=5, cache_ttl=60)])
+        send(HttpRequest(url=f"{self.base}/gzip", timeout=5))
+
+        self.assertFalse(first.from_cache)
+        self.assertTrue(second.from_cache and batch[0].from_cache)
+        self.assertEqual(second.body, b"plain body")
+        self.assertEqual(second.headers.get("ETag"), '"abc"')
+        self.assertEqual(_Handler.hits, {"/plain": 1, "/gzip": 2})
+
+    def test_stale_and_uncached_requests_go_to_the_network(self):
+        send(HttpRequest(url=f"{self.base}/plain", timeout=5, cache_ttl=60))
+        send(HttpRequest(url=f"{self.base}/plain", timeout=5, cache_ttl=60, headers={"Accept": "x"}))
+        time.sleep(0.02)
+        stale = send(HttpRequest(url=f"{self.base}/plain", timeout=5, cache_ttl=0.01))
+        self.assertFalse(stale.from_cache)
+        self.assertEqual(_Handler.hits["/plain"], 3)
+
+    def test_streams_are_cached_only_when_read_to_the_end(self):
+        request = HttpRequest(url=f"{self.base}/chunked", timeout=5, cache_ttl=60)
+        with open_stream(request) as stream:
+            self.assertEqual(b"".join(stream.iter_chunks()), b"hello world")
+        with open_stream(request) as stream:
+            self.assertIsInstance(stream, CachedStream)
+            self.assertEqual(b"".join(stream.iter_chunks()), b"hello world")
+
+        partial = HttpRequest(url=f"{self.base}/big", timeout=5, cache_ttl=60)
+        with open_stream(partial) as stream:
+            next(stream.iter_chunks())
+        with open_stream(partial) as stream:
+            self.assertNotIsInstance(stream, CachedStream)
+        self.assertEqual(_Handler.hits, {"/chunked": 1, "/big": 2})
+
+    def test_sniffed_heads_are_cached_as_head_only_entries(self):
+        first = fetch_link_preview_metadata(f"{self.base}/page", timeout=5)
+        second = fetch_link_preview_metadata(f"{self.base}/page", timeout=5)
+        self.assertEqual(first, second)
+        self.assertEqual(first["title"], "Page Title")
+        self.assertEqual(_Handler.hits, {"/page": 1})
+
+        request = HttpRequest(url=f"{self.base}/page", timeout=5, cache_ttl=60)
+        page = sniff_html_head(request)
+        self.assertEqual(page.head.title, "Page Title")
+        self.assertIsNone(self.cache.get(request))
+        self.assertLess(len(self.cache.get(request, variant="head").body), 8000)
+
+    def test_size_bound_evicts_least_recently_used(self):
+        cache = HttpCache(Path(self.tmp.name) / "lru", max_bytes=3000)
+        requests = [HttpRequest(url=f"{self.base}/{n}", cache_ttl=60) for n in range(3)]
+        response = send(HttpRequest(url=f"{self.base}/plain", timeout=5))
+        for index, request in enumerate(requests[:2]):
+            cache.put(request, url=request.url, status=200, headers=response.headers, body=b"x" * 1000)
+            path = cache._path(request)
+            os.utime(path, (time.time() - 100 + index, time.time() - 100 + index))
+        self.assertIsNotNone(cache.get(requests[0]))  # refreshes its mtime
+        cache.put(requests[2], url=requests[2].url, status=200, headers=response.headers, body=b"x" * 1000)
+
+        self.assertIsNotNone(cache.get(requests[0]))
+        self.assertIsNone(cache.get(requests[1]))
+        self.assertIsNotNone(cache.get(requests[2]))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+
+class TestHtmlHeadSniffer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_stops_reading_at_end_of_head(self):
+        page = sniff_html_head(HttpRequest(url=f"{self.base}/page", timeout=5))
+        self.assertTrue(page.head.head_done)
+        self.assertEqual(page.head.title, "Page Title")
+        self.assertEqual(page.head.meta["og:description"], "About it")
+        self.assertEqual(page.head.links[0]["href"], "/feed.xml")
+        self.assertLess(page.bytes_read, 100_000)
+
+        capped = sniff_html_head(
+            HttpRequest(url=f"{self.base}/page", timeout=5), until_head_end=False, max_bytes=20_000
+        )
+        self.assertLessEqual(len(capped.head.text), 20_000)
+
+    def test_preview_reads_head_and_rejects_non_html(self):
+        preview = fetch_link_preview_metadata(f"{self.base}/page")
+        self.assertEqual((preview["title"], preview["description"]), ("Page Title", "About it"))
+        with self.assertRaises(RuntimeError):
+            fetch_link_preview_metadata(f"{self.base}/image")
+
+    def test_ingest_detection_discovers_feed_from_streamed_head(self):
+        detection = detect_ingest(f"{self.base}/page")
+        self.assertEqual((detection.source_type, detection.value), ("rss", f"{self.base}/feed.xml"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from digest.models import Item
+from digest.pipeline.dedupe import dedupe_exact
+from digest.pipeline.normalize import normalize_items
+from digest.storage.sqlite_store import SQLiteStore
+from digest.urls import canonical_url, item_key
+
+
+class TestCanonicalUrl(unittest.TestCase):
+    def test_rules_fold_url_variants(self):
+        cases = {
+            "http://example.com/post/?utm_source=rss&utm_medium=feed&id=7#comments": "https://example.com/post?id=7",
+            "https://example.com/post?fbclid=abc&utm_campaign=x": "https://example.com/post",
+            "https://example.com/compare?ref=main&amp=1": "https://example.com/compare?ref=main&amp=1",
+            "http://intranet.example:8080/x/": "http://intranet.example:8080/x",
+            "http://example.com:80/post": "https://example.com/post",
+            "https://amp.example.com/post/amp": "https://example.com/post",
+            "https://example-com.cdn.ampproject.org/c/s/example.com/post": "https://example.com/post",
+            "https://mobile.twitter.com/openai/status/1?s=20&t=x": "https://x.com/openai/status/1",
+            "https://youtu.be/abc123?si=share": "https://www.youtube.com/watch?v=abc123",
+            "https://m.youtube.com/watch?v=abc123&feature=share": "https://www.youtube.com/watch?v=abc123",
+            "https://arxiv.org/pdf/2401.01234v2.pdf": "https://arxiv.org/abs/2401.01234v2",
+            "https://en.m.wikipedia.org/wiki/Transformer": "https://en.wikipedia.org/wiki/Transformer",
+            "https://news.ycombinator.com/item?id=42&utm_source=x": "https://news.ycombinator.com/item?id=42",
+        }
+        for raw, expected in cases.items():
+            with self.subTest(raw=raw):
+                self.assertEqual(canonical_url(raw), expected)
+        self.assertEqual(canonical_url("not a url"), "not a url")
+
+    def test_variants_collapse_in_exact_dedupe_with_canonical_hash(self):
+        items = [
+            Item("1", "http://example.com/post/", "A", "s", None, datetime.now(), "article", "one", hash="h1"),
+            Item("2", "https://example.com/post?utm_source=rss", "A", "s", None, datetime.now(), "article", "two", hash="h2"),
+        ]
+        normalized = normalize_items(items)
+        self.assertEqual({i.hash for i in normalized}, {normalized[0].hash})
+        self.assertEqual(
+            [i.url for i in normalized],
+            ["http://example.com/post/", "https://example.com/post?utm_source=rss"],
+        )
+        self.assertEqual({item_key(i) for i in normalized}, {"https://example.com/post"})
+        self.assertEqual(len(dedupe_exact(normalized)), 1)
+
+
+class TestSeenKeyMigration(unittest.TestCase):
+    def test_existing_seen_keys_are_canonicalized_once(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db = str(Path(tmp) / "digest.db")
+            SQLiteStore(db)
+            with sqlite3.connect(db) as conn:
+                conn.execute("DELETE FROM schema_migrations")
+                conn.executemany(
+                    "INSERT INTO seen (key, first_seen_at) VALUES (?, ?)",
+                    [
+                        ("http://example.com/post/?utm_source=rss", "2026-01-02T00:00:00+00:00"),
+                        ("https://example.com/post", "2026-01-03T00:00:00+00:00"),
+                        ("abc123hash", "2026-01-01T00:00:00+00:00"),
+                    ],
+                )
+            store = SQLiteStore(db)
+            self.assertEqual(store.seen_keys(), {"https://example.com/post", "abc123hash"})
+            with sqlite3.connect(db) as conn:
+                first_seen = conn.execute(
+                    "SELECT first_seen_at FROM seen WHERE key = 'https://example.com/post'"
+                ).fetchone()[0]
+            self.assertEqual(first_seen, "2026-01-02T00:00:00+00:00")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from digest.models import Item
+from digest.ops.poll_planner import SourcePollPlanner
+from digest.storage.sqlite_store import SQLiteStore
+
+DAILY = "rss:https://example.com/daily.xml"
+FRESH = "rss:https://example.com/new.xml"
+
+
+class TestSourcePollPlanner(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = SQLiteStore(str(Path(self.tmp.name) / "digest.db"))
+        self.now = datetime(2026, 3, 10, 12, 0, tzinfo=timezone.utc)
+        items = [
+            Item(
+                f"daily-{day}",
+                f"https://example.com/{day}",
+                f"Post {day}",
+                "example.com",
+                None,
+                self.now - timedelta(days=day),
+                "article",
+                "",
+            )
+            for day in range(1, 6)
+        ]
+        self.store.upsert_items(items)
+        self.store.link_source_items(
+            run_id="run-1",
+            links=[
+                {"source_key": DAILY, "source_type": "rss", "source_value": "daily", "item_id": item.id}
+                for item in items
+            ],
+        )
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _planner(self, hours: float = 0, staleness: int = 24) -> SourcePollPlanner:
+        return SourcePollPlanner(
+            self.store,
+            [DAILY, FRESH],
+            max_staleness_hours=staleness,
+            now=self.now + timedelta(hours=hours),
+        )
+
+    def test_daily_source_is_polled_at_a_fraction_of_its_interval(self):
+        first = self._planner()
+        self.assertEqual(first.interval(DAILY), timedelta(days=1))
+        self.assertTrue(first.is_due(DAILY))
+        first.mark_polled(DAILY)
+        first.flush()
+        self.assertEqual(first.next_due[DAILY], (self.now + timedelta(hours=6)).isoformat())
+
+        early = self._planner(hours=2)
+        self.assertFalse(early.is_due(DAILY))
+        self.assertTrue(early.is_due(FRESH))
+        self.assertEqual(early.skipped, {DAILY: (self.now + timedelta(hours=6)).isoformat()})
+        self.assertTrue(self._planner(hours=6).is_due(DAILY))
+
+    def test_max_staleness_caps_wait_and_zero_disables(self):
+        planner = self._planner()
+        planner.mark_polled(DAILY)
+        planner.flush()
+        self.assertTrue(self._planner(hours=2, staleness=2).is_due(DAILY))
+        self.assertTrue(self._planner(hours=1, staleness=0).is_due(DAILY))
+
+    def test_window_reads_back_to_last_successful_poll(self):
+        planner = self._planner()
+        planner.mark_polled(DAILY)
+        planner.flush()
+        later = self._planner(hours=30)
+        run_window = self.now + timedelta(hours=29)
+        self.assertEqual(later.window_start(DAILY, run_window), self.now)
+        self.assertEqual(later.window_start(FRESH, run_window), run_window)
+        self.assertEqual(later.window_start(DAILY, self.now - timedelta(hours=1)), self.now - timedelta(hours=1))
+        months = self._planner(hours=24 * 60)
+        self.assertEqual(
+            months.window_start(DAILY, self.now + timedelta(days=59)),
+            self.now + timedelta(days=53),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
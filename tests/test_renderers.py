@@ -1,7 +1,8 @@
 import json
 import unittest
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from http.client import HTTPMessage
+from unittest.mock import patch
 from urllib.parse import parse_qs
 
 from digest.delivery.obsidian import render_obsidian_note
@@ -12,6 +13,7 @@ from digest.delivery.telegram import (
     send_telegram_message,
 )
 from digest.models import DigestSections, Item, ItemType, Score, ScoredItem, Summary
+from digest.net.engine import HttpResponse
 
 
 def _scored(idx: int, kind: ItemType = "article") -> ScoredItem:
@@ -423,14 +425,17 @@ class TestRenderers(unittest.TestCase):
         self.assertIn("<i>arXiv | Must-read | High 75</i>", msg)
 
     def test_send_telegram_message_uses_html_parse_mode(self):
-        response = MagicMock()
-        response.read.return_value = json.dumps({"ok": True}).encode("utf-8")
-        response.__enter__.return_value = response
-        response.__exit__.return_value = False
-        with patch("digest.delivery.telegram.urllib.request.urlopen", return_value=response) as urlopen:
+        response = HttpResponse(
+            url="https://api.telegram.org/bottoken/sendMessage",
+            status=200,
+            headers=HTTPMessage(),
+            body=json.dumps({"ok": True}).encode("utf-8"),
+        )
+        with patch("digest.delivery.telegram.send", return_value=response) as send:
             send_telegram_message("token", "chat", "<b>hello</b>")
 
-        request = urlopen.call_args.args[0]
+        request = send.call_args.args[0]
+        self.assertEqual(request.method, "POST")
         body = parse_qs(request.data.decode("utf-8"))
         self.assertEqual(body["parse_mode"], ["HTML"])
         self.assertEqual(body["disable_web_page_preview"], ["true"])
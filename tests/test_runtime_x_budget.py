@@ -28,6 +28,22 @@ class TestRuntimeXBudget(unittest.TestCase):
         self.assertEqual(plan["theme_budget"], 0)
         self.assertEqual(plan["author_limits"], {"alice": 5, "bob": 5})
         self.assertEqual(plan["theme_limits"], {"ai agents": 0})
+        self.assertIsNone(plan["author_batches"])
+        self.assertEqual(plan["author_requests"], 2)
+
+    def test_batched_plan_packs_funded_authors_into_fewer_requests(self):
+        plan = _plan_x_selector_limits(
+            authors=[f"author{index}" for index in range(30)],
+            themes=[],
+            max_spend_usd=0.5,
+            cost_per_post_usd=0.005,
+            batch_query_chars=512,
+        )
+        self.assertEqual(plan["post_budget"], 100)
+        batched = [author for batch in plan["author_batches"] for author in batch]
+        self.assertEqual(batched, [f"author{index}" for index in range(30)])
+        self.assertEqual(plan["author_requests"], len(plan["author_batches"]))
+        self.assertLess(plan["author_requests"], 30)
 
 
 if __name__ == "__main__":
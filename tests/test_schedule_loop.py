@@ -1,8 +1,9 @@
 import unittest
 from datetime import datetime, timezone
 
-from digest.config import ProfileConfig, ScheduleSettings
-from digest.ops.schedule_slots import evaluate_schedule_tick
+from digest.config import ProfileConfig, ScheduleSettings, SourceConfig
+from digest.ops.schedule_slots import evaluate_schedule_tick, next_prefetch_shard
+from digest.ops.source_shards import plan_source_shards, shardable_sources, sources_excluding
 
 
 def _profile(**kwargs) -> ProfileConfig:
@@ -83,5 +84,53 @@ class TestEvaluateScheduleTick(unittest.TestCase):
         self.assertEqual(action, "quiet")
 
 
+
+class TestFetchShards(unittest.TestCase):
+    def test_shards_split_lead_time_before_next_slot(self):
+        profile = _profile()
+        profile.fetch_shards = 3
+        profile.fetch_shard_lead_minutes = 90
+        slot = "2026-07-26T10:00:00+00:00"
+        self.assertIsNone(next_prefetch_shard(profile, _utc(2026, 7, 26, 8, 29), {}))
+        self.assertEqual(next_prefetch_shard(profile, _utc(2026, 7, 26, 8, 30), {}), (slot, 0))
+        done = {"slot": slot, "shards": [0]}
+        self.assertIsNone(next_prefetch_shard(profile, _utc(2026, 7, 26, 8, 59), done))
+        self.assertEqual(next_prefetch_shard(profile, _utc(2026, 7, 26, 9, 45), done), (slot, 1))
+        profile.fetch_shards = 1
+        self.assertIsNone(next_prefetch_shard(profile, _utc(2026, 7, 26, 9, 45), {}))
+
+    def test_no_prefetch_for_a_slot_in_quiet_hours(self):
+        profile = _profile(
+            quiet_hours_enabled=True, quiet_start_local="06:00", quiet_end_local="08:00"
+        )
+        profile.fetch_shards = 2
+        self.assertIsNone(next_prefetch_shard(profile, _utc(2026, 7, 26, 9, 30), {}))
+
+        # Quiet hours that end at the slot itself still allow the lead-up fetch.
+        profile.schedule.quiet_end_local = "07:00"
+        self.assertEqual(
+            next_prefetch_shard(profile, _utc(2026, 7, 26, 9, 30), {}),
+            ("2026-07-26T10:00:00+00:00", 0),
+        )
+
+    def test_plan_balances_cost_and_delivery_keeps_the_rest(self):
+        sources = SourceConfig(
+            rss_feeds=[f"https://feed{i}.example/rss" for i in range(6)],
+            github_orgs=["openai"],
+            x_inbox_path="inbox.txt",
+        )
+        shards = plan_source_shards(sources, 2)
+        self.assertEqual(shards, plan_source_shards(sources, 2))
+        self.assertEqual([s.github_orgs for s in shards], [["openai"], []])
+        self.assertEqual([len(s.rss_feeds) for s in shards], [1, 5])
+        self.assertTrue(all(s.x_inbox_path == "" for s in shards))
+
+        covered = {key for _type, _value, key in shardable_sources(shards[1])}
+        rest = sources_excluding(sources, covered)
+        self.assertEqual(rest.rss_feeds, shards[0].rss_feeds)
+        self.assertEqual(rest.github_orgs, ["openai"])
+        self.assertEqual(rest.x_inbox_path, "inbox.txt")
+
+
 if __name__ == "__main__":
     unittest.main()
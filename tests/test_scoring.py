@@ -4,6 +4,9 @@ from datetime import datetime
 from digest.config import ProfileConfig
 from digest.models import Item, Score, ScoredItem
 from digest.pipeline.scoring import (
+    ProfileMatcher,
+    content_depth_adjustment,
+    is_blocked,
     research_concentration_adjustments,
     score_item,
     source_preference_adjustment,
@@ -192,6 +195,78 @@ class TestScoring(unittest.TestCase):
         adjustments = research_concentration_adjustments(rows, pool_size=6)
         self.assertEqual(adjustments, {})
 
+    def test_profile_matcher_matches_per_call_scoring(self):
+        profile = ProfileConfig(
+            topics=["Agents", "agents"],
+            entities=["OpenAI"],
+            exclusions=["giveaway"],
+            blocked_sources=["Spam"],
+            blocked_orgs_github=["BadOrg"],
+            trusted_sources=["example"],
+            content_depth_preference="practical",
+        )
+        items = [
+            Item(
+                id="m1",
+                url="https://example.com/m1",
+                title="OpenAI agents recap: kv cache latency paper",
+                source="example.com",
+                author=None,
+                published_at=datetime.now(),
+                type="article",
+                raw_text="Models and storage x_endorsed_by:alice x_endorsed_by:bob " * 20,
+            ),
+            Item(
+                id="m2",
+                url="https://github.com/badorg/repo",
+                title="Shocking giveaway tutorial",
+                source="github:BadOrg/repo",
+                author=None,
+                published_at=datetime.now(),
+                type="github_repo",
+                raw_text="How to win",
+            ),
+        ]
+        matcher = ProfileMatcher(profile)
+        for item in items:
+            with self.subTest(item=item.id):
+                expected = score_item(item, profile)
+                self.assertEqual(score_item(item, profile, matcher), expected)
+                self.assertEqual(is_blocked(item, profile, matcher), is_blocked(item, profile))
+                self.assertEqual(
+                    source_preference_adjustment(item, expected, profile, matcher),
+                    source_preference_adjustment(item, expected, profile),
+                )
+                self.assertEqual(
+                    content_depth_adjustment(item, profile, matcher),
+                    content_depth_adjustment(item, profile),
+                )
+
+        score = score_item(items[0], profile, matcher)
+        # Substring hits: agents, openai, model and "rag" inside "storage".
+        self.assertEqual(score.relevance, 4 * 6 + 15)
+        self.assertEqual(score.quality, 10 + 8 + 8)
+        self.assertEqual(score.novelty, 6)
+        self.assertIn("x-discovered", score.format_tags)
+        self.assertTrue(is_blocked(items[1], profile, matcher))
+
+    def test_profile_matcher_caches_features_per_item(self):
+        matcher = ProfileMatcher(ProfileConfig())
+        item = Item(
+            id="c1",
+            url="https://example.com/c1",
+            title="CUDA kernel throughput benchmark",
+            source="example.com",
+            author=None,
+            published_at=datetime.now(),
+            type="article",
+            raw_text="",
+        )
+        features = matcher.features(item)
+        self.assertIs(matcher.features(item), features)
+        self.assertIn("cuda", features.hits)
+        self.assertEqual(features.technicality, "high")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,75 @@
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+from digest.storage.seen_bloom import SeenBloomFilter
+from digest.storage.sqlite_store import SQLiteStore
+
+
+class TestSeenStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db = str(Path(self.tmp.name) / "digest.db")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_batch_lookup_matches_with_and_without_bloom(self):
+        for bloom in (True, False):
+            with self.subTest(bloom=bloom):
+                db = str(Path(self.tmp.name) / f"bloom-{bloom}.db")
+                store = SQLiteStore(db, seen_bloom=bloom)
+                store.mark_seen([f"https://example.com/{i}" for i in range(1200)])
+                keys = [f"https://example.com/{i}" for i in range(0, 2400, 2)]
+                self.assertEqual(
+                    store.seen_matches(keys), {f"https://example.com/{i}" for i in range(0, 1200, 2)}
+                )
+                self.assertEqual(store.seen_count(), 1200)
+                self.assertEqual(Path(db + ".seen-bloom").exists(), bloom)
+
+    def test_bloom_grows_incrementally_and_rebuilds_after_deletes(self):
+        store = SQLiteStore(self.db, seen_bloom=True)
+        store.mark_seen(["a", "b"])
+        self.assertEqual(store.seen_matches(["a", "z"]), {"a"})
+        bloom = SeenBloomFilter.load(store.seen_bloom_path)
+        self.assertEqual((bloom.key_count, "a" in bloom, "z" in bloom), (2, True, False))
+
+        store.mark_seen(["c"])
+        with patch.object(SeenBloomFilter, "__init__", side_effect=AssertionError("full rebuild")):
+            self.assertEqual(store.seen_matches(["c"]), {"c"})
+        self.assertEqual(SeenBloomFilter.load(store.seen_bloom_path).key_count, 3)
+
+        self.assertEqual(store.reset_seen(), 3)
+        self.assertFalse(store.seen_bloom_path.exists())
+        self.assertEqual(store.seen_matches(["a", "b", "c"]), set())
+        self.assertEqual(SeenBloomFilter.load(store.seen_bloom_path).key_count, 0)
+
+    def test_ttl_expiry_keeps_the_filter_unless_it_must_rebuild(self):
+        store = SQLiteStore(self.db, seen_bloom=True)
+        store.mark_seen([f"k{i}" for i in range(10)])
+        store.seen_matches(["k0"])
+        before = store.seen_bloom_path.read_bytes()
+
+        self.assertEqual(store.reset_seen(older_than_days=30), 0)
+        self.assertEqual(store.seen_bloom_path.read_bytes(), before)
+
+        old = (datetime.now(timezone.utc) - timedelta(days=60)).isoformat()
+        with store._conn() as conn:
+            conn.execute("UPDATE seen SET first_seen_at = ? WHERE key IN ('k0', 'k1')", (old,))
+        self.assertEqual(store.reset_seen(older_than_days=30), 2)
+        self.assertEqual(store.seen_bloom_path.read_bytes(), before)
+        self.assertEqual(store.seen_matches(["k0", "k2"]), {"k2"})
+
+        # Expiring the newest row lets new rows reuse rowids the filter covers.
+        with store._conn() as conn:
+            conn.execute("UPDATE seen SET first_seen_at = ? WHERE key = 'k9'", (old,))
+        self.assertEqual(store.reset_seen(older_than_days=30), 1)
+        self.assertFalse(store.seen_bloom_path.exists())
+        store.mark_seen(["fresh"])
+        self.assertEqual(store.seen_matches(["fresh", "k9"]), {"fresh"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from digest.constants import SOURCE_QUARANTINE_AFTER_FAILURES
+from digest.ops.source_health import SourceHealthTracker, load_source_health
+from digest.storage.sqlite_store import SQLiteStore
+
+KEY = "rss:https://example.com/feed.xml"
+
+
+class TestSourceHealthTracker(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = SQLiteStore(str(Path(self.tmp.name) / "digest.db"))
+        self.now = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _tracker(self, hours: float = 0) -> SourceHealthTracker:
+        return SourceHealthTracker(self.store, [KEY], now=self.now + timedelta(hours=hours))
+
+    def test_timeout_follows_latency_history(self):
+        tracker = self._tracker()
+        self.assertEqual(tracker.timeout_for(KEY, 20), 20)
+        for elapsed in (0.4, 0.5, 0.6, 0.5, 1.2):
+            tracker.record(KEY, elapsed_s=elapsed, error=None)
+        tracker.flush()
+
+        reloaded = self._tracker()
+        self.assertEqual(reloaded.timeout_for(KEY, 20), 5)
+        self.assertEqual(reloaded.retries_for(KEY, 2), 2)
+        (health,) = load_source_health(self.store)
+        self.assertEqual(health.percentile(0.5), 0.5)
+        self.assertEqual(health.last_success_at, self.now)
+
+    def test_repeated_failures_quarantine_with_doubling_reprobe(self):
+        tracker = self._tracker()
+        for _ in range(SOURCE_QUARANTINE_AFTER_FAILURES):
+            tracker.record(KEY, elapsed_s=20, error=RuntimeError("timed out"))
+        tracker.flush()
+        self.assertEqual(tracker.newly_quarantined, [KEY])
+        self.assertEqual(tracker.retries_for(KEY, 2), 0)
+
+        self.assertTrue(self._tracker(hours=0.5).should_skip(KEY))
+        probe = self._tracker(hours=1.5)
+        self.assertFalse(probe.should_skip(KEY))
+        probe.record(KEY, elapsed_s=20, error=RuntimeError("timed out"))
+        probe.flush()
+        (health,) = load_source_health(self.store)
+        self.assertEqual(health.quarantined_until, self.now + timedelta(hours=1.5 + 2))
+
+        recovered = self._tracker(hours=4)
+        recovered.record(KEY, elapsed_s=0.3, error=None)
+        recovered.flush()
+        (health,) = load_source_health(self.store)
+        self.assertIsNone(health.quarantined_until)
+        self.assertEqual((health.consecutive_failures, health.quarantine_count), (0, 0))
+        self.assertEqual(health.last_error, "timed out")
+
+
+if __name__ == "__main__":
+    unittest.main()
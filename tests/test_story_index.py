@@ -0,0 +1,85 @@
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from digest.models import Item
+from digest.ops.story_index import StoryIndex, story_shingles
+from digest.storage.sqlite_store import SQLiteStore
+
+
+def _item(item_id: str, url: str, title: str) -> Item:
+    return Item(item_id, url, title, "example.com", None, datetime.now(timezone.utc), "article", "")
+
+
+def _x_post(item_id: str, text: str) -> Item:
+    return Item(
+        item_id,
+        f"https://x.com/karpathy/status/{item_id}",
+        "X post by @karpathy",
+        "x.com",
+        "karpathy",
+        datetime.now(timezone.utc),
+        "x_post",
+        text,
+        description=text,
+    )
+
+
+class TestStoryIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = SQLiteStore(str(Path(self.tmp.name) / "digest.db"))
+        self.now = datetime.now(timezone.utc)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _index(self, days: float = 0) -> StoryIndex:
+        return StoryIndex(self.store, ttl_days=7, now=self.now + timedelta(days=days))
+
+    def test_repeat_from_another_outlet_links_to_the_first_story(self):
+        first = _item("a", "https://one.example/launch", "OpenAI releases new open weights reasoning model")
+        other = _item("b", "https://one.example/chips", "Nvidia announces next generation datacenter chips")
+        day_one = self._index()
+        self.assertEqual(day_one.match([first, other]), {})
+        day_one.remember([first, other], delivered_ids={"a"})
+
+        repeat = _item("c", "https://two.example/story", "OpenAI releases new open weights reasoning model today")
+        fresh = _item("d", "https://two.example/other", "Rust compiler gets faster incremental builds")
+        day_two = self._index(days=1)
+        matches = day_two.match([repeat, fresh, first])
+        self.assertEqual(list(matches), ["c"])
+        self.assertEqual((matches["c"].story_id, matches["c"].delivered), ("a", True))
+        day_two.remember([repeat], delivered_ids=set())
+        self.assertEqual(self.store.get_story_entries(["c"])["c"]["story_id"], "a")
+
+    def test_entries_expire_after_ttl(self):
+        story = _item("a", "https://one.example/launch", "OpenAI releases new open weights reasoning model")
+        self._index().remember([story], delivered_ids={"a"})
+        later = StoryIndex(self.store, ttl_days=7, now=self.now + timedelta(days=8))
+        self.assertEqual(later.pruned, 1)
+        repeat = _item("c", "https://two.example/story", "OpenAI releases new open weights reasoning model")
+        self.assertEqual(later.match([repeat]), {})
+
+    def test_templated_titles_are_keyed_on_their_text(self):
+        first = _x_post("1", "New lecture on tokenizers and why byte pair encoding is weird")
+        self._index().remember([first], delivered_ids={"1"})
+
+        unrelated = _x_post("2", "Spent the weekend building a tiny autograd engine in plain numpy")
+        quoted = _x_post("3", "New lecture on tokenizers and why byte pair encoding is weird!")
+        matches = self._index(days=1).match([unrelated, quoted])
+        self.assertEqual(list(matches), ["3"])
+
+    def test_items_with_too_few_shingles_are_not_indexed(self):
+        release = _item("r", "https://github.com/o/r/releases/v1.2.0", "v1.2.0")
+        self.assertEqual(story_shingles(release), frozenset())
+        self.assertEqual(story_shingles(_x_post("4", "gm")), frozenset())
+        self._index().remember([release], delivered_ids={"r"})
+        self.assertEqual(self.store.get_story_entries(["r"]), {})
+        again = _item("s", "https://github.com/o/r/releases/v1.2.1", "v1.2.1")
+        self.assertEqual(self._index(days=1).match([again]), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,13 @@
 import tempfile
 import time
 import unittest
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import patch
 
 from digest.ops.run_lock import RunLock
 from digest.ops.telegram_commands import CommandContext, handle_update
+from digest.storage.sqlite_store import SQLiteStore
 
 
 class TestTelegramCommands(unittest.TestCase):
@@ -71,6 +73,33 @@ class TestTelegramCommands(unittest.TestCase):
             assert resp is not None
             self.assertIn("Added github_org: vercel-labs", resp.text or "")
 
+    def test_sources_health_lists_quarantined_and_slow_sources(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            ctx, _, _ = self._ctx(tmp)
+            store = SQLiteStore(ctx.db_path)
+            store.upsert_source_health(
+                [
+                    {
+                        "source_key": "rss:https://dead.example/feed",
+                        "consecutive_failures": 4,
+                        "quarantine_count": 2,
+                        "quarantined_until": datetime.now(timezone.utc) + timedelta(hours=2),
+                        "last_error": "timed out",
+                    },
+                    {"source_key": "rss:https://ok.example/feed", "latencies": [0.5, 1.5, 2.5]},
+                ]
+            )
+            upd = {
+                "update_id": 1,
+                "message": {"text": "/sources health", "chat": {"id": 1}, "from": {"id": 2}},
+            }
+            resp = handle_update(upd, ctx)
+            assert resp is not None
+            text = resp.text or ""
+            self.assertIn("2 tracked, 1 quarantined", text)
+            self.assertIn("rss:https://dead.example/feed: 4 failures", text)
+            self.assertIn("rss:https://ok.example/feed: 1.5s / 2.5s", text)
+
     def test_status_command_reports_last_run(self):
         with tempfile.TemporaryDirectory() as tmp:
             ctx, _, _ = self._ctx(tmp)
@@ -1,8 +1,10 @@
 import tempfile
 import unittest
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from digest.connectors.x_inbox import fetch_x_inbox_items
+from digest.storage.sqlite_store import SQLiteStore
 
 
 class TestXInbox(unittest.TestCase):
@@ -44,5 +46,55 @@ https://twitter.com/bob/status/9876543210987654321 | interesting thread
             )
 
 
+class TestXInboxTailing(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "x_inbox.txt"
+        self.store = SQLiteStore(str(Path(self.tmp.name) / "digest.db"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _append(self, text: str) -> None:
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.write(text)
+
+    def test_appended_lines_are_parsed_once_and_keep_first_ingested_time(self):
+        self._append("https://x.com/alice/status/1 | first interesting post\n")
+        first = fetch_x_inbox_items(str(self.path), store=self.store)
+        consumed = self.path.stat().st_size
+
+        self._append("https://x.com/bob/status/2 | second interesting post\nhttps://x.com/carol/status/3")
+        second = fetch_x_inbox_items(str(self.path), store=self.store)
+        later = fetch_x_inbox_items(
+            str(self.path), store=self.store, window_start=second[1].published_at
+        )
+
+        self.assertEqual([i.author for i in first], ["alice"])
+        state = self.store.get_x_inbox_state(str(self.path.resolve()))
+        self.assertEqual(state["read_offset"], consumed + len("https://x.com/bob/status/2 | second interesting post\n"))
+        # The unterminated carol line waits for its newline.
+        self.assertEqual([i.author for i in second], ["alice", "bob"])
+        self.assertEqual(second[0].published_at, first[0].published_at)
+        self.assertEqual([i.author for i in later], ["bob"])
+
+    def test_truncated_or_replaced_file_is_rescanned(self):
+        self._append("https://x.com/alice/status/1 | first interesting post\n")
+        fetch_x_inbox_items(str(self.path), store=self.store)
+        self.path.write_text("https://x.com/dave/status/4 | replacement post here\n", encoding="utf-8")
+        items = fetch_x_inbox_items(
+            str(self.path),
+            store=self.store,
+            window_start=datetime.now(timezone.utc) - timedelta(minutes=1),
+        )
+        self.assertEqual([i.author for i in items], ["alice", "dave"])
+
+        replacement = Path(self.tmp.name) / "next.txt"
+        replacement.write_text("https://x.com/erin/status/5 | brand new inbox file\n", encoding="utf-8")
+        replacement.replace(self.path)
+        items = fetch_x_inbox_items(str(self.path), store=self.store)
+        self.assertEqual([i.author for i in items], ["alice", "dave", "erin"])
+
+
 if __name__ == "__main__":
     unittest.main()
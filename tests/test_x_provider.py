@@ -1,18 +1,33 @@
 import json
 import unittest
 import urllib.parse
-from unittest.mock import MagicMock, patch
+from http.client import HTTPMessage
+from unittest.mock import patch
 
-from digest.connectors.x_provider import XApiProvider
+from digest.connectors.x_provider import XApiProvider, pack_author_batches
+from digest.constants import X_AUTHOR_BATCH_MAX_PAGES
+from digest.net.engine import HttpResponse
 
 
-def _response(payload: dict) -> MagicMock:
-    response = MagicMock()
-    response.read.return_value = json.dumps(payload).encode("utf-8")
-    context = MagicMock()
-    context.__enter__.return_value = response
-    context.__exit__.return_value = False
-    return context
+def _page(posts: list[tuple[str, str]], next_token: str | None = None) -> dict:
+    users = sorted({author for _post_id, author in posts})
+    return {
+        "data": [
+            {"id": post_id, "text": "post", "author_id": f"u-{author}"}
+            for post_id, author in posts
+        ],
+        "includes": {"users": [{"id": f"u-{author}", "username": author} for author in users]},
+        "meta": {"next_token": next_token} if next_token else {},
+    }
+
+
+def _response(payload: dict) -> HttpResponse:
+    return HttpResponse(
+        url="https://api.x.com/2/tweets/search/recent",
+        status=200,
+        headers=HTTPMessage(),
+        body=json.dumps(payload).encode("utf-8"),
+    )
 
 
 class TestXApiProvider(unittest.TestCase):
@@ -32,9 +47,9 @@ class TestXApiProvider(unittest.TestCase):
         }
 
         with patch(
-            "digest.connectors.x_provider.urllib.request.urlopen",
+            "digest.connectors.x_provider.send",
             return_value=_response(payload),
-        ) as urlopen:
+        ) as send:
             posts, cursor = provider.fetch_author_posts(
                 author="@OpenAI",
                 cursor="cursor-1",
@@ -45,8 +60,8 @@ class TestXApiProvider(unittest.TestCase):
         self.assertEqual(posts[0].author_username, "openai")
         self.assertEqual(posts[0].url, "https://x.com/openai/status/111")
 
-        request = urlopen.call_args.args[0]
-        parsed = urllib.parse.urlparse(request.full_url)
+        request = send.call_args.args[0]
+        parsed = urllib.parse.urlparse(request.url)
         params = urllib.parse.parse_qs(parsed.query)
         self.assertEqual(parsed.path, "/2/tweets/search/recent")
         self.assertEqual(params["query"], ["from:openai -is:retweet -is:reply"])
@@ -69,9 +84,9 @@ class TestXApiProvider(unittest.TestCase):
         }
 
         with patch(
-            "digest.connectors.x_provider.urllib.request.urlopen",
+            "digest.connectors.x_provider.send",
             return_value=_response(payload),
-        ) as urlopen:
+        ) as send:
             posts, cursor = provider.fetch_theme_posts(
                 query="ai agents lang:en",
                 cursor=None,
@@ -81,13 +96,117 @@ class TestXApiProvider(unittest.TestCase):
         self.assertEqual(cursor, "next-theme")
         self.assertEqual(posts[0].author_username, "newsbot")
 
-        request = urlopen.call_args.args[0]
-        parsed = urllib.parse.urlparse(request.full_url)
+        request = send.call_args.args[0]
+        parsed = urllib.parse.urlparse(request.url)
         params = urllib.parse.parse_qs(parsed.query)
         self.assertEqual(parsed.path, "/2/tweets/search/recent")
         self.assertEqual(params["query"], ["ai agents lang:en"])
         self.assertNotIn("next_token", params)
 
+    def test_author_batch_packs_or_query_and_splits_by_author(self):
+        provider = XApiProvider(bearer_token="test-token", timeout=5)
+        pages = [
+            {
+                "data": [
+                    {"id": "303", "text": "b post", "author_id": "u2"},
+                    {"id": "302", "text": "a post", "author_id": "u1"},
+                ],
+                "includes": {
+                    "users": [{"id": "u1", "username": "alice"}, {"id": "u2", "username": "Bob"}]
+                },
+                "meta": {"next_token": "page-2"},
+            },
+            {
+                "data": [{"id": "301", "text": "older a post", "author_id": "u1"}],
+                "includes": {"users": [{"id": "u1", "username": "alice"}]},
+                "meta": {},
+            },
+        ]
+
+        with patch(
+            "digest.connectors.x_provider.send",
+            side_effect=[_response(page) for page in pages],
+        ) as send:
+            by_author = provider.fetch_author_batch(
+                authors=["@Alice", "bob"], since_id="300", limits={"@Alice": 10, "bob": 10}
+            )
+
+        self.assertEqual([p.id for p in by_author["alice"]], ["302", "301"])
+        self.assertEqual([p.id for p in by_author["bob"]], ["303"])
+        first, second = (
+            urllib.parse.parse_qs(urllib.parse.urlparse(call.args[0].url).query)
+            for call in send.call_args_list
+        )
+        self.assertEqual(first["query"], ["(from:alice OR from:bob) -is:retweet -is:reply"])
+        self.assertEqual(first["since_id"], ["300"])
+        self.assertEqual(first["max_results"], ["20"])
+        self.assertEqual(second["next_token"], ["page-2"])
+        self.assertEqual(second["max_results"], ["18"])
+
+    def test_author_batch_pages_past_a_prolific_author_until_each_is_served(self):
+        provider = XApiProvider(bearer_token="test-token", timeout=5)
+        pages = [
+            _page([("310", "alice"), ("309", "alice"), ("308", "alice")], "page-2"),
+            _page([("307", "alice"), ("306", "bob"), ("305", "carol")], "page-3"),
+            _page([("304", "carol")], "page-4"),
+        ]
+
+        with patch(
+            "digest.connectors.x_provider.send",
+            side_effect=[_response(page) for page in pages],
+        ) as send:
+            by_author = provider.fetch_author_batch(
+                authors=["alice", "bob", "carol"],
+                since_id="300",
+                limits={"alice": 2, "bob": 1, "carol": 2},
+                marks={"alice": 300, "bob": 300, "carol": 305},
+            )
+
+        self.assertEqual([p.id for p in by_author["alice"]], ["310", "309"])
+        self.assertEqual([p.id for p in by_author["bob"]], ["306"])
+        # carol's only post is at her mark, and the pages have passed it.
+        self.assertEqual(by_author["carol"], [])
+        self.assertEqual(send.call_count, 2)
+
+    def test_author_batch_requeries_authors_starved_by_the_page_cap(self):
+        provider = XApiProvider(bearer_token="test-token", timeout=5)
+        pages = [
+            _page([(str(400 - page), "alice")], f"page-{page + 1}")
+            for page in range(X_AUTHOR_BATCH_MAX_PAGES)
+        ]
+        pages.append(_page([("350", "bob")]))
+
+        with patch(
+            "digest.connectors.x_provider.send",
+            side_effect=[_response(page) for page in pages],
+        ) as send:
+            by_author = provider.fetch_author_batch(
+                authors=["alice", "bob"],
+                since_id="300",
+                limits={"alice": X_AUTHOR_BATCH_MAX_PAGES, "bob": 1},
+                marks={"alice": 300, "bob": 320},
+            )
+
+        self.assertEqual([p.id for p in by_author["bob"]], ["350"])
+        params = urllib.parse.parse_qs(urllib.parse.urlparse(send.call_args.args[0].url).query)
+        self.assertEqual(params["query"], ["from:bob -is:retweet -is:reply"])
+        self.assertEqual(params["since_id"], ["320"])
+
+    def test_pack_author_batches_respects_query_length_and_page_size(self):
+        authors = [f"author{index:02d}" for index in range(12)]
+        batches = pack_author_batches(authors, max_chars=80)
+        self.assertEqual([a for batch in batches for a in batch], authors)
+        self.assertTrue(len(batches) > 1)
+        for batch in batches:
+            query = "(" + " OR ".join(f"from:{a}" for a in batch) + ") -is:retweet -is:reply"
+            self.assertLessEqual(len(query), 80)
+
+        limits = {author: 40 for author in authors[:4]}
+        self.assertEqual(
+            pack_author_batches(authors[:4], max_chars=512, limits=limits),
+            [authors[:2], authors[2:4]],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
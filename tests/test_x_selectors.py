@@ -1,4 +1,5 @@
 import tempfile
+import threading
 import unittest
 from datetime import datetime, timezone
 from pathlib import Path
@@ -131,6 +132,106 @@ class TestXSelectors(unittest.TestCase):
             self.assertEqual(fake.theme_calls, [])
             self.assertEqual([item.type for item in items].count("link"), 1)
 
+    def test_promoted_link_previews_are_persisted_and_fetched_concurrently(self):
+        urls = [f"https://example.com/{name}" for name in ("a", "b", "c", "broken")]
+
+        class _LinkProvider(_FakeProvider):
+            def fetch_author_posts(self, *, author: str, cursor: str | None, limit: int):
+                posts = [
+                    XPostPayload(
+                        id=str(n),
+                        text="links",
+                        author_username=author,
+                        created_at=datetime(2026, 3, 1, 0, 0, tzinfo=timezone.utc),
+                        url=f"https://x.com/{author}/status/{n}",
+                        outbound_urls=urls[2 * n : 2 * n + 2],
+                    )
+                    for n in range(2)
+                ]
+                return posts, None
+
+        # Passes only if two previews are in flight at the same time.
+        barrier = threading.Barrier(2, timeout=5)
+        fetched: list[str] = []
+
+        def fake_preview(url):
+            fetched.append(url)
+            barrier.wait()
+            if url.endswith("broken"):
+                raise RuntimeError("timed out")
+            return {"url": url, "resolved_url": url, "host": "example.com", "title": url[-1], "status": "ready"}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SQLiteStore(str(Path(tmp) / "digest.db"))
+            sources = SourceConfig(x_authors=["openai"])
+            with (
+                patch("digest.connectors.x_selectors.get_x_provider", return_value=_LinkProvider()),
+                patch("digest.connectors.x_selectors.fetch_link_preview_metadata", side_effect=fake_preview),
+            ):
+                first, _errors = fetch_x_selector_items(sources, store, provider_mode="x_api")
+                second, _errors = fetch_x_selector_items(sources, store, provider_mode="x_api")
+            failure = store.get_cached_link_preview(urls[3])
+
+        self.assertEqual(sorted(fetched), sorted(urls))
+        self.assertEqual([i.title for i in first if i.type == "link"][:3], ["a", "b", "c"])
+        self.assertEqual(
+            [(i.url, i.title) for i in first if i.type == "link"],
+            [(i.url, i.title) for i in second if i.type == "link"],
+        )
+        self.assertEqual(failure["status"], "preview_unavailable")
+        self.assertEqual(failure["error"], "timed out")
+
+    def test_author_batches_split_posts_and_keep_per_author_marks(self):
+        def post_id(minutes_ago: int) -> str:
+            posted_ms = int(datetime.now(timezone.utc).timestamp() * 1000) - minutes_ago * 60_000
+            return str((posted_ms - 1288834974657) << 22)
+
+        alice_old, bob_new, alice_new = post_id(90), post_id(60), post_id(30)
+
+        class _BatchProvider(_FakeProvider):
+            def __init__(self):
+                super().__init__()
+                self.batch_calls: list[tuple[list[str], str | None, int]] = []
+
+            def fetch_author_batch(self, *, authors, since_id, limits, marks=None):
+                self.batch_calls.append((list(authors), since_id, dict(limits)))
+                return {
+                    "alice": [self._post("alice", alice_new), self._post("alice", alice_old)],
+                    "bob": [self._post("bob", bob_new)],
+                }
+
+            def _post(self, author, post_id):
+                return XPostPayload(
+                    id=post_id,
+                    text="batched",
+                    author_username=author,
+                    created_at=datetime(2026, 3, 1, 0, 0, tzinfo=timezone.utc),
+                    url=f"https://x.com/{author}/status/{post_id}",
+                    outbound_urls=[],
+                )
+
+        fake = _BatchProvider()
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SQLiteStore(str(Path(tmp) / "digest.db"))
+            store.set_x_cursor(selector_type="x_author", selector_value="alice", cursor=None, last_item_id=alice_old)
+            store.set_x_cursor(selector_type="x_author", selector_value="bob", cursor=None, last_item_id=alice_old)
+            sources = SourceConfig(x_authors=["alice", "bob", "carol"])
+            with patch("digest.connectors.x_selectors.get_x_provider", return_value=fake):
+                items, errors = fetch_x_selector_items(
+                    sources,
+                    store,
+                    provider_mode="x_api",
+                    author_limits={"alice": 5, "bob": 5, "carol": 0},
+                    author_batches=[["alice", "bob", "carol"]],
+                )
+            marks = store.get_x_last_item_ids("x_author", ["alice", "bob"])
+
+        self.assertEqual(errors, [])
+        self.assertEqual(fake.author_calls, [])
+        self.assertEqual(fake.batch_calls, [(["alice", "bob"], alice_old, {"alice": 5, "bob": 5})])
+        self.assertEqual(sorted(item.url.rsplit("/", 1)[1] for item in items), sorted([alice_new, bob_new]))
+        self.assertEqual(marks, {"alice": alice_new, "bob": bob_new})
+
 
 if __name__ == "__main__":
     unittest.main()